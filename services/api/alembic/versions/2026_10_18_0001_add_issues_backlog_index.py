@@ -0,0 +1,34 @@
+"""add_issues_backlog_index
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the partial index serving the backlog of a project."""
+    op.create_index(
+        "ix_issues_backlog",
+        "issues",
+        ["project_id", "backlog_order", "created_at"],
+        postgresql_include=["id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the backlog index."""
+    op.drop_index("ix_issues_backlog", table_name="issues")
@@ -0,0 +1,99 @@
+"""add_issue_rollups_table
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: str | None = "e5f6a7b8c9d0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create issue_rollups and fill it for existing parent issues."""
+    op.create_table(
+        "issue_rollups",
+        sa.Column(
+            "issue_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("issues.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("child_count", sa.Integer(), nullable=False),
+        sa.Column("descendant_count", sa.Integer(), nullable=False),
+        sa.Column("status_counts", postgresql.JSON(), nullable=False),
+        sa.Column("story_points_total", sa.Integer(), nullable=False),
+        sa.Column("story_points_done", sa.Integer(), nullable=False),
+        sa.Column("hours_logged", sa.Numeric(10, 2), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+    # Backfill: aggregate the live descendants of every parent issue
+    op.execute("""
+        WITH RECURSIVE subtree(root_id, id, status, story_points, depth) AS (
+            SELECT parent_issue_id, id, status, story_points, 1
+            FROM issues
+            WHERE parent_issue_id IS NOT NULL AND deleted_at IS NULL
+            UNION ALL
+            SELECT subtree.root_id, issues.id, issues.status, issues.story_points,
+                   subtree.depth + 1
+            FROM issues JOIN subtree ON issues.parent_issue_id = subtree.id
+            WHERE issues.deleted_at IS NULL AND subtree.depth < 32
+        ),
+        hours AS (
+            SELECT issue_id, sum(hours) AS hours FROM time_entries GROUP BY issue_id
+        ),
+        status_counts AS (
+            SELECT root_id, json_object_agg(status, count) AS counts
+            FROM (
+                SELECT root_id, status, count(*) AS count
+                FROM subtree GROUP BY root_id, status
+            ) AS by_status
+            GROUP BY root_id
+        ),
+        totals AS (
+            SELECT subtree.root_id,
+                   count(*) FILTER (WHERE subtree.depth = 1) AS child_count,
+                   count(*) AS descendant_count,
+                   coalesce(sum(subtree.story_points), 0) AS points_total,
+                   coalesce(
+                       sum(subtree.story_points) FILTER (WHERE subtree.status = 'done'), 0
+                   ) AS points_done,
+                   coalesce(sum(hours.hours), 0) AS hours
+            FROM subtree LEFT JOIN hours ON hours.issue_id = subtree.id
+            GROUP BY subtree.root_id
+        )
+        INSERT INTO issue_rollups (
+            issue_id, child_count, descendant_count, status_counts,
+            story_points_total, story_points_done, hours_logged
+        )
+        SELECT totals.root_id, totals.child_count, totals.descendant_count, status_counts.counts,
+               totals.points_total, totals.points_done, totals.hours
+        FROM totals JOIN status_counts ON status_counts.root_id = totals.root_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop issue_rollups."""
+    op.drop_table("issue_rollups")
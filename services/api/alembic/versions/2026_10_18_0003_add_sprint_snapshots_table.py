@@ -0,0 +1,62 @@
+"""add_sprint_snapshots_table
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: str | None = "f6a7b8c9d0e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create sprint_snapshots (recorded when a sprint is completed)."""
+    op.create_table(
+        "sprint_snapshots",
+        sa.Column(
+            "sprint_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("sprints.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("total_issues", sa.Integer(), nullable=False),
+        sa.Column("completed_issues", sa.Integer(), nullable=False),
+        sa.Column("incomplete_issues", sa.Integer(), nullable=False),
+        sa.Column("total_story_points", sa.Integer(), nullable=False),
+        sa.Column("completed_story_points", sa.Integer(), nullable=False),
+        sa.Column(
+            "moved_to_sprint_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("sprints.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("issues", postgresql.JSON(), nullable=False),
+        sa.Column("metrics", postgresql.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop sprint_snapshots."""
+    op.drop_table("sprint_snapshots")
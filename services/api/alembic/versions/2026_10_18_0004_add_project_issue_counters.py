@@ -0,0 +1,46 @@
+"""add_project_issue_counters
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create project_issue_counters and start them after the existing issues."""
+    op.create_table(
+        "project_issue_counters",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("last_issue_number", sa.Integer(), nullable=False),
+    )
+
+    # Soft-deleted issues keep their numbers: count them too
+    op.execute("""
+        INSERT INTO project_issue_counters (project_id, last_issue_number)
+        SELECT project_id, max(issue_number)
+        FROM issues
+        GROUP BY project_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop project_issue_counters."""
+    op.drop_table("project_issue_counters")
@@ -0,0 +1,33 @@
+"""add_issues_keyset_index
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: str | None = "b8c9d0e1f2a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the newest-first keyset order of saved filter pages."""
+    op.create_index(
+        "ix_issues_project_created",
+        "issues",
+        ["project_id", "created_at", "id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    op.drop_index("ix_issues_project_created", table_name="issues")
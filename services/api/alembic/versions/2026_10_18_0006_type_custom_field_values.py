@@ -0,0 +1,83 @@
+"""type_custom_field_values
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: str | None = "c9d0e1f2a3b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Store custom field values as JSONB with indexed typed projections."""
+    op.alter_column(
+        "custom_field_values",
+        "value",
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="value::jsonb",
+    )
+    op.add_column(
+        "custom_field_values",
+        sa.Column(
+            "number_value",
+            sa.Numeric(),
+            sa.Computed(
+                "CASE WHEN jsonb_typeof(value) = 'number' THEN (value #>> '{}')::numeric END",
+                persisted=True,
+            ),
+        ),
+    )
+    op.add_column(
+        "custom_field_values",
+        sa.Column(
+            "text_value",
+            sa.Text(),
+            sa.Computed(
+                "CASE WHEN jsonb_typeof(value) = 'string' THEN value #>> '{}' END",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_custom_field_values_value",
+        "custom_field_values",
+        ["value"],
+        postgresql_using="gin",
+        postgresql_ops={"value": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_custom_field_values_field_number",
+        "custom_field_values",
+        ["custom_field_id", "number_value"],
+    )
+    op.create_index(
+        "ix_custom_field_values_field_text",
+        "custom_field_values",
+        ["custom_field_id", "text_value"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the typed projections and store values as JSON again."""
+    op.drop_index("ix_custom_field_values_field_text", table_name="custom_field_values")
+    op.drop_index("ix_custom_field_values_field_number", table_name="custom_field_values")
+    op.drop_index("ix_custom_field_values_value", table_name="custom_field_values")
+    op.drop_column("custom_field_values", "text_value")
+    op.drop_column("custom_field_values", "number_value")
+    op.alter_column(
+        "custom_field_values",
+        "value",
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using="value::json",
+    )
@@ -0,0 +1,38 @@
+"""add_space_access_versions
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: str | None = "d0e1f2a3b4c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create space_access_versions (spaces without a row are at version 0)."""
+    op.create_table(
+        "space_access_versions",
+        sa.Column(
+            "space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("spaces.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("version", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop space_access_versions."""
+    op.drop_table("space_access_versions")
@@ -0,0 +1,50 @@
+"""add_search_indexes
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "f2a3b4c5d6e7"
+down_revision: str | None = "e1f2a3b4c5d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _search_document(title: str, body: str) -> sa.TextClause:
+    # Must match search_document() of the models for the planner to use the index
+    return sa.text(
+        f"(setweight(to_tsvector('simple'::regconfig, coalesce({title}, '')), 'A') || "
+        f"setweight(to_tsvector('simple'::regconfig, coalesce({body}, '')), 'B'))"
+    )
+
+
+def upgrade() -> None:
+    """Index the full-text search documents of live issues and pages."""
+    op.create_index(
+        "ix_issues_search",
+        "issues",
+        [_search_document("title", "description")],
+        postgresql_using="gin",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_pages_search",
+        "pages",
+        [_search_document("title", "content")],
+        postgresql_using="gin",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the search indexes."""
+    op.drop_index("ix_pages_search", table_name="pages")
+    op.drop_index("ix_issues_search", table_name="issues")
@@ -0,0 +1,52 @@
+"""add_typeahead_indexes
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "a3b4c5d6e7f8"
+down_revision: str | None = "f2a3b4c5d6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Trigram indexes serve the typeahead's ILIKE '%term%' lookups
+TRIGRAM_INDEXES = [
+    ("ix_issues_title_trgm", "issues", "title", sa.text("deleted_at IS NULL")),
+    ("ix_projects_name_trgm", "projects", "name", sa.text("deleted_at IS NULL")),
+    ("ix_users_name_trgm", "users", "name", sa.text("deleted_at IS NULL")),
+]
+
+
+def upgrade() -> None:
+    """Index issue keys, recent activity and the names matched by the typeahead."""
+    op.create_index("ix_issues_project_number", "issues", ["project_id", "issue_number"])
+    op.create_index(
+        "ix_issue_activities_user_created", "issue_activities", ["user_id", "created_at"]
+    )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column, where in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            postgresql_where=where,
+        )
+
+
+def downgrade() -> None:
+    """Drop the typeahead indexes (the pg_trgm extension is kept)."""
+    for name, table, _, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
+    op.drop_index("ix_issue_activities_user_created", table_name="issue_activities")
+    op.drop_index("ix_issues_project_number", table_name="issues")
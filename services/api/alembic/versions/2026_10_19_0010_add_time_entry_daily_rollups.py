@@ -0,0 +1,61 @@
+"""add_time_entry_daily_rollups
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "b4c5d6e7f8a9"
+down_revision: str | None = "a3b4c5d6e7f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create time_entry_daily_rollups and fill it from the existing time entries."""
+    op.create_table(
+        "time_entry_daily_rollups",
+        sa.Column(
+            "project_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("hours", sa.Numeric(12, 2), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_time_entry_daily_rollups_user_date",
+        "time_entry_daily_rollups",
+        ["user_id", "date"],
+    )
+
+    # Backfill: hours of every user, project and day
+    op.execute("""
+        INSERT INTO time_entry_daily_rollups (project_id, date, user_id, hours, entry_count)
+        SELECT issues.project_id, time_entries.date, time_entries.user_id,
+               sum(time_entries.hours), count(*)
+        FROM time_entries JOIN issues ON issues.id = time_entries.issue_id
+        GROUP BY issues.project_id, time_entries.date, time_entries.user_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop time_entry_daily_rollups."""
+    op.drop_index("ix_time_entry_daily_rollups_user_date", table_name="time_entry_daily_rollups")
+    op.drop_table("time_entry_daily_rollups")
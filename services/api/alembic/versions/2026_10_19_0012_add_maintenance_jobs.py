@@ -0,0 +1,67 @@
+"""add_maintenance_jobs
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: str | None = "c5d6e7f8a9b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create maintenance_jobs and the indexes the purge jobs scan in order."""
+    op.create_table(
+        "maintenance_jobs",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column(
+            "next_run_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("cursor", sa.Text(), nullable=True),
+        sa.Column("last_started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_purged", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_purged", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+    )
+
+    op.create_index(
+        "ix_issues_deleted_at",
+        "issues",
+        ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_pages_deleted_at",
+        "pages",
+        ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_index("ix_notifications_created_at", "notifications", ["created_at"])
+    op.create_index(
+        "ix_outbox_events_processed",
+        "outbox_events",
+        ["processed_at"],
+        postgresql_where=sa.text("processed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop maintenance_jobs and the purge indexes."""
+    op.drop_index("ix_outbox_events_processed", table_name="outbox_events")
+    op.drop_index("ix_notifications_created_at", table_name="notifications")
+    op.drop_index("ix_pages_deleted_at", table_name="pages")
+    op.drop_index("ix_issues_deleted_at", table_name="issues")
+    op.drop_table("maintenance_jobs")
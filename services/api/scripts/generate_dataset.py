@@ -0,0 +1,788 @@
+#!/usr/bin/env python3
+"""Synthetic large-tenant dataset generator.
+
+Builds one organization sized like a large production tenant: at scale 1,
+200 projects and 1M issues (labels, links, subtasks, sprints, comments,
+activity history) plus 20 spaces holding 50k pages in deep trees with long
+version histories. Sizes scale linearly with `--scale`.
+
+Rows are streamed with PostgreSQL COPY (small tables use multi-row
+INSERTs), which keeps a scale 1 tenant within minutes. The output is
+deterministic: identifiers, content and timestamps derive from `--seed`, so
+two runs with the same seed and scale produce the same rows.
+
+All users share the password `TestPass123!` (as in seed.py).
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+# Add the project root to the path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession  # noqa: E402
+
+from src.application.services.issue_hierarchy_service import IssueHierarchyService  # noqa: E402
+from src.domain.value_objects import Password  # noqa: E402
+from src.infrastructure.database.config import get_engine  # noqa: E402
+from src.infrastructure.database.models import (  # noqa: E402
+    BoardListModel,
+    BoardModel,
+    IssueModel,
+    IssueRollupModel,
+)
+from src.infrastructure.security import BcryptPasswordService  # noqa: E402
+
+DEFAULT_PASSWORD = "TestPass123!"
+DEFAULT_SEED = 42
+
+# Rows sent per COPY command
+COPY_BATCH_SIZE = 10_000
+
+# Board lists created per project board (one per label)
+BOARD_LABEL_LISTS = 8
+
+# Generated history spans two years ending at this date
+HISTORY_END = datetime(2026, 1, 1, tzinfo=UTC)
+HISTORY_DAYS = 730
+SPRINT_DAYS = 14
+# Sprints fit in the history window: large projects get larger sprints
+MAX_SPRINTS_PER_PROJECT = HISTORY_DAYS // SPRINT_DAYS
+
+ISSUE_TYPES = ("task", "task", "task", "bug", "bug", "story", "story", "epic")
+ISSUE_PRIORITIES = ("low", "medium", "medium", "high", "critical")
+OPEN_STATUSES = ("todo", "todo", "in_progress")
+LINK_TYPES = ("blocks", "relates_to", "relates_to", "duplicate")
+ACTIVITY_FIELDS = ("status", "priority", "assignee_id", "title", "story_points")
+WORDS = (
+    "account",
+    "api",
+    "billing",
+    "board",
+    "cache",
+    "dashboard",
+    "editor",
+    "email",
+    "export",
+    "import",
+    "invoice",
+    "login",
+    "migration",
+    "mobile",
+    "notification",
+    "onboarding",
+    "payment",
+    "permission",
+    "report",
+    "search",
+    "settings",
+    "sync",
+    "timeout",
+    "upload",
+    "webhook",
+    "workflow",
+)
+
+
+@dataclass(frozen=True)
+class TenantSize:
+    """Row counts and shape of a generated tenant (defaults are scale 1)."""
+
+    users: int = 2_000
+    projects: int = 200
+    issues: int = 1_000_000
+    # Share of all issues held by the first ("hot") project
+    hot_project_share: float = 0.05
+    labels_per_project: int = 20
+    # Share of each project's issues planned in sprints (the rest is backlog)
+    planned_share: float = 0.6
+    # Issues per sprint (raised for projects too large to fit their sprints
+    # in the two year history)
+    sprint_size: int = 50
+    subtask_share: float = 0.1
+    labels_per_issue: float = 1.5
+    links_per_issue: float = 0.2
+    comments_per_issue: float = 2.0
+    activities_per_issue: float = 3.0
+    spaces: int = 20
+    pages: int = 50_000
+    max_page_depth: int = 12
+    # Mean versions per page (exponentially distributed: most pages have a
+    # few versions, some have very long histories)
+    versions_per_page: float = 5.0
+
+    def scaled(self, factor: float) -> "TenantSize":
+        """Scale the entity counts (ratios and shape are kept)."""
+
+        def scale(count: int) -> int:
+            return max(1, round(count * factor))
+
+        return replace(
+            self,
+            users=scale(self.users),
+            projects=scale(self.projects),
+            issues=scale(self.issues),
+            spaces=scale(self.spaces),
+            pages=scale(self.pages),
+        )
+
+
+@dataclass
+class GeneratedTenant:
+    """Identifiers and row counts of a generated tenant."""
+
+    organization_id: UUID
+    user_ids: list[UUID]
+    # Project ids, the hot project first
+    project_ids: list[UUID]
+    space_ids: list[UUID]
+    board_ids: list[UUID]
+    row_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def admin_user_id(self) -> UUID:
+        """Organization admin (first generated user)."""
+        return self.user_ids[0]
+
+
+class _Random(random.Random):
+    """Seeded random source with dataset helpers."""
+
+    def uuid(self) -> UUID:
+        return uuid.UUID(int=self.getrandbits(128), version=4)
+
+    def sentence(self, words: int) -> str:
+        return " ".join(self.choice(WORDS) for _ in range(words)).capitalize()
+
+    def paragraph(self, sentences: int) -> str:
+        return ". ".join(self.sentence(self.randint(6, 14)) for _ in range(sentences)) + "."
+
+    def count(self, mean: float) -> int:
+        """Random count with the given mean (uniform over 0..2*mean)."""
+        return round(self.uniform(0, 2 * mean))
+
+    def moment(self, after: datetime | None = None) -> datetime:
+        """Random timestamp in the history window (after `after` if given)."""
+        start = after or HISTORY_END - timedelta(days=HISTORY_DAYS)
+        span = max((HISTORY_END - start).total_seconds(), 1.0)
+        return start + timedelta(seconds=self.uniform(0, span))
+
+
+class _CopyWriter:
+    """Buffers rows of one table and sends them with COPY."""
+
+    def __init__(self, table: str, columns: Sequence[str]) -> None:
+        self.table = table
+        self.columns = tuple(columns)
+        self.rows: list[tuple[Any, ...]] = []
+
+    def add(self, *row: Any) -> None:
+        self.rows.append(row)
+
+    async def flush(self, driver_connection: Any) -> int:
+        """Send the buffered rows and return how many were sent."""
+        for start in range(0, len(self.rows), COPY_BATCH_SIZE):
+            await driver_connection.copy_records_to_table(
+                self.table,
+                records=self.rows[start : start + COPY_BATCH_SIZE],
+                columns=self.columns,
+            )
+        count = len(self.rows)
+        self.rows.clear()
+        return count
+
+
+def _issue_counts(size: TenantSize) -> list[int]:
+    """Split the issues between projects (hot project first, the rest evenly)."""
+    if size.projects == 1:
+        return [size.issues]
+    hot = max(1, round(size.issues * size.hot_project_share))
+    others, remainder = divmod(size.issues - hot, size.projects - 1)
+    return [hot] + [others + (1 if index < remainder else 0) for index in range(size.projects - 1)]
+
+
+class _TenantGenerator:
+    """Generates the tenant table by table in foreign key order."""
+
+    def __init__(self, conn: AsyncConnection, size: TenantSize, seed: int) -> None:
+        self.conn = conn
+        self.size = size
+        self.seed = seed
+        self.writers: dict[str, _CopyWriter] = {}
+        self.row_counts: dict[str, int] = {}
+        self.driver_connection: Any = None
+
+    def _rng(self, stream: str) -> _Random:
+        """Independent random stream per entity kind (stable across code changes)."""
+        return _Random(f"{self.seed}:{stream}")
+
+    def _writer(self, table: str, columns: Sequence[str]) -> _CopyWriter:
+        if table not in self.writers:
+            self.writers[table] = _CopyWriter(table, columns)
+        return self.writers[table]
+
+    async def _flush(self, *tables: str) -> None:
+        for table in tables:
+            count = await self.writers[table].flush(self.driver_connection)
+            self.row_counts[table] = self.row_counts.get(table, 0) + count
+
+    async def run(self) -> GeneratedTenant:
+        # The dialect begins transactions lazily: start it before COPYing on the
+        # driver connection so the whole tenant is committed atomically
+        await self.conn.exec_driver_sql("SET LOCAL synchronous_commit TO OFF")
+        raw_connection = await self.conn.get_raw_connection()
+        self.driver_connection = raw_connection.driver_connection
+
+        organization_id, user_ids = await self._users_and_organization()
+        project_ids, board_ids = await self._projects(organization_id, user_ids)
+        space_ids = await self._spaces(organization_id, user_ids)
+
+        return GeneratedTenant(
+            organization_id=organization_id,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            space_ids=space_ids,
+            board_ids=board_ids,
+            row_counts=self.row_counts,
+        )
+
+    async def _users_and_organization(self) -> tuple[UUID, list[UUID]]:
+        rng = self._rng("users")
+        password_hash = BcryptPasswordService().hash(Password(DEFAULT_PASSWORD)).value
+        users = self._writer(
+            "users",
+            ("id", "email", "password_hash", "name", "language", "is_active", "is_verified"),
+        )
+        user_ids = []
+        for index in range(self.size.users):
+            user_id = rng.uuid()
+            user_ids.append(user_id)
+            users.add(
+                user_id,
+                f"user{index}@tenant-{self.seed}.example.com",
+                password_hash,
+                f"User {index}",
+                rng.choice(("en", "en", "fr")),
+                True,
+                True,
+            )
+
+        organization_id = rng.uuid()
+        organizations = self._writer("organizations", ("id", "name", "slug", "description"))
+        organizations.add(
+            organization_id, f"Tenant {self.seed}", f"tenant-{self.seed}", "Generated tenant"
+        )
+        members = self._writer("organization_members", ("organization_id", "user_id", "role"))
+        for index, user_id in enumerate(user_ids):
+            members.add(organization_id, user_id, "admin" if index == 0 else "member")
+
+        await self._flush("users", "organizations", "organization_members")
+        return organization_id, user_ids
+
+    async def _projects(
+        self, organization_id: UUID, user_ids: list[UUID]
+    ) -> tuple[list[UUID], list[UUID]]:
+        rng = self._rng("projects")
+        projects = self._writer(
+            "projects", ("id", "organization_id", "name", "key", "description", "status")
+        )
+        project_members = self._writer("project_members", ("project_id", "user_id", "role"))
+        labels = self._writer("labels", ("id", "project_id", "name", "color"))
+
+        project_ids = []
+        project_labels: dict[UUID, list[UUID]] = {}
+        for index in range(self.size.projects):
+            project_id = rng.uuid()
+            project_ids.append(project_id)
+            projects.add(
+                project_id,
+                organization_id,
+                f"Project {index}",
+                f"P{index}",
+                rng.sentence(8),
+                "in-progress",
+            )
+            team = rng.sample(user_ids, min(len(user_ids), 15))
+            if user_ids[0] not in team:
+                team[0] = user_ids[0]
+            for member_index, user_id in enumerate(team):
+                project_members.add(project_id, user_id, "admin" if member_index == 0 else "member")
+            project_labels[project_id] = []
+            for label_index in range(self.size.labels_per_project):
+                label_id = rng.uuid()
+                project_labels[project_id].append(label_id)
+                labels.add(
+                    label_id, project_id, f"label-{label_index}", f"#{rng.getrandbits(24):06x}"
+                )
+        await self._flush("projects", "project_members", "labels")
+
+        # Issues are numbered 1..n: counters continue from there, as the API allocates
+        counters = self._writer("project_issue_counters", ("project_id", "last_issue_number"))
+        for project_id, issue_count in zip(project_ids, _issue_counts(self.size), strict=True):
+            await self._project_issues(
+                project_id, issue_count, project_labels[project_id], user_ids
+            )
+            counters.add(project_id, issue_count)
+        await self._flush("project_issue_counters")
+
+        await self._issue_rollups(project_ids)
+        board_ids = await self._boards(project_ids, project_labels, user_ids[0])
+        return project_ids, board_ids
+
+    async def _issue_rollups(self, project_ids: list[UUID]) -> None:
+        """Rollups of the parent issues, as the application maintains them."""
+        async with AsyncSession(bind=self.conn) as session:
+            hierarchy = IssueHierarchyService(session)
+            for project_id in project_ids:
+                await hierarchy.rebuild_project_rollups(project_id)
+            result = await session.execute(
+                select(func.count())
+                .select_from(IssueRollupModel)
+                .join(IssueModel, IssueModel.id == IssueRollupModel.issue_id)
+                .where(IssueModel.project_id.in_(project_ids))
+            )
+            self.row_counts["issue_rollups"] = result.scalar_one()
+
+    async def _project_issues(
+        self, project_id: UUID, issue_count: int, label_ids: list[UUID], user_ids: list[UUID]
+    ) -> None:
+        """Issues of one project with their labels, links, sprints, comments and activities."""
+        size = self.size
+        rng = self._rng(f"issues:{project_id}")
+        issues = self._writer(
+            "issues",
+            (
+                "id",
+                "project_id",
+                "issue_number",
+                "title",
+                "description",
+                "type",
+                "status",
+                "priority",
+                "reporter_id",
+                "assignee_id",
+                "due_date",
+                "story_points",
+                "backlog_order",
+                "parent_issue_id",
+                "created_at",
+                "updated_at",
+            ),
+        )
+        issue_labels = self._writer("issue_labels", ("id", "issue_id", "label_id"))
+        issue_links = self._writer(
+            "issue_links", ("id", "source_issue_id", "target_issue_id", "link_type")
+        )
+        comments = self._writer(
+            "comments",
+            (
+                "id",
+                "entity_type",
+                "entity_id",
+                "issue_id",
+                "user_id",
+                "content",
+                "is_edited",
+                "created_at",
+                "updated_at",
+            ),
+        )
+        activities = self._writer(
+            "issue_activities",
+            (
+                "id",
+                "issue_id",
+                "user_id",
+                "action",
+                "field_name",
+                "old_value",
+                "new_value",
+                "created_at",
+                "updated_at",
+            ),
+        )
+        team = rng.sample(user_ids, min(len(user_ids), 15))
+
+        # The oldest issues are planned in sprints (completed, then one active)
+        planned = round(issue_count * size.planned_share)
+        sprint_size = max(size.sprint_size, -(-planned // MAX_SPRINTS_PER_PROJECT))
+        sprint_count = -(-planned // sprint_size)
+        first_sprint_start = HISTORY_END - timedelta(days=SPRINT_DAYS * sprint_count)
+
+        issue_ids: list[UUID] = []
+        for index in range(issue_count):
+            issue_id = rng.uuid()
+            sprint_index = index // sprint_size if index < planned else None
+            completed = sprint_index is not None and sprint_index < sprint_count - 1
+            if sprint_index is not None:
+                # Planned issues exist before their sprint starts
+                sprint_start = first_sprint_start + timedelta(days=SPRINT_DAYS * sprint_index)
+                created_at = min(rng.moment(), sprint_start)
+            else:
+                created_at = rng.moment(after=first_sprint_start)
+            status = "done" if completed and rng.random() < 0.85 else rng.choice(OPEN_STATUSES)
+            parent_id = (
+                rng.choice(issue_ids[-200:])
+                if issue_ids and rng.random() < size.subtask_share
+                else None
+            )
+            issues.add(
+                issue_id,
+                project_id,
+                index + 1,
+                rng.sentence(rng.randint(3, 8))[:255],
+                rng.paragraph(rng.randint(1, 5)),
+                "task" if parent_id else rng.choice(ISSUE_TYPES),
+                status,
+                rng.choice(ISSUE_PRIORITIES),
+                rng.choice(team),
+                rng.choice(team) if rng.random() < 0.9 else None,
+                (
+                    (created_at + timedelta(days=rng.randint(7, 60))).date()
+                    if rng.random() < 0.2
+                    else None
+                ),
+                rng.choice((1, 2, 3, 5, 8, 13)) if rng.random() < 0.8 else None,
+                index - planned if sprint_index is None else None,
+                parent_id,
+                created_at,
+                rng.moment(after=created_at),
+            )
+
+            for label_id in rng.sample(
+                label_ids, min(len(label_ids), rng.count(size.labels_per_issue))
+            ):
+                issue_labels.add(rng.uuid(), issue_id, label_id)
+            if issue_ids and rng.random() < size.links_per_issue:
+                issue_links.add(rng.uuid(), issue_id, rng.choice(issue_ids), rng.choice(LINK_TYPES))
+            for _ in range(rng.count(size.comments_per_issue)):
+                commented_at = rng.moment(after=created_at)
+                comments.add(
+                    rng.uuid(),
+                    "issue",
+                    issue_id,
+                    issue_id,
+                    rng.choice(team),
+                    rng.paragraph(rng.randint(1, 3)),
+                    False,
+                    commented_at,
+                    commented_at,
+                )
+            self._issue_activities(rng, activities, issue_id, created_at, team)
+            issue_ids.append(issue_id)
+
+        await self._flush("issues", "issue_labels", "issue_links", "comments", "issue_activities")
+        await self._sprints(
+            rng, project_id, issue_ids[:planned], sprint_size, sprint_count, first_sprint_start
+        )
+
+    def _issue_activities(
+        self,
+        rng: _Random,
+        activities: _CopyWriter,
+        issue_id: UUID,
+        created_at: datetime,
+        team: list[UUID],
+    ) -> None:
+        """Creation entry followed by field changes in chronological order."""
+        activities.add(
+            rng.uuid(),
+            issue_id,
+            rng.choice(team),
+            "created",
+            None,
+            None,
+            None,
+            created_at,
+            created_at,
+        )
+        changed_at = created_at
+        for _ in range(max(0, rng.count(self.size.activities_per_issue) - 1)):
+            changed_at = rng.moment(after=changed_at)
+            field_name = rng.choice(ACTIVITY_FIELDS)
+            action = {"status": "status_changed", "assignee_id": "assigned"}.get(
+                field_name, "updated"
+            )
+            activities.add(
+                rng.uuid(),
+                issue_id,
+                rng.choice(team),
+                action,
+                field_name,
+                rng.choice(WORDS),
+                rng.choice(WORDS),
+                changed_at,
+                changed_at,
+            )
+
+    async def _sprints(
+        self,
+        rng: _Random,
+        project_id: UUID,
+        planned_issue_ids: list[UUID],
+        sprint_size: int,
+        sprint_count: int,
+        first_sprint_start: datetime,
+    ) -> None:
+        sprints = self._writer(
+            "sprints", ("id", "project_id", "name", "goal", "start_date", "end_date", "status")
+        )
+        sprint_issues = self._writer("sprint_issues", ("sprint_id", "issue_id", "order"))
+        for index in range(sprint_count):
+            sprint_id = rng.uuid()
+            start: date = (first_sprint_start + timedelta(days=SPRINT_DAYS * index)).date()
+            sprints.add(
+                sprint_id,
+                project_id,
+                f"Sprint {index + 1}",
+                rng.sentence(6),
+                start,
+                start + timedelta(days=SPRINT_DAYS),
+                "active" if index == sprint_count - 1 else "completed",
+            )
+            members = planned_issue_ids[index * sprint_size : (index + 1) * sprint_size]
+            for order, issue_id in enumerate(members):
+                sprint_issues.add(sprint_id, issue_id, order)
+        await self._flush("sprints", "sprint_issues")
+
+    async def _boards(
+        self,
+        project_ids: list[UUID],
+        project_labels: dict[UUID, list[UUID]],
+        created_by: UUID,
+    ) -> list[UUID]:
+        """One default board per project with a list per label (JSON config: plain INSERTs)."""
+        rng = self._rng("boards")
+        boards = []
+        board_lists = []
+        for project_id in project_ids:
+            board_id = rng.uuid()
+            boards.append(
+                {
+                    "id": board_id,
+                    "project_id": project_id,
+                    "name": "Board",
+                    "is_default": True,
+                    "board_type": "project",
+                    "swimlane_type": "none",
+                    "position": 0,
+                    "created_by": created_by,
+                }
+            )
+            for position, label_id in enumerate(project_labels[project_id][:BOARD_LABEL_LISTS]):
+                board_lists.append(
+                    {
+                        "id": rng.uuid(),
+                        "board_id": board_id,
+                        "list_type": "label",
+                        "list_config": {"label_id": str(label_id)},
+                        "position": position,
+                    }
+                )
+        await self.conn.execute(insert(BoardModel.__table__), boards)
+        if board_lists:
+            await self.conn.execute(insert(BoardListModel.__table__), board_lists)
+        self.row_counts["boards"] = len(boards)
+        self.row_counts["board_lists"] = len(board_lists)
+        return [board["id"] for board in boards]
+
+    async def _spaces(self, organization_id: UUID, user_ids: list[UUID]) -> list[UUID]:
+        rng = self._rng("spaces")
+        spaces = self._writer(
+            "spaces",
+            (
+                "id",
+                "organization_id",
+                "name",
+                "key",
+                "description",
+                "status",
+                "view_count",
+                "created_by",
+            ),
+        )
+        space_ids = []
+        for index in range(self.size.spaces):
+            space_id = rng.uuid()
+            space_ids.append(space_id)
+            spaces.add(
+                space_id,
+                organization_id,
+                f"Space {index}",
+                f"S{index}",
+                rng.sentence(8),
+                "published",
+                rng.randint(0, 10_000),
+                user_ids[0],
+            )
+        await self._flush("spaces")
+
+        base, remainder = divmod(self.size.pages, self.size.spaces)
+        for index, space_id in enumerate(space_ids):
+            await self._space_pages(space_id, base + (1 if index < remainder else 0), user_ids)
+        return space_ids
+
+    async def _space_pages(self, space_id: UUID, page_count: int, user_ids: list[UUID]) -> None:
+        """Pages of one space (deep trees) and their version histories."""
+        rng = self._rng(f"pages:{space_id}")
+        pages = self._writer(
+            "pages",
+            (
+                "id",
+                "space_id",
+                "parent_id",
+                "title",
+                "slug",
+                "content",
+                "created_by",
+                "updated_by",
+                "position",
+                "created_at",
+                "updated_at",
+            ),
+        )
+        versions = self._writer(
+            "page_versions",
+            (
+                "id",
+                "page_id",
+                "version_number",
+                "title",
+                "content",
+                "created_by",
+                "created_at",
+                "updated_at",
+            ),
+        )
+        authors = rng.sample(user_ids, min(len(user_ids), 30))
+        depths: dict[UUID, int] = {}
+        children: dict[UUID | None, int] = {}
+        recent: list[UUID] = []
+        for index in range(page_count):
+            # Mostly nest under a recently created page: produces deep, bushy trees
+            candidates = [
+                page_id for page_id in recent if depths[page_id] < self.size.max_page_depth
+            ]
+            parent_id = rng.choice(candidates) if candidates and rng.random() < 0.9 else None
+            page_id = rng.uuid()
+            depths[page_id] = depths[parent_id] + 1 if parent_id else 1
+            position = children.get(parent_id, 0)
+            children[parent_id] = position + 1
+            recent = [*recent[-19:], page_id]
+
+            title = f"{rng.sentence(rng.randint(2, 6))} {index}"
+            created_at = rng.moment()
+            author = rng.choice(authors)
+            version_count = min(200, 1 + int(rng.expovariate(1 / self.size.versions_per_page)))
+            version_at = created_at
+            for version_number in range(1, version_count + 1):
+                versions.add(
+                    rng.uuid(),
+                    page_id,
+                    version_number,
+                    title,
+                    rng.paragraph(rng.randint(2, 6)),
+                    rng.choice(authors),
+                    version_at,
+                    version_at,
+                )
+                version_at = rng.moment(after=version_at)
+            pages.add(
+                page_id,
+                space_id,
+                parent_id,
+                title,
+                f"page-{index}",
+                "<p>" + "</p><p>".join(rng.paragraph(4) for _ in range(rng.randint(2, 8))) + "</p>",
+                author,
+                rng.choice(authors),
+                position,
+                created_at,
+                version_at,
+            )
+        await self._flush("pages", "page_versions")
+
+
+async def generate_tenant(
+    conn: AsyncConnection, size: TenantSize | None = None, seed: int = DEFAULT_SEED
+) -> GeneratedTenant:
+    """Generate a tenant on a connection.
+
+    Args:
+        conn: Connection inside a transaction (committed by the caller)
+        size: Tenant size (defaults to scale 1)
+        seed: Random seed; same seed and size generate the same rows
+
+    Returns:
+        Identifiers and row counts of the generated tenant
+    """
+    return await _TenantGenerator(conn, size or TenantSize(), seed).run()
+
+
+async def generate(scale: float, seed: int) -> None:
+    """Generate a tenant in the configured database."""
+    size = TenantSize().scaled(scale)
+    print(
+        f"🏭 Generating tenant (scale={scale}, seed={seed}): {size.projects} projects, "
+        f"{size.issues} issues, {size.pages} pages, {size.users} users"
+    )
+    started = time.perf_counter()
+    engine = get_engine()
+    async with engine.begin() as conn:
+        tenant = await generate_tenant(conn, size, seed)
+    await engine.dispose()
+
+    for table, count in sorted(tenant.row_counts.items()):
+        print(f"  {table:<22} {count:>10}")
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+    print(f"   Organization: {tenant.organization_id}")
+    print(f"   Admin login:  user0@tenant-{seed}.example.com / {DEFAULT_PASSWORD}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate a large synthetic tenant",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scale 1: 200 projects, 1M issues, 50k pages
+  python scripts/generate_dataset.py
+
+  # Small tenant (2 projects, 10k issues, 500 pages)
+  python scripts/generate_dataset.py --scale 0.01
+
+  # Several tenants in the same database (one per seed)
+  python scripts/generate_dataset.py --scale 0.1 --seed 1
+  python scripts/generate_dataset.py --scale 0.1 --seed 2
+        """,
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Linear size factor (default: 1.0)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Random seed, also makes the tenant's slugs and emails unique (default: {DEFAULT_SEED})",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(generate(args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
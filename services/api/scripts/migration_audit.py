@@ -6,19 +6,32 @@ Ce script permet de :
 - Détecter les colonnes, index et contraintes manquants
 - Générer un script SQL pour appliquer les corrections
 - Vérifier l'état des migrations Alembic
+- Proposer des index composites et partiels à partir de la charge réelle
+  (pg_stat_statements ou journal des requêtes lentes) et générer la migration
+  Alembic correspondante (CREATE INDEX CONCURRENTLY)
 """
 
 import argparse
 import asyncio
+import hashlib
+import json
+import math
+import re
 import sys
+import uuid
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import inspect  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from alembic.script import ScriptDirectory  # noqa: E402
+from sqlalchemy import inspect, text  # noqa: E402
 
 from src.infrastructure.database.config import Base, get_engine  # noqa: E402
 from src.infrastructure.database.models import *  # noqa: F403, F401, E402
@@ -84,9 +97,11 @@ def get_model_structure():
 
         indexes = {}
         for index in table.indexes:
+            where = index.dialect_options["postgresql"]["where"]
             indexes[index.name] = {
                 "columns": [col.name for col in index.columns],
                 "unique": index.unique,
+                "where": str(where) if where is not None else None,
             }
 
         foreign_keys = []
@@ -217,6 +232,583 @@ def generate_sql_fix(issues, model_structure):
     return "\n".join(sql_lines)
 
 
+# ---------------------------------------------------------------------------
+# Index advisor
+# ---------------------------------------------------------------------------
+
+# SELECTs of the database the app uses, heaviest first (PostgreSQL 13+)
+_PG_STAT_STATEMENTS_QUERY = text(r"""
+    SELECT query, calls, total_exec_time
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+      AND query ~* '^\s*(WITH|SELECT)\s'
+    ORDER BY total_exec_time DESC
+    LIMIT :limit
+    """)
+
+_SQL_KEYWORDS = {
+    "as", "cross", "full", "group", "having", "inner", "join", "lateral", "left", "limit",
+    "natural", "offset", "on", "order", "outer", "right", "union", "using", "where", "window",
+}  # fmt: skip
+
+_TABLE_REF = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+_COLUMN_REF = r'"?(\w+)"?\."?(\w+)"?'
+_PREDICATE = re.compile(
+    _COLUMN_REF + r"\s*(IS\s+NOT\s+NULL|IS\s+NULL|NOT\s+IN\b|IN\b|BETWEEN\b|"
+    r"NOT\s+I?LIKE\b|I?LIKE\b|<=|>=|<>|!=|=|<|>)\s*([^\s,]*)",
+    re.IGNORECASE,
+)
+_CONDITION_START = re.compile(r"\b(?:WHERE|ON)\b", re.IGNORECASE)
+_CONDITION_END = re.compile(
+    r"\b(?:WHERE|JOIN|GROUP\s+BY|ORDER\s+BY|LIMIT|OFFSET|HAVING|UNION|RETURNING|FOR\s+UPDATE)\b",
+    re.IGNORECASE,
+)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+_ORDER_BY_END = re.compile(r"\b(?:LIMIT|OFFSET|FOR|FETCH)\b", re.IGNORECASE)
+
+# PostgreSQL truncates identifiers beyond 63 bytes
+_MAX_IDENTIFIER_LENGTH = 63
+_PAGE_SIZE = 8192
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """A normalized statement of the workload and what it cost."""
+
+    query: str
+    calls: int
+    total_ms: float
+
+
+@dataclass(frozen=True)
+class IndexCandidate:
+    """A composite (and possibly partial) btree index a query could use.
+
+    Equality columns come first (in any order for the query), then the
+    columns the query sorts on or filters by range, in that order.
+    """
+
+    table: str
+    equality: tuple[str, ...]
+    ordering: tuple[str, ...] = ()
+    where: str | None = None
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Indexed columns, in index order."""
+        return self.equality + self.ordering
+
+    @property
+    def name(self) -> str:
+        """Index name (ix_<table>_<columns>[_partial], hashed when too long)."""
+        name = f"ix_{self.table}_{'_'.join(self.columns)}" + ("_partial" if self.where else "")
+        if len(name) <= _MAX_IDENTIFIER_LENGTH:
+            return name
+        digest = hashlib.md5(name.encode(), usedforsecurity=False).hexdigest()[:8]
+        return f"{name[: _MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+
+    def is_served_by(self, columns: Sequence[str], where: str | None) -> bool:
+        """Whether an index on `columns` (with predicate `where`) serves this candidate.
+
+        A full index serves a partial candidate too, but less well: it is
+        not counted, the point of the candidate is the smaller index.
+        """
+        if _normalize_predicate(where) != _normalize_predicate(self.where):
+            return False
+        size = len(self.equality)
+        return (
+            set(columns[:size]) == set(self.equality)
+            and tuple(columns[size : size + len(self.ordering)]) == self.ordering
+        )
+
+
+@dataclass
+class IndexAdvice:
+    """An index candidate with the workload it would serve."""
+
+    candidate: IndexCandidate
+    calls: int = 0
+    total_ms: float = 0.0
+    queries: int = 0
+    estimated_bytes: int | None = None
+
+
+def parse_query_shape(query: str, tables: dict[str, set[str]]) -> list[IndexCandidate]:
+    """Index candidates of a statement (at most one per table it filters).
+
+    The statement is read with a few patterns matching what SQLAlchemy
+    renders (columns qualified by their table or alias): equality and IN
+    predicates become the leading columns, the outer ORDER BY (else the
+    first range predicate) the trailing ones, and `IS NULL`/`IS NOT NULL`
+    predicates the condition of a partial index. Predicates of subqueries
+    count for the tables they name too, so the result is a suggestion to
+    review, not a plan.
+
+    Args:
+        query: SQL statement (parameters as placeholders)
+        tables: Columns of each known table
+
+    Returns:
+        Index candidates
+    """
+    aliases: dict[str, str] = {}
+    for match in _TABLE_REF.finditer(query):
+        table, alias = match.group(1), match.group(2)
+        if table not in tables:
+            continue
+        aliases[table] = table
+        if alias and alias.lower() not in _SQL_KEYWORDS:
+            aliases[alias] = table
+
+    equality: dict[str, list[str]] = defaultdict(list)
+    ranges: dict[str, list[str]] = defaultdict(list)
+    conditions: dict[str, set[str]] = defaultdict(set)
+
+    for segment in _condition_segments(query):
+        for alias, column, operator, operand in _PREDICATE.findall(segment):
+            table = aliases.get(alias)
+            if table is None or column not in tables[table]:
+                continue
+            operator = " ".join(operator.upper().split())
+            if operator in ("IS NULL", "IS NOT NULL"):
+                conditions[table].add(f"{column} {operator}")
+            elif re.fullmatch(_COLUMN_REF, operand):
+                # Join condition between two columns
+                continue
+            elif operator in ("=", "IN"):
+                _append_once(equality[table], column)
+            elif operator in ("<", "<=", ">", ">=", "BETWEEN"):
+                _append_once(ranges[table], column)
+
+    ordering_table, ordering = _outer_ordering(query, aliases, tables)
+
+    filtered = set(equality) | set(ranges) | set(conditions)
+    if ordering_table is not None:
+        filtered.add(ordering_table)
+
+    candidates = []
+    for table in sorted(filtered):
+        partial = {condition.split()[0] for condition in conditions[table]}
+        leading = tuple(column for column in equality[table] if column not in partial)
+        trailing_columns = ordering if table == ordering_table else tuple(ranges[table][:1])
+        trailing = tuple(
+            column for column in trailing_columns if column not in leading and column not in partial
+        )
+        where = " AND ".join(sorted(conditions[table])) or None
+        if len(leading) + len(trailing) >= 2 or (where and (leading or trailing)):
+            candidates.append(IndexCandidate(table, leading, trailing, where))
+    return candidates
+
+
+def advise_indexes(
+    workload: Iterable[QueryShape],
+    tables: dict[str, set[str]],
+    existing_indexes: dict[str, list[tuple[list[str], str | None]]],
+) -> list[IndexAdvice]:
+    """Rank the index candidates of a workload by the time of the queries they serve.
+
+    Candidates an existing index already serves are dropped, and so are the
+    ones a heavier candidate also serves (their workload is added to it).
+
+    Args:
+        workload: Statements of the workload
+        tables: Columns of each known table
+        existing_indexes: Columns and predicate of the existing indexes, per table
+
+    Returns:
+        Advice, heaviest first
+    """
+    advice: dict[IndexCandidate, IndexAdvice] = {}
+    for shape in workload:
+        for candidate in parse_query_shape(shape.query, tables):
+            if any(
+                candidate.is_served_by(columns, where)
+                for columns, where in existing_indexes.get(candidate.table, [])
+            ):
+                continue
+            entry = advice.setdefault(candidate, IndexAdvice(candidate))
+            entry.calls += shape.calls
+            entry.total_ms += shape.total_ms
+            entry.queries += 1
+
+    ranked: list[IndexAdvice] = []
+    for entry in sorted(advice.values(), key=lambda entry: entry.total_ms, reverse=True):
+        covering = next(
+            (
+                kept
+                for kept in ranked
+                if kept.candidate.table == entry.candidate.table
+                and entry.candidate.is_served_by(kept.candidate.columns, kept.candidate.where)
+            ),
+            None,
+        )
+        if covering is None:
+            ranked.append(entry)
+        else:
+            covering.calls += entry.calls
+            covering.total_ms += entry.total_ms
+            covering.queries += entry.queries
+    return sorted(ranked, key=lambda entry: entry.total_ms, reverse=True)
+
+
+def estimate_index_size(
+    row_count: float,
+    column_widths: Sequence[float],
+    selected_fraction: float = 1.0,
+) -> int:
+    """Rough size in bytes of a btree index.
+
+    Each leaf entry holds an 8 byte tuple header and the key (MAXALIGNed)
+    plus a 4 byte line pointer, leaf pages are filled to the default 90%
+    fillfactor and the inner pages add about 1%.
+
+    Args:
+        row_count: Rows of the table (pg_class.reltuples)
+        column_widths: Average width of each indexed column (pg_stats.avg_width)
+        selected_fraction: Share of the rows a partial index keeps
+
+    Returns:
+        Estimated size in bytes
+    """
+    rows = max(row_count, 0) * selected_fraction
+    entry_bytes = 8 + math.ceil(sum(column_widths) / 8) * 8 + 4
+    usable_page_bytes = (_PAGE_SIZE - 24) * 0.9
+    leaf_pages = math.ceil(rows * entry_bytes / usable_page_bytes)
+    return math.ceil(leaf_pages * 1.01 + 1) * _PAGE_SIZE
+
+
+def load_captured_queries(path: Path) -> list[QueryShape]:
+    """Workload captured by the app's slow query log.
+
+    Reads the JSON log lines of the API ("Slow query" events, with
+    `statement` and `duration_ms`), other lines are skipped. Statements are
+    grouped by their text (parameters are placeholders).
+    """
+    calls: dict[str, int] = defaultdict(int)
+    total_ms: dict[str, float] = defaultdict(float)
+    for line in path.read_text().splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict) or "statement" not in event:
+            continue
+        query = " ".join(str(event["statement"]).split())
+        calls[query] += 1
+        total_ms[query] += float(event.get("duration_ms") or 0)
+    return [QueryShape(query, calls[query], total_ms[query]) for query in calls]
+
+
+async def load_pg_stat_statements(conn, limit: int) -> list[QueryShape]:
+    """Heaviest SELECT statements recorded by pg_stat_statements."""
+    result = await conn.execute(_PG_STAT_STATEMENTS_QUERY, {"limit": limit})
+    return [
+        QueryShape(" ".join(row.query.split()), int(row.calls), float(row.total_exec_time))
+        for row in result
+    ]
+
+
+async def estimate_sizes(conn, advice: list[IndexAdvice]) -> None:
+    """Fill in the estimated size of the advised indexes from the table statistics."""
+    for entry in advice:
+        candidate = entry.candidate
+        row_count = await conn.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": candidate.table},
+        )
+        if row_count is None or row_count < 0:
+            # Table never analyzed
+            continue
+        result = await conn.execute(
+            text(
+                "SELECT attname, avg_width, null_frac FROM pg_stats "
+                "WHERE schemaname = current_schema() AND tablename = :table"
+            ),
+            {"table": candidate.table},
+        )
+        stats = {row.attname: (row.avg_width, row.null_frac) for row in result}
+        widths = [stats.get(column, (8, 0.0))[0] for column in candidate.columns]
+        selected_fraction = 1.0
+        for condition in candidate.where.split(" AND ") if candidate.where else []:
+            column, _, operator = condition.partition(" ")
+            null_frac = stats.get(column, (8, 0.0))[1]
+            selected_fraction *= null_frac if operator == "IS NULL" else 1 - null_frac
+        entry.estimated_bytes = estimate_index_size(row_count, widths, selected_fraction)
+
+
+def render_index_migration(
+    advice: list[IndexAdvice],
+    revision: str,
+    down_revision: str | None,
+    create_date: datetime,
+    source: str,
+) -> str:
+    """Alembic migration creating the advised indexes with CREATE INDEX CONCURRENTLY.
+
+    Args:
+        advice: Indexes to create
+        revision: Revision ID of the migration
+        down_revision: Current head
+        create_date: Creation date
+        source: Where the workload came from
+
+    Returns:
+        Source of the migration module
+    """
+    upgrade, downgrade = [], []
+    for entry in advice:
+        candidate = entry.candidate
+        name, table = json.dumps(candidate.name), json.dumps(candidate.table)
+        size = f", ~{entry.estimated_bytes / 1024 / 1024:.1f} MB" if entry.estimated_bytes else ""
+        where = (
+            f"            postgresql_where=sa.text({json.dumps(candidate.where)}),\n"
+            if candidate.where
+            else ""
+        )
+        upgrade.append(
+            f"        # {entry.calls} calls, {entry.total_ms:.0f} ms total over "
+            f"{entry.queries} statement(s){size}\n"
+            "        op.create_index(\n"
+            f"            {name},\n"
+            f"            {table},\n"
+            f"            {json.dumps(list(candidate.columns))},\n"
+            f"{where}"
+            "            postgresql_concurrently=True,\n"
+            "            if_not_exists=True,\n"
+            "        )"
+        )
+        downgrade.append(
+            "        op.drop_index(\n"
+            f"            {name},\n"
+            f"            table_name={table},\n"
+            "            postgresql_concurrently=True,\n"
+            "            if_exists=True,\n"
+            "        )"
+        )
+
+    lines = [
+        '"""add_advised_indexes',
+        "",
+        f"Revision ID: {revision}",
+        f"Revises: {down_revision}",
+        f"Create Date: {create_date:%Y-%m-%d %H:%M}",
+        "",
+        f"Generated by scripts/migration_audit.py --advise-indexes from {source}.",
+        "Review the indexes (and declare them on the models) before applying.",
+        '"""',
+        "",
+        "from collections.abc import Sequence",
+        "",
+    ]
+    if any(entry.candidate.where for entry in advice):
+        lines += ["import sqlalchemy as sa", ""]
+    lines += [
+        "from alembic import op",
+        "",
+        f'revision: str = "{revision}"',
+        f"down_revision: str | None = {json.dumps(down_revision) if down_revision else None}",
+        "branch_labels: str | Sequence[str] | None = None",
+        "depends_on: str | Sequence[str] | None = None",
+        "",
+        "",
+        "def upgrade() -> None:",
+        '    """Create the advised indexes without blocking writes."""',
+        "    # CREATE INDEX CONCURRENTLY cannot run inside a transaction",
+        "    with op.get_context().autocommit_block():",
+        *upgrade,
+        "",
+        "",
+        "def downgrade() -> None:",
+        '    """Drop the advised indexes."""',
+        "    with op.get_context().autocommit_block():",
+        *downgrade,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_index_migration(advice: list[IndexAdvice], source: str) -> Path:
+    """Write the migration of the advised indexes after the current Alembic head."""
+    config = Config(str(project_root / "alembic.ini"))
+    config.set_main_option("script_location", str(project_root / "alembic"))
+    head = ScriptDirectory.from_config(config).get_current_head()
+    revision = uuid.uuid4().hex[:12]
+    now = datetime.now()
+    output_file = (
+        project_root
+        / "alembic"
+        / "versions"
+        / f"{now:%Y_%m_%d_%H%M}_{revision}_add_advised_indexes.py"
+    )
+    output_file.write_text(render_index_migration(advice, revision, head, now, source))
+    return output_file
+
+
+def get_existing_indexes(db_structure, model_structure):
+    """Columns and predicate of the indexes in the database or declared on the models."""
+    existing = defaultdict(list)
+    for table_name, table in db_structure.items():
+        for index in table["indexes"].values():
+            where = index.get("dialect_options", {}).get("postgresql_where")
+            existing[table_name].append((index["column_names"], where))
+    for table_name, table in model_structure.items():
+        for index in table["indexes"].values():
+            existing[table_name].append((index["columns"], index["where"]))
+    return existing
+
+
+async def advise_indexes_for_workload(
+    workload_file=None,
+    top=10,
+    min_calls=1,
+    statements_limit=500,
+    generate_migration=False,
+):
+    """Index advisor entry point."""
+    print("=" * 80)
+    print("CONSEILLER D'INDEX")
+    print("=" * 80)
+    print()
+
+    if workload_file is not None:
+        source = f"the slow query log {workload_file.name}"
+        print(f"📊 Lecture des requêtes capturées dans {workload_file}...")
+        workload = load_captured_queries(workload_file)
+    else:
+        source = "pg_stat_statements"
+        print("📊 Lecture de pg_stat_statements...")
+        engine = get_engine()
+        try:
+            async with engine.connect() as conn:
+                workload = await load_pg_stat_statements(conn, statements_limit)
+        except Exception as e:
+            print(f"   ❌ Erreur: {str(e).splitlines()[0]}")
+            print("   pg_stat_statements doit être chargé (shared_preload_libraries)")
+            print("   et installé : CREATE EXTENSION pg_stat_statements;")
+            print("   Sinon, utilisez --workload-file avec le journal des requêtes lentes.")
+            return 1
+        finally:
+            await engine.dispose()
+    workload = [shape for shape in workload if shape.calls >= min_calls]
+    print(f"   ✅ {len(workload)} requêtes analysées")
+
+    print("📊 Récupération des index existants...")
+    try:
+        db_structure = await get_db_structure()
+    except Exception as e:
+        print(f"   ❌ Erreur: {e}")
+        return 1
+    model_structure = get_model_structure()
+    tables = {table_name: set(table["columns"]) for table_name, table in model_structure.items()}
+    existing = get_existing_indexes(db_structure, model_structure)
+
+    advice = advise_indexes(workload, tables, existing)[:top]
+    engine = get_engine()
+    try:
+        async with engine.connect() as conn:
+            await estimate_sizes(conn, advice)
+    finally:
+        await engine.dispose()
+    print()
+
+    if not advice:
+        print("✅ Aucun index composite à proposer pour cette charge.")
+        return 0
+
+    print("=" * 80)
+    print(f"INDEX PROPOSÉS ({len(advice)})")
+    print("=" * 80)
+    print()
+    for entry in advice:
+        candidate = entry.candidate
+        size = _format_size(entry.estimated_bytes) if entry.estimated_bytes else "inconnue"
+        print(f"➕ {candidate.name}")
+        print(f"   ON {candidate.table} ({', '.join(candidate.columns)})")
+        if candidate.where:
+            print(f"   WHERE {candidate.where}")
+        print(
+            f"   {entry.calls} appels, {entry.total_ms:.0f} ms au total, "
+            f"{entry.queries} requête(s), taille estimée : {size}"
+        )
+        print()
+
+    if generate_migration:
+        output_file = write_index_migration(advice, source)
+        print(f"📝 Migration Alembic générée : {output_file}")
+        print("   Vérifiez-la et déclarez les index sur les modèles, puis appliquez-la avec :")
+        print("   alembic upgrade head")
+        print()
+
+    return 0
+
+
+def _condition_segments(query: str) -> list[str]:
+    """Text of each WHERE and ON clause of a statement."""
+    segments = []
+    for start in _CONDITION_START.finditer(query):
+        end = _CONDITION_END.search(query, start.end())
+        segments.append(query[start.end() : end.start() if end else len(query)])
+    return segments
+
+
+def _outer_ordering(
+    query: str, aliases: dict[str, str], tables: dict[str, set[str]]
+) -> tuple[str | None, tuple[str, ...]]:
+    """Table and columns of the outer ORDER BY, when it sorts on columns of one table."""
+    depths = _paren_depths(query)
+    outer = [match for match in _ORDER_BY.finditer(query) if depths[match.start()] == 0]
+    if not outer:
+        return None, ()
+    start = outer[-1].end()
+    end = _ORDER_BY_END.search(query, start)
+    clause = query[start : end.start() if end else len(query)]
+
+    ordering_table: str | None = None
+    columns: list[str] = []
+    for item in clause.split(","):
+        match = re.match(r"\s*" + _COLUMN_REF, item)
+        table = aliases.get(match.group(1)) if match else None
+        if table is None or match.group(2) not in tables[table]:
+            return None, ()
+        if ordering_table not in (None, table):
+            return None, ()
+        ordering_table = table
+        _append_once(columns, match.group(2))
+    return ordering_table, tuple(columns)
+
+
+def _paren_depths(query: str) -> list[int]:
+    """Parenthesis depth at each position of a statement."""
+    depths, depth = [], 0
+    for char in query:
+        if char == ")":
+            depth -= 1
+        depths.append(depth)
+        if char == "(":
+            depth += 1
+    return depths
+
+
+def _append_once(values: list[str], value: str) -> None:
+    if value not in values:
+        values.append(value)
+
+
+def _normalize_predicate(predicate: str | None) -> str | None:
+    """Predicate text comparable between the models, the catalog and the advisor."""
+    if predicate is None:
+        return None
+    return " ".join(re.sub(r'[()"]', " ", str(predicate)).lower().split())
+
+
+def _format_size(size_bytes: int) -> str:
+    size = float(size_bytes)
+    for unit in ("o", "Ko", "Mo"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "o" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Go"
+
+
 async def audit_database(verbose=False, generate_sql=False):
     """Main audit function."""
     print("=" * 80)
@@ -257,7 +849,9 @@ async def audit_database(verbose=False, generate_sql=False):
         total_issues += len(issues["missing_tables"])
 
     if issues["extra_tables"]:
-        print(f"ℹ️  TABLES SUPPLÉMENTAIRES DANS LA BASE DE DONNÉES ({len(issues['extra_tables'])}):")
+        print(
+            f"ℹ️  TABLES SUPPLÉMENTAIRES DANS LA BASE DE DONNÉES ({len(issues['extra_tables'])}):"
+        )
         for table in issues["extra_tables"]:
             print(f"   - {table}")
         print()
@@ -335,6 +929,12 @@ Exemples:
 
   # Audit et génération du script SQL de correction
   python scripts/migration_audit.py --generate-sql
+
+  # Index proposés d'après pg_stat_statements, avec la migration Alembic
+  python scripts/migration_audit.py --advise-indexes --generate-migration
+
+  # Index proposés d'après le journal des requêtes lentes de l'API (JSON)
+  python scripts/migration_audit.py --advise-indexes --workload-file api.log
         """,
     )
     parser.add_argument(
@@ -349,15 +949,52 @@ Exemples:
         action="store_true",
         help="Générer un script SQL pour corriger les différences",
     )
+    parser.add_argument(
+        "--advise-indexes",
+        action="store_true",
+        help="Proposer des index composites/partiels à partir de la charge observée",
+    )
+    parser.add_argument(
+        "--workload-file",
+        type=Path,
+        help="Journal JSON des requêtes lentes de l'API (au lieu de pg_stat_statements)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Nombre maximum d'index proposés (défaut : 10)",
+    )
+    parser.add_argument(
+        "--min-calls",
+        type=int,
+        default=1,
+        help="Ignorer les requêtes exécutées moins souvent (défaut : 1)",
+    )
+    parser.add_argument(
+        "--generate-migration",
+        action="store_true",
+        help="Générer la migration Alembic des index proposés",
+    )
 
     args = parser.parse_args()
 
-    exit_code = asyncio.run(
-        audit_database(
-            verbose=args.verbose,
-            generate_sql=args.generate_sql,
+    if args.advise_indexes:
+        exit_code = asyncio.run(
+            advise_indexes_for_workload(
+                workload_file=args.workload_file,
+                top=args.top,
+                min_calls=args.min_calls,
+                generate_migration=args.generate_migration,
+            )
+        )
+    else:
+        exit_code = asyncio.run(
+            audit_database(
+                verbose=args.verbose,
+                generate_sql=args.generate_sql,
+            )
         )
-    )
 
     sys.exit(exit_code)
 
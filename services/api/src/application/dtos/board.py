@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+from .issue import IssueRollupResponse
+
 
 class BoardListColumnResponse(BaseModel):
     """Response DTO for a board list (column)."""
@@ -181,16 +183,16 @@ class UpdateBoardRequest(BaseModel):
 class CreateBoardListRequest(BaseModel):
     """Request DTO for creating a board list (column)."""
 
-    list_type: str = Field(..., description="One of: label, assignee, milestone")
+    list_type: str = Field(..., description="One of: label, assignee, milestone, status")
     list_config: dict[str, Any] | None = Field(
-        None, description="e.g. label_id, user_id, sprint_id"
+        None, description="e.g. label_id, user_id, sprint_id, status"
     )
 
     @field_validator("list_type")
     @classmethod
     def validate_list_type(cls, v: str) -> str:
         """Validate list type."""
-        allowed = ("label", "assignee", "milestone")
+        allowed = ("label", "assignee", "milestone", "status")
         if v not in allowed:
             raise ValueError(f"list_type must be one of {allowed}")
         return v
@@ -271,6 +273,9 @@ class BoardSwimlaneResponse(BaseModel):
     assignee: SwimlaneAssigneeSummary | None = Field(
         None, description="Assignee details (when swimlane_type is assignee)"
     )
+    rollup: IssueRollupResponse | None = Field(
+        None, description="Epic progress (when swimlane_type is epic)"
+    )
     lists: list[BoardListWithIssuesResponse] = Field(
         default_factory=list,
         description="Columns with issues in this swimlane",
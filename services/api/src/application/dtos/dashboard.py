@@ -98,3 +98,20 @@ class WidgetDataResponse(BaseModel):
         """Pydantic config."""
 
         from_attributes = True
+
+
+class DashboardWidgetDataResponse(BaseModel):
+    """Response DTO for the data of one widget of a dashboard."""
+
+    widget_id: UUID
+    widget_type: str
+    data: dict[str, Any] = Field(default_factory=dict, description="Widget data")
+    cached: bool = Field(default=False, description="Whether the data came from the cache")
+    error: str | None = Field(default=None, description="Why the widget has no data")
+
+
+class DashboardDataResponse(BaseModel):
+    """Response DTO for the data of all widgets of a dashboard."""
+
+    dashboard_id: UUID
+    widgets: list[DashboardWidgetDataResponse] = Field(default_factory=list)
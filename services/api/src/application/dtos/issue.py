@@ -7,6 +7,8 @@ Follows Clean Architecture and DDD principles:
 """
 
 from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -81,6 +83,10 @@ class IssueListItemResponse(BaseModel):
     due_date: date | None = None
     story_points: int | None = None
 
+    custom_fields: dict[UUID, Any] | None = Field(
+        None, description="Custom field values by field ID (when requested)"
+    )
+
     created_at: datetime
     updated_at: datetime
 
@@ -197,3 +203,20 @@ class UpdateIssueRequest(BaseModel):
         if v not in valid_priorities:
             raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
         return v
+
+
+class IssueRollupResponse(BaseModel):
+    """Aggregates of the descendants of an issue (epic or story progress)."""
+
+    issue_id: UUID
+    child_count: int = Field(0, description="Number of direct children")
+    descendant_count: int = Field(0, description="Number of descendants at any depth")
+    status_counts: dict[str, int] = Field(default_factory=dict, description="Descendants by status")
+    story_points_total: int = Field(0, description="Story points of the descendants")
+    story_points_done: int = Field(0, description="Story points of the done descendants")
+    hours_logged: Decimal = Field(Decimal(0), description="Hours logged on the descendants")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
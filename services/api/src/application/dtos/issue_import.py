@@ -0,0 +1,98 @@
+"""Issue import DTOs."""
+
+from datetime import date
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ImportIssueRow(BaseModel):
+    """One issue of an import file.
+
+    Same fields as the issue export, so an export can be imported into another
+    project; export-only fields (key, parent, sprints, timestamps) are ignored.
+    """
+
+    title: str = Field(..., min_length=1, max_length=255, description="Issue title")
+    description: str | None = Field(None, description="Issue description")
+    type: str = Field(default="task", description="Issue type: task, bug, story, epic")
+    status: str = Field(
+        default="todo", description="Issue status: todo, in_progress, done, cancelled"
+    )
+    priority: str = Field(
+        default="medium", description="Issue priority: low, medium, high, critical"
+    )
+    reporter: str | None = Field(None, description="Email of the reporter (defaults to importer)")
+    assignee: str | None = Field(None, description="Email of the assignee")
+    due_date: date | None = Field(None, description="Issue due date")
+    story_points: int | None = Field(None, ge=0, description="Story points estimation")
+    labels: list[str] = Field(default_factory=list, description="Label names (created if missing)")
+    custom_fields: dict[str, Any] = Field(
+        default_factory=dict, description="Custom field values by field name"
+    )
+
+    @field_validator("title")
+    @classmethod
+    def validate_title(cls, v: str) -> str:
+        """Validate and strip title."""
+        v = v.strip()
+        if not v:
+            raise ValueError("Title cannot be empty")
+        return v
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v: str) -> str:
+        """Validate issue type."""
+        valid_types = {"task", "bug", "story", "epic"}
+        if v not in valid_types:
+            raise ValueError(f"Type must be one of: {', '.join(valid_types)}")
+        return v
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        """Validate issue status."""
+        valid_statuses = {"todo", "in_progress", "done", "cancelled"}
+        if v not in valid_statuses:
+            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        return v
+
+    @field_validator("priority")
+    @classmethod
+    def validate_priority(cls, v: str) -> str:
+        """Validate issue priority."""
+        valid_priorities = {"low", "medium", "high", "critical"}
+        if v not in valid_priorities:
+            raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
+        return v
+
+    @field_validator("labels")
+    @classmethod
+    def validate_labels(cls, v: list[str]) -> list[str]:
+        """Strip label names and drop duplicates (keeping order)."""
+        names = [name.strip() for name in v if name.strip()]
+        if any(len(name) > 100 for name in names):
+            raise ValueError("Label names cannot exceed 100 characters")
+        return list(dict.fromkeys(names))
+
+
+class ImportIssueError(BaseModel):
+    """Validation error of one row of an import file."""
+
+    row: int = Field(..., description="Row number (1-based, CSV header excluded)")
+    message: str = Field(..., description="What is wrong with the row")
+
+
+class ImportIssuesResponse(BaseModel):
+    """Response DTO for an issue import.
+
+    The import is all or nothing: when any row is invalid nothing is imported.
+    """
+
+    imported: int = Field(..., description="Number of issues created")
+    first_issue_number: int | None = Field(None, description="Number of the first issue created")
+    error_count: int = Field(0, description="Number of invalid rows")
+    errors: list[ImportIssueError] = Field(
+        default_factory=list, description="First validation errors"
+    )
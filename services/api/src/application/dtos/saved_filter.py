@@ -1,10 +1,81 @@
 """Saved filter DTOs."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.application.dtos.issue import IssueListItemResponse
+
+
+class DateRange(BaseModel):
+    """Inclusive range of dates (either bound optional)."""
+
+    from_: date | None = Field(default=None, alias="from", description="First day included")
+    to: date | None = Field(default=None, description="Last day included")
+
+    class Config:
+        """Pydantic config."""
+
+        extra = "forbid"
+        populate_by_name = True
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "DateRange":
+        """Validate the range is not reversed."""
+        if self.from_ and self.to and self.from_ > self.to:
+            raise ValueError("Range start must not be after its end")
+        return self
+
+
+class FilterCriteria(BaseModel):
+    """Criteria of a saved filter.
+
+    Every criterion is optional and they all apply (AND). List criteria match
+    any of their values; a null in `assignee_id` or `sprint_id` matches
+    unassigned issues or issues in no sprint. Scalars are accepted for lists.
+    """
+
+    status: list[str] | None = Field(default=None, description="Issue statuses")
+    type: list[str] | None = Field(default=None, description="Issue types")
+    priority: list[str] | None = Field(default=None, description="Issue priorities")
+    assignee_id: list[UUID | None] | None = Field(default=None, description="Assignees")
+    reporter_id: list[UUID] | None = Field(default=None, description="Reporters")
+    labels: list[str] | None = Field(default=None, description="Label names (any of)")
+    sprint_id: list[UUID | None] | None = Field(default=None, description="Sprints")
+    custom_fields: dict[str, Any] | None = Field(
+        default=None,
+        description="Custom field values by field name (lists match fields containing them)",
+    )
+    created_at: DateRange | None = Field(default=None, description="Creation date range")
+    updated_at: DateRange | None = Field(default=None, description="Last update date range")
+    due_date: DateRange | None = Field(default=None, description="Due date range")
+    text: str | None = Field(
+        default=None, min_length=1, max_length=255, description="Text in title or description"
+    )
+
+    class Config:
+        """Pydantic config."""
+
+        extra = "forbid"
+
+    @field_validator(
+        "status",
+        "type",
+        "priority",
+        "assignee_id",
+        "reporter_id",
+        "labels",
+        "sprint_id",
+        mode="before",
+    )
+    @classmethod
+    def wrap_scalar(cls, v: Any) -> Any:
+        """Accept a single value for a list criterion."""
+        if v is None or isinstance(v, list):
+            return v
+        return [v]
 
 
 class CreateSavedFilterRequest(BaseModel):
@@ -14,6 +85,13 @@ class CreateSavedFilterRequest(BaseModel):
     project_id: UUID | None = Field(default=None, description="Project ID (optional)")
     filter_criteria: dict[str, Any] = Field(..., description="Filter criteria dictionary")
 
+    @field_validator("filter_criteria")
+    @classmethod
+    def validate_filter_criteria(cls, v: dict[str, Any]) -> dict[str, Any]:
+        """Validate the criteria can be executed (stored as given)."""
+        FilterCriteria.model_validate(v)
+        return v
+
 
 class UpdateSavedFilterRequest(BaseModel):
     """Request DTO for updating a saved filter."""
@@ -23,6 +101,14 @@ class UpdateSavedFilterRequest(BaseModel):
         default=None, description="Filter criteria dictionary"
     )
 
+    @field_validator("filter_criteria")
+    @classmethod
+    def validate_filter_criteria(cls, v: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Validate the criteria can be executed (stored as given)."""
+        if v is not None:
+            FilterCriteria.model_validate(v)
+        return v
+
 
 class SavedFilterResponse(BaseModel):
     """Response DTO for saved filter."""
@@ -51,3 +137,14 @@ class SavedFilterListResponse(BaseModel):
         """Pydantic config."""
 
         from_attributes = True
+
+
+class SavedFilterIssuesResponse(BaseModel):
+    """Response DTO for a page of the issues matching a saved filter."""
+
+    issues: list[IssueListItemResponse]
+    total: int = Field(..., description="Number of matching issues")
+    limit: int
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page (None on the last page)"
+    )
@@ -32,9 +32,49 @@ class SearchResponse(BaseModel):
     limit: int
 
 
+class SearchFacet(BaseModel):
+    """Number of hits in a project or space."""
+
+    id: UUID
+    name: str
+    count: int
+
+
+class SearchFacets(BaseModel):
+    """Number of hits per entity type, project and space."""
+
+    issues: int = Field(0, description="Number of issues matching the search")
+    pages: int = Field(0, description="Number of pages matching the search")
+    projects: list[SearchFacet] = Field(default_factory=list)
+    spaces: list[SearchFacet] = Field(default_factory=list)
+
+
+class OrganizationSearchResponse(SearchResponse):
+    """Organization-wide search response with facets."""
+
+    facets: SearchFacets
+
+
 class SearchIssuesResponse(SearchResponse):
     """Search issues response."""
 
 
 class SearchPagesResponse(SearchResponse):
     """Search pages response."""
+
+
+class TypeaheadItem(BaseModel):
+    """Typeahead suggestion."""
+
+    entity_type: Literal["issue", "project", "user"]
+    id: UUID
+    label: str = Field(..., description="Issue title, project name or user name")
+    key: str | None = Field(None, description="Issue key (PROJ-123), project key or user email")
+    project_id: UUID | None = Field(None, description="Project ID for issue and project results")
+    score: float = Field(..., description="Match score, recent items boosted")
+
+
+class TypeaheadResponse(BaseModel):
+    """Typeahead suggestions, best first."""
+
+    items: list[TypeaheadItem]
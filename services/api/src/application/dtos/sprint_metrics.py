@@ -38,6 +38,10 @@ class CompleteSprintRequest(BaseModel):
         default=True,
         description="Whether to move incomplete issues to backlog",
     )
+    move_incomplete_to_sprint_id: UUID | None = Field(
+        default=None,
+        description="Sprint to move incomplete issues to (takes precedence over the backlog)",
+    )
 
 
 class CompleteSprintResponse(BaseModel):
@@ -46,6 +50,9 @@ class CompleteSprintResponse(BaseModel):
     sprint_id: UUID
     message: str = Field(default="Sprint completed successfully")
     incomplete_issues_moved: int = Field(
-        default=0, description="Number of incomplete issues moved to backlog"
+        default=0, description="Number of incomplete issues moved to backlog or next sprint"
+    )
+    moved_to_sprint_id: UUID | None = Field(
+        default=None, description="Sprint incomplete issues were moved to"
     )
     metrics: SprintMetricsResponse = Field(..., description="Final sprint metrics")
@@ -62,3 +62,26 @@ class TimeSummaryResponse(BaseModel):
         """Pydantic config."""
 
         from_attributes = True
+
+
+class TimesheetRow(BaseModel):
+    """Hours of one project (user timesheet) or one user (project timesheet)."""
+
+    id: UUID = Field(..., description="Project ID or user ID")
+    name: str = Field(..., description="Project name or user name")
+    total_hours: Decimal
+    hours_by_date: dict[DateType, Decimal] = Field(
+        default_factory=dict, description="Hours logged by day (days without hours left out)"
+    )
+
+
+class TimesheetResponse(BaseModel):
+    """Response DTO for a timesheet over a period."""
+
+    start_date: DateType
+    end_date: DateType = Field(..., description="Last day of the period (included)")
+    user_id: UUID | None = Field(None, description="User of a user timesheet")
+    project_id: UUID | None = Field(None, description="Project of a project timesheet")
+    total_hours: Decimal
+    hours_by_date: dict[DateType, Decimal] = Field(default_factory=dict)
+    rows: list[TimesheetRow]
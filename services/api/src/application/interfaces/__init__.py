@@ -1,5 +1,8 @@
 """Application interfaces (ports)."""
 
+from src.application.interfaces.attachment_preview_service import AttachmentPreviewService
+from src.application.interfaces.cache_service import CacheService
+from src.application.interfaces.event_publisher import EventPublisher
 from src.application.interfaces.token_service import TokenService
 
-__all__ = ["TokenService"]
+__all__ = ["AttachmentPreviewService", "CacheService", "EventPublisher", "TokenService"]
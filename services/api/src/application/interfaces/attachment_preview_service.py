@@ -0,0 +1,32 @@
+"""Attachment preview service interface."""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class AttachmentPreviewService(ABC):
+    """Abstract attachment preview (thumbnail) service interface.
+
+    This is a port for generating derivatives of uploaded attachments in the
+    background, after the upload has responded.
+    Implementation will be in infrastructure layer.
+    """
+
+    @abstractmethod
+    def schedule(self, attachment_id: UUID, file_content: bytes, mime_type: str) -> None:
+        """Schedule thumbnail generation for an uploaded attachment.
+
+        Returns immediately; the attachment's thumbnail_path is set once the
+        thumbnail is stored (left empty if none can be made for the file type).
+
+        Args:
+            attachment_id: Attachment UUID
+            file_content: Original file content
+            mime_type: MIME type of the original file
+        """
+        ...
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """Wait for scheduled work and release the worker pool."""
+        ...
@@ -0,0 +1,44 @@
+"""Cache service interface."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CacheService(ABC):
+    """Abstract cache service interface.
+
+    This is a port for short-lived caching of computed results.
+    Implementation will be in infrastructure layer.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must not be mutated afterwards)
+            ttl_seconds: Time to live in seconds
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a cached value (no-op if missing).
+
+        Args:
+            key: Cache key
+        """
+        ...
@@ -0,0 +1,23 @@
+"""Event publisher interface."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.events import DomainEvent
+
+
+class EventPublisher(ABC):
+    """Abstract domain event publisher interface.
+
+    This is a port for publishing domain events in the transaction of the
+    change that raised them; their handlers run after it has committed.
+    Implementation will be in infrastructure layer.
+    """
+
+    @abstractmethod
+    async def publish(self, *events: DomainEvent) -> None:
+        """Publish events (written in the current transaction).
+
+        Args:
+            events: Events to publish, in order
+        """
+        ...
@@ -0,0 +1,51 @@
+"""Registry of the handlers of domain events."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.events import DomainEvent
+
+E = TypeVar("E", bound=DomainEvent)
+
+# Builds the handler of a delivery from the session of the batch being delivered
+HandlerFactory = Callable[[AsyncSession], Callable[[Any], Awaitable[None]]]
+
+
+class EventHandlerRegistry:
+    """Handlers of each domain event type.
+
+    Handlers are registered under a name, stored with the events they handled:
+    it must stay the same across deployments, or pending retries would run the
+    handler again. A handler runs on the session of the dispatcher, whose
+    writes commit together with the event being marked as handled.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, dict[str, HandlerFactory]] = {}
+
+    def subscribe(
+        self,
+        event_class: type[E],
+        name: str,
+        factory: Callable[[AsyncSession], Callable[[E], Awaitable[None]]],
+    ) -> None:
+        """Register a handler of an event type.
+
+        Args:
+            event_class: Domain event class handled
+            name: Name of the handler, unique for the event type
+            factory: Builds the handler from the session it runs on
+
+        Raises:
+            ValueError: If a handler of the event type already has this name
+        """
+        handlers = self._handlers.setdefault(event_class.event_type, {})
+        if name in handlers:
+            raise ValueError(f"Handler '{name}' already subscribed to {event_class.event_type}")
+        handlers[name] = factory
+
+    def handlers(self, event_type: str) -> dict[str, HandlerFactory]:
+        """Handlers of an event type by name, in subscription order."""
+        return dict(self._handlers.get(event_type, {}))
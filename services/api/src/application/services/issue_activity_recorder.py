@@ -0,0 +1,71 @@
+"""Write-behind buffer for issue activity logs."""
+
+from uuid import UUID
+
+from src.domain.repositories import IssueActivityEntry, IssueActivityRepository
+
+
+class IssueActivityRecorder:
+    """Collects the activity entries of a unit of work and writes them at once.
+
+    Use cases `record` each change as they apply it, then `flush` once the
+    changes are saved: the entries go out in one multi-row INSERT in the
+    transaction of the change, instead of an INSERT (and a refresh) per
+    changed field. Entries are written in the order they were recorded.
+    """
+
+    def __init__(self, activity_repository: IssueActivityRepository) -> None:
+        """Initialize recorder.
+
+        Args:
+            activity_repository: Issue activity repository entries are written with
+        """
+        self._activity_repository = activity_repository
+        self._pending: list[IssueActivityEntry] = []
+
+    def record(
+        self,
+        issue_id: UUID,
+        user_id: UUID | None,
+        action: str,
+        field_name: str | None = None,
+        old_value: str | None = None,
+        new_value: str | None = None,
+    ) -> None:
+        """Add an activity entry to the next flush.
+
+        Args:
+            issue_id: Issue UUID
+            user_id: User UUID who performed the action (None for system actions)
+            action: Action type (created, updated, status_changed, etc.)
+            field_name: Optional field name that was changed
+            old_value: Optional old value (as string)
+            new_value: Optional new value (as string)
+        """
+        self._pending.append(
+            IssueActivityEntry(
+                issue_id=issue_id,
+                user_id=user_id,
+                action=action,
+                field_name=field_name,
+                old_value=old_value,
+                new_value=new_value,
+            )
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting for the next flush."""
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Write the recorded entries in one statement.
+
+        Returns:
+            Number of entries written
+        """
+        if not self._pending:
+            return 0
+
+        entries, self._pending = self._pending, []
+        return await self._activity_repository.create_batch(entries)
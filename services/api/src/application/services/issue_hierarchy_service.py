@@ -0,0 +1,218 @@
+"""Issue hierarchy rollups (epics → stories → subtasks)."""
+
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, and_, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.issue import IssueRollupResponse
+from src.infrastructure.database.models import IssueModel, IssueRollupModel, TimeEntryModel
+from src.infrastructure.database.repositories.issue_repository import MAX_HIERARCHY_DEPTH
+
+
+class IssueHierarchyService:
+    """Maintains and reads the rollups of parent issues.
+
+    A rollup aggregates the live descendants of an issue (counts by status,
+    story points, hours logged). Use cases changing an issue or its time
+    entries call `refresh_rollups` with that issue, which recomputes the
+    rollups of its ancestors only, so the cost follows the size of the
+    hierarchy, not of the project.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def refresh_rollups(self, issue_ids: Iterable[UUID | None]) -> None:
+        """Recompute the rollups of the ancestors of the given issues.
+
+        Args:
+            issue_ids: Issues that were created, changed or deleted, or whose
+                time entries changed
+        """
+        ids = list(dict.fromkeys(i for i in issue_ids if i is not None))
+        if not ids:
+            return
+
+        ancestors = (
+            select(IssueModel.parent_issue_id.label("id"), literal(1).label("depth"))
+            .where(IssueModel.id.in_(ids), IssueModel.parent_issue_id.is_not(None))
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union_all(
+            select(IssueModel.parent_issue_id, ancestors.c.depth + 1)
+            .join(ancestors, IssueModel.id == ancestors.c.id)
+            .where(
+                IssueModel.parent_issue_id.is_not(None),
+                ancestors.c.depth < MAX_HIERARCHY_DEPTH,
+            )
+        )
+        result = await self._session.execute(select(ancestors.c.id).distinct())
+        targets = list(result.scalars().all())
+        if targets:
+            await self._recompute(targets)
+
+    async def rebuild_project_rollups(self, project_id: UUID) -> None:
+        """Recompute the rollups of every parent issue of a project.
+
+        Args:
+            project_id: Project UUID
+        """
+        parents = (
+            select(IssueModel.parent_issue_id)
+            .where(
+                IssueModel.project_id == project_id,
+                IssueModel.parent_issue_id.is_not(None),
+                IssueModel.deleted_at.is_(None),
+            )
+            .distinct()
+        )
+        await self._recompute(parents)
+
+    async def get_rollups(self, issue_ids: Iterable[UUID]) -> dict[UUID, IssueRollupResponse]:
+        """Get the rollups of the given issues.
+
+        Args:
+            issue_ids: Issue UUIDs
+
+        Returns:
+            Rollup by issue ID (issues without descendants are absent)
+        """
+        ids = list(dict.fromkeys(issue_ids))
+        if not ids:
+            return {}
+        result = await self._session.execute(
+            select(IssueRollupModel).where(IssueRollupModel.issue_id.in_(ids))
+            # Rollups are upserted in bulk: skip stale objects of the identity map
+            .execution_options(populate_existing=True)
+        )
+        return {
+            model.issue_id: IssueRollupResponse.model_validate(model)
+            for model in result.scalars().all()
+        }
+
+    async def _recompute(self, targets: list[UUID] | Select[Any]) -> None:
+        """Upsert the rollups of the target issues in one statement, drop stale ones."""
+        # Serialize recomputes of the same rollups: a transaction changing a
+        # sibling waits here until the other commits, so the aggregation below
+        # (a new READ COMMITTED snapshot) includes its change instead of
+        # overwriting its totals. Locked in id order, against deadlocks.
+        await self._session.execute(
+            select(IssueModel.id)
+            .where(IssueModel.id.in_(targets))
+            .order_by(IssueModel.id)
+            .with_for_update(key_share=True)
+        )
+
+        subtree = (
+            select(
+                IssueModel.parent_issue_id.label("root_id"),
+                IssueModel.id,
+                IssueModel.status,
+                IssueModel.story_points,
+                literal(1).label("depth"),
+            )
+            .where(IssueModel.parent_issue_id.in_(targets), IssueModel.deleted_at.is_(None))
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(
+                subtree.c.root_id,
+                IssueModel.id,
+                IssueModel.status,
+                IssueModel.story_points,
+                subtree.c.depth + 1,
+            )
+            .join(subtree, IssueModel.parent_issue_id == subtree.c.id)
+            .where(IssueModel.deleted_at.is_(None), subtree.c.depth < MAX_HIERARCHY_DEPTH)
+        )
+        hours = (
+            select(TimeEntryModel.issue_id, func.sum(TimeEntryModel.hours).label("hours"))
+            .where(TimeEntryModel.issue_id.in_(select(subtree.c.id)))
+            .group_by(TimeEntryModel.issue_id)
+            .cte("hours")
+        )
+        by_status = (
+            select(subtree.c.root_id, subtree.c.status, func.count().label("count"))
+            .group_by(subtree.c.root_id, subtree.c.status)
+            .cte("by_status")
+        )
+        status_counts = (
+            select(
+                by_status.c.root_id,
+                func.json_object_agg(by_status.c.status, by_status.c.count).label("counts"),
+            )
+            .group_by(by_status.c.root_id)
+            .cte("status_counts")
+        )
+        totals = (
+            select(
+                subtree.c.root_id,
+                func.count().filter(subtree.c.depth == 1).label("child_count"),
+                func.count().label("descendant_count"),
+                func.coalesce(func.sum(subtree.c.story_points), 0).label("points_total"),
+                func.coalesce(
+                    func.sum(subtree.c.story_points).filter(subtree.c.status == "done"), 0
+                ).label("points_done"),
+                func.coalesce(func.sum(hours.c.hours), 0).label("hours"),
+            )
+            .select_from(subtree.outerjoin(hours, hours.c.issue_id == subtree.c.id))
+            .group_by(subtree.c.root_id)
+            .cte("totals")
+        )
+        rows = select(
+            totals.c.root_id,
+            totals.c.child_count,
+            totals.c.descendant_count,
+            status_counts.c.counts,
+            totals.c.points_total,
+            totals.c.points_done,
+            totals.c.hours,
+            func.now(),
+            func.now(),
+        ).join(status_counts, status_counts.c.root_id == totals.c.root_id)
+
+        upsert = insert(IssueRollupModel).from_select(
+            [
+                "issue_id",
+                "child_count",
+                "descendant_count",
+                "status_counts",
+                "story_points_total",
+                "story_points_done",
+                "hours_logged",
+                "created_at",
+                "updated_at",
+            ],
+            rows,
+        )
+        await self._session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[IssueRollupModel.issue_id],
+                set_={
+                    "child_count": upsert.excluded.child_count,
+                    "descendant_count": upsert.excluded.descendant_count,
+                    "status_counts": upsert.excluded.status_counts,
+                    "story_points_total": upsert.excluded.story_points_total,
+                    "story_points_done": upsert.excluded.story_points_done,
+                    "hours_logged": upsert.excluded.hours_logged,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+        # Targets left without live children have nothing to roll up
+        await self._session.execute(
+            delete(IssueRollupModel).where(
+                IssueRollupModel.issue_id.in_(targets),
+                ~exists().where(
+                    and_(
+                        IssueModel.parent_issue_id == IssueRollupModel.issue_id,
+                        IssueModel.deleted_at.is_(None),
+                    )
+                ),
+            )
+        )
@@ -0,0 +1,141 @@
+"""Batch resolution of projects and spaces into nodes."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.node import NodeDetailsProject, NodeDetailsSpace, NodeListItemResponse
+from src.domain.value_objects.entity_type import EntityType
+from src.infrastructure.database.models import (
+    IssueModel,
+    PageModel,
+    ProjectMemberModel,
+    ProjectModel,
+    SpaceModel,
+)
+
+# (entity type, entity ID), e.g. ("project", <project id>)
+NodeRef = tuple[str, UUID]
+
+
+class NodeResolver:
+    """Hydrates projects and spaces into node list items.
+
+    Takes any mix of project and space references and loads each entity type
+    with its folder and counts in a single statement (counts are grouped
+    subqueries joined to the rows), however many references there are.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize resolver.
+
+        Args:
+            session: Database session the nodes are read with
+        """
+        self._session = session
+
+    async def resolve(self, refs: Iterable[NodeRef]) -> dict[NodeRef, NodeListItemResponse]:
+        """Resolve references into nodes.
+
+        Args:
+            refs: Entity type and ID of each node (other entity types are ignored)
+
+        Returns:
+            Nodes by reference; references to missing entities are absent
+        """
+        ids_by_type: dict[str, set[UUID]] = defaultdict(set)
+        for entity_type, entity_id in refs:
+            ids_by_type[entity_type].add(entity_id)
+
+        nodes: dict[NodeRef, NodeListItemResponse] = {}
+        if ids_by_type[EntityType.PROJECT]:
+            nodes.update(await self._resolve_projects(ids_by_type[EntityType.PROJECT]))
+        if ids_by_type[EntityType.SPACE]:
+            nodes.update(await self._resolve_spaces(ids_by_type[EntityType.SPACE]))
+        return nodes
+
+    async def _resolve_projects(self, ids: set[UUID]) -> dict[NodeRef, NodeListItemResponse]:
+        members = (
+            select(ProjectMemberModel.project_id, func.count().label("count"))
+            .where(ProjectMemberModel.project_id.in_(ids))
+            .group_by(ProjectMemberModel.project_id)
+            .subquery()
+        )
+        issues = (
+            select(IssueModel.project_id, func.count().label("count"))
+            .where(IssueModel.project_id.in_(ids))
+            .group_by(IssueModel.project_id)
+            .subquery()
+        )
+        result = await self._session.execute(
+            select(
+                ProjectModel.id,
+                ProjectModel.organization_id,
+                ProjectModel.name,
+                ProjectModel.key,
+                ProjectModel.description,
+                ProjectModel.folder_id,
+                func.coalesce(members.c.count, 0).label("member_count"),
+                func.coalesce(issues.c.count, 0).label("issue_count"),
+            )
+            .outerjoin(members, members.c.project_id == ProjectModel.id)
+            .outerjoin(issues, issues.c.project_id == ProjectModel.id)
+            .where(ProjectModel.id.in_(ids))
+        )
+
+        return {
+            (EntityType.PROJECT, row.id): NodeListItemResponse(
+                type="project",
+                id=row.id,
+                organization_id=row.organization_id,
+                details=NodeDetailsProject(
+                    name=row.name,
+                    key=row.key,
+                    description=row.description,
+                    folder_id=row.folder_id,
+                    member_count=row.member_count,
+                    issue_count=row.issue_count,
+                ),
+            )
+            for row in result.all()
+        }
+
+    async def _resolve_spaces(self, ids: set[UUID]) -> dict[NodeRef, NodeListItemResponse]:
+        pages = (
+            select(PageModel.space_id, func.count().label("count"))
+            .where(PageModel.space_id.in_(ids))
+            .group_by(PageModel.space_id)
+            .subquery()
+        )
+        result = await self._session.execute(
+            select(
+                SpaceModel.id,
+                SpaceModel.organization_id,
+                SpaceModel.name,
+                SpaceModel.key,
+                SpaceModel.description,
+                SpaceModel.folder_id,
+                func.coalesce(pages.c.count, 0).label("page_count"),
+            )
+            .outerjoin(pages, pages.c.space_id == SpaceModel.id)
+            .where(SpaceModel.id.in_(ids))
+        )
+
+        return {
+            (EntityType.SPACE, row.id): NodeListItemResponse(
+                type="space",
+                id=row.id,
+                organization_id=row.organization_id,
+                details=NodeDetailsSpace(
+                    name=row.name,
+                    key=row.key,
+                    description=row.description,
+                    folder_id=row.folder_id,
+                    page_count=row.page_count,
+                ),
+            )
+            for row in result.all()
+        }
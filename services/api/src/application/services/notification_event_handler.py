@@ -0,0 +1,119 @@
+"""Notifications sent in reaction to domain events."""
+
+from uuid import UUID
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.notification_service import NotificationService
+from src.application.utils.mentions import parse_mentions
+from src.domain.events import CommentCreated, IssueAssigned, IssueStatusChanged
+from src.domain.repositories import IssueRepository, NotificationRepository
+from src.infrastructure.database.models import UserModel
+
+logger = structlog.get_logger()
+
+
+class NotificationEventHandler:
+    """Notifies the users concerned by issue changes and comments.
+
+    Runs after the change has committed (see OutboxDispatcher): the names
+    shown in notifications are looked up here rather than in the request, and
+    a failure is retried rather than dropped.
+    """
+
+    def __init__(
+        self,
+        notification_repository: NotificationRepository,
+        issue_repository: IssueRepository,
+        session: AsyncSession,
+    ) -> None:
+        """Initialize handler with dependencies.
+
+        Args:
+            notification_repository: Notification repository for creating notifications
+            issue_repository: Issue repository to load commented issues
+            session: Database session for loading user details
+        """
+        self._notification_service = NotificationService(notification_repository)
+        self._issue_repository = issue_repository
+        self._session = session
+
+    async def issue_status_changed(self, event: IssueStatusChanged) -> None:
+        """Notify the assignee of an issue that its status changed."""
+        if not event.assignee_id or event.assignee_id == event.changed_by:
+            return
+
+        await self._notification_service.notify_issue_status_changed(
+            user_id=event.assignee_id,
+            issue_id=event.issue_id,
+            issue_title=event.issue_title,
+            old_status=event.old_status,
+            new_status=event.new_status,
+            changed_by_name=await self._user_name(event.changed_by),
+        )
+
+    async def issue_assigned(self, event: IssueAssigned) -> None:
+        """Notify the new assignee of an issue."""
+        if not event.new_assignee_id:
+            return
+
+        await self._notification_service.notify_issue_assigned(
+            assignee_id=event.new_assignee_id,
+            issue_id=event.issue_id,
+            issue_title=event.issue_title,
+            assigned_by_name=await self._user_name(event.assigned_by),
+        )
+
+    async def comment_created(self, event: CommentCreated) -> None:
+        """Notify the reporter, the assignee and the mentioned users of a commented issue."""
+        issue = await self._issue_repository.get_by_id(event.issue_id)
+        if issue is None:
+            logger.info(
+                "Commented issue gone, skipping notifications", issue_id=str(event.issue_id)
+            )
+            return
+
+        author_name = await self._user_name(event.author_id)
+        comment_preview = event.content[:100]
+
+        # Notify issue reporter, then assignee (if different from reporter and author)
+        recipients = [
+            user_id
+            for user_id in dict.fromkeys([issue.reporter_id, issue.assignee_id])
+            if user_id and user_id != event.author_id
+        ]
+        for user_id in recipients:
+            await self._notification_service.notify_issue_commented(
+                user_id=user_id,
+                issue_id=issue.id,
+                issue_title=issue.title,
+                commenter_name=author_name,
+                comment_preview=comment_preview,
+            )
+
+        # @mentions match the email prefix (before @) or the exact email
+        for username in sorted(parse_mentions(event.content)):
+            result = await self._session.execute(
+                select(UserModel.id).where(
+                    (UserModel.email.like(f"{username}@%")) | (UserModel.email == username)
+                )
+            )
+            mentioned_user_id = result.scalars().first()
+            if mentioned_user_id and mentioned_user_id != event.author_id:
+                await self._notification_service.notify_comment_mentioned(
+                    user_id=mentioned_user_id,
+                    comment_id=event.comment_id,
+                    entity_type="issue",
+                    entity_id=issue.id,
+                    entity_title=issue.title,
+                    mentioned_by_name=author_name,
+                )
+
+    async def _user_name(self, user_id: UUID | None) -> str:
+        """Name of the user behind a change ("Someone" if unknown)."""
+        if user_id is None:
+            return "Someone"
+        result = await self._session.execute(select(UserModel.name).where(UserModel.id == user_id))
+        return result.scalar_one_or_none() or "Someone"
@@ -0,0 +1,317 @@
+"""Effective page permissions of a user, resolved for a whole space."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, func, or_, select, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from src.application.interfaces import CacheService
+from src.domain.entities import Page
+from src.domain.entities.page_permission import (
+    PERMISSION_ROLE_ADMIN,
+    PERMISSION_ROLE_CREATE,
+    PERMISSION_ROLE_DELETE,
+    PERMISSION_ROLE_EDIT,
+)
+from src.infrastructure.database.models import (
+    PageModel,
+    PagePermissionModel,
+    SpaceAccessVersionModel,
+    SpaceModel,
+    SpacePermissionModel,
+)
+
+# Grants that allow editing (any grant allows reading)
+PAGE_EDIT_ROLES = frozenset({PERMISSION_ROLE_EDIT, PERMISSION_ROLE_DELETE, PERMISSION_ROLE_ADMIN})
+SPACE_EDIT_ROLES = frozenset(
+    {PERMISSION_ROLE_CREATE, PERMISSION_ROLE_EDIT, PERMISSION_ROLE_DELETE, PERMISSION_ROLE_ADMIN}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PageAccess:
+    """What a user may do with the pages of a space.
+
+    Spaces and pages without grants are open to the organization members; a
+    space or page with grants is restricted to its grantees (a grant without
+    user is given to everyone). Read restrictions add up down the tree: a page
+    is readable when the user is a grantee of every restricted page above it.
+    Edit rights come from the closest restricted page, else from the space.
+
+    Only the pages that differ from the space rights are listed, so the size
+    follows the restricted subtrees rather than the space.
+    """
+
+    can_read_space: bool = True
+    can_edit_space: bool = True
+    # Pages the user may not read
+    hidden: frozenset[UUID] = frozenset()
+    # Readable pages whose edit right is the opposite of the space's
+    edit_overrides: frozenset[UUID] = frozenset()
+
+    def can_read(self, page_id: UUID) -> bool:
+        """Whether the user may read a page of the space."""
+        return self.can_read_space and page_id not in self.hidden
+
+    def can_edit(self, page_id: UUID) -> bool:
+        """Whether the user may edit a page of the space."""
+        return self.can_read(page_id) and self.can_edit_space != (page_id in self.edit_overrides)
+
+    def readable(self, pages: Iterable[Page]) -> list[Page]:
+        """Pages the user may read, in order."""
+        if not self.can_read_space:
+            return []
+        return [page for page in pages if page.id not in self.hidden]
+
+
+# Access of organization admins, and of spaces without any grant
+UNRESTRICTED = PageAccess()
+
+
+class PageAccessResolver:
+    """Resolves the page permissions of a user across a space.
+
+    A single recursive statement walks the page tree from the root pages down,
+    carrying read and edit rights from parents to children, so restricted
+    pages cost the same whatever their number, and the spaces of an
+    organization are resolved together. Results are cached under the
+    space access version, which `invalidate` bumps in the transaction of the
+    change: no worker reads permissions older than the committed grants.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_service: CacheService | None = None,
+        ttl_seconds: float = 300,
+    ) -> None:
+        """Initialize resolver.
+
+        Args:
+            session: Database session grants are read (or the version bumped) with
+            cache_service: Cache resolved permissions are kept in (None disables caching)
+            ttl_seconds: Time to live of resolved permissions (0 disables caching)
+        """
+        self._session = session
+        self._cache_service = cache_service
+        self._ttl_seconds = ttl_seconds
+
+    async def resolve(self, space_id: UUID, user_id: UUID) -> PageAccess:
+        """Effective permissions of a user on the pages of a space.
+
+        Args:
+            space_id: Space UUID
+            user_id: User UUID
+
+        Returns:
+            Page access of the user
+        """
+        return (await self._resolve_many([space_id], user_id))[space_id]
+
+    async def resolve_restricted(
+        self, organization_id: UUID, user_id: UUID
+    ) -> dict[UUID, PageAccess]:
+        """Effective permissions of a user in the spaces of an organization that have grants.
+
+        Spaces without any space or page grant are left out: their pages are
+        open to every member of the organization.
+
+        Args:
+            organization_id: Organization UUID
+            user_id: User UUID
+
+        Returns:
+            Page access of the user by space UUID
+        """
+        space_grants = select(SpacePermissionModel.id).where(
+            SpacePermissionModel.space_id == SpaceModel.id
+        )
+        page_grants = (
+            select(PagePermissionModel.id)
+            .join(PageModel, PageModel.id == PagePermissionModel.page_id)
+            .where(PageModel.space_id == SpaceModel.id)
+        )
+        result = await self._session.execute(
+            select(SpaceModel.id).where(
+                SpaceModel.organization_id == organization_id,
+                SpaceModel.deleted_at.is_(None),
+                or_(space_grants.exists(), page_grants.exists()),
+            )
+        )
+        return await self._resolve_many(list(result.scalars().all()), user_id)
+
+    async def invalidate(self, space_id: UUID) -> None:
+        """Start a new access version of a space (after its grants or tree changed).
+
+        Args:
+            space_id: Space UUID
+        """
+        versions = SpaceAccessVersionModel
+        await self._session.execute(
+            insert(versions)
+            .values(space_id=space_id, version=1)
+            .on_conflict_do_update(
+                index_elements=[versions.space_id],
+                set_={"version": versions.version + 1},
+            )
+        )
+
+    async def _resolve_many(self, space_ids: list[UUID], user_id: UUID) -> dict[UUID, PageAccess]:
+        """Page access of a user in several spaces: cached ones, the others in one load."""
+        if not space_ids:
+            return {}
+        if self._cache_service is None or self._ttl_seconds <= 0:
+            return await self._load(space_ids, user_id)
+
+        # The versions are read first: a change committed during the load bumps
+        # them, so the possibly stale result is not read again
+        versions = await self._versions(space_ids)
+        keys = {
+            space_id: f"page-access:{space_id}:{versions.get(space_id, 0)}:{user_id}"
+            for space_id in space_ids
+        }
+        access: dict[UUID, PageAccess] = {}
+        for space_id, key in keys.items():
+            cached: PageAccess | None = await self._cache_service.get(key)
+            if cached is not None:
+                access[space_id] = cached
+
+        missing = [space_id for space_id in space_ids if space_id not in access]
+        if missing:
+            loaded = await self._load(missing, user_id)
+            for space_id in missing:
+                await self._cache_service.set(keys[space_id], loaded[space_id], self._ttl_seconds)
+            access.update(loaded)
+        return access
+
+    async def _versions(self, space_ids: list[UUID]) -> dict[UUID, int]:
+        result = await self._session.execute(
+            select(SpaceAccessVersionModel.space_id, SpaceAccessVersionModel.version).where(
+                SpaceAccessVersionModel.space_id.in_(space_ids)
+            )
+        )
+        return {row.space_id: row.version for row in result}
+
+    async def _load(self, space_ids: list[UUID], user_id: UUID) -> dict[UUID, PageAccess]:
+        # One row per space, the space grants aggregated (spaces without any
+        # are open to every member)
+        has_grant = SpacePermissionModel.id.is_not(None)
+        space_grants = (
+            select(
+                SpaceModel.id.label("space_id"),
+                func.coalesce(
+                    func.bool_or(_is_grantee(SpacePermissionModel.user_id, user_id)).filter(
+                        has_grant
+                    ),
+                    true(),
+                ).label("can_read"),
+                func.coalesce(
+                    func.bool_or(
+                        and_(
+                            _is_grantee(SpacePermissionModel.user_id, user_id),
+                            SpacePermissionModel.role.in_(SPACE_EDIT_ROLES),
+                        )
+                    ).filter(has_grant),
+                    true(),
+                ).label("can_edit"),
+            )
+            .select_from(SpaceModel)
+            .outerjoin(SpacePermissionModel, SpacePermissionModel.space_id == SpaceModel.id)
+            .where(SpaceModel.id.in_(space_ids))
+            .group_by(SpaceModel.id)
+            .cte("space_grants")
+        )
+        page_grants = (
+            select(
+                PagePermissionModel.page_id,
+                func.bool_or(_is_grantee(PagePermissionModel.user_id, user_id)).label("can_read"),
+                func.bool_or(
+                    and_(
+                        _is_grantee(PagePermissionModel.user_id, user_id),
+                        PagePermissionModel.role.in_(PAGE_EDIT_ROLES),
+                    )
+                ).label("can_edit"),
+            )
+            .select_from(PagePermissionModel)
+            .join(PageModel, PageModel.id == PagePermissionModel.page_id)
+            .where(PageModel.space_id.in_(space_ids))
+            .group_by(PagePermissionModel.page_id)
+            .cte("page_grants")
+        )
+
+        # Soft-deleted pages are walked too: their restrictions still cover
+        # their children
+        tree = (
+            select(
+                PageModel.id,
+                PageModel.space_id,
+                func.coalesce(page_grants.c.can_read, true()).label("can_read"),
+                func.coalesce(page_grants.c.can_edit, space_grants.c.can_edit).label("can_edit"),
+            )
+            .select_from(PageModel)
+            .join(space_grants, space_grants.c.space_id == PageModel.space_id)
+            .outerjoin(page_grants, page_grants.c.page_id == PageModel.id)
+            .where(PageModel.parent_id.is_(None))
+            .cte("page_access", recursive=True)
+        )
+        child = aliased(PageModel)
+        tree = tree.union_all(
+            select(
+                child.id,
+                tree.c.space_id,
+                and_(tree.c.can_read, func.coalesce(page_grants.c.can_read, true())),
+                func.coalesce(page_grants.c.can_edit, tree.c.can_edit),
+            )
+            .select_from(child)
+            .join(tree, child.parent_id == tree.c.id)
+            .outerjoin(page_grants, page_grants.c.page_id == child.id)
+        )
+
+        # One row per space, joined to its pages that differ from it
+        result = await self._session.execute(
+            select(
+                space_grants.c.space_id,
+                space_grants.c.can_read.label("can_read_space"),
+                space_grants.c.can_edit.label("can_edit_space"),
+                tree.c.id,
+                tree.c.can_read,
+                tree.c.can_edit,
+            ).select_from(
+                space_grants.outerjoin(
+                    tree,
+                    and_(
+                        tree.c.space_id == space_grants.c.space_id,
+                        or_(~tree.c.can_read, tree.c.can_edit != space_grants.c.can_edit),
+                    ),
+                )
+            )
+        )
+        spaces: dict[UUID, PageAccess] = {}
+        hidden: dict[UUID, set[UUID]] = {}
+        edit_overrides: dict[UUID, set[UUID]] = {}
+        for row in result:
+            spaces[row.space_id] = PageAccess(row.can_read_space, row.can_edit_space)
+            if row.id is not None:
+                pages = edit_overrides if row.can_read else hidden
+                pages.setdefault(row.space_id, set()).add(row.id)
+
+        # A space that does not exist has no grants either
+        return {
+            space_id: replace(
+                spaces.get(space_id, UNRESTRICTED),
+                hidden=frozenset(hidden.get(space_id, ())),
+                edit_overrides=frozenset(edit_overrides.get(space_id, ())),
+            )
+            for space_id in space_ids
+        }
+
+
+def _is_grantee(
+    grant_user_id: InstrumentedAttribute[UUID | None], user_id: UUID
+) -> ColumnElement[bool]:
+    # Grants without user are given to everyone
+    return or_(grant_user_id == user_id, grant_user_id.is_(None))
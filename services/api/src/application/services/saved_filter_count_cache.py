@@ -0,0 +1,100 @@
+"""Cached result counts of saved filters."""
+
+from collections.abc import Awaitable, Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces import CacheService
+from src.infrastructure.database import after_commit
+
+# Generations outlive the counts they version; an evicted one only costs a recount
+GENERATION_TTL_SECONDS = 24 * 60 * 60
+
+# Generation of the issues of all projects (filters not scoped to a project)
+ALL_PROJECTS = "all"
+
+
+class SavedFilterCountCache:
+    """Caches how many issues match a saved filter.
+
+    Counts are keyed by the filter version and by the generation of the issues
+    of its project. Issue writes call `invalidate` with the project, which
+    starts a new generation: the counts of that project (and of the filters
+    spanning all projects) are recomputed on their next read, older ones
+    simply expire. With the session of the write, the new generation starts
+    once it commits: started earlier, a count in between would still see the
+    old rows and cache them under the new generation.
+    """
+
+    def __init__(
+        self,
+        cache_service: CacheService,
+        ttl_seconds: float = 300,
+        session: AsyncSession | None = None,
+    ) -> None:
+        """Initialize count cache.
+
+        Args:
+            cache_service: Cache the counts and generations are kept in
+            ttl_seconds: Time to live of cached counts (0 disables caching)
+            session: Session of the issue writes (invalidations wait for its commit)
+        """
+        self._cache_service = cache_service
+        self._ttl_seconds = ttl_seconds
+        self._session = session
+
+    async def get_or_count(
+        self,
+        filter_id: UUID,
+        version: str,
+        project_id: UUID | None,
+        count: Callable[[], Awaitable[int]],
+    ) -> int:
+        """Cached count of a filter version, counted (and cached) when missing.
+
+        Args:
+            filter_id: Saved filter ID
+            version: Version of the filter criteria (changes when they do)
+            project_id: Project of the filter (None for all projects)
+            count: Runs the count query
+
+        Returns:
+            Number of matching issues
+        """
+        if self._ttl_seconds <= 0:
+            return await count()
+
+        # The key is resolved first: a write during the count starts a new
+        # generation, so the possibly stale result is not read again
+        key = await self._count_key(filter_id, version, project_id)
+        cached: int | None = await self._cache_service.get(key)
+        if cached is not None:
+            return cached
+
+        total = await count()
+        await self._cache_service.set(key, total, self._ttl_seconds)
+        return total
+
+    async def invalidate(self, project_id: UUID) -> None:
+        """Drop the counts affected by a write to the issues of a project."""
+        if self._session is not None:
+            after_commit(self._session, lambda: self._start_generation(project_id))
+        else:
+            await self._start_generation(project_id)
+
+    async def _start_generation(self, project_id: UUID) -> None:
+        await self._cache_service.delete(_generation_key(project_id))
+        await self._cache_service.delete(_generation_key(None))
+
+    async def _count_key(self, filter_id: UUID, version: str, project_id: UUID | None) -> str:
+        generation_key = _generation_key(project_id)
+        generation = await self._cache_service.get(generation_key)
+        if generation is None:
+            generation = uuid4().hex
+            await self._cache_service.set(generation_key, generation, GENERATION_TTL_SECONDS)
+        return f"saved-filter-count:{filter_id}:{version}:{generation}"
+
+
+def _generation_key(project_id: UUID | None) -> str:
+    return f"issue-generation:{project_id or ALL_PROJECTS}"
@@ -1,13 +1,18 @@
 """Search query service for issues and pages."""
 
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Collection, Iterable
+from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, text
+from sqlalchemy import CTE, BigInteger, cast, func, null, or_, select, text, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from src.infrastructure.database.models import IssueModel, PageModel
+from src.infrastructure.database.models import IssueModel, PageModel, ProjectModel, SpaceModel
+from src.infrastructure.database.models.base import search_document, search_query
+
+# ts_rank_cd normalization: rank / (rank + 1), a score in [0, 1) comparable across types
+NORMALIZED_RANK = 32
 
 
 class SearchQueryService:
@@ -98,8 +103,9 @@ class SearchQueryService:
         space_id: UUID,
         skip: int,
         limit: int,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
-        """Search pages by title/content."""
+        """Search pages by title/content, leaving out `exclude_ids` (pages the user may not read)."""
 
         search_pattern = f"%{query}%"
         conditions: list[Any] = [
@@ -110,6 +116,8 @@ class SearchQueryService:
                 PageModel.content.ilike(search_pattern),
             ),
         ]
+        if exclude_ids:
+            conditions.append(PageModel.id.not_in(exclude_ids))
 
         count_stmt = select(func.count()).select_from(PageModel).where(*conditions)
         count_result = await self._session.execute(count_stmt)
@@ -150,6 +158,167 @@ class SearchQueryService:
 
         return items, total
 
+    async def search_organization_issues(
+        self, query: str, organization_id: UUID, limit: int
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Full-text search of the issues of every live project of an organization.
+
+        One statement returns the best `limit` issues and the number of hits
+        per project.
+
+        Returns:
+            Tuple of (items, facets): facets hold the id, name and hit count of
+            each project with hits
+        """
+
+        document = search_document(IssueModel.title, IssueModel.description)
+        tsquery = search_query(query)
+        projects = select(ProjectModel.id).where(
+            ProjectModel.organization_id == organization_id, ProjectModel.deleted_at.is_(None)
+        )
+        matches = (
+            select(
+                IssueModel.id,
+                IssueModel.project_id.label("container_id"),
+                IssueModel.created_at,
+                func.ts_rank_cd(document, tsquery, NORMALIZED_RANK).label("score"),
+            )
+            .where(
+                IssueModel.project_id.in_(projects),
+                IssueModel.deleted_at.is_(None),
+                document.op("@@")(tsquery),
+            )
+            .cte("matches")
+        )
+
+        return await self._top_with_facets(
+            matches, "issue", IssueModel, IssueModel.description, ProjectModel, limit
+        )
+
+    async def search_organization_pages(
+        self,
+        query: str,
+        organization_id: UUID,
+        limit: int,
+        exclude_space_ids: Collection[UUID] | None = None,
+        exclude_ids: Collection[UUID] | None = None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Full-text search of the pages of every live space of an organization.
+
+        One statement returns the best `limit` pages and the number of hits
+        per space, leaving out `exclude_space_ids` and `exclude_ids` (spaces
+        and pages the user may not read).
+
+        Returns:
+            Tuple of (items, facets): facets hold the id, name and hit count of
+            each space with hits
+        """
+
+        document = search_document(PageModel.title, PageModel.content)
+        tsquery = search_query(query)
+        space_conditions: list[Any] = [
+            SpaceModel.organization_id == organization_id,
+            SpaceModel.deleted_at.is_(None),
+        ]
+        if exclude_space_ids:
+            space_conditions.append(SpaceModel.id.not_in(exclude_space_ids))
+        conditions: list[Any] = [
+            PageModel.space_id.in_(select(SpaceModel.id).where(*space_conditions)),
+            PageModel.deleted_at.is_(None),
+            document.op("@@")(tsquery),
+        ]
+        if exclude_ids:
+            conditions.append(PageModel.id.not_in(exclude_ids))
+        matches = (
+            select(
+                PageModel.id,
+                PageModel.space_id.label("container_id"),
+                PageModel.created_at,
+                func.ts_rank_cd(document, tsquery, NORMALIZED_RANK).label("score"),
+            )
+            .where(*conditions)
+            .cte("matches")
+        )
+
+        return await self._top_with_facets(
+            matches, "page", PageModel, PageModel.content, SpaceModel, limit
+        )
+
+    async def _top_with_facets(
+        self,
+        matches: CTE,
+        entity_type: Literal["issue", "page"],
+        model: type[IssueModel] | type[PageModel],
+        body: InstrumentedAttribute[str | None],
+        container: type[ProjectModel] | type[SpaceModel],
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Best `limit` matches and the match count per container, in one round trip.
+
+        Facet rows are told apart from hits by their missing id.
+        """
+
+        top = (
+            select(
+                matches.c.id,
+                model.title,
+                matches.c.container_id,
+                matches.c.score,
+                matches.c.created_at,
+                func.substr(body, 1, 200).label("snippet"),
+                cast(null(), BigInteger).label("count"),
+            )
+            .select_from(matches)
+            .join(model, model.id == matches.c.id)
+            .order_by(matches.c.score.desc(), matches.c.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        counts = (
+            select(
+                null(),
+                container.name,
+                matches.c.container_id,
+                null(),
+                null(),
+                null(),
+                func.count(),
+            )
+            .select_from(matches)
+            .join(container, container.id == matches.c.container_id)
+            .group_by(matches.c.container_id, container.name)
+        )
+
+        result = await self._session.execute(union_all(select(top), counts))
+        rows = result.mappings().all()
+        # The union does not keep the order of the top rows
+        hits = sorted(
+            (row for row in rows if row["id"] is not None),
+            key=lambda row: (row["score"], row["created_at"]),
+            reverse=True,
+        )
+        items = [
+            {
+                "entity_type": entity_type,
+                "id": row["id"],
+                "title": row["title"],
+                "snippet": row["snippet"],
+                "score": float(row["score"]),
+                "project_id": row["container_id"] if entity_type == "issue" else None,
+                "space_id": row["container_id"] if entity_type == "page" else None,
+            }
+            for row in hits
+        ]
+        facets = sorted(
+            (
+                {"id": row["container_id"], "name": row["title"], "count": row["count"]}
+                for row in rows
+                if row["id"] is None
+            ),
+            key=lambda facet: (-facet["count"], facet["name"]),
+        )
+        return items, facets
+
     @staticmethod
     def _merge_and_paginate(
         issue_items: Iterable[dict[str, Any]],
@@ -0,0 +1,155 @@
+"""Daily time rollups and the timesheets read from them."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.time_entry import TimesheetResponse, TimesheetRow
+from src.infrastructure.database.models import (
+    IssueModel,
+    ProjectModel,
+    TimeEntryRollupModel,
+    UserModel,
+)
+
+
+class TimesheetService:
+    """Maintains the daily time rollups and reads timesheets from them.
+
+    Use cases changing a time entry call `record` in the same transaction
+    with the hours added, or removed as negative hours. The upsert adds
+    them to the row of the day under its row lock, so concurrent entries of
+    the same day add up instead of overwriting each other.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record(
+        self, issue_id: UUID, user_id: UUID, day: date, hours: Decimal, entries: int
+    ) -> None:
+        """Add hours logged on an issue to the rollup of the day.
+
+        Args:
+            issue_id: Issue the hours were logged on (gives the project)
+            user_id: User who logged the hours
+            day: Day the hours were logged for
+            hours: Hours added (negative when removed)
+            entries: Time entries added (negative when removed)
+        """
+        rollups = TimeEntryRollupModel
+        project_id = select(IssueModel.project_id).where(IssueModel.id == issue_id)
+        upsert = insert(rollups).from_select(
+            ["project_id", "user_id", "date", "hours", "entry_count"],
+            project_id.add_columns(
+                literal(user_id), literal(day), literal(hours), literal(entries)
+            ),
+        )
+        await self._session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[rollups.project_id, rollups.date, rollups.user_id],
+                set_={
+                    "hours": rollups.hours + upsert.excluded.hours,
+                    "entry_count": rollups.entry_count + upsert.excluded.entry_count,
+                },
+            )
+        )
+
+        if entries < 0:
+            # Days without entries left are dropped rather than kept at zero
+            await self._session.execute(
+                delete(rollups).where(
+                    rollups.project_id == project_id.scalar_subquery(),
+                    rollups.user_id == user_id,
+                    rollups.date == day,
+                    rollups.entry_count <= 0,
+                )
+            )
+
+    async def get_user_timesheet(
+        self, organization_id: UUID, user_id: UUID, start_date: date, end_date: date
+    ) -> TimesheetResponse:
+        """Hours of a user across the projects of an organization, by project and day.
+
+        Args:
+            organization_id: Organization UUID
+            user_id: User UUID
+            start_date: First day of the period
+            end_date: Last day of the period (included)
+
+        Returns:
+            Timesheet with a row per project
+        """
+        rollups = TimeEntryRollupModel
+        result = await self._session.execute(
+            select(ProjectModel.id, ProjectModel.name, rollups.date, rollups.hours)
+            .join(ProjectModel, ProjectModel.id == rollups.project_id)
+            .where(
+                rollups.user_id == user_id,
+                rollups.date.between(start_date, end_date),
+                ProjectModel.organization_id == organization_id,
+            )
+            .order_by(ProjectModel.name, ProjectModel.id, rollups.date)
+        )
+        return self._timesheet(result.all(), start_date, end_date, user_id=user_id, project_id=None)
+
+    async def get_project_timesheet(
+        self, project_id: UUID, start_date: date, end_date: date
+    ) -> TimesheetResponse:
+        """Hours logged in a project, by user and day.
+
+        Args:
+            project_id: Project UUID
+            start_date: First day of the period
+            end_date: Last day of the period (included)
+
+        Returns:
+            Timesheet with a row per user
+        """
+        rollups = TimeEntryRollupModel
+        result = await self._session.execute(
+            select(UserModel.id, UserModel.name, rollups.date, rollups.hours)
+            .join(UserModel, UserModel.id == rollups.user_id)
+            .where(
+                rollups.project_id == project_id,
+                rollups.date.between(start_date, end_date),
+            )
+            .order_by(UserModel.name, UserModel.id, rollups.date)
+        )
+        return self._timesheet(
+            result.all(), start_date, end_date, user_id=None, project_id=project_id
+        )
+
+    @staticmethod
+    def _timesheet(
+        rows: Any,
+        start_date: date,
+        end_date: date,
+        user_id: UUID | None,
+        project_id: UUID | None,
+    ) -> TimesheetResponse:
+        """Timesheet of (row id, row name, day, hours) rollups, sorted by row."""
+        timesheet_rows: dict[UUID, TimesheetRow] = {}
+        hours_by_date: dict[date, Decimal] = {}
+        for row_id, name, day, hours in rows:
+            timesheet_row = timesheet_rows.setdefault(
+                row_id, TimesheetRow(id=row_id, name=name, total_hours=Decimal("0"))
+            )
+            timesheet_row.hours_by_date[day] = hours
+            timesheet_row.total_hours += hours
+            hours_by_date[day] = hours_by_date.get(day, Decimal("0")) + hours
+
+        return TimesheetResponse(
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            project_id=project_id,
+            total_hours=sum(hours_by_date.values(), Decimal("0")),
+            hours_by_date=dict(sorted(hours_by_date.items())),
+            rows=list(timesheet_rows.values()),
+        )
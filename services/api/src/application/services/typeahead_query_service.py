@@ -0,0 +1,263 @@
+"""Typeahead query service for issues, projects and users."""
+
+import re
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Float,
+    Select,
+    String,
+    case,
+    cast,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.infrastructure.database.models import (
+    IssueActivityModel,
+    IssueModel,
+    OrganizationMemberModel,
+    ProjectModel,
+    UserModel,
+)
+
+# "PROJ-123": an issue key
+ISSUE_KEY_PATTERN = re.compile(r"^([A-Za-z][A-Za-z0-9]*)-(\d+)$")
+# Trigram indexes only serve patterns of at least 3 characters: shorter terms
+# match the user's recent issues only
+TRIGRAM_MIN_LENGTH = 3
+# Activities of the user the recent issues are taken from
+RECENT_ACTIVITIES = 50
+# Score of an exact issue key, and bonus of the user's recent issues and projects
+EXACT_KEY_SCORE = 2.0
+RECENT_BOOST = 1.0
+
+
+class TypeaheadQueryService:
+    """Suggests issues, projects and users matching a few typed characters.
+
+    Every lookup is one statement: an exact issue key, issue titles, project
+    names and keys, and member names and emails are matched (ILIKE, backed by
+    the trigram indexes) and ranked in their own branch, the best of each
+    branch coming back in one round trip.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def suggest(
+        self, organization_id: UUID, user_id: UUID, query: str, limit: int
+    ) -> list[dict[str, Any]]:
+        """Best matches of a term within an organization, best first.
+
+        Matches score 1 when equal to the term, 0.75 when starting with it, 0.5
+        when a word starts with it and 0.25 otherwise; issues and projects the
+        user recently worked on get a bonus of 1.
+
+        Args:
+            organization_id: Organization UUID
+            user_id: User UUID (whose recent issues are boosted)
+            query: Typed term
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of suggestions (entity_type, id, label, key, project_id, score)
+        """
+
+        term = query.strip()
+        if not term:
+            return []
+
+        recent_activities = (
+            select(IssueActivityModel.issue_id)
+            .where(IssueActivityModel.user_id == user_id)
+            .order_by(IssueActivityModel.created_at.desc())
+            .limit(RECENT_ACTIVITIES)
+            .subquery()
+        )
+        recent_issues = select(recent_activities.c.issue_id).distinct().cte("recent_issues")
+        recent_projects = select(IssueModel.project_id).where(
+            IssueModel.id.in_(select(recent_issues.c.issue_id))
+        )
+
+        branches = [
+            self._issues(organization_id, term, recent_issues, limit),
+            self._projects(organization_id, term, recent_projects, limit),
+            self._members(organization_id, term, limit),
+        ]
+        key_match = ISSUE_KEY_PATTERN.match(term)
+        if key_match:
+            branches.insert(0, self._issue_by_key(organization_id, key_match[1], int(key_match[2])))
+
+        result = await self._session.execute(
+            union_all(*(select(branch.subquery()) for branch in branches))
+        )
+
+        # An issue found by key may be found by title too: keep its best score
+        suggestions: dict[tuple[str, UUID], dict[str, Any]] = {}
+        for row in result.mappings():
+            suggestion = {
+                "entity_type": row["entity_type"],
+                "id": row["id"],
+                "label": row["label"],
+                "key": row["key"],
+                "project_id": row["project_id"],
+                "score": float(row["score"]),
+            }
+            identity = (row["entity_type"], row["id"])
+            if identity not in suggestions or suggestions[identity]["score"] < suggestion["score"]:
+                suggestions[identity] = suggestion
+
+        ranked = sorted(
+            suggestions.values(), key=lambda item: (-item["score"], item["label"].lower())
+        )
+        return ranked[:limit]
+
+    @staticmethod
+    def _issue_by_key(organization_id: UUID, project_key: str, issue_number: int) -> Select:
+        """Issue of an exact key (uq_project_key, then ix_issues_project_number)."""
+        return (
+            select(
+                literal("issue").label("entity_type"),
+                IssueModel.id,
+                IssueModel.title.label("label"),
+                _issue_key(),
+                IssueModel.project_id,
+                literal(EXACT_KEY_SCORE, Float).label("score"),
+            )
+            .join(ProjectModel, ProjectModel.id == IssueModel.project_id)
+            .where(
+                ProjectModel.organization_id == organization_id,
+                ProjectModel.key == project_key.upper(),
+                ProjectModel.deleted_at.is_(None),
+                IssueModel.issue_number == issue_number,
+                IssueModel.deleted_at.is_(None),
+            )
+        )
+
+    @staticmethod
+    def _issues(organization_id: UUID, term: str, recent_issues: Any, limit: int) -> Select:
+        """Live issues whose title contains the term, recent ones first."""
+        is_recent = IssueModel.id.in_(select(recent_issues.c.issue_id))
+        conditions: list[Any] = [
+            ProjectModel.organization_id == organization_id,
+            ProjectModel.deleted_at.is_(None),
+            IssueModel.deleted_at.is_(None),
+            IssueModel.title.ilike(_contains(term)),
+        ]
+        if len(term) < TRIGRAM_MIN_LENGTH:
+            conditions.append(is_recent)
+        score = _match_score(IssueModel.title, term) + case((is_recent, RECENT_BOOST), else_=0.0)
+
+        return (
+            select(
+                literal("issue").label("entity_type"),
+                IssueModel.id,
+                IssueModel.title.label("label"),
+                _issue_key(),
+                IssueModel.project_id,
+                score.label("score"),
+            )
+            .join(ProjectModel, ProjectModel.id == IssueModel.project_id)
+            .where(*conditions)
+            .order_by(score.desc(), IssueModel.updated_at.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    def _projects(organization_id: UUID, term: str, recent_projects: Select, limit: int) -> Select:
+        """Live projects whose name contains the term or whose key starts with it."""
+        score = func.greatest(
+            _match_score(ProjectModel.name, term),
+            case(
+                (ProjectModel.key == term.upper(), 1.0),
+                (ProjectModel.key.ilike(_starts_with(term)), 0.75),
+                else_=0.0,
+            ),
+        ) + case((ProjectModel.id.in_(recent_projects), RECENT_BOOST), else_=0.0)
+
+        return (
+            select(
+                literal("project").label("entity_type"),
+                ProjectModel.id,
+                ProjectModel.name.label("label"),
+                ProjectModel.key.label("key"),
+                ProjectModel.id.label("project_id"),
+                score.label("score"),
+            )
+            .where(
+                ProjectModel.organization_id == organization_id,
+                ProjectModel.deleted_at.is_(None),
+                or_(
+                    ProjectModel.name.ilike(_contains(term)),
+                    ProjectModel.key.ilike(_starts_with(term)),
+                ),
+            )
+            .order_by(score.desc(), ProjectModel.name)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def _members(organization_id: UUID, term: str, limit: int) -> Select:
+        """Active members whose name contains the term or whose email starts with it."""
+        score = func.greatest(
+            _match_score(UserModel.name, term),
+            case((UserModel.email.ilike(_starts_with(term)), 0.75), else_=0.0),
+        )
+
+        return (
+            select(
+                literal("user").label("entity_type"),
+                UserModel.id,
+                UserModel.name.label("label"),
+                UserModel.email.label("key"),
+                cast(null(), PGUUID(as_uuid=True)).label("project_id"),
+                score.label("score"),
+            )
+            .join(OrganizationMemberModel, OrganizationMemberModel.user_id == UserModel.id)
+            .where(
+                OrganizationMemberModel.organization_id == organization_id,
+                UserModel.deleted_at.is_(None),
+                UserModel.is_active.is_(True),
+                or_(
+                    UserModel.name.ilike(_contains(term)),
+                    UserModel.email.ilike(_starts_with(term)),
+                ),
+            )
+            .order_by(score.desc(), UserModel.name)
+            .limit(limit)
+        )
+
+
+def _issue_key() -> Any:
+    return (ProjectModel.key + "-" + cast(IssueModel.issue_number, String)).label("key")
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(term: str) -> str:
+    return f"%{_escape_like(term)}%"
+
+
+def _starts_with(term: str) -> str:
+    return f"{_escape_like(term)}%"
+
+
+def _match_score(column: InstrumentedAttribute[str], term: str) -> Any:
+    """1 for the term itself, 0.75 for a prefix, 0.5 for a word prefix, else 0.25."""
+    return case(
+        (func.lower(column) == term.lower(), 1.0),
+        (column.ilike(_starts_with(term)), 0.75),
+        (column.ilike(f"% {_escape_like(term)}%"), 0.5),
+        else_=0.25,
+    )
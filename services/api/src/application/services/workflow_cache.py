@@ -0,0 +1,212 @@
+"""Compiled workflows cached in-process for status change validation."""
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.workflow import Workflow
+from src.domain.repositories import WorkflowRepository
+from src.infrastructure.database import after_commit
+
+
+def status_key(name: str) -> str:
+    """Key matching issue statuses and workflow status names ("In Progress" -> "inprogress")."""
+    return "".join(char for char in name.lower() if char.isalnum())
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledWorkflow:
+    """Immutable adjacency table of a workflow.
+
+    Maps each status to the statuses it may move to, so checking a transition
+    is two dict lookups instead of a scan of the transition list. A workflow
+    without any transition does not constrain issue status changes.
+    """
+
+    workflow_id: UUID
+    project_id: UUID
+    targets: Mapping[UUID, frozenset[UUID]]
+    status_ids: Mapping[str, UUID]
+    has_transitions: bool
+
+    @classmethod
+    def compile(cls, workflow: Workflow) -> "CompiledWorkflow":
+        """Compile a workflow loaded with its statuses and transitions."""
+        targets: dict[UUID, set[UUID]] = {status.id: set() for status in workflow.statuses}
+        for transition in workflow.transitions:
+            targets.setdefault(transition.from_status_id, set()).add(transition.to_status_id)
+        return cls(
+            workflow_id=workflow.id,
+            project_id=workflow.project_id,
+            targets=MappingProxyType({k: frozenset(v) for k, v in targets.items()}),
+            status_ids=MappingProxyType(
+                {status_key(status.name): status.id for status in workflow.statuses}
+            ),
+            has_transitions=bool(workflow.transitions),
+        )
+
+    def allows(self, from_status_id: UUID, to_status_id: UUID) -> bool:
+        """Whether the workflow has a transition between two statuses."""
+        return to_status_id in self.targets.get(from_status_id, ())
+
+    def allows_status_change(self, old_status: str, new_status: str) -> bool:
+        """Whether an issue may change from one status to another.
+
+        Issue statuses match workflow statuses by name (see `status_key`).
+        Only changes between two statuses of the workflow are checked: a
+        status the workflow does not define is not constrained by it.
+        """
+        if old_status == new_status or not self.has_transitions:
+            return True
+        from_id = self.status_ids.get(status_key(old_status))
+        to_id = self.status_ids.get(status_key(new_status))
+        if from_id is None or to_id is None:
+            return True
+        return self.allows(from_id, to_id)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    workflow: CompiledWorkflow | None
+    version: int
+    expires_at: float
+
+
+class WorkflowCache:
+    """Caches the compiled workflows of the projects, per worker process.
+
+    Entries are stamped with the version of their project: the workflow use
+    cases call `invalidate`, which bumps it once their transaction commits,
+    so the next read recompiles (a load racing with the commit keeps the old
+    version and is not read again; bumped before, a load in between would
+    cache the old workflow under the new version).
+    Other worker processes see a change once `ttl_seconds` have passed.
+    Projects without default workflow are cached too, as None.
+    """
+
+    def __init__(self, ttl_seconds: float = 60) -> None:
+        """Initialize workflow cache.
+
+        Args:
+            ttl_seconds: Time to live of compiled workflows (0 disables caching)
+        """
+        self._ttl_seconds = ttl_seconds
+        self._versions: dict[UUID, int] = {}
+        self._invalidations = 0
+        self._defaults: dict[UUID, _Entry] = {}
+        self._workflows: dict[UUID, _Entry] = {}
+
+    async def get_default(
+        self, project_id: UUID, workflow_repository: WorkflowRepository
+    ) -> CompiledWorkflow | None:
+        """Compiled default workflow of a project.
+
+        Args:
+            project_id: Project ID
+            workflow_repository: Loads the workflow when it is not cached
+
+        Returns:
+            Compiled workflow, or None when the project has no default workflow
+        """
+        entry = self._defaults.get(project_id)
+        if entry is not None and self._is_fresh(entry, project_id):
+            return entry.workflow
+
+        # The version is read before loading: an invalidation during the load
+        # makes the entry stale right away
+        version = self._versions.get(project_id, 0)
+        workflow = await workflow_repository.get_default_by_project_id(project_id)
+        compiled = CompiledWorkflow.compile(workflow) if workflow is not None else None
+        self._store(self._defaults, project_id, compiled, version)
+        return compiled
+
+    async def get(
+        self, workflow_id: UUID, workflow_repository: WorkflowRepository
+    ) -> CompiledWorkflow | None:
+        """Compiled workflow by ID.
+
+        Args:
+            workflow_id: Workflow ID
+            workflow_repository: Loads the workflow when it is not cached
+
+        Returns:
+            Compiled workflow, or None when it does not exist
+        """
+        entry = self._workflows.get(workflow_id)
+        if entry is not None and entry.workflow is not None:
+            if self._is_fresh(entry, entry.workflow.project_id):
+                return entry.workflow
+
+        # The project is only known once loaded: the result is not cached when
+        # any project was invalidated meanwhile
+        invalidations = self._invalidations
+        workflow = await workflow_repository.get_by_id(workflow_id)
+        if workflow is None:
+            self._workflows.pop(workflow_id, None)
+            return None
+        compiled = CompiledWorkflow.compile(workflow)
+        if invalidations == self._invalidations:
+            version = self._versions.get(workflow.project_id, 0)
+            self._store(self._workflows, workflow_id, compiled, version)
+        return compiled
+
+    async def allows_status_change(
+        self,
+        project_id: UUID,
+        old_status: str,
+        new_status: str,
+        workflow_repository: WorkflowRepository,
+    ) -> bool:
+        """Whether an issue of a project may change status.
+
+        Args:
+            project_id: Project of the issue
+            old_status: Current issue status
+            new_status: Requested issue status
+            workflow_repository: Loads the workflow when it is not cached
+
+        Returns:
+            False when the project's default workflow forbids the change
+        """
+        if old_status == new_status:
+            return True
+        workflow = await self.get_default(project_id, workflow_repository)
+        return workflow is None or workflow.allows_status_change(old_status, new_status)
+
+    def invalidate(self, project_id: UUID, session: AsyncSession | None = None) -> None:
+        """Drop the compiled workflows of a project (after one of them changed).
+
+        Args:
+            project_id: Project of the changed workflow
+            session: Session of the change (the workflows are dropped once it commits)
+        """
+        if session is not None:
+            after_commit(session, lambda: self.invalidate(project_id))
+            return
+
+        self._versions[project_id] = self._versions.get(project_id, 0) + 1
+        self._invalidations += 1
+        self._defaults.pop(project_id, None)
+        for workflow_id, entry in list(self._workflows.items()):
+            if entry.workflow is not None and entry.workflow.project_id == project_id:
+                del self._workflows[workflow_id]
+
+    def _store(
+        self,
+        entries: dict[UUID, _Entry],
+        key: UUID,
+        workflow: CompiledWorkflow | None,
+        version: int,
+    ) -> None:
+        if self._ttl_seconds > 0:
+            entries[key] = _Entry(workflow, version, time.monotonic() + self._ttl_seconds)
+
+    def _is_fresh(self, entry: _Entry, project_id: UUID) -> bool:
+        return (
+            entry.version == self._versions.get(project_id, 0)
+            and time.monotonic() < entry.expires_at
+        )
@@ -50,6 +50,7 @@ from src.application.use_cases.unified import ListFoldersAndNodesUseCase
 from src.application.use_cases.user import (
     DeactivateUserUseCase,
     DeleteAvatarUseCase,
+    GetAvatarUseCase,
     GetUserPreferencesUseCase,
     GetUserProfileUseCase,
     ListUsersUseCase,
@@ -76,6 +77,7 @@ __all__ = [
     # Avatar use cases
     "UploadAvatarUseCase",
     "DeleteAvatarUseCase",
+    "GetAvatarUseCase",
     # Preferences use cases
     "GetUserPreferencesUseCase",
     "UpdateUserPreferencesUseCase",
@@ -3,6 +3,9 @@
 from src.application.use_cases.attachment.delete_attachment import DeleteAttachmentUseCase
 from src.application.use_cases.attachment.download_attachment import DownloadAttachmentUseCase
 from src.application.use_cases.attachment.get_attachment import GetAttachmentUseCase
+from src.application.use_cases.attachment.get_attachment_thumbnail import (
+    GetAttachmentThumbnailUseCase,
+)
 from src.application.use_cases.attachment.list_attachments import ListAttachmentsUseCase
 from src.application.use_cases.attachment.upload_attachment import UploadAttachmentUseCase
 
@@ -12,4 +15,5 @@ __all__ = [
     "ListAttachmentsUseCase",
     "DeleteAttachmentUseCase",
     "DownloadAttachmentUseCase",
+    "GetAttachmentThumbnailUseCase",
 ]
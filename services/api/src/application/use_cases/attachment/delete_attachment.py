@@ -79,6 +79,16 @@ class DeleteAttachmentUseCase:
             )
             # Continue with database deletion even if storage deletion fails
 
+        if attachment.thumbnail_path:
+            try:
+                await self._storage_service.delete(attachment.thumbnail_path)
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete thumbnail from storage",
+                    thumbnail_path=attachment.thumbnail_path,
+                    error=str(e),
+                )
+
         # Delete from database
         await self._attachment_repository.delete(attachment_uuid)
 
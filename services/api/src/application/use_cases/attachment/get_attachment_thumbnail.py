@@ -0,0 +1,60 @@
+"""Get attachment thumbnail use case."""
+
+from uuid import UUID
+
+import structlog
+
+from src.domain.exceptions import EntityNotFoundException
+from src.domain.repositories import AttachmentRepository
+from src.domain.services import StorageService
+
+logger = structlog.get_logger()
+
+
+class GetAttachmentThumbnailUseCase:
+    """Use case for retrieving the thumbnail of an attachment."""
+
+    def __init__(
+        self,
+        attachment_repository: AttachmentRepository,
+        storage_service: StorageService,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            attachment_repository: Attachment repository
+            storage_service: Storage service for retrieving files
+        """
+        self._attachment_repository = attachment_repository
+        self._storage_service = storage_service
+
+    async def execute(self, attachment_id: str) -> bytes:
+        """Execute get attachment thumbnail.
+
+        Args:
+            attachment_id: Attachment ID
+
+        Returns:
+            Thumbnail content (WEBP)
+
+        Raises:
+            EntityNotFoundException: If attachment not found or has no thumbnail (yet)
+        """
+        attachment_uuid = UUID(attachment_id)
+        attachment = await self._attachment_repository.get_by_id(attachment_uuid)
+
+        if attachment is None:
+            raise EntityNotFoundException("Attachment", attachment_id)
+
+        if attachment.thumbnail_path is None:
+            raise EntityNotFoundException("Attachment thumbnail", attachment_id)
+
+        try:
+            return await self._storage_service.get_file(attachment.thumbnail_path)
+        except Exception as e:
+            logger.error(
+                "Failed to retrieve thumbnail from storage",
+                thumbnail_path=attachment.thumbnail_path,
+                error=str(e),
+            )
+            raise EntityNotFoundException("Attachment thumbnail", attachment_id) from e
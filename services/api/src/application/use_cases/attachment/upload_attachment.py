@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.attachment import UploadAttachmentResponse
+from src.application.interfaces import AttachmentPreviewService
 from src.application.utils.file_validation import (
     generate_unique_filename,
     validate_file_size,
@@ -31,6 +32,7 @@ class UploadAttachmentUseCase:
         user_repository: UserRepository,
         storage_service: StorageService,
         session: AsyncSession,
+        preview_service: AttachmentPreviewService | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -40,12 +42,14 @@ class UploadAttachmentUseCase:
             user_repository: User repository to verify user exists
             storage_service: Storage service for file operations
             session: Database session for loading user details
+            preview_service: Service generating thumbnails in the background (optional)
         """
         self._attachment_repository = attachment_repository
         self._issue_repository = issue_repository
         self._user_repository = user_repository
         self._storage_service = storage_service
         self._session = session
+        self._preview_service = preview_service
 
     async def execute(
         self,
@@ -150,6 +154,10 @@ class UploadAttachmentUseCase:
         # Persist attachment
         created_attachment = await self._attachment_repository.create(attachment)
 
+        # Thumbnail is generated off the request path, thumbnail_path is set when ready
+        if self._preview_service is not None:
+            self._preview_service.schedule(created_attachment.id, file_content, mime_type)
+
         # Load user details for response
         result = await self._session.execute(select(UserModel).where(UserModel.id == user_uuid))
         user_model = result.scalar_one()
@@ -0,0 +1,29 @@
+"""Backlog membership shared by the backlog use cases."""
+
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, exists, select
+
+from src.infrastructure.database.models import IssueModel, SprintIssueModel
+
+
+def backlog_conditions(project_id: UUID) -> list[ColumnElement[bool]]:
+    """Conditions selecting the backlog of a project.
+
+    The backlog is the live issues of the project that belong to no sprint.
+    Membership is an anti-join on the indexed `sprint_issues.issue_id`, so it
+    only looks at the project's issues (served by `ix_issues_backlog`).
+
+    Args:
+        project_id: Project UUID
+
+    Returns:
+        WHERE conditions on IssueModel
+    """
+    return [
+        IssueModel.project_id == project_id,
+        IssueModel.deleted_at.is_(None),
+        ~exists(
+            select(SprintIssueModel.issue_id).where(SprintIssueModel.issue_id == IssueModel.id)
+        ),
+    ]
@@ -3,14 +3,15 @@
 from uuid import UUID
 
 import structlog
-from sqlalchemy import case, select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.backlog import BacklogListResponse
 from src.application.dtos.issue import IssueListItemResponse
+from src.application.use_cases.backlog.backlog_filter import backlog_conditions
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueRepository, ProjectRepository, SprintRepository
-from src.infrastructure.database.models import IssueModel, SprintIssueModel
+from src.infrastructure.database.models import IssueModel
 
 logger = structlog.get_logger()
 
@@ -81,37 +82,24 @@ class ListBacklogUseCase:
 
         skip = (page - 1) * limit
 
-        # Get all issue IDs that are in sprints
-        sprint_issues_result = await self._session.execute(
-            select(SprintIssueModel.issue_id).distinct()
-        )
-        sprint_issue_ids = {row[0] for row in sprint_issues_result.all()}
-
-        # Build query for backlog issues (not in any sprint)
-        query = select(IssueModel).where(
-            IssueModel.project_id == project_id,
-            IssueModel.deleted_at.is_(None),
-        )
-
-        # Exclude issues in sprints
-        if sprint_issue_ids:
-            query = query.where(~IssueModel.id.in_(sprint_issue_ids))
-
-        # Apply filters
+        # Backlog issues (not in any sprint) matching the filters
+        conditions = backlog_conditions(project_id)
         if type_filter:
-            query = query.where(IssueModel.type == type_filter)
+            conditions.append(IssueModel.type == type_filter)
         if assignee_id:
-            query = query.where(IssueModel.assignee_id == assignee_id)
+            conditions.append(IssueModel.assignee_id == assignee_id)
         if priority_filter:
-            query = query.where(IssueModel.priority == priority_filter)
+            conditions.append(IssueModel.priority == priority_filter)
         if search:
             # Search in title and description
             search_pattern = f"%{search}%"
-            query = query.where(
+            conditions.append(
                 (IssueModel.title.ilike(search_pattern))
                 | (IssueModel.description.ilike(search_pattern))
             )
 
+        query = select(IssueModel).where(*conditions)
+
         # Apply sorting
         if sort_by == "backlog_order":
             query = query.order_by(
@@ -142,30 +130,7 @@ class ListBacklogUseCase:
             )
 
         # Get total count (before pagination)
-        from sqlalchemy import func
-
-        count_query = select(func.count(IssueModel.id)).where(
-            IssueModel.project_id == project_id,
-            IssueModel.deleted_at.is_(None),
-        )
-
-        if sprint_issue_ids:
-            count_query = count_query.where(~IssueModel.id.in_(sprint_issue_ids))
-
-        if type_filter:
-            count_query = count_query.where(IssueModel.type == type_filter)
-        if assignee_id:
-            count_query = count_query.where(IssueModel.assignee_id == assignee_id)
-        if priority_filter:
-            count_query = count_query.where(IssueModel.priority == priority_filter)
-        if search:
-            # Search in title and description
-            search_pattern = f"%{search}%"
-            count_query = count_query.where(
-                (IssueModel.title.ilike(search_pattern))
-                | (IssueModel.description.ilike(search_pattern))
-            )
-
+        count_query = select(func.count(IssueModel.id)).where(*conditions)
         count_result = await self._session.execute(count_query)
         total = count_result.scalar_one() or 0
 
@@ -175,12 +140,6 @@ class ListBacklogUseCase:
         result = await self._session.execute(query)
         issues = result.scalars().all()
 
-        # Get project to generate issue keys
-        project = await self._project_repository.get_by_id(project_id)
-        if project is None:
-            logger.warning("Project not found", project_id=str(project_id))
-            raise EntityNotFoundException("Project", str(project_id))
-
         # Convert to response DTOs with keys
         issue_responses = []
         for issue in issues:
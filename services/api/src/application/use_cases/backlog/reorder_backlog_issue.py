@@ -7,9 +7,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.backlog import ReorderBacklogIssueRequest
+from src.application.use_cases.backlog.backlog_filter import backlog_conditions
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import ProjectRepository, SprintRepository
-from src.infrastructure.database.models import IssueModel, SprintIssueModel
+from src.infrastructure.database.models import IssueModel
 
 logger = structlog.get_logger()
 
@@ -87,33 +88,17 @@ class ReorderBacklogIssueUseCase:
             )
             raise EntityNotFoundException("BacklogIssue", str(issue_id))
 
-        # Get all backlog issues (not in sprints) for this project
-        sprint_issues_result = await self._session.execute(
-            select(SprintIssueModel.issue_id).distinct()
+        # Get all backlog issues (not in sprints) for this project, in backlog order
+        backlog_query = (
+            select(IssueModel)
+            .where(*backlog_conditions(project_id))
+            .order_by(IssueModel.backlog_order.asc().nulls_last(), IssueModel.created_at.asc())
         )
-        sprint_issue_ids = {row[0] for row in sprint_issues_result.all()}
-
-        backlog_query = select(IssueModel).where(
-            IssueModel.project_id == project_id,
-            IssueModel.deleted_at.is_(None),
-        )
-
-        if sprint_issue_ids:
-            backlog_query = backlog_query.where(~IssueModel.id.in_(sprint_issue_ids))
 
         backlog_result = await self._session.execute(backlog_query)
-        backlog_issues = backlog_result.scalars().all()
 
         # Remove the issue being reordered from the list
-        backlog_issues = [i for i in backlog_issues if i.id != issue_id]
-
-        # Sort by current backlog_order
-        backlog_issues.sort(
-            key=lambda x: (
-                x.backlog_order if x.backlog_order is not None else float("inf"),
-                x.created_at,
-            )
-        )
+        backlog_issues = [i for i in backlog_result.scalars().all() if i.id != issue_id]
 
         # Insert issue at new position
         new_position = min(request.position, len(backlog_issues))
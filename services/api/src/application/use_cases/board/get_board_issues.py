@@ -14,6 +14,8 @@ from src.application.dtos.board import (
     BoardSwimlaneResponse,
     SwimlaneAssigneeSummary,
 )
+from src.application.dtos.issue import IssueRollupResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
 from src.domain.entities.board import BoardList
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import (
@@ -45,6 +47,7 @@ class GetBoardIssuesUseCase:
         comment_repository: CommentRepository,
         project_repository: ProjectRepository,
         user_repository: UserRepository | None = None,
+        hierarchy_service: IssueHierarchyService | None = None,
     ) -> None:
         self._board_repository = board_repository
         self._issue_repository = issue_repository
@@ -52,6 +55,7 @@ class GetBoardIssuesUseCase:
         self._comment_repository = comment_repository
         self._project_repository = project_repository
         self._user_repository = user_repository
+        self._hierarchy_service = hierarchy_service
 
     async def execute(self, board_id: UUID) -> BoardIssuesResponse:
         """Load board, apply scope, for each list load issues and build list-with-issues DTOs."""
@@ -111,6 +115,10 @@ class GetBoardIssuesUseCase:
                 scope_sprint_id=scope_sprint_id,
                 scope_reporter_id=scope_reporter_id,
             )
+            # Subtask counts come from the maintained rollups (one query per list)
+            rollups: dict[UUID, IssueRollupResponse] | None = None
+            if self._hierarchy_service:
+                rollups = await self._hierarchy_service.get_rollups(i.id for i in issues)
             items: list[BoardIssueItemResponse] = []
             for issue in issues:
                 label_entities = await self._label_repository.get_labels_for_issue(issue.id)
@@ -152,10 +160,14 @@ class GetBoardIssuesUseCase:
                     continue
                 project_key = project.key
                 comment_count = await self._comment_repository.count_by_issue_id(issue.id)
-                subtask_count = await self._issue_repository.count(
-                    issue.project_id,
-                    parent_issue_id=issue.id,
-                )
+                if rollups is not None:
+                    rollup = rollups.get(issue.id)
+                    subtask_count = rollup.child_count if rollup else 0
+                else:
+                    subtask_count = await self._issue_repository.count(
+                        issue.project_id,
+                        parent_issue_id=issue.id,
+                    )
                 item = BoardIssueItemResponse(
                     id=issue.id,
                     issue_number=issue.issue_number,
@@ -235,6 +247,13 @@ class GetBoardIssuesUseCase:
             keys_ordered.remove(None)
             keys_ordered.insert(0, None)
 
+        # Progress of every epic in one query
+        epic_rollups: dict[UUID, IssueRollupResponse] = {}
+        if swimlane_type == "epic" and self._hierarchy_service:
+            epic_rollups = await self._hierarchy_service.get_rollups(
+                k for k in keys_ordered if k is not None
+            )
+
         result: list[BoardSwimlaneResponse] = []
         for swimlane_id in keys_ordered:
             list_id_to_items = by_key[swimlane_id]
@@ -251,6 +270,7 @@ class GetBoardIssuesUseCase:
                         issues=items_in_cell,
                     )
                 )
+            rollup = epic_rollups.get(swimlane_id) if swimlane_id else None
             if swimlane_type == "epic":
                 if swimlane_id is None:
                     title = "No epic"
@@ -283,6 +303,7 @@ class GetBoardIssuesUseCase:
                     swimlane_id=swimlane_id,
                     swimlane_title=title,
                     assignee=assignee_summary,
+                    rollup=rollup,
                     lists=list_dtos_for_swimlane,
                 )
             )
@@ -301,6 +322,7 @@ class GetBoardIssuesUseCase:
         label_ids: list[UUID] | None = None
         assignee_id: UUID | None = None
         sprint_id: UUID | None = None
+        status: str | None = None
 
         if lst.list_type == "label":
             lid = list_config.get("label_id")
@@ -314,6 +336,8 @@ class GetBoardIssuesUseCase:
             sid = list_config.get("sprint_id")
             if sid is not None:
                 sprint_id = sid if isinstance(sid, UUID) else UUID(str(sid))
+        elif lst.list_type == "status":
+            status = list_config.get("status")
 
         # Apply global assignee/sprint scope on top of list-based filters (intersection).
         if scope_assignee_id:
@@ -333,6 +357,7 @@ class GetBoardIssuesUseCase:
                 limit=BOARD_ISSUES_LIMIT_PER_LIST,
                 assignee_id=assignee_id,
                 reporter_id=scope_reporter_id,
+                status=status,
                 label_ids=label_ids,
                 sprint_id=sprint_id,
             )
@@ -8,8 +8,14 @@ from uuid import UUID
 import structlog
 
 from src.application.dtos.board import BoardIssueItemResponse
+from src.application.interfaces import EventPublisher
+from src.application.services.issue_activity_recorder import IssueActivityRecorder
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.services.workflow_cache import WorkflowCache
 from src.domain.entities.board import BoardList
-from src.domain.exceptions import ConflictException, EntityNotFoundException
+from src.domain.events import DomainEvent, IssueAssigned, IssueStatusChanged
+from src.domain.exceptions import ConflictException, EntityNotFoundException, ValidationException
 
 if TYPE_CHECKING:
     from src.domain.entities import Issue
@@ -21,6 +27,7 @@ from src.domain.repositories import (
     LabelRepository,
     ProjectRepository,
     SprintRepository,
+    WorkflowRepository,
 )
 
 logger = structlog.get_logger()
@@ -40,6 +47,11 @@ class MoveBoardIssueUseCase:
         comment_repository: CommentRepository,
         project_repository: ProjectRepository,
         issue_activity_repository: IssueActivityRepository,
+        workflow_repository: WorkflowRepository | None = None,
+        workflow_cache: WorkflowCache | None = None,
+        event_publisher: EventPublisher | None = None,
+        hierarchy_service: IssueHierarchyService | None = None,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         self._board_repository = board_repository
         self._issue_repository = issue_repository
@@ -47,7 +59,12 @@ class MoveBoardIssueUseCase:
         self._sprint_repository = sprint_repository
         self._comment_repository = comment_repository
         self._project_repository = project_repository
-        self._issue_activity_repository = issue_activity_repository
+        self._activity_recorder = IssueActivityRecorder(issue_activity_repository)
+        self._workflow_repository = workflow_repository
+        self._workflow_cache = workflow_cache
+        self._event_publisher = event_publisher
+        self._hierarchy_service = hierarchy_service
+        self._filter_count_cache = filter_count_cache
 
     async def execute(
         self,
@@ -97,6 +114,11 @@ class MoveBoardIssueUseCase:
         if source_list_id == target_list_id:
             return await self._build_issue_response(issue, project.key, issue.project_id)
 
+        target_status = _get_status_from_config(target_list)
+        if target_status is not None:
+            await self._check_transition(issue, target_status)
+
+        old_status, old_assignee_id = issue.status, issue.assignee_id
         await self._apply_source_list_actions(issue, source_list)
         await self._apply_target_list_actions(issue, target_list, board.project_id)
 
@@ -104,7 +126,57 @@ class MoveBoardIssueUseCase:
         if updated_issue is None:
             raise EntityNotFoundException("Issue", str(issue_id))
 
-        await self._issue_activity_repository.create(
+        status_changed = updated_issue.status != old_status
+        if self._hierarchy_service and updated_issue.parent_issue_id and status_changed:
+            await self._hierarchy_service.refresh_rollups([updated_issue.id])
+
+        # Labels, sprints, status and assignee are all saved filter criteria
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(updated_issue.project_id)
+
+        # The fields the lists changed are logged with the move, in one statement,
+        # and published as the events notifications are sent from
+        events: list[DomainEvent] = []
+        if status_changed:
+            self._activity_recorder.record(
+                issue_id=issue_id,
+                user_id=user_id,
+                action="status_changed",
+                field_name="status",
+                old_value=old_status,
+                new_value=updated_issue.status,
+            )
+            events.append(
+                IssueStatusChanged(
+                    issue_id=updated_issue.id,
+                    project_id=updated_issue.project_id,
+                    issue_title=updated_issue.title,
+                    old_status=old_status,
+                    new_status=updated_issue.status,
+                    assignee_id=updated_issue.assignee_id,
+                    changed_by=user_id,
+                )
+            )
+        if updated_issue.assignee_id != old_assignee_id:
+            self._activity_recorder.record(
+                issue_id=issue_id,
+                user_id=user_id,
+                action="assigned",
+                field_name="assignee_id",
+                old_value=str(old_assignee_id) if old_assignee_id else None,
+                new_value=str(updated_issue.assignee_id) if updated_issue.assignee_id else None,
+            )
+            events.append(
+                IssueAssigned(
+                    issue_id=updated_issue.id,
+                    project_id=updated_issue.project_id,
+                    issue_title=updated_issue.title,
+                    old_assignee_id=old_assignee_id,
+                    new_assignee_id=updated_issue.assignee_id,
+                    assigned_by=user_id,
+                )
+            )
+        self._activity_recorder.record(
             issue_id=issue_id,
             user_id=user_id,
             action=ACTION_BOARD_MOVE,
@@ -112,6 +184,9 @@ class MoveBoardIssueUseCase:
             old_value=str(source_list_id),
             new_value=str(target_list_id),
         )
+        await self._activity_recorder.flush()
+        if self._event_publisher:
+            await self._event_publisher.publish(*events)
 
         logger.info(
             "Board issue moved",
@@ -161,6 +236,14 @@ class MoveBoardIssueUseCase:
             if uid:
                 issue.update_assignee(uid)
                 await self._issue_repository.update(issue)
+        elif target_list.list_type == "status":
+            status = _get_status_from_config(target_list)
+            if status and status != issue.status:
+                try:
+                    issue.update_status(status)
+                except ValueError as e:
+                    raise ValidationException(str(e), field="target_list_id") from e
+                await self._issue_repository.update(issue)
         elif target_list.list_type == "milestone":
             sid = _get_uuid_from_config(list_config, "sprint_id")
             if sid:
@@ -175,6 +258,19 @@ class MoveBoardIssueUseCase:
                 except ConflictException:
                     pass
 
+    async def _check_transition(self, issue: Issue, status: str) -> None:
+        """Reject a status change the project's default workflow does not allow."""
+        if not self._workflow_cache or not self._workflow_repository:
+            return
+        if not await self._workflow_cache.allows_status_change(
+            issue.project_id, issue.status, status, self._workflow_repository
+        ):
+            raise ValidationException(
+                f"Transition from '{issue.status}' to '{status}' "
+                "is not allowed by the project workflow",
+                field="target_list_id",
+            )
+
     async def _build_issue_response(
         self, issue: Issue, project_key: str, project_id: UUID
     ) -> BoardIssueItemResponse:
@@ -215,6 +311,14 @@ def _get_uuid_from_config(config: dict, key: str) -> UUID | None:
         return None
 
 
+def _get_status_from_config(board_list: BoardList) -> str | None:
+    """Issue status a status list sets (None for other list types)."""
+    if board_list.list_type != "status":
+        return None
+    status = (board_list.list_config or {}).get("status")
+    return status if isinstance(status, str) else None
+
+
 def _extract_label_ids(value: object) -> list[UUID]:
     """Extract list of UUIDs from scope_config label_ids."""
     if not value or not isinstance(value, list):
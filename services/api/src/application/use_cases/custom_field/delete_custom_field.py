@@ -4,6 +4,7 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories.custom_field_repository import CustomFieldRepository
 
@@ -13,9 +14,14 @@ logger = structlog.get_logger()
 class DeleteCustomFieldUseCase:
     """Use case for deleting a custom field."""
 
-    def __init__(self, custom_field_repository: CustomFieldRepository) -> None:
+    def __init__(
+        self,
+        custom_field_repository: CustomFieldRepository,
+        filter_count_cache: SavedFilterCountCache | None = None,
+    ) -> None:
         """Initialize use case with dependencies."""
         self._custom_field_repository = custom_field_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(self, custom_field_id: UUID) -> None:
         """Execute delete custom field."""
@@ -29,4 +35,8 @@ class DeleteCustomFieldUseCase:
 
         await self._custom_field_repository.delete(custom_field_id)
 
+        # The values of the field go with it
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(custom_field.project_id)
+
         logger.info("Custom field deleted", field_id=str(custom_field_id))
@@ -0,0 +1,167 @@
+"""Get dashboard data use case."""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.dtos.dashboard import DashboardDataResponse, DashboardWidgetDataResponse
+from src.application.interfaces import CacheService
+from src.application.use_cases.dashboard.widget_data import (
+    WidgetAggregate,
+    compute_widget_data,
+    resolve_widget_project,
+)
+from src.domain.entities.dashboard import Dashboard, DashboardWidget
+from src.domain.exceptions import EntityNotFoundException
+from src.domain.repositories.dashboard_repository import DashboardRepository
+
+logger = structlog.get_logger()
+
+
+class GetDashboardDataUseCase:
+    """Use case for getting the data of every widget of a dashboard in one call.
+
+    Widgets showing the same aggregate (same type and project) share one
+    query, cached results are reused for `cache_ttl_seconds`, and the
+    remaining queries run concurrently, each on its own session.
+    """
+
+    def __init__(
+        self,
+        dashboard_repository: DashboardRepository,
+        session: AsyncSession,
+        cache_service: CacheService,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        cache_ttl_seconds: float = 30,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            dashboard_repository: Dashboard repository
+            session: Request session (used for every query without a session factory)
+            cache_service: Cache of widget results
+            session_factory: Factory of the sessions queries run on concurrently
+            cache_ttl_seconds: Time to live of cached results (0 disables caching)
+            max_concurrency: Maximum number of queries running at once
+        """
+        self._dashboard_repository = dashboard_repository
+        self._session = session
+        self._cache_service = cache_service
+        self._session_factory = session_factory
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._max_concurrency = max_concurrency
+
+    async def execute(
+        self, dashboard_id: UUID, dashboard: Dashboard | None = None
+    ) -> DashboardDataResponse:
+        """Execute get dashboard data.
+
+        Args:
+            dashboard_id: Dashboard ID
+            dashboard: The dashboard, when already loaded (not loaded again)
+
+        Returns:
+            Data of the dashboard widgets, in position order
+
+        Raises:
+            EntityNotFoundException: If dashboard not found
+        """
+        logger.info("Getting dashboard data", dashboard_id=str(dashboard_id))
+
+        if dashboard is None:
+            dashboard = await self._dashboard_repository.get_by_id(dashboard_id)
+        if dashboard is None:
+            raise EntityNotFoundException("Dashboard", str(dashboard_id))
+
+        widgets = sorted(dashboard.widgets, key=lambda w: w.position)
+        widget_aggregates: dict[UUID, WidgetAggregate | None] = {}
+        for widget in widgets:
+            project_id = resolve_widget_project(dashboard.project_id, widget.config)
+            widget_aggregates[widget.id] = (
+                WidgetAggregate(widget_type=widget.type, project_id=project_id)
+                if project_id
+                else None
+            )
+
+        # One query per distinct aggregate, first checked against the cache
+        aggregates = list(dict.fromkeys(a for a in widget_aggregates.values() if a is not None))
+        results: dict[WidgetAggregate, dict[str, Any]] = {}
+        if self._cache_ttl_seconds > 0:
+            for aggregate in aggregates:
+                cached = await self._cache_service.get(aggregate.cache_key)
+                if cached is not None:
+                    results[aggregate] = cached
+        cached_aggregates = set(results)
+
+        misses = [a for a in aggregates if a not in cached_aggregates]
+        results.update(await self._compute(misses))
+
+        if self._cache_ttl_seconds > 0:
+            for aggregate in misses:
+                await self._cache_service.set(
+                    aggregate.cache_key, results[aggregate], self._cache_ttl_seconds
+                )
+
+        logger.info(
+            "Dashboard data computed",
+            dashboard_id=str(dashboard_id),
+            widgets=len(widgets),
+            queries=len(misses),
+            cache_hits=len(cached_aggregates),
+        )
+
+        return DashboardDataResponse(
+            dashboard_id=dashboard.id,
+            widgets=[
+                self._widget_response(
+                    widget, widget_aggregates[widget.id], results, cached_aggregates
+                )
+                for widget in widgets
+            ],
+        )
+
+    async def _compute(
+        self, aggregates: list[WidgetAggregate]
+    ) -> dict[WidgetAggregate, dict[str, Any]]:
+        """Run the queries of the given aggregates."""
+        if self._session_factory is None or self._max_concurrency <= 1 or len(aggregates) <= 1:
+            # A session runs one statement at a time: run them in turn
+            return {
+                aggregate: await compute_widget_data(self._session, aggregate)
+                for aggregate in aggregates
+            }
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        session_factory = self._session_factory
+
+        async def compute(aggregate: WidgetAggregate) -> dict[str, Any]:
+            async with semaphore, session_factory() as session:
+                return await compute_widget_data(session, aggregate)
+
+        data = await asyncio.gather(*(compute(aggregate) for aggregate in aggregates))
+        return dict(zip(aggregates, data, strict=True))
+
+    @staticmethod
+    def _widget_response(
+        widget: DashboardWidget,
+        aggregate: WidgetAggregate | None,
+        results: dict[WidgetAggregate, dict[str, Any]],
+        cached_aggregates: set[WidgetAggregate],
+    ) -> DashboardWidgetDataResponse:
+        """Build the response of one widget."""
+        if aggregate is None:
+            return DashboardWidgetDataResponse(
+                widget_id=widget.id,
+                widget_type=widget.type,
+                error="No project specified",
+            )
+        return DashboardWidgetDataResponse(
+            widget_id=widget.id,
+            widget_type=widget.type,
+            data=results[aggregate],
+            cached=aggregate in cached_aggregates,
+        )
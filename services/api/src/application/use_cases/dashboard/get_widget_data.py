@@ -1,17 +1,20 @@
 """Get widget data use case."""
 
-from typing import Any
 from uuid import UUID
 
 import structlog
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.dashboard import WidgetDataRequest, WidgetDataResponse
+from src.application.interfaces import CacheService
+from src.application.use_cases.dashboard.widget_data import (
+    WidgetAggregate,
+    compute_widget_data,
+    resolve_widget_project,
+)
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueRepository, ProjectRepository
 from src.domain.repositories.dashboard_repository import DashboardRepository
-from src.infrastructure.database.models import IssueModel
 
 logger = structlog.get_logger()
 
@@ -25,12 +28,25 @@ class GetWidgetDataUseCase:
         issue_repository: IssueRepository,
         project_repository: ProjectRepository,
         session: AsyncSession,
+        cache_service: CacheService | None = None,
+        cache_ttl_seconds: float = 0,
     ) -> None:
-        """Initialize use case with dependencies."""
+        """Initialize use case with dependencies.
+
+        Args:
+            dashboard_repository: Dashboard repository
+            issue_repository: Issue repository
+            project_repository: Project repository
+            session: Database session the widget query runs on
+            cache_service: Cache of widget results (optional)
+            cache_ttl_seconds: Time to live of cached results (0 disables caching)
+        """
         self._dashboard_repository = dashboard_repository
         self._issue_repository = issue_repository
         self._project_repository = project_repository
         self._session = session
+        self._cache_service = cache_service
+        self._cache_ttl_seconds = cache_ttl_seconds
 
     async def execute(
         self, dashboard_id: UUID, widget_id: UUID, request: WidgetDataRequest
@@ -51,86 +67,17 @@ class GetWidgetDataUseCase:
         if widget is None:
             raise EntityNotFoundException("DashboardWidget", str(widget_id))
 
-        # Get project_id from dashboard or config
-        project_id = dashboard.project_id
-        if not project_id and request.config:
-            project_id = request.config.get("project_id")
-
+        project_id = resolve_widget_project(dashboard.project_id, request.config)
         if not project_id:
             raise EntityNotFoundException("Project", "No project specified")
 
-        # Generate widget data based on type
-        data: dict[str, Any] = {}
-
-        if request.widget_type == "issue_status_breakdown":
-            # Count issues by status
-            result = await self._session.execute(
-                select(
-                    IssueModel.status,
-                    func.count(IssueModel.id).label("count"),
-                )
-                .where(
-                    IssueModel.project_id == project_id,
-                    IssueModel.deleted_at.is_(None),
-                )
-                .group_by(IssueModel.status)
-            )
-            rows = result.all()
-            data = {row.status: row.count for row in rows}
-
-        elif request.widget_type == "issue_count_over_time":
-            # Count issues created over time (last 30 days)
-            from datetime import datetime, timedelta
-
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=30)
-
-            result = await self._session.execute(
-                select(
-                    func.date(IssueModel.created_at).label("date"),
-                    func.count(IssueModel.id).label("count"),
-                )
-                .where(
-                    IssueModel.project_id == project_id,
-                    IssueModel.deleted_at.is_(None),
-                    IssueModel.created_at >= start_date,
-                    IssueModel.created_at <= end_date,
-                )
-                .group_by(func.date(IssueModel.created_at))
-                .order_by(func.date(IssueModel.created_at))
-            )
-            rows = result.all()
-            data = {str(row.date): row.count for row in rows}
-
-        elif request.widget_type == "assigned_issues_list":
-            # Get assigned issues (limit to 10)
-            # Query issues directly from the session
-            stmt = (
-                select(IssueModel)
-                .where(
-                    IssueModel.project_id == project_id,
-                    IssueModel.assignee_id.is_not(None),
-                    IssueModel.deleted_at.is_(None),
-                )
-                .limit(10)
-            )
-            result = await self._session.execute(stmt)
-            issue_models = result.scalars().all()
-            # Convert to dict format for widget data
-            data = {
-                "issues": [
-                    {
-                        "id": str(im.id),
-                        "title": im.title,
-                        "status": im.status,
-                        "assignee_id": str(im.assignee_id) if im.assignee_id else None,
-                    }
-                    for im in issue_models
-                ]
-            }
-
-        elif request.widget_type == "recent_activity_feed":
-            # Get recent activity (placeholder - would need activity repository)
-            data = {"activities": []}
+        aggregate = WidgetAggregate(widget_type=request.widget_type, project_id=project_id)
+        data = None
+        if self._cache_service is not None and self._cache_ttl_seconds > 0:
+            data = await self._cache_service.get(aggregate.cache_key)
+        if data is None:
+            data = await compute_widget_data(self._session, aggregate)
+            if self._cache_service is not None and self._cache_ttl_seconds > 0:
+                await self._cache_service.set(aggregate.cache_key, data, self._cache_ttl_seconds)
 
         return WidgetDataResponse(data=data)
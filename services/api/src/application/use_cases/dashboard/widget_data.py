@@ -0,0 +1,120 @@
+"""Widget aggregates shared by the widget data use cases."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import IssueModel
+
+# Window of the issue_count_over_time widget
+ISSUE_COUNT_OVER_TIME_DAYS = 30
+
+# Number of issues listed by the assigned_issues_list widget
+ASSIGNED_ISSUES_LIMIT = 10
+
+
+@dataclass(frozen=True)
+class WidgetAggregate:
+    """Query behind a widget: widgets with equal aggregates show the same data."""
+
+    widget_type: str
+    project_id: UUID
+
+    @property
+    def cache_key(self) -> str:
+        """Cache key of the aggregate result (scoped by project)."""
+        return f"dashboard-widget:{self.project_id}:{self.widget_type}"
+
+
+def resolve_widget_project(
+    dashboard_project_id: UUID | None, config: dict[str, Any] | None
+) -> UUID | None:
+    """Project a widget reports on: the dashboard's, else `project_id` from its config."""
+    if dashboard_project_id:
+        return dashboard_project_id
+    project_id = (config or {}).get("project_id")
+    if project_id is None:
+        return None
+    return project_id if isinstance(project_id, UUID) else UUID(str(project_id))
+
+
+async def compute_widget_data(session: AsyncSession, aggregate: WidgetAggregate) -> dict[str, Any]:
+    """Run the query of a widget aggregate.
+
+    Args:
+        session: Database session to run the query on
+        aggregate: Widget aggregate
+
+    Returns:
+        Widget data (empty for unknown widget types)
+    """
+    project_id = aggregate.project_id
+
+    if aggregate.widget_type == "issue_status_breakdown":
+        # Count issues by status
+        result = await session.execute(
+            select(
+                IssueModel.status,
+                func.count(IssueModel.id).label("count"),
+            )
+            .where(
+                IssueModel.project_id == project_id,
+                IssueModel.deleted_at.is_(None),
+            )
+            .group_by(IssueModel.status)
+        )
+        return {row.status: row.count for row in result.all()}
+
+    if aggregate.widget_type == "issue_count_over_time":
+        # Count issues created per day over the window
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=ISSUE_COUNT_OVER_TIME_DAYS)
+
+        result = await session.execute(
+            select(
+                func.date(IssueModel.created_at).label("date"),
+                func.count(IssueModel.id).label("count"),
+            )
+            .where(
+                IssueModel.project_id == project_id,
+                IssueModel.deleted_at.is_(None),
+                IssueModel.created_at >= start_date,
+                IssueModel.created_at <= end_date,
+            )
+            .group_by(func.date(IssueModel.created_at))
+            .order_by(func.date(IssueModel.created_at))
+        )
+        return {str(row.date): row.count for row in result.all()}
+
+    if aggregate.widget_type == "assigned_issues_list":
+        # Only the listed columns are loaded (no full issue rows)
+        result = await session.execute(
+            select(IssueModel.id, IssueModel.title, IssueModel.status, IssueModel.assignee_id)
+            .where(
+                IssueModel.project_id == project_id,
+                IssueModel.assignee_id.is_not(None),
+                IssueModel.deleted_at.is_(None),
+            )
+            .limit(ASSIGNED_ISSUES_LIMIT)
+        )
+        return {
+            "issues": [
+                {
+                    "id": str(row.id),
+                    "title": row.title,
+                    "status": row.status,
+                    "assignee_id": str(row.assignee_id) if row.assignee_id else None,
+                }
+                for row in result.all()
+            ]
+        }
+
+    if aggregate.widget_type == "recent_activity_feed":
+        # Get recent activity (placeholder - would need activity repository)
+        return {"activities": []}
+
+    return {}
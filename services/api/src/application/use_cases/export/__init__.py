@@ -1,9 +1,13 @@
 """Export use cases."""
 
+from src.application.use_cases.export.export_issues import ExportIssuesUseCase
 from src.application.use_cases.export.export_page import ExportPageUseCase
 from src.application.use_cases.export.export_space import ExportSpaceUseCase
+from src.application.use_cases.export.import_issues import ImportIssuesUseCase
 
 __all__ = [
+    "ExportIssuesUseCase",
     "ExportPageUseCase",
     "ExportSpaceUseCase",
+    "ImportIssuesUseCase",
 ]
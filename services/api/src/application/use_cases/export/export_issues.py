@@ -0,0 +1,279 @@
+"""Export issues use case."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, cast
+from uuid import UUID
+
+import structlog
+from sqlalchemy import JSON, String, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from src.domain.exceptions import EntityNotFoundException
+from src.domain.repositories import ProjectRepository
+from src.domain.repositories.custom_field_repository import CustomFieldRepository
+from src.infrastructure.database.models import (
+    CustomFieldModel,
+    CustomFieldValueModel,
+    IssueLabelModel,
+    IssueModel,
+    LabelModel,
+    SprintIssueModel,
+    SprintModel,
+    UserModel,
+)
+
+logger = structlog.get_logger()
+
+# Export format -> MIME type
+ISSUE_EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Rows fetched per round trip from the server-side cursor (and written per chunk)
+EXPORT_BATCH_SIZE = 1000
+
+# CSV columns, followed by one "cf:<name>" column per custom field of the project
+CSV_COLUMNS = (
+    "key",
+    "title",
+    "description",
+    "type",
+    "status",
+    "priority",
+    "reporter",
+    "assignee",
+    "due_date",
+    "story_points",
+    "parent",
+    "labels",
+    "sprints",
+    "created_at",
+    "updated_at",
+)
+CUSTOM_FIELD_COLUMN_PREFIX = "cf:"
+
+# Separator of list values (labels, sprints, multi-valued custom fields) in CSV cells
+CSV_LIST_SEPARATOR = ";"
+
+
+class ExportIssuesUseCase:
+    """Use case for exporting the issues of a project as NDJSON or CSV.
+
+    Issues are read through a server-side cursor and written batch by batch,
+    so memory use does not grow with the project size. Labels, custom field
+    values and sprint membership are aggregated in the same query.
+
+    The content is produced after the request handler has returned (and its
+    session closed), so the cursor runs on a session of its own, opened and
+    closed by the content iterator.
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        custom_field_repository: CustomFieldRepository,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            project_repository: Project repository
+            custom_field_repository: Custom field repository (CSV columns)
+            session_factory: Factory of the session the export is streamed from
+        """
+        self._project_repository = project_repository
+        self._custom_field_repository = custom_field_repository
+        self._session_factory = session_factory
+
+    async def execute(
+        self,
+        project_id: str,
+        export_format: str = "ndjson",
+    ) -> tuple[AsyncIterator[bytes], str, str]:
+        """Execute export issues.
+
+        The project and format are checked before returning; the content is
+        produced while the returned iterator is consumed.
+
+        Args:
+            project_id: Project ID
+            export_format: Export format (ndjson, csv)
+
+        Returns:
+            Tuple of (content chunks, mime_type, filename)
+
+        Raises:
+            EntityNotFoundException: If project not found
+            ValueError: If export format is invalid
+        """
+        if export_format not in ISSUE_EXPORT_FORMATS:
+            raise ValueError(
+                f"Invalid export format: {export_format}. "
+                f"Supported formats: {', '.join(ISSUE_EXPORT_FORMATS)}"
+            )
+
+        project_uuid = UUID(project_id)
+        project = await self._project_repository.get_by_id(project_uuid)
+        if project is None:
+            raise EntityNotFoundException("Project", project_id)
+
+        logger.info("Exporting issues", project_id=project_id, format=export_format)
+
+        if export_format == "csv":
+            custom_fields = await self._custom_field_repository.get_by_project_id(project_uuid)
+            chunks = self._csv_chunks(
+                project_uuid, project.key, sorted(field.name for field in custom_fields)
+            )
+        else:
+            chunks = self._ndjson_chunks(project_uuid, project.key)
+
+        filename = f"{project.key.lower()}-issues.{export_format}"
+        return chunks, ISSUE_EXPORT_FORMATS[export_format], filename
+
+    async def _ndjson_chunks(self, project_id: UUID, project_key: str) -> AsyncIterator[bytes]:
+        """One JSON document per line and per issue."""
+        async for rows in self._batches(project_id):
+            yield "".join(
+                json.dumps(self._record(row, project_key), ensure_ascii=False) + "\n"
+                for row in rows
+            ).encode()
+
+    async def _csv_chunks(
+        self, project_id: UUID, project_key: str, custom_field_names: list[str]
+    ) -> AsyncIterator[bytes]:
+        """CSV with a header row, custom fields as "cf:<name>" columns."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(
+            [*CSV_COLUMNS, *(CUSTOM_FIELD_COLUMN_PREFIX + name for name in custom_field_names)]
+        )
+
+        async for rows in self._batches(project_id):
+            for row in rows:
+                record = self._record(row, project_key)
+                custom_fields = record.pop("custom_fields")
+                writer.writerow(
+                    [
+                        *(_csv_cell(record[column]) for column in CSV_COLUMNS),
+                        *(_csv_cell(custom_fields.get(name)) for name in custom_field_names),
+                    ]
+                )
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Header only (no issues)
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    async def _batches(self, project_id: UUID) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Stream the issues of a project (by number) through a server-side cursor."""
+        reporter = aliased(UserModel)
+        assignee = aliased(UserModel)
+        parent = aliased(IssueModel)
+
+        labels = (
+            select(
+                func.array_agg(
+                    aggregate_order_by(LabelModel.name, LabelModel.name), type_=ARRAY(String)
+                )
+            )
+            .select_from(IssueLabelModel)
+            .join(LabelModel, LabelModel.id == IssueLabelModel.label_id)
+            .where(IssueLabelModel.issue_id == IssueModel.id)
+            .scalar_subquery()
+        )
+        custom_fields = (
+            select(
+                func.json_object_agg(CustomFieldModel.name, CustomFieldValueModel.value, type_=JSON)
+            )
+            .select_from(CustomFieldValueModel)
+            .join(CustomFieldModel, CustomFieldModel.id == CustomFieldValueModel.custom_field_id)
+            .where(CustomFieldValueModel.issue_id == IssueModel.id)
+            .scalar_subquery()
+        )
+        sprints = (
+            select(
+                func.array_agg(
+                    aggregate_order_by(SprintModel.name, SprintModel.start_date, SprintModel.name),
+                    type_=ARRAY(String),
+                )
+            )
+            .select_from(SprintIssueModel)
+            .join(SprintModel, SprintModel.id == SprintIssueModel.sprint_id)
+            .where(SprintIssueModel.issue_id == IssueModel.id)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(
+                IssueModel.issue_number,
+                IssueModel.title,
+                IssueModel.description,
+                IssueModel.type,
+                IssueModel.status,
+                IssueModel.priority,
+                reporter.email.label("reporter"),
+                assignee.email.label("assignee"),
+                IssueModel.due_date,
+                IssueModel.story_points,
+                parent.issue_number.label("parent_number"),
+                labels.label("labels"),
+                custom_fields.label("custom_fields"),
+                sprints.label("sprints"),
+                IssueModel.created_at,
+                IssueModel.updated_at,
+            )
+            .outerjoin(reporter, reporter.id == IssueModel.reporter_id)
+            .outerjoin(assignee, assignee.id == IssueModel.assignee_id)
+            .outerjoin(parent, parent.id == IssueModel.parent_issue_id)
+            .where(IssueModel.project_id == project_id, IssueModel.deleted_at.is_(None))
+            .order_by(IssueModel.issue_number)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        session = self._session_factory()
+        try:
+            result = await session.stream(query)
+            async for rows in result.partitions():
+                yield cast(Sequence[Row[Any]], rows)
+        finally:
+            await session.close()
+
+    @staticmethod
+    def _record(row: Row[Any], project_key: str) -> dict[str, Any]:
+        """Exported representation of one issue (the format the import reads)."""
+        return {
+            "key": f"{project_key}-{row.issue_number}",
+            "title": row.title,
+            "description": row.description,
+            "type": row.type,
+            "status": row.status,
+            "priority": row.priority,
+            "reporter": row.reporter,
+            "assignee": row.assignee,
+            "due_date": row.due_date.isoformat() if row.due_date else None,
+            "story_points": row.story_points,
+            "parent": f"{project_key}-{row.parent_number}" if row.parent_number else None,
+            "labels": row.labels or [],
+            "custom_fields": row.custom_fields or {},
+            "sprints": row.sprints or [],
+            "created_at": row.created_at.isoformat(),
+            "updated_at": row.updated_at.isoformat(),
+        }
+
+
+def _csv_cell(value: Any) -> Any:
+    """CSV representation of an exported value (lists joined, None empty)."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return value
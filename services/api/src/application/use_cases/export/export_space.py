@@ -120,13 +120,11 @@ class ExportSpaceUseCase:
         ]
 
         for page in pages:
-            html_parts.append(
-                f"""
+            html_parts.append(f"""
     <div class="page">
         <div class="page-title">{page.title}</div>
         <div class="page-content">{page.content or ''}</div>
-    </div>"""
-            )
+    </div>""")
 
         html_parts.append("</body></html>")
         full_html = "\n".join(html_parts)
@@ -217,13 +215,11 @@ class ExportSpaceUseCase:
         ]
 
         for page in pages:
-            html_parts.append(
-                f"""
+            html_parts.append(f"""
     <div class="page">
         <div class="page-title">{page.title}</div>
         <div class="page-content">{page.content or ''}</div>
-    </div>"""
-            )
+    </div>""")
 
         html_parts.append("</body></html>")
         full_html = "\n".join(html_parts)
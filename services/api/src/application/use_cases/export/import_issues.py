@@ -0,0 +1,438 @@
+"""Import issues use case."""
+
+import asyncio
+import csv
+import io
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
+from uuid import UUID, uuid4
+
+import structlog
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.issue_import import (
+    ImportIssueError,
+    ImportIssueRow,
+    ImportIssuesResponse,
+)
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.use_cases.export.export_issues import (
+    CSV_LIST_SEPARATOR,
+    CUSTOM_FIELD_COLUMN_PREFIX,
+)
+from src.domain.entities.custom_field import CustomField
+from src.domain.exceptions import EntityNotFoundException, ValidationException
+from src.domain.repositories import IssueRepository, ProjectRepository
+from src.domain.repositories.custom_field_repository import CustomFieldRepository
+from src.infrastructure.database.models import (
+    LabelModel,
+    OrganizationMemberModel,
+    UserModel,
+)
+
+logger = structlog.get_logger()
+
+ISSUE_IMPORT_FORMATS = ("ndjson", "csv")
+
+# Rows sent per COPY command
+IMPORT_BATCH_SIZE = 5000
+
+# Validation errors returned (all are counted)
+MAX_REPORTED_ERRORS = 100
+
+# Color of the labels an import creates
+DEFAULT_LABEL_COLOR = "#6b7280"
+
+ISSUE_COPY_COLUMNS = (
+    "id",
+    "project_id",
+    "issue_number",
+    "title",
+    "description",
+    "type",
+    "status",
+    "priority",
+    "reporter_id",
+    "assignee_id",
+    "due_date",
+    "story_points",
+)
+
+
+class ImportIssuesUseCase:
+    """Use case for importing issues into a project from NDJSON or CSV.
+
+    The file is read twice, row by row: a first pass validates every row (and
+    resolves users, labels and custom fields in bulk), a second pass loads the
+    rows with COPY in batches. Issue numbers are reserved as one block, so an
+    import is a handful of statements whatever its size. Nothing is written
+    when any row is invalid.
+    """
+
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        issue_repository: IssueRepository,
+        custom_field_repository: CustomFieldRepository,
+        session: AsyncSession,
+        filter_count_cache: SavedFilterCountCache | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            project_repository: Project repository
+            issue_repository: Issue repository (issue number reservation)
+            custom_field_repository: Custom field repository
+            session: Database session the rows are copied through
+            filter_count_cache: Saved filter totals to invalidate (optional)
+        """
+        self._project_repository = project_repository
+        self._issue_repository = issue_repository
+        self._custom_field_repository = custom_field_repository
+        self._session = session
+        self._filter_count_cache = filter_count_cache
+
+    async def execute(
+        self,
+        project_id: str,
+        file: BinaryIO,
+        import_format: str,
+        user_id: str,
+    ) -> ImportIssuesResponse:
+        """Execute import issues.
+
+        Args:
+            project_id: Project ID
+            file: Seekable binary file (UTF-8 NDJSON or CSV with a header row)
+            import_format: Import format (ndjson, csv)
+            user_id: ID of the importing user (default reporter)
+
+        Returns:
+            Import response (number of issues created, or the validation errors)
+
+        Raises:
+            EntityNotFoundException: If project not found
+            ValidationException: If the file is not UTF-8
+            ValueError: If import format is invalid
+        """
+        if import_format not in ISSUE_IMPORT_FORMATS:
+            raise ValueError(
+                f"Invalid import format: {import_format}. "
+                f"Supported formats: {', '.join(ISSUE_IMPORT_FORMATS)}"
+            )
+
+        project_uuid = UUID(project_id)
+        project = await self._project_repository.get_by_id(project_uuid)
+        if project is None:
+            raise EntityNotFoundException("Project", project_id)
+
+        custom_fields = {
+            field.name: field
+            for field in await self._custom_field_repository.get_by_project_id(project_uuid)
+        }
+
+        # First pass: validate and collect the references to resolve, in a thread
+        # (the whole file is parsed without I/O to yield to the event loop on)
+        row_count, errors, email_rows, label_names = await asyncio.to_thread(
+            self._scan, file, import_format, custom_fields
+        )
+
+        user_ids = await self._organization_user_ids(project.organization_id, list(email_rows))
+        for email, rows in email_rows.items():
+            if email not in user_ids:
+                errors.extend(
+                    ImportIssueError(
+                        row=row_number,
+                        message=f"User '{email}' is not a member of the organization",
+                    )
+                    for row_number in rows
+                )
+
+        if errors or row_count == 0:
+            errors.sort(key=lambda error: error.row)
+            logger.info(
+                "Issue import rejected",
+                project_id=project_id,
+                rows=row_count,
+                error_count=len(errors),
+            )
+            return ImportIssuesResponse(
+                imported=0,
+                error_count=len(errors),
+                errors=errors[:MAX_REPORTED_ERRORS],
+            )
+
+        # Second pass: load
+        file.seek(0)
+        label_ids = await self._ensure_labels(project_uuid, label_names)
+        numbers = await self._issue_repository.reserve_issue_numbers(project_uuid, row_count)
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        loader = _IssueLoader(
+            raw_connection.driver_connection,
+            project_uuid,
+            UUID(user_id),
+            user_ids,
+            label_ids,
+            custom_fields,
+        )
+        parsed_rows = self._read(file, import_format, custom_fields)
+        for (_, row), issue_number in zip(parsed_rows, numbers, strict=True):
+            if isinstance(row, ImportIssueRow):  # Always, the first pass found no errors
+                loader.add(issue_number, row)
+            if loader.pending >= IMPORT_BATCH_SIZE:
+                await loader.flush()
+        await loader.flush()
+
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(project_uuid)
+
+        logger.info(
+            "Issues imported",
+            project_id=project_id,
+            imported=row_count,
+            first_issue_number=numbers.start,
+        )
+
+        return ImportIssuesResponse(imported=row_count, first_issue_number=numbers.start)
+
+    def _scan(
+        self,
+        file: BinaryIO,
+        import_format: str,
+        custom_fields: dict[str, CustomField],
+    ) -> tuple[int, list[ImportIssueError], dict[str, list[int]], set[str]]:
+        """Validate every row of the file.
+
+        Returns:
+            Tuple of (row count, row errors, row numbers by user email, label names)
+        """
+        errors: list[ImportIssueError] = []
+        row_count = 0
+        email_rows: dict[str, list[int]] = defaultdict(list)
+        label_names: set[str] = set()
+        for row_number, row in self._read(file, import_format, custom_fields):
+            row_count += 1
+            if isinstance(row, ImportIssueError):
+                errors.append(row)
+                continue
+            for email in (row.reporter, row.assignee):
+                if email:
+                    email_rows[email.lower()].append(row_number)
+            label_names.update(row.labels)
+        return row_count, errors, email_rows, label_names
+
+    def _read(
+        self,
+        file: BinaryIO,
+        import_format: str,
+        custom_fields: dict[str, CustomField],
+    ) -> Iterator[tuple[int, ImportIssueRow | ImportIssueError]]:
+        """Parse and validate the rows of the file, one at a time."""
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            if import_format == "csv":
+                records: Iterable[dict[str, Any] | str] = (
+                    _from_csv(record, custom_fields) for record in csv.DictReader(text)
+                )
+            else:
+                records = (_from_ndjson(line) for line in text if line.strip())
+
+            for row_number, record in enumerate(records, start=1):
+                if isinstance(record, str):
+                    yield row_number, ImportIssueError(row=row_number, message=record)
+                    continue
+                yield row_number, _validate(row_number, record, custom_fields)
+        except UnicodeDecodeError as e:
+            raise ValidationException("Import file must be UTF-8 encoded", field="file") from e
+        finally:
+            # Leave the file open (and seekable) for the second pass
+            text.detach()
+
+    async def _organization_user_ids(
+        self, organization_id: UUID, emails: list[str]
+    ) -> dict[str, UUID]:
+        """Resolve emails to the organization members having them."""
+        if not emails:
+            return {}
+        result = await self._session.execute(
+            select(func.lower(UserModel.email), UserModel.id)
+            .join(OrganizationMemberModel, OrganizationMemberModel.user_id == UserModel.id)
+            .where(
+                OrganizationMemberModel.organization_id == organization_id,
+                func.lower(UserModel.email).in_(emails),
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def _ensure_labels(self, project_id: UUID, names: set[str]) -> dict[str, UUID]:
+        """Create the missing labels and return the IDs of all of them by name."""
+        if not names:
+            return {}
+        await self._session.execute(
+            insert(LabelModel)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "project_id": project_id,
+                        "name": name,
+                        "color": DEFAULT_LABEL_COLOR,
+                    }
+                    for name in sorted(names)
+                ]
+            )
+            .on_conflict_do_nothing(constraint="uq_label_project_name")
+        )
+        result = await self._session.execute(
+            select(LabelModel.name, LabelModel.id).where(
+                LabelModel.project_id == project_id, LabelModel.name.in_(names)
+            )
+        )
+        return dict(result.tuples().all())
+
+
+class _IssueLoader:
+    """Buffers imported issues and their labels, field values and activities for COPY."""
+
+    def __init__(
+        self,
+        driver_connection: Any,
+        project_id: UUID,
+        importer_id: UUID,
+        user_ids: dict[str, UUID],
+        label_ids: dict[str, UUID],
+        custom_fields: dict[str, CustomField],
+    ) -> None:
+        self._driver_connection = driver_connection
+        self._project_id = project_id
+        self._importer_id = importer_id
+        self._user_ids = user_ids
+        self._label_ids = label_ids
+        self._custom_fields = custom_fields
+        self._issues: list[tuple[Any, ...]] = []
+        self._issue_labels: list[tuple[Any, ...]] = []
+        self._field_values: list[tuple[Any, ...]] = []
+        self._activities: list[tuple[Any, ...]] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered issues."""
+        return len(self._issues)
+
+    def add(self, issue_number: int, row: ImportIssueRow) -> None:
+        issue_id = uuid4()
+        reporter_id = self._user_ids[row.reporter.lower()] if row.reporter else self._importer_id
+        self._issues.append(
+            (
+                issue_id,
+                self._project_id,
+                issue_number,
+                row.title,
+                row.description,
+                row.type,
+                row.status,
+                row.priority,
+                reporter_id,
+                self._user_ids[row.assignee.lower()] if row.assignee else None,
+                row.due_date,
+                row.story_points,
+            )
+        )
+        self._issue_labels.extend((uuid4(), issue_id, self._label_ids[name]) for name in row.labels)
+        self._field_values.extend(
+            (uuid4(), self._custom_fields[name].id, issue_id, json.dumps(value))
+            for name, value in row.custom_fields.items()
+            if value is not None
+        )
+        self._activities.append((uuid4(), issue_id, self._importer_id, "created"))
+
+    async def flush(self) -> None:
+        """COPY the buffered rows (timestamps use the column defaults)."""
+        for table, columns, records in (
+            ("issues", ISSUE_COPY_COLUMNS, self._issues),
+            ("issue_labels", ("id", "issue_id", "label_id"), self._issue_labels),
+            (
+                "custom_field_values",
+                ("id", "custom_field_id", "issue_id", "value"),
+                self._field_values,
+            ),
+            ("issue_activities", ("id", "issue_id", "user_id", "action"), self._activities),
+        ):
+            if records:
+                await self._driver_connection.copy_records_to_table(
+                    table, records=records, columns=columns
+                )
+                records.clear()
+
+
+def _from_ndjson(line: str) -> dict[str, Any] | str:
+    """Parse one NDJSON line (error message if invalid)."""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return f"Invalid JSON: {e.msg}"
+    if not isinstance(record, dict):
+        return "Each line must be a JSON object"
+    return record
+
+
+def _from_csv(
+    record: dict[str, Any], custom_fields: dict[str, CustomField]
+) -> dict[str, Any] | str:
+    """Convert a CSV record to the NDJSON shape (error message if invalid)."""
+    converted: dict[str, Any] = {}
+    values: dict[str, Any] = {}
+    for column, value in record.items():
+        # Empty cells are missing values; extra cells of a row have no column
+        if column is None or value is None or value == "":
+            continue
+        if column.startswith(CUSTOM_FIELD_COLUMN_PREFIX):
+            name = column[len(CUSTOM_FIELD_COLUMN_PREFIX) :]
+            field = custom_fields.get(name)
+            if field is None:
+                return f"Unknown custom field '{name}'"
+            if field.type in {"multi_select", "users"}:
+                values[name] = value.split(CSV_LIST_SEPARATOR)
+            elif field.type == "number":
+                try:
+                    number = float(value)
+                except ValueError:
+                    return f"Custom field '{name}' must be a number"
+                values[name] = int(number) if number.is_integer() else number
+            else:
+                values[name] = value
+        elif column == "labels":
+            converted[column] = value.split(CSV_LIST_SEPARATOR)
+        else:
+            converted[column] = value
+    converted["custom_fields"] = values
+    return converted
+
+
+def _validate(
+    row_number: int, record: dict[str, Any], custom_fields: dict[str, CustomField]
+) -> ImportIssueRow | ImportIssueError:
+    """Validate one record against the issue fields and the project custom fields."""
+    try:
+        row = ImportIssueRow.model_validate(record)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return ImportIssueError(row=row_number, message=f"{location}: {error['msg']}")
+
+    for name in row.custom_fields:
+        if name not in custom_fields:
+            return ImportIssueError(row=row_number, message=f"Unknown custom field '{name}'")
+    for name, field in custom_fields.items():
+        try:
+            field.validate_value(row.custom_fields.get(name))
+        except ValueError as e:
+            return ImportIssueError(row=row_number, message=str(e))
+    return row
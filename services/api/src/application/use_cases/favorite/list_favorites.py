@@ -3,20 +3,11 @@
 from uuid import UUID
 
 import structlog
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.favorite import FavoriteListItemResponse, FavoriteListResponse
-from src.application.dtos.node import NodeDetailsProject, NodeDetailsSpace, NodeListItemResponse
-from src.domain.repositories import FavoriteRepository, ProjectRepository, SpaceRepository
+from src.application.services.node_resolver import NodeResolver
+from src.domain.repositories import FavoriteRepository
 from src.domain.value_objects.entity_type import EntityType
-from src.infrastructure.database.models import (
-    IssueModel,
-    PageModel,
-    ProjectMemberModel,
-    ProjectModel,
-    SpaceModel,
-)
 
 logger = structlog.get_logger()
 
@@ -27,22 +18,16 @@ class ListFavoritesUseCase:
     def __init__(
         self,
         favorite_repository: FavoriteRepository,
-        project_repository: ProjectRepository,
-        space_repository: SpaceRepository,
-        session: AsyncSession,
+        node_resolver: NodeResolver,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             favorite_repository: Favorite repository
-            project_repository: Project repository
-            space_repository: Space repository
-            session: Database session for getting folder_id and counts
+            node_resolver: Resolves the favorite projects and spaces into nodes
         """
         self._favorite_repository = favorite_repository
-        self._project_repository = project_repository
-        self._space_repository = space_repository
-        self._session = session
+        self._node_resolver = node_resolver
 
     async def execute(
         self,
@@ -85,11 +70,9 @@ class ListFavoritesUseCase:
             entity_type=entity_type_vo,
         )
 
-        favorite_responses = []
-
+        # Favorites are only allowed for projects and spaces
+        supported = []
         for favorite in favorites:
-            # Favorites are only allowed for projects and spaces
-            # Skip any favorites that are not projects or spaces (shouldn't happen, but safety check)
             if not favorite.entity_type.is_project() and not favorite.entity_type.is_space():
                 logger.warning(
                     "Skipping favorite with unsupported entity type",
@@ -97,78 +80,16 @@ class ListFavoritesUseCase:
                     entity_type=favorite.entity_type.value,
                 )
                 continue
+            supported.append(favorite)
 
-            node_data: NodeListItemResponse | None = None
-
-            # Enrich with node data for projects and spaces only (no folders)
-            if favorite.entity_type.is_project():
-                project = await self._project_repository.get_by_id(favorite.entity_id)
-                if project:
-                    # Get folder_id from model
-                    folder_result = await self._session.execute(
-                        select(ProjectModel.folder_id).where(ProjectModel.id == project.id)
-                    )
-                    project_folder_id = folder_result.scalar_one_or_none()
-
-                    # Count members
-                    member_result = await self._session.execute(
-                        select(func.count())
-                        .select_from(ProjectMemberModel)
-                        .where(ProjectMemberModel.project_id == project.id)
-                    )
-                    member_count: int = member_result.scalar_one()
-
-                    # Count issues
-                    issue_result = await self._session.execute(
-                        select(func.count())
-                        .select_from(IssueModel)
-                        .where(IssueModel.project_id == project.id)
-                    )
-                    issue_count: int = issue_result.scalar_one()
-
-                    node_data = NodeListItemResponse(
-                        type="project",
-                        id=project.id,
-                        organization_id=project.organization_id,
-                        details=NodeDetailsProject(
-                            name=project.name,
-                            key=project.key,
-                            description=project.description,
-                            folder_id=project_folder_id,
-                            member_count=member_count,
-                            issue_count=issue_count,
-                        ),
-                    )
-
-            elif favorite.entity_type.is_space():
-                space = await self._space_repository.get_by_id(favorite.entity_id)
-                if space:
-                    # Get folder_id from model
-                    space_folder_result = await self._session.execute(
-                        select(SpaceModel.folder_id).where(SpaceModel.id == space.id)
-                    )
-                    space_folder_id = space_folder_result.scalar_one_or_none()
-
-                    # Count pages
-                    page_count_result = await self._session.execute(
-                        select(func.count())
-                        .select_from(PageModel)
-                        .where(PageModel.space_id == space.id)
-                    )
-                    page_count: int = page_count_result.scalar_one()
-
-                    node_data = NodeListItemResponse(
-                        type="space",
-                        id=space.id,
-                        organization_id=space.organization_id,
-                        details=NodeDetailsSpace(
-                            name=space.name,
-                            key=space.key,
-                            description=space.description,
-                            folder_id=space_folder_id,
-                            page_count=page_count,
-                        ),
-                    )
+        # One query per entity type for the whole page
+        nodes = await self._node_resolver.resolve(
+            (favorite.entity_type.value, favorite.entity_id) for favorite in supported
+        )
+
+        favorite_responses = []
+        for favorite in supported:
+            node_data = nodes.get((favorite.entity_type.value, favorite.entity_id))
 
             # If node_data is None, skip this favorite (entity not found)
             if node_data is None:
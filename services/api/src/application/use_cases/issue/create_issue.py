@@ -6,6 +6,8 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.issue import CreateIssueRequest, IssueResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.entities import Issue
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import (
@@ -28,6 +30,8 @@ class CreateIssueUseCase:
         user_repository: UserRepository,
         activity_repository: IssueActivityRepository,
         session: AsyncSession,
+        hierarchy_service: IssueHierarchyService | None = None,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -37,12 +41,16 @@ class CreateIssueUseCase:
             user_repository: User repository to verify reporter exists
             activity_repository: Issue activity repository for logging
             session: Database session (for consistency, not directly used here)
+            hierarchy_service: Maintains the rollups of the parent issues (optional)
+            filter_count_cache: Saved filter totals to invalidate (optional)
         """
         self._issue_repository = issue_repository
         self._project_repository = project_repository
         self._user_repository = user_repository
         self._activity_repository = activity_repository
         self._session = session
+        self._hierarchy_service = hierarchy_service
+        self._filter_count_cache = filter_count_cache
 
     async def execute(self, request: CreateIssueRequest, reporter_user_id: str) -> IssueResponse:
         """Execute issue creation.
@@ -116,6 +124,12 @@ class CreateIssueUseCase:
         # Persist issue
         created_issue = await self._issue_repository.create(issue)
 
+        if self._hierarchy_service and created_issue.parent_issue_id:
+            await self._hierarchy_service.refresh_rollups([created_issue.id])
+
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(created_issue.project_id)
+
         # Create activity log for issue creation
         await self._activity_repository.create(
             issue_id=created_issue.id,
@@ -4,6 +4,8 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueActivityRepository, IssueRepository
 
@@ -17,15 +19,21 @@ class DeleteIssueUseCase:
         self,
         issue_repository: IssueRepository,
         activity_repository: IssueActivityRepository,
+        hierarchy_service: IssueHierarchyService | None = None,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             issue_repository: Issue repository for data access
             activity_repository: Issue activity repository for logging
+            hierarchy_service: Maintains the rollups of the parent issues (optional)
+            filter_count_cache: Saved filter totals to invalidate (optional)
         """
         self._issue_repository = issue_repository
         self._activity_repository = activity_repository
+        self._hierarchy_service = hierarchy_service
+        self._filter_count_cache = filter_count_cache
 
     async def execute(self, issue_id: str, user_id: UUID | None = None) -> None:
         """Execute delete issue.
@@ -48,6 +56,12 @@ class DeleteIssueUseCase:
         issue.delete()  # Soft delete
         await self._issue_repository.update(issue)
 
+        if self._hierarchy_service and issue.parent_issue_id:
+            await self._hierarchy_service.refresh_rollups([issue.id])
+
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(issue.project_id)
+
         # Create activity log for issue deletion
         await self._activity_repository.create(
             issue_id=issue.id,
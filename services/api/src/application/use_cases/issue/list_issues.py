@@ -1,13 +1,19 @@
 """List issues use case."""
 
 import math
+from typing import Any
 from uuid import UUID
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.issue import IssueListItemResponse, IssueListResponse
-from src.domain.repositories import IssueRepository, ProjectRepository
+from src.domain.entities import CustomFieldValue
+from src.domain.repositories import (
+    CustomFieldValueRepository,
+    IssueRepository,
+    ProjectRepository,
+)
 
 logger = structlog.get_logger()
 
@@ -23,6 +29,7 @@ class ListIssuesUseCase:
         issue_repository: IssueRepository,
         project_repository: ProjectRepository,
         session: AsyncSession,
+        custom_field_value_repository: CustomFieldValueRepository | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -30,10 +37,13 @@ class ListIssuesUseCase:
             issue_repository: Issue repository for data access
             project_repository: Project repository to get project keys for issue key generation
             session: Database session (for consistency, not directly used here)
+            custom_field_value_repository: Loads the custom field values of a page
+                (optional, required by `include_custom_fields`)
         """
         self._issue_repository = issue_repository
         self._project_repository = project_repository
         self._session = session
+        self._custom_field_value_repository = custom_field_value_repository
 
     async def execute(
         self,
@@ -47,6 +57,10 @@ class ListIssuesUseCase:
         type: str | None = None,
         priority: str | None = None,
         sprint_id: str | None = None,
+        custom_field_values: dict[str, Any] | None = None,
+        sort_custom_field_id: str | None = None,
+        sort_order: str = "asc",
+        include_custom_fields: bool = False,
     ) -> IssueListResponse:
         """Execute list issues.
 
@@ -60,6 +74,13 @@ class ListIssuesUseCase:
             status: Optional status filter
             type: Optional type filter
             priority: Optional priority filter
+            sprint_id: Optional sprint filter
+            custom_field_values: Optional custom field filters by field ID (a list
+                value matches issues having all its items)
+            sort_custom_field_id: Optional custom field to sort by (issues without
+                a value come last)
+            sort_order: Custom field sort order, "asc" or "desc"
+            include_custom_fields: Whether to return the custom field values
 
         Returns:
             Issue list response DTO with pagination metadata
@@ -74,6 +95,9 @@ class ListIssuesUseCase:
         if limit < 1:
             raise ValueError("Limit must be >= 1")
 
+        if sort_order not in ("asc", "desc"):
+            raise ValueError("Sort order must be 'asc' or 'desc'")
+
         if limit > self.MAX_LIMIT:
             limit = self.MAX_LIMIT
 
@@ -92,6 +116,8 @@ class ListIssuesUseCase:
             type=type,
             priority=priority,
             sprint_id=sprint_id,
+            custom_field_values=custom_field_values,
+            sort_custom_field_id=sort_custom_field_id,
         )
 
         project_uuid = UUID(project_id)
@@ -105,6 +131,12 @@ class ListIssuesUseCase:
         assignee_uuid = UUID(assignee_id) if assignee_id else None
         reporter_uuid = UUID(reporter_id) if reporter_id else None
         sprint_uuid = UUID(sprint_id) if sprint_id else None
+        field_values = (
+            {UUID(field_id): value for field_id, value in custom_field_values.items()}
+            if custom_field_values
+            else None
+        )
+        sort_field_uuid = UUID(sort_custom_field_id) if sort_custom_field_id else None
 
         # Get issues based on filters
         if search:
@@ -126,6 +158,9 @@ class ListIssuesUseCase:
                 type=type,
                 priority=priority,
                 sprint_id=sprint_uuid,
+                custom_field_values=field_values,
+                sort_custom_field_id=sort_field_uuid,
+                sort_descending=sort_order == "desc",
             )
             total = await self._issue_repository.count(
                 project_id=project_uuid,
@@ -136,16 +171,24 @@ class ListIssuesUseCase:
                 type=type,
                 priority=priority,
                 sprint_id=sprint_uuid,
+                custom_field_values=field_values,
             )
 
         # Calculate total pages
         pages = math.ceil(total / limit) if total > 0 else 0
 
+        # One query for the custom field values of the whole page
+        values_by_issue: dict[UUID, list[CustomFieldValue]] = {}
+        if include_custom_fields and self._custom_field_value_repository is not None:
+            values_by_issue = await self._custom_field_value_repository.get_by_issue_ids(
+                [issue.id for issue in issues]
+            )
+
         # Convert to response DTOs with keys
         issue_responses = []
         for issue in issues:
             issue_key = issue.generate_key(project.key)
-            issue_dict = {
+            issue_dict: dict[str, Any] = {
                 "id": issue.id,
                 "project_id": issue.project_id,
                 "issue_number": issue.issue_number,
@@ -159,6 +202,11 @@ class ListIssuesUseCase:
                 "created_at": issue.created_at,
                 "updated_at": issue.updated_at,
             }
+            if include_custom_fields:
+                issue_dict["custom_fields"] = {
+                    value.custom_field_id: value.value
+                    for value in values_by_issue.get(issue.id, [])
+                }
             issue_responses.append(IssueListItemResponse.model_validate(issue_dict))
 
         logger.info(
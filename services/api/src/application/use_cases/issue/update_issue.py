@@ -3,20 +3,23 @@
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.issue import IssueResponse, UpdateIssueRequest
-from src.application.services.notification_service import NotificationService
+from src.application.interfaces import EventPublisher
+from src.application.services.issue_activity_recorder import IssueActivityRecorder
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.services.workflow_cache import WorkflowCache
+from src.domain.events import DomainEvent, IssueAssigned, IssueStatusChanged
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.repositories import (
     IssueActivityRepository,
     IssueRepository,
-    NotificationRepository,
     ProjectRepository,
     UserRepository,
+    WorkflowRepository,
 )
-from src.infrastructure.database.models import UserModel
 
 logger = structlog.get_logger()
 
@@ -30,8 +33,12 @@ class UpdateIssueUseCase:
         project_repository: ProjectRepository,
         user_repository: UserRepository,
         activity_repository: IssueActivityRepository,
-        notification_repository: NotificationRepository,
+        event_publisher: EventPublisher,
         session: AsyncSession,
+        hierarchy_service: IssueHierarchyService | None = None,
+        filter_count_cache: SavedFilterCountCache | None = None,
+        workflow_repository: WorkflowRepository | None = None,
+        workflow_cache: WorkflowCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -40,15 +47,24 @@ class UpdateIssueUseCase:
             project_repository: Project repository to get project key for issue key generation
             user_repository: User repository to verify assignee exists
             activity_repository: Issue activity repository for logging
-            notification_repository: Notification repository for creating notifications
+            event_publisher: Publisher of the status change and assignment events
             session: Database session (for consistency, not directly used here)
+            hierarchy_service: Maintains the rollups of the parent issues (optional)
+            filter_count_cache: Saved filter totals to invalidate (optional)
+            workflow_repository: Workflow repository, with `workflow_cache` status
+                changes must follow the project's default workflow (optional)
+            workflow_cache: Compiled workflows status changes are checked against (optional)
         """
         self._issue_repository = issue_repository
         self._project_repository = project_repository
         self._user_repository = user_repository
-        self._activity_repository = activity_repository
-        self._notification_service = NotificationService(notification_repository)
+        self._activity_recorder = IssueActivityRecorder(activity_repository)
+        self._event_publisher = event_publisher
         self._session = session
+        self._hierarchy_service = hierarchy_service
+        self._filter_count_cache = filter_count_cache
+        self._workflow_repository = workflow_repository
+        self._workflow_cache = workflow_cache
 
     async def execute(
         self, issue_id: str, request: UpdateIssueRequest, user_id: UUID | None = None
@@ -106,6 +122,18 @@ class UpdateIssueUseCase:
                 issue.update_status(request.status)
             except ValueError as e:
                 raise ValidationException(str(e), field="status") from e
+            if (
+                self._workflow_cache
+                and self._workflow_repository
+                and not await self._workflow_cache.allows_status_change(
+                    issue.project_id, old_status, issue.status, self._workflow_repository
+                )
+            ):
+                raise ValidationException(
+                    f"Transition from '{old_status}' to '{issue.status}' "
+                    "is not allowed by the project workflow",
+                    field="status",
+                )
 
         if request.priority is not None:
             try:
@@ -128,10 +156,22 @@ class UpdateIssueUseCase:
         # Save to database
         updated_issue = await self._issue_repository.update(issue)
 
-        # Create activity logs for changed fields
+        if (
+            self._hierarchy_service
+            and updated_issue.parent_issue_id
+            and (request.status is not None or request.story_points is not None)
+        ):
+            await self._hierarchy_service.refresh_rollups([updated_issue.id])
+
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(updated_issue.project_id)
+
+        # Record activity logs for changed fields (written together below), and the
+        # events notifications are sent from once the update has committed
+        events: list[DomainEvent] = []
 
         if request.title is not None and old_title != updated_issue.title:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="updated",
@@ -141,7 +181,7 @@ class UpdateIssueUseCase:
             )
 
         if request.description is not None and old_description != updated_issue.description:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="updated",
@@ -151,7 +191,7 @@ class UpdateIssueUseCase:
             )
 
         if request.status is not None and old_status != updated_issue.status:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="status_changed",
@@ -160,42 +200,20 @@ class UpdateIssueUseCase:
                 new_value=updated_issue.status,
             )
 
-            # Notify issue assignee about status change
-            if updated_issue.assignee_id and updated_issue.assignee_id != user_id:
-                # Get user who changed status
-                changer_name = "Someone"
-                if user_id:
-                    result = await self._session.execute(
-                        select(UserModel).where(UserModel.id == user_id)
-                    )
-                    changer_model = result.scalar_one_or_none()
-                    if changer_model:
-                        changer_name = changer_model.name
-
-                try:
-                    await self._notification_service.notify_issue_status_changed(
-                        user_id=updated_issue.assignee_id,
-                        issue_id=updated_issue.id,
-                        issue_title=updated_issue.title,
-                        old_status=old_status,
-                        new_status=updated_issue.status,
-                        changed_by_name=changer_name,
-                    )
-                    logger.info(
-                        "Notification sent for status change",
-                        issue_id=str(updated_issue.id),
-                        assignee_id=str(updated_issue.assignee_id),
-                    )
-                except Exception as e:
-                    # Log error but don't fail the update if notification fails
-                    logger.warning(
-                        "Failed to send status change notification",
-                        error=str(e),
-                        issue_id=str(updated_issue.id),
-                    )
+            events.append(
+                IssueStatusChanged(
+                    issue_id=updated_issue.id,
+                    project_id=updated_issue.project_id,
+                    issue_title=updated_issue.title,
+                    old_status=old_status,
+                    new_status=updated_issue.status,
+                    assignee_id=updated_issue.assignee_id,
+                    changed_by=user_id,
+                )
+            )
 
         if request.priority is not None and old_priority != updated_issue.priority:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="updated",
@@ -205,7 +223,7 @@ class UpdateIssueUseCase:
             )
 
         if request.assignee_id is not None and old_assignee_id != updated_issue.assignee_id:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="assigned",
@@ -214,40 +232,19 @@ class UpdateIssueUseCase:
                 new_value=str(updated_issue.assignee_id) if updated_issue.assignee_id else None,
             )
 
-            # Notify newly assigned user
-            if updated_issue.assignee_id and updated_issue.assignee_id != old_assignee_id:
-                # Get assigner user name
-                assigner_name = "Someone"
-                if user_id:
-                    result = await self._session.execute(
-                        select(UserModel).where(UserModel.id == user_id)
-                    )
-                    assigner_model = result.scalar_one_or_none()
-                    if assigner_model:
-                        assigner_name = assigner_model.name
-
-                try:
-                    await self._notification_service.notify_issue_assigned(
-                        assignee_id=updated_issue.assignee_id,
-                        issue_id=updated_issue.id,
-                        issue_title=updated_issue.title,
-                        assigned_by_name=assigner_name,
-                    )
-                    logger.info(
-                        "Notification sent for issue assignment",
-                        issue_id=str(updated_issue.id),
-                        assignee_id=str(updated_issue.assignee_id),
-                    )
-                except Exception as e:
-                    # Log error but don't fail the update if notification fails
-                    logger.warning(
-                        "Failed to send assignment notification",
-                        error=str(e),
-                        issue_id=str(updated_issue.id),
-                    )
+            events.append(
+                IssueAssigned(
+                    issue_id=updated_issue.id,
+                    project_id=updated_issue.project_id,
+                    issue_title=updated_issue.title,
+                    old_assignee_id=old_assignee_id,
+                    new_assignee_id=updated_issue.assignee_id,
+                    assigned_by=user_id,
+                )
+            )
 
         if request.due_date is not None and old_due_date != updated_issue.due_date:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="updated",
@@ -257,7 +254,7 @@ class UpdateIssueUseCase:
             )
 
         if request.story_points is not None and old_story_points != updated_issue.story_points:
-            await self._activity_repository.create(
+            self._activity_recorder.record(
                 issue_id=updated_issue.id,
                 user_id=user_id,
                 action="updated",
@@ -266,6 +263,9 @@ class UpdateIssueUseCase:
                 new_value=str(updated_issue.story_points) if updated_issue.story_points else None,
             )
 
+        await self._activity_recorder.flush()
+        await self._event_publisher.publish(*events)
+
         # Get project to generate issue key
         project = await self._project_repository.get_by_id(updated_issue.project_id)
         if project is None:
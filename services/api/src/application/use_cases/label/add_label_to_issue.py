@@ -4,6 +4,7 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueRepository, LabelRepository
 
@@ -17,9 +18,11 @@ class AddLabelToIssueUseCase:
         self,
         label_repository: LabelRepository,
         issue_repository: IssueRepository,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         self._label_repository = label_repository
         self._issue_repository = issue_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(self, issue_id: str, label_id: str) -> None:
         """Add a label to an issue."""
@@ -30,3 +33,6 @@ class AddLabelToIssueUseCase:
         if issue is None:
             raise EntityNotFoundException("Issue", issue_id)
         await self._label_repository.add_label_to_issue(issue_uuid, label_uuid)
+
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(issue.project_id)
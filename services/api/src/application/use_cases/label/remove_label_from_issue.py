@@ -4,6 +4,7 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.repositories import LabelRepository
 
 logger = structlog.get_logger()
@@ -12,8 +13,13 @@ logger = structlog.get_logger()
 class RemoveLabelFromIssueUseCase:
     """Use case for removing a label from an issue."""
 
-    def __init__(self, label_repository: LabelRepository) -> None:
+    def __init__(
+        self,
+        label_repository: LabelRepository,
+        filter_count_cache: SavedFilterCountCache | None = None,
+    ) -> None:
         self._label_repository = label_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(self, issue_id: str, label_id: str) -> None:
         """Remove a label from an issue."""
@@ -21,3 +27,9 @@ class RemoveLabelFromIssueUseCase:
         issue_uuid = UUID(issue_id)
         label_uuid = UUID(label_id)
         await self._label_repository.remove_label_from_issue(issue_uuid, label_uuid)
+
+        if self._filter_count_cache:
+            # Labels belong to the project of the issues they are on
+            label = await self._label_repository.get_by_id(label_uuid)
+            if label is not None:
+                await self._filter_count_cache.invalidate(label.project_id)
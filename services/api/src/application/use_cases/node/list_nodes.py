@@ -3,23 +3,11 @@
 from uuid import UUID
 
 import structlog
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.application.dtos.node import (
-    NodeDetailsProject,
-    NodeDetailsSpace,
-    NodeListItemResponse,
-    NodeListResponse,
-)
+
+from src.application.dtos.node import NodeListResponse
+from src.application.services.node_resolver import NodeResolver
 from src.domain.repositories import ProjectRepository, SpaceRepository
-from src.infrastructure.database.models import (
-    IssueModel,
-    PageModel,
-    ProjectMemberModel,
-    ProjectModel,
-    SpaceModel,
-)
+from src.domain.value_objects.entity_type import EntityType
 
 logger = structlog.get_logger()
 
@@ -31,18 +19,18 @@ class ListNodesUseCase:
         self,
         project_repository: ProjectRepository,
         space_repository: SpaceRepository,
-        session: AsyncSession,
+        node_resolver: NodeResolver,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             project_repository: Project repository
             space_repository: Space repository
-            session: Database session for getting folder_id and counts
+            node_resolver: Resolves the projects and spaces into nodes
         """
         self._project_repository = project_repository
         self._space_repository = space_repository
-        self._session = session
+        self._node_resolver = node_resolver
 
     async def execute(
         self,
@@ -90,77 +78,12 @@ class ListNodesUseCase:
             include_deleted=False,
         )
 
-        # Combine into nodes
-        node_responses = []
-
-        # Add projects as nodes
-        for project in projects:
-            # Get folder_id from model
-            folder_result = await self._session.execute(
-                select(ProjectModel.folder_id).where(ProjectModel.id == project.id)
-            )
-            project_folder_id = folder_result.scalar_one_or_none()
-
-            # Count members
-            member_result = await self._session.execute(
-                select(func.count())
-                .select_from(ProjectMemberModel)
-                .where(ProjectMemberModel.project_id == project.id)
-            )
-            member_count: int = member_result.scalar_one()
-
-            # Count issues
-            issue_result = await self._session.execute(
-                select(func.count())
-                .select_from(IssueModel)
-                .where(IssueModel.project_id == project.id)
-            )
-            issue_count: int = issue_result.scalar_one()
-
-            node_responses.append(
-                NodeListItemResponse(
-                    type="project",
-                    id=project.id,
-                    organization_id=project.organization_id,
-                    details=NodeDetailsProject(
-                        name=project.name,
-                        key=project.key,
-                        description=project.description,
-                        folder_id=project_folder_id,
-                        member_count=member_count,
-                        issue_count=issue_count,
-                    ),
-                )
-            )
-
-        # Add spaces as nodes
-        for space in spaces:
-            # Get folder_id from model
-            space_folder_result = await self._session.execute(
-                select(SpaceModel.folder_id).where(SpaceModel.id == space.id)
-            )
-            space_folder_id = space_folder_result.scalar_one_or_none()
-
-            # Count pages
-            page_count_result = await self._session.execute(
-                select(func.count()).select_from(PageModel).where(PageModel.space_id == space.id)
-            )
-            page_count: int = page_count_result.scalar_one()
-
-            node_responses.append(
-                NodeListItemResponse(
-                    type="space",
-                    id=space.id,
-                    organization_id=space.organization_id,
-                    details=NodeDetailsSpace(
-                        name=space.name,
-                        key=space.key,
-                        description=space.description,
-                        folder_id=space_folder_id,
-                        page_count=page_count,
-                    ),
-                )
-            )
+        # Combine into nodes (one query per entity type for folders and counts)
+        refs = [(EntityType.PROJECT, project.id) for project in projects] + [
+            (EntityType.SPACE, space.id) for space in spaces
+        ]
+        nodes = await self._node_resolver.resolve(refs)
+        node_responses = [nodes[ref] for ref in refs if ref in nodes]
 
         total = len(node_responses)
 
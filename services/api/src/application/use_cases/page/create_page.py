@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.page import CreatePageRequest, PageResponse
+from src.application.services.page_access import PageAccessResolver
 from src.domain.entities import Page
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import PageRepository, SpaceRepository, UserRepository
@@ -24,6 +25,7 @@ class CreatePageUseCase:
         space_repository: SpaceRepository,
         user_repository: UserRepository,
         session: AsyncSession,
+        page_access_resolver: PageAccessResolver | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -32,11 +34,13 @@ class CreatePageUseCase:
             space_repository: Space repository to verify space exists
             user_repository: User repository to verify creator exists
             session: Database session for counting comments
+            page_access_resolver: Optional resolver whose cached permissions are invalidated
         """
         self._page_repository = page_repository
         self._space_repository = space_repository
         self._user_repository = user_repository
         self._session = session
+        self._page_access_resolver = page_access_resolver
 
     async def execute(self, request: CreatePageRequest, creator_user_id: str) -> PageResponse:
         """Execute page creation.
@@ -99,6 +103,10 @@ class CreatePageUseCase:
         # Persist page
         created_page = await self._page_repository.create(page)
 
+        # A child inherits the restrictions of its parent
+        if created_page.parent_id is not None and self._page_access_resolver:
+            await self._page_access_resolver.invalidate(created_page.space_id)
+
         # Count comments (will be 0 for new page)
         result = await self._session.execute(
             select(func.count())
@@ -5,6 +5,7 @@ from uuid import UUID
 import structlog
 
 from src.application.dtos.page import PageTreeItem, PageTreeResponse
+from src.application.services.page_access import PageAccess
 from src.domain.repositories import PageRepository
 
 logger = structlog.get_logger()
@@ -21,11 +22,12 @@ class GetPageTreeUseCase:
         """
         self._page_repository = page_repository
 
-    async def execute(self, space_id: str) -> PageTreeResponse:
+    async def execute(self, space_id: str, access: PageAccess | None = None) -> PageTreeResponse:
         """Execute get page tree.
 
         Args:
             space_id: Space ID
+            access: Pages the user may read (None for all pages)
 
         Returns:
             Page tree response DTO with nested structure
@@ -34,6 +36,8 @@ class GetPageTreeUseCase:
 
         space_uuid = UUID(space_id)
         pages = await self._page_repository.get_tree(space_uuid)
+        if access is not None:
+            pages = access.readable(pages)
 
         # Build tree structure
         page_map: dict[UUID, PageTreeItem] = {}
@@ -1,5 +1,6 @@
 """List pages use case."""
 
+from collections.abc import Collection
 from math import ceil
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.page import PageListItemResponse, PageListResponse
+from src.application.services.page_access import PageAccess
 from src.domain.repositories import PageRepository
 from src.infrastructure.database.models import PageModel
 
@@ -38,6 +40,7 @@ class ListPagesUseCase:
         limit: int = 20,
         search: str | None = None,
         parent_id: str | None = None,
+        access: PageAccess | None = None,
     ) -> PageListResponse:
         """Execute list pages.
 
@@ -47,6 +50,7 @@ class ListPagesUseCase:
             limit: Number of pages per page
             search: Optional search query for title or content
             parent_id: Optional parent page ID to filter by (None for root pages)
+            access: Pages the user may read (None for all pages)
 
         Returns:
             Page list response DTO with pagination metadata
@@ -54,6 +58,7 @@ class ListPagesUseCase:
         space_uuid = UUID(space_id)
         parent_uuid = UUID(parent_id) if parent_id else None
         offset = (page - 1) * limit
+        hidden = access.hidden if access is not None else None
 
         logger.info(
             "Listing pages",
@@ -66,14 +71,20 @@ class ListPagesUseCase:
 
         if search:
             pages = await self._page_repository.search(
-                space_id=space_uuid, query=search, skip=offset, limit=limit
+                space_id=space_uuid, query=search, skip=offset, limit=limit, exclude_ids=hidden
             )
-            total = await self._count_search_results(space_uuid, search)
+            total = await self._count_search_results(space_uuid, search, exclude_ids=hidden)
         else:
             pages = await self._page_repository.get_all(
-                space_id=space_uuid, skip=offset, limit=limit, parent_id=parent_uuid
+                space_id=space_uuid,
+                skip=offset,
+                limit=limit,
+                parent_id=parent_uuid,
+                exclude_ids=hidden,
+            )
+            total = await self._page_repository.count(
+                space_id=space_uuid, parent_id=parent_uuid, exclude_ids=hidden
             )
-            total = await self._page_repository.count(space_id=space_uuid, parent_id=parent_uuid)
 
         # Calculate total pages
         pages_count = ceil(total / limit) if total > 0 else 0
@@ -104,12 +115,15 @@ class ListPagesUseCase:
             pages_count=pages_count,
         )
 
-    async def _count_search_results(self, space_id: UUID, query: str) -> int:
+    async def _count_search_results(
+        self, space_id: UUID, query: str, exclude_ids: Collection[UUID] | None = None
+    ) -> int:
         """Count search results.
 
         Args:
             space_id: Space UUID
             query: Search query
+            exclude_ids: Pages to leave out
 
         Returns:
             Total count of matching pages
@@ -128,6 +142,8 @@ class ListPagesUseCase:
                 ),
             )
         )
+        if exclude_ids:
+            stmt = stmt.where(PageModel.id.not_in(exclude_ids))
 
         result = await self._session.execute(stmt)
         count: int = result.scalar_one()
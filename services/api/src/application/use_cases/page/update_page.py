@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.page import PageResponse, UpdatePageRequest
+from src.application.services.page_access import PageAccessResolver
 from src.domain.entities import PageVersion
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import PageRepository, PageVersionRepository
@@ -23,6 +24,7 @@ class UpdatePageUseCase:
         page_repository: PageRepository,
         page_version_repository: PageVersionRepository | None = None,
         session: AsyncSession | None = None,
+        page_access_resolver: PageAccessResolver | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -30,10 +32,12 @@ class UpdatePageUseCase:
             page_repository: Page repository
             page_version_repository: Optional page version repository for auto-versioning
             session: Database session for counting comments
+            page_access_resolver: Optional resolver whose cached permissions are invalidated
         """
         self._page_repository = page_repository
         self._page_version_repository = page_version_repository
         self._session = session
+        self._page_access_resolver = page_access_resolver
 
     async def execute(
         self, page_id: str, request: UpdatePageRequest, updater_user_id: str
@@ -81,6 +85,7 @@ class UpdatePageUseCase:
         if request.content is not None:
             page.update_content(request.content, updated_by=updater_uuid)
 
+        moved = request.parent_id is not None and request.parent_id != page.parent_id
         if request.parent_id is not None:
             page.update_parent(request.parent_id, updated_by=updater_uuid)
 
@@ -90,6 +95,10 @@ class UpdatePageUseCase:
         # Persist changes
         updated_page = await self._page_repository.update(page)
 
+        # The page now inherits the restrictions of its new parent
+        if moved and self._page_access_resolver:
+            await self._page_access_resolver.invalidate(updated_page.space_id)
+
         # Create version automatically if version repository is available
         if self._page_version_repository:
             try:
@@ -9,6 +9,7 @@ from src.application.dtos.page_permission import (
     PagePermissionResponse,
     UpdatePagePermissionRequest,
 )
+from src.application.services.page_access import PageAccessResolver
 from src.domain.entities import PagePermission
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import (
@@ -26,15 +27,18 @@ class UpdatePagePermissionsUseCase:
         self,
         page_repository: PageRepository,
         page_permission_repository: PagePermissionRepository,
+        page_access_resolver: PageAccessResolver | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             page_repository: Page repository
             page_permission_repository: Page permission repository
+            page_access_resolver: Optional resolver whose cached permissions are invalidated
         """
         self._page_repository = page_repository
         self._page_permission_repository = page_permission_repository
+        self._page_access_resolver = page_access_resolver
 
     async def execute(
         self,
@@ -88,6 +92,9 @@ class UpdatePagePermissionsUseCase:
             created = await self._page_permission_repository.create(permission)
             new_permissions.append(created)
 
+        if self._page_access_resolver:
+            await self._page_access_resolver.invalidate(page.space_id)
+
         permission_responses = [
             PagePermissionResponse(
                 id=perm.id,
@@ -9,6 +9,7 @@ from src.application.dtos.page_permission import (
     SpacePermissionResponse,
     UpdateSpacePermissionRequest,
 )
+from src.application.services.page_access import PageAccessResolver
 from src.domain.entities import SpacePermission
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import (
@@ -26,15 +27,18 @@ class UpdateSpacePermissionsUseCase:
         self,
         space_repository: SpaceRepository,
         space_permission_repository: SpacePermissionRepository,
+        page_access_resolver: PageAccessResolver | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             space_repository: Space repository
             space_permission_repository: Space permission repository
+            page_access_resolver: Optional resolver whose cached permissions are invalidated
         """
         self._space_repository = space_repository
         self._space_permission_repository = space_permission_repository
+        self._page_access_resolver = page_access_resolver
 
     async def execute(
         self,
@@ -87,6 +91,9 @@ class UpdateSpacePermissionsUseCase:
             created = await self._space_permission_repository.create(permission)
             new_permissions.append(created)
 
+        if self._page_access_resolver:
+            await self._page_access_resolver.invalidate(space_uuid)
+
         permission_responses = [
             SpacePermissionResponse(
                 id=perm.id,
@@ -9,6 +9,9 @@ from src.application.use_cases.saved_filter.delete_saved_filter import (
 from src.application.use_cases.saved_filter.get_saved_filter import (
     GetSavedFilterUseCase,
 )
+from src.application.use_cases.saved_filter.list_saved_filter_issues import (
+    ListSavedFilterIssuesUseCase,
+)
 from src.application.use_cases.saved_filter.list_saved_filters import (
     ListSavedFiltersUseCase,
 )
@@ -20,6 +23,7 @@ __all__ = [
     "CreateSavedFilterUseCase",
     "GetSavedFilterUseCase",
     "ListSavedFiltersUseCase",
+    "ListSavedFilterIssuesUseCase",
     "UpdateSavedFilterUseCase",
     "DeleteSavedFilterUseCase",
 ]
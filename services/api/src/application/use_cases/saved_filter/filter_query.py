@@ -0,0 +1,178 @@
+"""Saved filter criteria compiled to SQL, shared by the saved filter use cases."""
+
+import base64
+import json
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, exists, false, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.application.dtos.saved_filter import DateRange, FilterCriteria
+from src.domain.exceptions import ValidationException
+from src.infrastructure.database.models import (
+    CustomFieldModel,
+    CustomFieldValueModel,
+    IssueLabelModel,
+    IssueModel,
+    LabelModel,
+    SprintIssueModel,
+)
+
+
+def filter_conditions(criteria: FilterCriteria) -> list[ColumnElement[bool]]:
+    """Conditions selecting the issues matching filter criteria.
+
+    Each criterion becomes one condition of a single statement: plain columns
+    are compared directly, labels, sprints and custom field values are
+    semi-joins on their indexed `issue_id`. The caller adds the scope
+    (project or organizations) and `deleted_at IS NULL`.
+
+    Args:
+        criteria: Validated filter criteria
+
+    Returns:
+        WHERE conditions on IssueModel
+    """
+    conditions: list[ColumnElement[bool]] = []
+
+    for column, values in (
+        (IssueModel.status, criteria.status),
+        (IssueModel.type, criteria.type),
+        (IssueModel.priority, criteria.priority),
+        (IssueModel.reporter_id, criteria.reporter_id),
+    ):
+        if values is not None:
+            conditions.append(column.in_(values))
+
+    if criteria.assignee_id is not None:
+        conditions.append(_in_or_null(IssueModel.assignee_id, criteria.assignee_id))
+
+    if criteria.labels is not None:
+        conditions.append(
+            exists(
+                select(IssueLabelModel.issue_id)
+                .join(LabelModel, LabelModel.id == IssueLabelModel.label_id)
+                .where(
+                    IssueLabelModel.issue_id == IssueModel.id,
+                    LabelModel.name.in_(criteria.labels),
+                )
+            )
+        )
+
+    if criteria.sprint_id is not None:
+        sprint_ids = [sprint_id for sprint_id in criteria.sprint_id if sprint_id is not None]
+        in_sprint = select(SprintIssueModel.issue_id).where(
+            SprintIssueModel.issue_id == IssueModel.id
+        )
+        matches: list[ColumnElement[bool]] = []
+        if sprint_ids:
+            matches.append(exists(in_sprint.where(SprintIssueModel.sprint_id.in_(sprint_ids))))
+        if len(sprint_ids) < len(criteria.sprint_id):
+            # null: in no sprint (the backlog)
+            matches.append(~exists(in_sprint))
+        conditions.append(or_(*matches) if matches else false())
+
+    for name, value in (criteria.custom_fields or {}).items():
+        # Containment: equality for scalars, "has these values" for lists
+        conditions.append(
+            exists(
+                select(CustomFieldValueModel.issue_id)
+                .join(
+                    CustomFieldModel, CustomFieldModel.id == CustomFieldValueModel.custom_field_id
+                )
+                .where(
+                    CustomFieldValueModel.issue_id == IssueModel.id,
+                    CustomFieldModel.name == name,
+                    CustomFieldValueModel.value.contains(literal(value, JSONB)),
+                )
+            )
+        )
+
+    for timestamp_column, date_range in (
+        (IssueModel.created_at, criteria.created_at),
+        (IssueModel.updated_at, criteria.updated_at),
+    ):
+        if date_range is not None:
+            conditions.extend(_timestamp_range(timestamp_column, date_range))
+
+    if criteria.due_date is not None:
+        if criteria.due_date.from_:
+            conditions.append(IssueModel.due_date >= criteria.due_date.from_)
+        if criteria.due_date.to:
+            conditions.append(IssueModel.due_date <= criteria.due_date.to)
+
+    if criteria.text:
+        pattern = f"%{criteria.text}%"
+        conditions.append(
+            or_(IssueModel.title.ilike(pattern), IssueModel.description.ilike(pattern))
+        )
+
+    return conditions
+
+
+def keyset_condition(cursor: str) -> ColumnElement[bool]:
+    """Condition selecting the issues after a cursor (newest first order).
+
+    Args:
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        WHERE condition on IssueModel
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    created_at, issue_id = decode_cursor(cursor)
+    return tuple_(IssueModel.created_at, IssueModel.id) < tuple_(created_at, issue_id)
+
+
+def encode_cursor(created_at: datetime, issue_id: UUID) -> str:
+    """Opaque cursor pointing after an issue."""
+    payload = json.dumps([created_at.isoformat(), str(issue_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Position encoded by `encode_cursor`.
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, issue_id = json.loads(payload)
+        return datetime.fromisoformat(created_at), UUID(issue_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationException("Invalid cursor", field="cursor") from e
+
+
+def _in_or_null(
+    column: InstrumentedAttribute[UUID | None], values: list[UUID | None]
+) -> ColumnElement[bool]:
+    """`column IN values`, where a None value also matches NULL."""
+    ids = [value for value in values if value is not None]
+    matches: list[ColumnElement[bool]] = []
+    if ids:
+        matches.append(column.in_(ids))
+    if len(ids) < len(values):
+        matches.append(column.is_(None))
+    return or_(*matches) if matches else false()
+
+
+def _timestamp_range(
+    column: InstrumentedAttribute[datetime], date_range: DateRange
+) -> list[ColumnElement[bool]]:
+    """Conditions on a timestamp column for an inclusive range of days."""
+    conditions: list[ColumnElement[bool]] = []
+    if date_range.from_:
+        conditions.append(column >= _start_of(date_range.from_))
+    if date_range.to:
+        conditions.append(column < _start_of(date_range.to + timedelta(days=1)))
+    return conditions
+
+
+def _start_of(day: date) -> datetime:
+    """Midnight UTC at the start of a day."""
+    return datetime.combine(day, time.min, tzinfo=UTC)
@@ -0,0 +1,190 @@
+"""List saved filter issues use case."""
+
+from uuid import UUID
+
+import structlog
+from pydantic import ValidationError
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.dtos.issue import IssueListItemResponse
+from src.application.dtos.saved_filter import FilterCriteria, SavedFilterIssuesResponse
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.use_cases.saved_filter.filter_query import (
+    encode_cursor,
+    filter_conditions,
+    keyset_condition,
+)
+from src.domain.entities import SavedFilter
+from src.domain.exceptions import EntityNotFoundException, ValidationException
+from src.domain.repositories.saved_filter_repository import SavedFilterRepository
+from src.infrastructure.database.models import (
+    IssueModel,
+    OrganizationMemberModel,
+    ProjectModel,
+)
+
+logger = structlog.get_logger()
+
+
+class ListSavedFilterIssuesUseCase:
+    """Use case for listing the issues matching a saved filter.
+
+    The criteria are compiled into one statement, paged by keyset (newest
+    first, on `created_at, id`) so deep pages cost the same as the first one.
+    The total is counted once per filter version and cached until an issue
+    of the filter's project changes.
+    """
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 100
+
+    def __init__(
+        self,
+        saved_filter_repository: SavedFilterRepository,
+        session: AsyncSession,
+        count_cache: SavedFilterCountCache | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            saved_filter_repository: Saved filter repository
+            session: Database session the filter runs on
+            count_cache: Cache of the filter totals (optional)
+        """
+        self._saved_filter_repository = saved_filter_repository
+        self._session = session
+        self._count_cache = count_cache
+
+    async def execute(
+        self,
+        filter_id: UUID,
+        cursor: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+    ) -> SavedFilterIssuesResponse:
+        """Execute list saved filter issues.
+
+        Args:
+            filter_id: Saved filter ID
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Number of issues per page
+
+        Returns:
+            Page of matching issues, total and cursor of the next page
+
+        Raises:
+            EntityNotFoundException: If saved filter not found
+            ValidationException: If the criteria or the cursor are invalid
+        """
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        logger.info("Listing saved filter issues", filter_id=str(filter_id), limit=limit)
+
+        saved_filter = await self._saved_filter_repository.get_by_id(filter_id)
+        if saved_filter is None:
+            raise EntityNotFoundException("SavedFilter", str(filter_id))
+
+        try:
+            criteria = FilterCriteria.model_validate(saved_filter.filter_criteria)
+        except ValidationError as e:
+            raise ValidationException(
+                f"Invalid filter criteria: {e.errors()[0]['msg']}", field="filter_criteria"
+            ) from e
+
+        conditions = [*self._scope(saved_filter), *filter_conditions(criteria)]
+        page_conditions = [*conditions, keyset_condition(cursor)] if cursor else conditions
+
+        # One extra row tells whether there is a next page
+        result = await self._session.execute(
+            select(
+                IssueModel.id,
+                IssueModel.project_id,
+                IssueModel.issue_number,
+                ProjectModel.key.label("project_key"),
+                IssueModel.title,
+                IssueModel.type,
+                IssueModel.status,
+                IssueModel.priority,
+                IssueModel.assignee_id,
+                IssueModel.reporter_id,
+                IssueModel.due_date,
+                IssueModel.story_points,
+                IssueModel.created_at,
+                IssueModel.updated_at,
+            )
+            .join(ProjectModel, ProjectModel.id == IssueModel.project_id)
+            .where(*page_conditions)
+            .order_by(IssueModel.created_at.desc(), IssueModel.id.desc())
+            .limit(limit + 1)
+        )
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        total = await self._count(saved_filter, conditions)
+
+        issues = [
+            IssueListItemResponse.model_validate(
+                {
+                    "id": row.id,
+                    "project_id": row.project_id,
+                    "issue_number": row.issue_number,
+                    "key": f"{row.project_key}-{row.issue_number}",
+                    "title": row.title,
+                    "type": row.type,
+                    "status": row.status,
+                    "priority": row.priority,
+                    "assignee_id": row.assignee_id,
+                    "reporter_id": row.reporter_id,
+                    "due_date": row.due_date,
+                    "story_points": row.story_points,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                }
+            )
+            for row in rows
+        ]
+
+        return SavedFilterIssuesResponse(
+            issues=issues,
+            total=total,
+            limit=limit,
+            next_cursor=encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
+        )
+
+    @staticmethod
+    def _scope(saved_filter: SavedFilter) -> list[ColumnElement[bool]]:
+        """Issues a filter can match: its project, else the owner's organizations."""
+        conditions: list[ColumnElement[bool]] = [
+            IssueModel.deleted_at.is_(None),
+            ProjectModel.deleted_at.is_(None),
+        ]
+        if saved_filter.project_id:
+            conditions.append(IssueModel.project_id == saved_filter.project_id)
+        else:
+            conditions.append(
+                ProjectModel.organization_id.in_(
+                    select(OrganizationMemberModel.organization_id).where(
+                        OrganizationMemberModel.user_id == saved_filter.user_id
+                    )
+                )
+            )
+        return conditions
+
+    async def _count(self, saved_filter: SavedFilter, conditions: list[ColumnElement[bool]]) -> int:
+        """Number of issues matching the filter (cached per filter version)."""
+
+        async def count() -> int:
+            result = await self._session.execute(
+                select(func.count())
+                .select_from(IssueModel)
+                .join(ProjectModel, ProjectModel.id == IssueModel.project_id)
+                .where(*conditions)
+            )
+            total: int = result.scalar_one()
+            return total
+
+        if self._count_cache is None:
+            return await count()
+        return await self._count_cache.get_or_count(
+            saved_filter.id, saved_filter.updated_at.isoformat(), saved_filter.project_id, count
+        )
@@ -4,6 +4,7 @@ from typing import Literal
 from uuid import UUID
 
 from src.application.dtos.search import SearchResponse, SearchResultItem
+from src.application.services.page_access import PageAccess
 from src.application.services.search_query_service import SearchQueryService
 
 
@@ -29,6 +30,7 @@ class SearchAllUseCase:
         status: str | None = None,
         type: str | None = None,
         priority: str | None = None,
+        access: PageAccess | None = None,
     ) -> SearchResponse:
         if page < 1:
             raise ValueError("Page must be >= 1")
@@ -38,6 +40,8 @@ class SearchAllUseCase:
             limit = self.MAX_LIMIT
 
         skip = (page - 1) * limit
+        # Each side returns its first skip + limit hits: the page of the merge is among them
+        window = skip + limit
 
         issue_items: list[dict] = []
         page_items: list[dict] = []
@@ -48,8 +52,8 @@ class SearchAllUseCase:
             issue_items, issue_total = await self._search_service.search_issues(
                 query=query,
                 project_id=project_id,
-                skip=skip,
-                limit=limit,
+                skip=0,
+                limit=window,
                 assignee_id=assignee_id,
                 reporter_id=reporter_id,
                 status=status,
@@ -61,8 +65,9 @@ class SearchAllUseCase:
             page_items, page_total = await self._search_service.search_pages(
                 query=query,
                 space_id=space_id,
-                skip=skip,
-                limit=limit,
+                skip=0,
+                limit=window,
+                exclude_ids=access.hidden if access is not None else None,
             )
 
         combined = issue_items + page_items
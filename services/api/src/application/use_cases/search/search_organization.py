@@ -0,0 +1,164 @@
+"""Use case for searching every project and space of an organization."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.dtos.search import (
+    OrganizationSearchResponse,
+    SearchFacet,
+    SearchFacets,
+    SearchResultItem,
+)
+from src.application.services.page_access import PageAccess
+from src.application.services.search_query_service import SearchQueryService
+from src.domain.exceptions import ValidationException
+
+SearchResults = tuple[list[dict[str, Any]], list[dict[str, Any]]]
+
+
+class SearchOrganizationUseCase:
+    """Search issues and pages across an organization.
+
+    Each entity type is searched with one full-text statement, backed by its
+    GIN index, returning its best hits and its hit counts per project or
+    space. The statements run concurrently, each on its own session, and the
+    hits are merged by their normalized rank (between 0 and 1 for both types).
+    """
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 50
+    # Hits reachable by paging: each type fetches up to page * limit hits
+    MAX_RESULTS = 1000
+
+    def __init__(
+        self,
+        search_service: SearchQueryService,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            search_service: Search service on the request session (used for every
+                statement without a session factory)
+            session_factory: Factory of the sessions statements run on concurrently
+        """
+        self._search_service = search_service
+        self._session_factory = session_factory
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        query: str,
+        search_type: Literal["all", "issues", "pages"] = "all",
+        page: int = 1,
+        limit: int = DEFAULT_LIMIT,
+        page_access: Mapping[UUID, PageAccess] | None = None,
+    ) -> OrganizationSearchResponse:
+        """Execute organization search.
+
+        Args:
+            organization_id: Organization UUID
+            query: Search term (web search syntax: quoted phrases, `or`, `-word`)
+            search_type: Entity types searched
+            page: Page number (1-based)
+            limit: Number of items per page
+            page_access: Page access of the user by space, for the spaces with
+                grants (None or empty: every page is readable)
+
+        Returns:
+            One page of hits, with the hit counts per type, project and space
+
+        Raises:
+            ValueError: If page or limit is lower than 1
+            ValidationException: If the page is beyond the first MAX_RESULTS hits
+        """
+        if page < 1:
+            raise ValueError("Page must be >= 1")
+        if limit < 1:
+            raise ValueError("Limit must be >= 1")
+        if limit > self.MAX_LIMIT:
+            limit = self.MAX_LIMIT
+
+        skip = (page - 1) * limit
+        # The page of the merge is among the first skip + limit hits of each type
+        window = skip + limit
+        if window > self.MAX_RESULTS:
+            raise ValidationException(
+                f"Search results are limited to the first {self.MAX_RESULTS} hits", field="page"
+            )
+
+        searches: dict[str, Callable[[SearchQueryService], Awaitable[SearchResults]]] = {}
+        if search_type in ("all", "issues"):
+
+            async def search_issues(service: SearchQueryService) -> SearchResults:
+                return await service.search_organization_issues(query, organization_id, window)
+
+            searches["issues"] = search_issues
+
+        if search_type in ("all", "pages"):
+            access = page_access or {}
+            unreadable_spaces = [
+                space_id for space_id, space in access.items() if not space.can_read_space
+            ]
+            hidden_pages = [
+                page_id
+                for space in access.values()
+                if space.can_read_space
+                for page_id in space.hidden
+            ]
+
+            async def search_pages(service: SearchQueryService) -> SearchResults:
+                return await service.search_organization_pages(
+                    query,
+                    organization_id,
+                    window,
+                    exclude_space_ids=unreadable_spaces,
+                    exclude_ids=hidden_pages,
+                )
+
+            searches["pages"] = search_pages
+
+        results = await self._run(searches) if query.strip() else {}
+        issue_items, project_facets = results.get("issues", ([], []))
+        page_items, space_facets = results.get("pages", ([], []))
+
+        combined = issue_items + page_items
+        combined.sort(key=lambda item: item["score"], reverse=True)
+
+        facets = SearchFacets(
+            issues=sum(facet["count"] for facet in project_facets),
+            pages=sum(facet["count"] for facet in space_facets),
+            projects=[SearchFacet(**facet) for facet in project_facets],
+            spaces=[SearchFacet(**facet) for facet in space_facets],
+        )
+
+        return OrganizationSearchResponse(
+            items=[SearchResultItem(**item) for item in combined[skip : skip + limit]],
+            total=facets.issues + facets.pages,
+            page=page,
+            limit=limit,
+            facets=facets,
+        )
+
+    async def _run(
+        self, searches: dict[str, Callable[[SearchQueryService], Awaitable[SearchResults]]]
+    ) -> dict[str, SearchResults]:
+        """Run the searches, concurrently when sessions can be opened for them."""
+        if self._session_factory is None or len(searches) <= 1:
+            # A session runs one statement at a time: run them in turn
+            return {name: await search(self._search_service) for name, search in searches.items()}
+
+        session_factory = self._session_factory
+
+        async def run(
+            search: Callable[[SearchQueryService], Awaitable[SearchResults]],
+        ) -> SearchResults:
+            async with session_factory() as session:
+                return await search(SearchQueryService(session))
+
+        results = await asyncio.gather(*(run(search) for search in searches.values()))
+        return dict(zip(searches, results, strict=True))
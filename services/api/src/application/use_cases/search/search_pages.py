@@ -3,6 +3,7 @@
 from uuid import UUID
 
 from src.application.dtos.search import SearchPagesResponse, SearchResultItem
+from src.application.services.page_access import PageAccess
 from src.application.services.search_query_service import SearchQueryService
 
 
@@ -21,6 +22,7 @@ class SearchPagesUseCase:
         query: str,
         page: int = 1,
         limit: int = DEFAULT_LIMIT,
+        access: PageAccess | None = None,
     ) -> SearchPagesResponse:
         if page < 1:
             raise ValueError("Page must be >= 1")
@@ -36,6 +38,7 @@ class SearchPagesUseCase:
             space_id=space_id,
             skip=skip,
             limit=limit,
+            exclude_ids=access.hidden if access is not None else None,
         )
 
         items = [
@@ -0,0 +1,34 @@
+"""Use case for the typeahead of the command palette."""
+
+from uuid import UUID
+
+from src.application.dtos.search import TypeaheadItem, TypeaheadResponse
+from src.application.services.typeahead_query_service import TypeaheadQueryService
+
+
+class TypeaheadUseCase:
+    """Suggest issues, projects and users of an organization while typing."""
+
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 20
+
+    def __init__(self, typeahead_service: TypeaheadQueryService) -> None:
+        self._typeahead_service = typeahead_service
+
+    async def execute(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+    ) -> TypeaheadResponse:
+        if limit < 1:
+            raise ValueError("Limit must be >= 1")
+        if limit > self.MAX_LIMIT:
+            limit = self.MAX_LIMIT
+
+        suggestions = await self._typeahead_service.suggest(
+            organization_id=organization_id, user_id=user_id, query=query, limit=limit
+        )
+
+        return TypeaheadResponse(items=[TypeaheadItem(**item) for item in suggestions])
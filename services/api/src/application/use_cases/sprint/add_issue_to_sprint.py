@@ -4,6 +4,7 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.exceptions import ConflictException, EntityNotFoundException
 from src.domain.repositories import IssueRepository, SprintRepository
 
@@ -17,15 +18,18 @@ class AddIssueToSprintUseCase:
         self,
         sprint_repository: SprintRepository,
         issue_repository: IssueRepository,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             sprint_repository: Sprint repository
             issue_repository: Issue repository to verify issue exists and belongs to project
+            filter_count_cache: Saved filter totals to invalidate (optional)
         """
         self._sprint_repository = sprint_repository
         self._issue_repository = issue_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(
         self,
@@ -91,6 +95,9 @@ class AddIssueToSprintUseCase:
         # Add issue to sprint
         await self._sprint_repository.add_issue_to_sprint(sprint_id, issue_id, order)
 
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(sprint.project_id)
+
         logger.info(
             "Issue added to sprint successfully",
             sprint_id=str(sprint_id),
@@ -3,26 +3,41 @@
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.dtos.sprint_metrics import CompleteSprintRequest, CompleteSprintResponse
-from src.domain.exceptions import EntityNotFoundException
-from src.domain.repositories import IssueRepository, SprintRepository
+from src.application.dtos.sprint_metrics import (
+    CompleteSprintRequest,
+    CompleteSprintResponse,
+    SprintMetricsResponse,
+)
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.domain.entities import Sprint
+from src.domain.exceptions import EntityNotFoundException, ValidationException
+from src.domain.repositories import IssueActivityRepository, IssueRepository, SprintRepository
 from src.domain.value_objects.sprint_status import SprintStatus
-from src.infrastructure.database.models import IssueModel
+from src.infrastructure.database.models import IssueModel, SprintIssueModel, SprintSnapshotModel
+from src.infrastructure.database.repositories.sprint_repository import CLOSED_ISSUE_STATUSES
 
 logger = structlog.get_logger()
 
 
 class CompleteSprintUseCase:
-    """Use case for completing a sprint."""
+    """Use case for completing a sprint.
+
+    The final metrics and scope are frozen in a sprint snapshot, then the
+    incomplete issues are moved to the next sprint or to the backlog in one
+    set-based statement, with their activity entries inserted in bulk.
+    """
 
     def __init__(
         self,
         sprint_repository: SprintRepository,
         issue_repository: IssueRepository,
         session: AsyncSession,
+        activity_repository: IssueActivityRepository | None = None,
+        filter_count_cache: SavedFilterCountCache | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
@@ -30,27 +45,34 @@ class CompleteSprintUseCase:
             sprint_repository: Sprint repository
             issue_repository: Issue repository
             session: Database session for queries
+            activity_repository: Issue activity repository for logging moves (optional)
+            filter_count_cache: Saved filter totals to invalidate (optional)
         """
         self._sprint_repository = sprint_repository
         self._issue_repository = issue_repository
         self._session = session
+        self._activity_repository = activity_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(
         self,
         sprint_id: UUID,
         request: CompleteSprintRequest,
+        user_id: UUID | None = None,
     ) -> CompleteSprintResponse:
         """Execute sprint completion.
 
         Args:
             sprint_id: Sprint UUID
             request: Complete sprint request
+            user_id: User completing the sprint (for activity logging)
 
         Returns:
             Complete sprint response with metrics
 
         Raises:
-            EntityNotFoundException: If sprint not found
+            EntityNotFoundException: If sprint or target sprint not found
+            ValidationException: If target sprint cannot receive the issues
         """
         logger.info("Completing sprint", sprint_id=str(sprint_id))
 
@@ -60,37 +82,9 @@ class CompleteSprintUseCase:
             logger.warning("Sprint not found", sprint_id=str(sprint_id))
             raise EntityNotFoundException("Sprint", str(sprint_id))
 
-        # Get sprint issues
-        sprint_issues = await self._sprint_repository.get_sprint_issues(sprint_id)
-        issue_ids = [issue_id for issue_id, _ in sprint_issues]
-
-        incomplete_issues_moved = 0
-
-        if issue_ids:
-            # Get issues
-            result = await self._session.execute(
-                select(IssueModel)
-                .where(IssueModel.id.in_(issue_ids))
-                .where(IssueModel.deleted_at.is_(None))
-            )
-            issues = result.scalars().all()
-
-            # Move incomplete issues to backlog if requested
-            if request.move_incomplete_to_backlog:
-                for issue in issues:
-                    if issue.status not in ("done", "cancelled"):
-                        # Remove from sprint
-                        await self._sprint_repository.remove_issue_from_sprint(sprint_id, issue.id)
-                        # Clear backlog_order to move to end of backlog
-                        issue.backlog_order = None
-                        await self._session.flush()
-                        incomplete_issues_moved += 1
-
-        # Update sprint status to completed
-        sprint.update_status(SprintStatus.COMPLETED)
-        await self._sprint_repository.update(sprint)
+        target_sprint = await self._get_target_sprint(sprint, request.move_incomplete_to_sprint_id)
 
-        # Get final metrics
+        # Final metrics, computed before incomplete issues leave the sprint
         from src.application.use_cases.sprint.get_sprint_metrics import (
             GetSprintMetricsUseCase,
         )
@@ -98,16 +92,140 @@ class CompleteSprintUseCase:
         metrics_use_case = GetSprintMetricsUseCase(
             self._sprint_repository, self._issue_repository, self._session
         )
-        metrics = await metrics_use_case.execute(sprint_id)
+        metrics = await metrics_use_case.compute(sprint)
+        await self._record_snapshot(sprint_id, metrics, target_sprint)
+
+        moved_issue_ids: list[UUID] = []
+        if target_sprint is not None or request.move_incomplete_to_backlog:
+            moved_issue_ids = await self._sprint_repository.move_incomplete_issues(
+                sprint_id, target_sprint.id if target_sprint else None
+            )
+
+        if self._filter_count_cache and moved_issue_ids:
+            await self._filter_count_cache.invalidate(sprint.project_id)
+
+        if self._activity_repository and moved_issue_ids:
+            await self._activity_repository.create_many(
+                moved_issue_ids,
+                user_id=user_id,
+                action="updated",
+                field_name="sprint",
+                old_value=sprint.name,
+                new_value=target_sprint.name if target_sprint else None,
+            )
+
+        # Update sprint status to completed
+        sprint.update_status(SprintStatus.COMPLETED)
+        await self._sprint_repository.update(sprint)
 
         logger.info(
             "Sprint completed successfully",
             sprint_id=str(sprint_id),
-            incomplete_issues_moved=incomplete_issues_moved,
+            incomplete_issues_moved=len(moved_issue_ids),
+            moved_to_sprint_id=str(target_sprint.id) if target_sprint else None,
         )
 
         return CompleteSprintResponse(
             sprint_id=sprint_id,
-            incomplete_issues_moved=incomplete_issues_moved,
+            incomplete_issues_moved=len(moved_issue_ids),
+            moved_to_sprint_id=target_sprint.id if target_sprint else None,
             metrics=metrics,
         )
+
+    async def _get_target_sprint(
+        self, sprint: Sprint, target_sprint_id: UUID | None
+    ) -> Sprint | None:
+        """Load and validate the sprint incomplete issues move to."""
+        if target_sprint_id is None:
+            return None
+
+        target_sprint = await self._sprint_repository.get_by_id(target_sprint_id)
+        if target_sprint is None:
+            raise EntityNotFoundException("Sprint", str(target_sprint_id))
+        if target_sprint.id == sprint.id or target_sprint.project_id != sprint.project_id:
+            raise ValidationException(
+                "Incomplete issues can only move to another sprint of the same project",
+                field="move_incomplete_to_sprint_id",
+            )
+        if target_sprint.status == SprintStatus.COMPLETED:
+            raise ValidationException(
+                "Incomplete issues cannot move to a completed sprint",
+                field="move_incomplete_to_sprint_id",
+            )
+        return target_sprint
+
+    async def _record_snapshot(
+        self,
+        sprint_id: UUID,
+        metrics: SprintMetricsResponse,
+        target_sprint: Sprint | None,
+    ) -> None:
+        """Record the sprint scope and metrics at close (one INSERT ... SELECT)."""
+        scope = (
+            select(
+                literal(sprint_id),
+                func.count(),
+                func.count().filter(IssueModel.status == "done"),
+                func.count().filter(IssueModel.status.not_in(CLOSED_ISSUE_STATUSES)),
+                literal(metrics.total_story_points),
+                literal(metrics.completed_story_points),
+                literal(
+                    target_sprint.id if target_sprint else None,
+                    SprintSnapshotModel.moved_to_sprint_id.type,
+                ),
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "issue_id",
+                                IssueModel.id,
+                                "status",
+                                IssueModel.status,
+                                "story_points",
+                                IssueModel.story_points,
+                            ),
+                            SprintIssueModel.order,
+                        )
+                    ),
+                    func.json_build_array(),
+                ),
+                literal(metrics.model_dump(mode="json"), SprintSnapshotModel.metrics.type),
+                func.now(),
+                func.now(),
+            )
+            .select_from(SprintIssueModel)
+            .join(IssueModel, IssueModel.id == SprintIssueModel.issue_id)
+            .where(SprintIssueModel.sprint_id == sprint_id, IssueModel.deleted_at.is_(None))
+        )
+        snapshot = insert(SprintSnapshotModel).from_select(
+            [
+                "sprint_id",
+                "total_issues",
+                "completed_issues",
+                "incomplete_issues",
+                "total_story_points",
+                "completed_story_points",
+                "moved_to_sprint_id",
+                "issues",
+                "metrics",
+                "created_at",
+                "updated_at",
+            ],
+            scope,
+        )
+        await self._session.execute(
+            snapshot.on_conflict_do_update(
+                index_elements=[SprintSnapshotModel.sprint_id],
+                set_={
+                    "total_issues": snapshot.excluded.total_issues,
+                    "completed_issues": snapshot.excluded.completed_issues,
+                    "incomplete_issues": snapshot.excluded.incomplete_issues,
+                    "total_story_points": snapshot.excluded.total_story_points,
+                    "completed_story_points": snapshot.excluded.completed_story_points,
+                    "moved_to_sprint_id": snapshot.excluded.moved_to_sprint_id,
+                    "issues": snapshot.excluded.issues,
+                    "metrics": snapshot.excluded.metrics,
+                    "updated_at": func.now(),
+                },
+            )
+        )
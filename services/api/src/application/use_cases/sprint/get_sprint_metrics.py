@@ -6,12 +6,14 @@ from uuid import UUID
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from src.application.dtos.sprint_metrics import BurndownDataPoint, SprintMetricsResponse
 from src.domain.entities import Sprint
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueRepository, SprintRepository
-from src.infrastructure.database.models import IssueModel
+from src.domain.value_objects.sprint_status import SprintStatus
+from src.infrastructure.database.models import IssueModel, SprintSnapshotModel
 
 logger = structlog.get_logger()
 
@@ -56,6 +58,30 @@ class GetSprintMetricsUseCase:
             logger.warning("Sprint not found", sprint_id=str(sprint_id))
             raise EntityNotFoundException("Sprint", str(sprint_id))
 
+        if sprint.status == SprintStatus.COMPLETED:
+            # Completed sprints report the metrics frozen at close
+            result = await self._session.execute(
+                select(SprintSnapshotModel.metrics).where(
+                    SprintSnapshotModel.sprint_id == sprint_id
+                )
+            )
+            snapshot_metrics = result.scalar_one_or_none()
+            if snapshot_metrics is not None:
+                return SprintMetricsResponse.model_validate(snapshot_metrics)
+
+        return await self.compute(sprint)
+
+    async def compute(self, sprint: Sprint) -> SprintMetricsResponse:
+        """Compute the metrics of a sprint from its current issues.
+
+        Args:
+            sprint: Sprint entity
+
+        Returns:
+            Sprint metrics response DTO
+        """
+        sprint_id = sprint.id
+
         # Get sprint issues
         sprint_issues = await self._sprint_repository.get_sprint_issues(sprint_id)
         issue_ids = [issue_id for issue_id, _ in sprint_issues]
@@ -73,11 +99,12 @@ class GetSprintMetricsUseCase:
                 burndown_data=[],
             )
 
-        # Get issues with story points
+        # Get issues with story points (their relationships are not needed)
         result = await self._session.execute(
             select(IssueModel)
             .where(IssueModel.id.in_(issue_ids))
             .where(IssueModel.deleted_at.is_(None))
+            .options(lazyload("*"))
         )
         issues = result.scalars().all()
 
@@ -4,6 +4,7 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import SprintRepository
 
@@ -13,13 +14,19 @@ logger = structlog.get_logger()
 class RemoveIssueFromSprintUseCase:
     """Use case for removing an issue from a sprint."""
 
-    def __init__(self, sprint_repository: SprintRepository) -> None:
+    def __init__(
+        self,
+        sprint_repository: SprintRepository,
+        filter_count_cache: SavedFilterCountCache | None = None,
+    ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             sprint_repository: Sprint repository
+            filter_count_cache: Saved filter totals to invalidate (optional)
         """
         self._sprint_repository = sprint_repository
+        self._filter_count_cache = filter_count_cache
 
     async def execute(
         self,
@@ -50,6 +57,9 @@ class RemoveIssueFromSprintUseCase:
         # Remove issue from sprint
         await self._sprint_repository.remove_issue_from_sprint(sprint_id, issue_id)
 
+        if self._filter_count_cache:
+            await self._filter_count_cache.invalidate(sprint.project_id)
+
         logger.info(
             "Issue removed from sprint successfully",
             sprint_id=str(sprint_id),
@@ -1,7 +1,9 @@
 """Subtask use cases."""
 
+from src.application.use_cases.subtask.get_issue_rollup import GetIssueRollupUseCase
 from src.application.use_cases.subtask.list_subtasks import ListSubtasksUseCase
 
 __all__ = [
+    "GetIssueRollupUseCase",
     "ListSubtasksUseCase",
 ]
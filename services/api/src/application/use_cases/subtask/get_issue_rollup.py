@@ -0,0 +1,46 @@
+"""Get issue rollup use case."""
+
+from uuid import UUID
+
+import structlog
+
+from src.application.dtos.issue import IssueRollupResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.domain.exceptions import EntityNotFoundException
+from src.domain.repositories import IssueRepository
+
+logger = structlog.get_logger()
+
+
+class GetIssueRollupUseCase:
+    """Use case for getting the progress of an issue's descendants (epic progress)."""
+
+    def __init__(
+        self,
+        issue_repository: IssueRepository,
+        hierarchy_service: IssueHierarchyService,
+    ) -> None:
+        """Initialize use case with dependencies."""
+        self._issue_repository = issue_repository
+        self._hierarchy_service = hierarchy_service
+
+    async def execute(self, issue_id: UUID) -> IssueRollupResponse:
+        """Execute get issue rollup.
+
+        Args:
+            issue_id: Issue UUID
+
+        Returns:
+            Rollup of the issue (all zero when it has no descendants)
+
+        Raises:
+            EntityNotFoundException: If issue not found
+        """
+        logger.info("Getting issue rollup", issue_id=str(issue_id))
+
+        issue = await self._issue_repository.get_by_id(issue_id)
+        if issue is None:
+            raise EntityNotFoundException("Issue", str(issue_id))
+
+        rollups = await self._hierarchy_service.get_rollups([issue_id])
+        return rollups.get(issue_id) or IssueRollupResponse(issue_id=issue_id)
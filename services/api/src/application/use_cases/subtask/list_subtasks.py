@@ -6,7 +6,7 @@ import structlog
 
 from src.application.dtos.issue import IssueListItemResponse
 from src.domain.exceptions import EntityNotFoundException
-from src.domain.repositories import IssueRepository
+from src.domain.repositories import IssueRepository, ProjectRepository
 
 logger = structlog.get_logger()
 
@@ -14,9 +14,14 @@ logger = structlog.get_logger()
 class ListSubtasksUseCase:
     """Use case for listing subtasks of an issue."""
 
-    def __init__(self, issue_repository: IssueRepository) -> None:
+    def __init__(
+        self,
+        issue_repository: IssueRepository,
+        project_repository: ProjectRepository,
+    ) -> None:
         """Initialize use case with dependencies."""
         self._issue_repository = issue_repository
+        self._project_repository = project_repository
 
     async def execute(self, issue_id: UUID) -> list[IssueListItemResponse]:
         """Execute list subtasks."""
@@ -28,16 +33,12 @@ class ListSubtasksUseCase:
             logger.warning("Parent issue not found", issue_id=str(issue_id))
             raise EntityNotFoundException("Issue", str(issue_id))
 
-        # Get all issues with this issue as parent
-        # Use get_all with a large limit to get all issues in the project
-        issues = await self._issue_repository.get_all(
-            project_id=parent_issue.project_id,
-            skip=0,
-            limit=10000,  # Large limit to get all issues
-        )
+        project = await self._project_repository.get_by_id(parent_issue.project_id)
+        if project is None:
+            raise EntityNotFoundException("Project", str(parent_issue.project_id))
 
-        # Filter subtasks
-        subtasks = [issue for issue in issues if issue.parent_issue_id == issue_id]
+        # Direct children only (indexed lookup on parent_issue_id)
+        subtasks = await self._issue_repository.get_children(issue_id)
 
         # Convert to response DTOs
         subtask_items = [
@@ -46,7 +47,7 @@ class ListSubtasksUseCase:
                     "id": s.id,
                     "project_id": s.project_id,
                     "issue_number": s.issue_number,
-                    "key": f"PROJ-{s.issue_number}",  # Will be replaced with actual project key
+                    "key": s.generate_key(project.key),
                     "title": s.title,
                     "type": s.type,
                     "status": s.status,
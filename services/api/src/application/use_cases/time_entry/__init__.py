@@ -2,8 +2,10 @@
 
 from src.application.use_cases.time_entry.create_time_entry import CreateTimeEntryUseCase
 from src.application.use_cases.time_entry.delete_time_entry import DeleteTimeEntryUseCase
+from src.application.use_cases.time_entry.get_project_timesheet import GetProjectTimesheetUseCase
 from src.application.use_cases.time_entry.get_time_entry import GetTimeEntryUseCase
 from src.application.use_cases.time_entry.get_time_summary import GetTimeSummaryUseCase
+from src.application.use_cases.time_entry.get_user_timesheet import GetUserTimesheetUseCase
 from src.application.use_cases.time_entry.list_time_entries import ListTimeEntriesUseCase
 from src.application.use_cases.time_entry.update_time_entry import UpdateTimeEntryUseCase
 
@@ -14,4 +16,6 @@ __all__ = [
     "UpdateTimeEntryUseCase",
     "DeleteTimeEntryUseCase",
     "GetTimeSummaryUseCase",
+    "GetUserTimesheetUseCase",
+    "GetProjectTimesheetUseCase",
 ]
@@ -5,6 +5,8 @@ from uuid import UUID
 import structlog
 
 from src.application.dtos.time_entry import TimeEntryRequest, TimeEntryResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.timesheet_service import TimesheetService
 from src.domain.entities.time_entry import TimeEntry
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.repositories import IssueRepository
@@ -20,10 +22,14 @@ class CreateTimeEntryUseCase:
         self,
         time_entry_repository: TimeEntryRepository,
         issue_repository: IssueRepository,
+        hierarchy_service: IssueHierarchyService | None = None,
+        timesheet_service: TimesheetService | None = None,
     ) -> None:
         """Initialize use case with dependencies."""
         self._time_entry_repository = time_entry_repository
         self._issue_repository = issue_repository
+        self._hierarchy_service = hierarchy_service
+        self._timesheet_service = timesheet_service
 
     async def execute(
         self, issue_id: UUID, user_id: UUID, request: TimeEntryRequest
@@ -52,6 +58,15 @@ class CreateTimeEntryUseCase:
         # Save to database
         created_entry = await self._time_entry_repository.create(time_entry)
 
+        if self._timesheet_service:
+            await self._timesheet_service.record(
+                issue_id, user_id, created_entry.date, created_entry.hours, 1
+            )
+
+        # Hours roll up to the parent issues
+        if self._hierarchy_service and issue.parent_issue_id:
+            await self._hierarchy_service.refresh_rollups([issue_id])
+
         logger.info("Time entry created", entry_id=str(created_entry.id))
 
         return TimeEntryResponse.model_validate(
@@ -4,6 +4,8 @@ from uuid import UUID
 
 import structlog
 
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.timesheet_service import TimesheetService
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories.time_entry_repository import TimeEntryRepository
 
@@ -13,9 +15,16 @@ logger = structlog.get_logger()
 class DeleteTimeEntryUseCase:
     """Use case for deleting a time entry."""
 
-    def __init__(self, time_entry_repository: TimeEntryRepository) -> None:
+    def __init__(
+        self,
+        time_entry_repository: TimeEntryRepository,
+        hierarchy_service: IssueHierarchyService | None = None,
+        timesheet_service: TimesheetService | None = None,
+    ) -> None:
         """Initialize use case with dependencies."""
         self._time_entry_repository = time_entry_repository
+        self._hierarchy_service = hierarchy_service
+        self._timesheet_service = timesheet_service
 
     async def execute(self, time_entry_id: UUID) -> None:
         """Execute delete time entry."""
@@ -28,4 +37,13 @@ class DeleteTimeEntryUseCase:
 
         await self._time_entry_repository.delete(time_entry_id)
 
+        if self._timesheet_service:
+            await self._timesheet_service.record(
+                time_entry.issue_id, time_entry.user_id, time_entry.date, -time_entry.hours, -1
+            )
+
+        # Hours roll up to the parent issues
+        if self._hierarchy_service:
+            await self._hierarchy_service.refresh_rollups([time_entry.issue_id])
+
         logger.info("Time entry deleted", entry_id=str(time_entry_id))
@@ -0,0 +1,39 @@
+"""Get project timesheet use case."""
+
+from datetime import date, timedelta
+from uuid import UUID
+
+import structlog
+
+from src.application.dtos.time_entry import TimesheetResponse
+from src.application.services.timesheet_service import TimesheetService
+
+logger = structlog.get_logger()
+
+
+class GetProjectTimesheetUseCase:
+    """Use case for getting the monthly timesheet of a project by user."""
+
+    def __init__(self, timesheet_service: TimesheetService) -> None:
+        """Initialize use case with dependencies."""
+        self._timesheet_service = timesheet_service
+
+    async def execute(self, project_id: UUID, month: date | None = None) -> TimesheetResponse:
+        """Execute get project timesheet.
+
+        Args:
+            project_id: Project UUID
+            month: Any day of the month (default: current month)
+
+        Returns:
+            Timesheet of the month with a row per user
+        """
+        start_date = (month or date.today()).replace(day=1)
+        end_date = (start_date + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        logger.info(
+            "Getting project timesheet",
+            project_id=str(project_id),
+            start_date=start_date.isoformat(),
+        )
+
+        return await self._timesheet_service.get_project_timesheet(project_id, start_date, end_date)
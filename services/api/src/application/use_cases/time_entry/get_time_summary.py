@@ -21,30 +21,12 @@ class GetTimeSummaryUseCase:
         """Execute get time summary."""
         logger.info("Getting time summary", issue_id=str(issue_id))
 
-        # Get total hours
-        total_hours = await self._time_entry_repository.get_total_hours_by_issue(issue_id)
-
-        # Get all entries for the issue
-        entries = await self._time_entry_repository.get_by_issue_id(issue_id)
-
-        # Calculate hours by user
-        hours_by_user: dict[str, float] = {}
-        for entry in entries:
-            user_id_str = str(entry.user_id)
-            if user_id_str not in hours_by_user:
-                hours_by_user[user_id_str] = 0
-            hours_by_user[user_id_str] += float(entry.hours)
-
-        # Calculate hours by date
-        hours_by_date: dict[str, float] = {}
-        for entry in entries:
-            date_str = entry.date.isoformat()
-            if date_str not in hours_by_date:
-                hours_by_date[date_str] = 0
-            hours_by_date[date_str] += float(entry.hours)
+        total_hours, hours_by_user, hours_by_date = (
+            await self._time_entry_repository.get_hours_summary_by_issue(issue_id)
+        )
 
         return TimeSummaryResponse(
             total_hours=total_hours,
-            hours_by_user={k: float(v) for k, v in hours_by_user.items()},
-            hours_by_date_range={k: float(v) for k, v in hours_by_date.items()},
+            hours_by_user={str(user_id): hours for user_id, hours in hours_by_user.items()},
+            hours_by_date_range={day.isoformat(): hours for day, hours in hours_by_date.items()},
         )
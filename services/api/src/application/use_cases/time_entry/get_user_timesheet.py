@@ -0,0 +1,46 @@
+"""Get user timesheet use case."""
+
+from datetime import date, timedelta
+from uuid import UUID
+
+import structlog
+
+from src.application.dtos.time_entry import TimesheetResponse
+from src.application.services.timesheet_service import TimesheetService
+
+logger = structlog.get_logger()
+
+
+class GetUserTimesheetUseCase:
+    """Use case for getting the weekly timesheet of a user across projects."""
+
+    def __init__(self, timesheet_service: TimesheetService) -> None:
+        """Initialize use case with dependencies."""
+        self._timesheet_service = timesheet_service
+
+    async def execute(
+        self, organization_id: UUID, user_id: UUID, week: date | None = None
+    ) -> TimesheetResponse:
+        """Execute get user timesheet.
+
+        Args:
+            organization_id: Organization UUID (whose projects are listed)
+            user_id: User UUID
+            week: Any day of the week, Monday to Sunday (default: current week)
+
+        Returns:
+            Timesheet of the week with a row per project
+        """
+        day = week or date.today()
+        start_date = day - timedelta(days=day.weekday())
+        end_date = start_date + timedelta(days=6)
+        logger.info(
+            "Getting user timesheet",
+            organization_id=str(organization_id),
+            user_id=str(user_id),
+            start_date=start_date.isoformat(),
+        )
+
+        return await self._timesheet_service.get_user_timesheet(
+            organization_id, user_id, start_date, end_date
+        )
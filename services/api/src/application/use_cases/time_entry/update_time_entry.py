@@ -5,6 +5,8 @@ from uuid import UUID
 import structlog
 
 from src.application.dtos.time_entry import TimeEntryRequest, TimeEntryResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.timesheet_service import TimesheetService
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.repositories.time_entry_repository import TimeEntryRepository
 
@@ -14,9 +16,16 @@ logger = structlog.get_logger()
 class UpdateTimeEntryUseCase:
     """Use case for updating a time entry."""
 
-    def __init__(self, time_entry_repository: TimeEntryRepository) -> None:
+    def __init__(
+        self,
+        time_entry_repository: TimeEntryRepository,
+        hierarchy_service: IssueHierarchyService | None = None,
+        timesheet_service: TimesheetService | None = None,
+    ) -> None:
         """Initialize use case with dependencies."""
         self._time_entry_repository = time_entry_repository
+        self._hierarchy_service = hierarchy_service
+        self._timesheet_service = timesheet_service
 
     async def execute(self, time_entry_id: UUID, request: TimeEntryRequest) -> TimeEntryResponse:
         """Execute update time entry."""
@@ -28,6 +37,8 @@ class UpdateTimeEntryUseCase:
             logger.warning("Time entry not found", entry_id=str(time_entry_id))
             raise EntityNotFoundException("TimeEntry", str(time_entry_id))
 
+        previous_date, previous_hours = time_entry.date, time_entry.hours
+
         # Apply updates
         if request.hours is not None:
             try:
@@ -44,6 +55,21 @@ class UpdateTimeEntryUseCase:
         # Save to database
         updated_entry = await self._time_entry_repository.update(time_entry)
 
+        # Move the hours in the timesheet rollups
+        if self._timesheet_service and (
+            updated_entry.date != previous_date or updated_entry.hours != previous_hours
+        ):
+            await self._timesheet_service.record(
+                time_entry.issue_id, time_entry.user_id, previous_date, -previous_hours, -1
+            )
+            await self._timesheet_service.record(
+                time_entry.issue_id, time_entry.user_id, updated_entry.date, updated_entry.hours, 1
+            )
+
+        # Hours roll up to the parent issues
+        if self._hierarchy_service:
+            await self._hierarchy_service.refresh_rollups([time_entry.issue_id])
+
         logger.info("Time entry updated", entry_id=str(time_entry_id))
 
         return TimeEntryResponse.model_validate(
@@ -1,6 +1,10 @@
 """User management use cases."""
 
-from src.application.use_cases.user.avatar import DeleteAvatarUseCase, UploadAvatarUseCase
+from src.application.use_cases.user.avatar import (
+    DeleteAvatarUseCase,
+    GetAvatarUseCase,
+    UploadAvatarUseCase,
+)
 from src.application.use_cases.user.deactivate import DeactivateUserUseCase
 from src.application.use_cases.user.list import ListUsersUseCase
 from src.application.use_cases.user.preferences import (
@@ -22,6 +26,7 @@ __all__ = [
     "UpdateUserPasswordUseCase",
     "UploadAvatarUseCase",
     "DeleteAvatarUseCase",
+    "GetAvatarUseCase",
     "GetUserPreferencesUseCase",
     "UpdateUserPreferencesUseCase",
     "ListUsersUseCase",
@@ -1,5 +1,7 @@
-"""Avatar upload and deletion use cases."""
+"""Avatar upload, retrieval and deletion use cases."""
 
+import asyncio
+from concurrent.futures import Executor
 from pathlib import Path
 from uuid import uuid4
 
@@ -13,23 +15,61 @@ from src.infrastructure.services.image_service import ImageProcessingService
 
 logger = structlog.get_logger()
 
+# Every format a variant may be stored in (to clean them up)
+AVATAR_EXTENSIONS = tuple(ImageProcessingService.FORMAT_EXTENSIONS.values())
+
+
+def _avatar_base_path(file_path: str) -> tuple[str, str]:
+    """Split the storage path of an avatar variant into its base path and extension.
+
+    Variants of one upload are stored as `{base}_{size}{extension}`, next to
+    `{base}_original{extension}` (the uploaded image).
+    """
+    path_obj = Path(file_path)
+    base_name = path_obj.stem.rsplit("_", 1)[0]  # Remove size suffix if present
+    return f"{path_obj.parent}/{base_name}", path_obj.suffix
+
+
+async def _delete_avatar_files(storage_service: StorageService, file_path: str) -> None:
+    """Delete the original and every generated variant of an avatar."""
+    base_path, extension = _avatar_base_path(file_path)
+    paths = {file_path, f"{base_path}_original{extension}"}
+    for size_config in ImageProcessingService.AVATAR_SIZES:
+        for variant_extension in AVATAR_EXTENSIONS:
+            paths.add(f"{base_path}_{size_config.name}{variant_extension}")
+
+    for path in paths:
+        try:
+            await storage_service.delete(path)
+        except Exception:
+            # Ignore errors for individual variant deletions
+            pass
+
 
 class UploadAvatarUseCase:
-    """Use case for uploading user avatar."""
+    """Use case for uploading user avatar.
+
+    The image is resized in the executor (a process pool in production) so the
+    event loop keeps serving other requests; only the default size is created,
+    the other sizes and formats are generated on first request.
+    """
 
     def __init__(
         self,
         user_repository: UserRepository,
         storage_service: StorageService,
+        executor: Executor | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             user_repository: User repository for data access
             storage_service: Storage service for file operations
+            executor: Pool image processing runs in (defaults to the loop's thread pool)
         """
         self._user_repository = user_repository
         self._storage_service = storage_service
+        self._executor = executor
 
     async def execute(
         self,
@@ -81,33 +121,36 @@ class UploadAvatarUseCase:
 
         # Delete old avatar if exists
         if user.avatar_url:
-            try:
-                # Extract path from URL
-                old_path = self._extract_path_from_url(user.avatar_url)
-                await self._storage_service.delete(old_path)
-                logger.info("Old avatar deleted", path=old_path)
-            except Exception as e:
-                logger.warning("Failed to delete old avatar", error=str(e))
-                # Continue with upload even if deletion fails
-
-        # Process image and create multiple sizes
+            old_path = self._extract_path_from_url(user.avatar_url)
+            await _delete_avatar_files(self._storage_service, old_path)
+            logger.info("Old avatar deleted", path=old_path)
+
+        # Create the default size off the event loop
         output_format = ImageProcessingService.get_output_format(content_type)
-        processed_images = ImageProcessingService.process_avatar(
-            file_content, output_format=output_format
-        )
+        default_size = ImageProcessingService.DEFAULT_AVATAR_SIZE
+        try:
+            processed_images = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                ImageProcessingService.process_avatar,
+                file_content,
+                output_format,
+                [default_size],
+            )
+        except Exception as e:
+            # Exceptions raised in worker processes lose their attributes
+            raise ValidationException("Failed to process image", field="file") from e
 
-        # Save all sizes to storage
-        file_extension = Path(file_name).suffix or ".png"
+        # Keep the original as the source of the sizes generated on demand
+        file_extension = ImageProcessingService.FORMAT_EXTENSIONS[output_format]
         base_filename = f"avatars/{user_id}/{uuid4().hex}"
-
-        saved_urls = {}
-        for size_name, processed_content in processed_images.items():
-            file_path = f"{base_filename}_{size_name}{file_extension}"
-            url = await self._storage_service.save(processed_content, file_path, content_type)
-            saved_urls[size_name] = url
-
-        # Use 256x256 as the main avatar URL (largest size)
-        avatar_url = saved_urls.get("256x256", saved_urls.get(list(saved_urls.keys())[0]))
+        await self._storage_service.save(
+            file_content, f"{base_filename}_original{file_extension}", content_type
+        )
+        avatar_url = await self._storage_service.save(
+            processed_images[default_size.name],
+            f"{base_filename}_{default_size.name}{file_extension}",
+            content_type,
+        )
 
         # Update user avatar URL
         user.update_avatar(avatar_url)
@@ -209,34 +252,10 @@ class DeleteAvatarUseCase:
                 updated_at=user.updated_at,
             )
 
-        # Delete file from storage
-        # Extract path from URL
+        # Delete the original and all sizes from storage
         upload_use_case = UploadAvatarUseCase(self._user_repository, self._storage_service)
         file_path = upload_use_case._extract_path_from_url(user.avatar_url)
-
-        try:
-            # Delete all sizes (assuming naming pattern)
-            # Delete main file
-            await self._storage_service.delete(file_path)
-
-            # Try to delete other sizes (they might have _64x64, _128x128, _256x256 suffixes)
-            path_obj = Path(file_path)
-            base_name = path_obj.stem.rsplit("_", 1)[0]  # Remove size suffix if present
-            extension = path_obj.suffix
-
-            for size_config in ImageProcessingService.AVATAR_SIZES:
-                size_file_path = f"{path_obj.parent}/{base_name}_{size_config.name}{extension}"
-                try:
-                    await self._storage_service.delete(size_file_path)
-                except Exception:
-                    # Ignore errors for individual size deletions
-                    pass
-
-        except Exception as e:
-            logger.warning(
-                "Failed to delete avatar file from storage", path=file_path, error=str(e)
-            )
-            # Continue with clearing avatar_url even if file deletion fails
+        await _delete_avatar_files(self._storage_service, file_path)
 
         # Clear avatar URL in database
         user.update_avatar(None)
@@ -254,3 +273,150 @@ class DeleteAvatarUseCase:
             created_at=updated_user.created_at,
             updated_at=updated_user.updated_at,
         )
+
+
+class GetAvatarUseCase:
+    """Use case for getting a user avatar in a given size and format.
+
+    Variants are generated on first request, in the executor, from the uploaded
+    original and cached in storage next to it.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        storage_service: StorageService,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            user_repository: User repository for data access
+            storage_service: Storage service for file operations
+            executor: Pool image processing runs in (defaults to the loop's thread pool)
+        """
+        self._user_repository = user_repository
+        self._storage_service = storage_service
+        self._executor = executor
+
+    async def execute(
+        self,
+        user_id: str,
+        size: str,
+        accept: str | None = None,
+        if_none_match: str | None = None,
+    ) -> tuple[bytes | None, str, str]:
+        """Execute get avatar.
+
+        Args:
+            user_id: ID of the user whose avatar is requested
+            size: Size name (e.g. "128x128")
+            accept: Accept header, to serve AVIF or WEBP to clients supporting them
+            if_none_match: ETag the client already has
+
+        Returns:
+            Tuple of (content, mime_type, etag); content is None when the
+            client's copy (if_none_match) is current
+
+        Raises:
+            EntityNotFoundException: If user not found or has no avatar
+            ValidationException: If the size is not allowed
+        """
+        from uuid import UUID
+
+        size_config = ImageProcessingService.get_avatar_size(size)
+        if size_config is None:
+            raise ValidationException(
+                f"Size not allowed. Allowed sizes: "
+                f"{', '.join(s.name for s in ImageProcessingService.AVATAR_SIZES)}",
+                field="size",
+            )
+
+        user = await self._user_repository.get_by_id(UUID(user_id))
+        if user is None:
+            raise EntityNotFoundException("User", user_id)
+        if not user.avatar_url:
+            raise EntityNotFoundException("Avatar", user_id)
+
+        upload_use_case = UploadAvatarUseCase(self._user_repository, self._storage_service)
+        base_path, extension = _avatar_base_path(
+            upload_use_case._extract_path_from_url(user.avatar_url)
+        )
+        fallback_format = next(
+            (
+                output_format
+                for output_format, format_extension in (
+                    ImageProcessingService.FORMAT_EXTENSIONS.items()
+                )
+                if format_extension == extension.lower()
+            ),
+            "PNG",
+        )
+        output_format = ImageProcessingService.negotiate_output_format(accept, fallback_format)
+        mime_type = ImageProcessingService.FORMAT_MIME_TYPES[output_format]
+
+        # Upload paths are unique, so the path identifies the content
+        variant_path = (
+            f"{base_path}_{size_config.name}"
+            f"{ImageProcessingService.FORMAT_EXTENSIONS[output_format]}"
+        )
+        etag = f'"{Path(variant_path).name}"'
+        if if_none_match == etag:
+            return None, mime_type, etag
+
+        if await self._storage_service.exists(variant_path):
+            return await self._storage_service.get_file(variant_path), mime_type, etag
+
+        source = await self._get_source(base_path, extension)
+        try:
+            processed_images = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                ImageProcessingService.process_avatar,
+                source,
+                output_format,
+                [size_config],
+            )
+        except Exception:
+            # Corrupt original or crashed worker: serve the size stored at upload
+            logger.exception(
+                "Avatar variant generation failed",
+                user_id=user_id,
+                size=size_config.name,
+                format=output_format,
+            )
+            return await self._get_stored_default(user_id, base_path, extension, fallback_format)
+        content = processed_images[size_config.name]
+        await self._storage_service.save(content, variant_path, mime_type)
+
+        logger.info(
+            "Avatar variant generated",
+            user_id=user_id,
+            size=size_config.name,
+            format=output_format,
+        )
+
+        return content, mime_type, etag
+
+    async def _get_stored_default(
+        self, user_id: str, base_path: str, extension: str, upload_format: str
+    ) -> tuple[bytes, str, str]:
+        """The default size stored at upload, in the upload's format."""
+        default_size = ImageProcessingService.DEFAULT_AVATAR_SIZE
+        default_path = f"{base_path}_{default_size.name}{extension}"
+        if not await self._storage_service.exists(default_path):
+            raise EntityNotFoundException("Avatar", user_id)
+        return (
+            await self._storage_service.get_file(default_path),
+            ImageProcessingService.FORMAT_MIME_TYPES[upload_format],
+            f'"{Path(default_path).name}"',
+        )
+
+    async def _get_source(self, base_path: str, extension: str) -> bytes:
+        """Read the image variants are generated from."""
+        original_path = f"{base_path}_original{extension}"
+        if await self._storage_service.exists(original_path):
+            return await self._storage_service.get_file(original_path)
+
+        # Avatars uploaded before originals were kept: use the largest stored size
+        default_size = ImageProcessingService.DEFAULT_AVATAR_SIZE
+        return await self._storage_service.get_file(f"{base_path}_{default_size.name}{extension}")
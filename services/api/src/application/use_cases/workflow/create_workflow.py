@@ -3,8 +3,10 @@
 from uuid import UUID
 
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.workflow import CreateWorkflowRequest, WorkflowResponse
+from src.application.services.workflow_cache import WorkflowCache
 from src.domain.entities.workflow import Workflow
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.repositories import ProjectRepository, WorkflowRepository
@@ -19,15 +21,21 @@ class CreateWorkflowUseCase:
         self,
         workflow_repository: WorkflowRepository,
         project_repository: ProjectRepository,
+        workflow_cache: WorkflowCache | None = None,
+        session: AsyncSession | None = None,
     ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             workflow_repository: Workflow repository for data access
             project_repository: Project repository to verify project exists
+            workflow_cache: Compiled workflows to invalidate (optional)
+            session: Session of the change (the cache is invalidated once it commits)
         """
         self._workflow_repository = workflow_repository
         self._project_repository = project_repository
+        self._workflow_cache = workflow_cache
+        self._session = session
 
     async def execute(self, project_id: UUID, request: CreateWorkflowRequest) -> WorkflowResponse:
         """Execute create workflow.
@@ -99,6 +107,8 @@ class CreateWorkflowUseCase:
 
         # Save to database
         created_workflow = await self._workflow_repository.create(workflow)
+        if self._workflow_cache:
+            self._workflow_cache.invalidate(project_id, self._session)
 
         logger.info("Workflow created", workflow_id=str(created_workflow.id))
 
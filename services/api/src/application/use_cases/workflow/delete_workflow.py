@@ -3,7 +3,9 @@
 from uuid import UUID
 
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.services.workflow_cache import WorkflowCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import WorkflowRepository
 
@@ -13,13 +15,22 @@ logger = structlog.get_logger()
 class DeleteWorkflowUseCase:
     """Use case for deleting a workflow."""
 
-    def __init__(self, workflow_repository: WorkflowRepository) -> None:
+    def __init__(
+        self,
+        workflow_repository: WorkflowRepository,
+        workflow_cache: WorkflowCache | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             workflow_repository: Workflow repository for data access
+            workflow_cache: Compiled workflows to invalidate (optional)
+            session: Session of the change (the cache is invalidated once it commits)
         """
         self._workflow_repository = workflow_repository
+        self._workflow_cache = workflow_cache
+        self._session = session
 
     async def execute(self, workflow_id: UUID) -> None:
         """Execute delete workflow.
@@ -39,5 +50,7 @@ class DeleteWorkflowUseCase:
             raise EntityNotFoundException("Workflow", str(workflow_id))
 
         await self._workflow_repository.delete(workflow_id)
+        if self._workflow_cache:
+            self._workflow_cache.invalidate(workflow.project_id, self._session)
 
         logger.info("Workflow deleted", workflow_id=str(workflow_id))
@@ -3,8 +3,10 @@
 from uuid import UUID
 
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.workflow import UpdateWorkflowRequest, WorkflowResponse
+from src.application.services.workflow_cache import WorkflowCache
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.repositories import WorkflowRepository
 
@@ -14,13 +16,22 @@ logger = structlog.get_logger()
 class UpdateWorkflowUseCase:
     """Use case for updating a workflow."""
 
-    def __init__(self, workflow_repository: WorkflowRepository) -> None:
+    def __init__(
+        self,
+        workflow_repository: WorkflowRepository,
+        workflow_cache: WorkflowCache | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             workflow_repository: Workflow repository for data access
+            workflow_cache: Compiled workflows to invalidate (optional)
+            session: Session of the change (the cache is invalidated once it commits)
         """
         self._workflow_repository = workflow_repository
+        self._workflow_cache = workflow_cache
+        self._session = session
 
     async def execute(self, workflow_id: UUID, request: UpdateWorkflowRequest) -> WorkflowResponse:
         """Execute update workflow.
@@ -65,6 +76,8 @@ class UpdateWorkflowUseCase:
 
         # Save to database
         updated_workflow = await self._workflow_repository.update(workflow)
+        if self._workflow_cache:
+            self._workflow_cache.invalidate(workflow.project_id, self._session)
 
         logger.info("Workflow updated", workflow_id=str(workflow_id))
 
@@ -5,6 +5,7 @@ from uuid import UUID
 import structlog
 
 from src.application.dtos.workflow import ValidateTransitionRequest, ValidateTransitionResponse
+from src.application.services.workflow_cache import CompiledWorkflow, WorkflowCache
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import WorkflowRepository
 
@@ -14,13 +15,19 @@ logger = structlog.get_logger()
 class ValidateTransitionUseCase:
     """Use case for validating a workflow transition."""
 
-    def __init__(self, workflow_repository: WorkflowRepository) -> None:
+    def __init__(
+        self,
+        workflow_repository: WorkflowRepository,
+        workflow_cache: WorkflowCache | None = None,
+    ) -> None:
         """Initialize use case with dependencies.
 
         Args:
             workflow_repository: Workflow repository for data access
+            workflow_cache: Compiled workflows, spares loading the workflow (optional)
         """
         self._workflow_repository = workflow_repository
+        self._workflow_cache = workflow_cache
 
     async def execute(
         self, workflow_id: UUID, request: ValidateTransitionRequest
@@ -44,14 +51,18 @@ class ValidateTransitionUseCase:
             to_status_id=str(request.to_status_id),
         )
 
-        workflow = await self._workflow_repository.get_by_id(workflow_id)
+        if self._workflow_cache:
+            workflow = await self._workflow_cache.get(workflow_id, self._workflow_repository)
+        else:
+            loaded = await self._workflow_repository.get_by_id(workflow_id)
+            workflow = CompiledWorkflow.compile(loaded) if loaded is not None else None
 
         if workflow is None:
             logger.warning("Workflow not found", workflow_id=str(workflow_id))
             raise EntityNotFoundException("Workflow", str(workflow_id))
 
         # Check if transition is valid
-        is_valid = workflow.is_valid_transition(request.from_status_id, request.to_status_id)
+        is_valid = workflow.allows(request.from_status_id, request.to_status_id)
 
         message = None
         if not is_valid:
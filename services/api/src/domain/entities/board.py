@@ -10,8 +10,8 @@ from uuid import UUID, uuid4
 class BoardList:
     """Board list (column) value object / entity.
 
-    Represents a column on a board with type (label, assignee, milestone)
-    and optional config (e.g. label_id, user_id, sprint_id).
+    Represents a column on a board with type (label, assignee, milestone, status)
+    and optional config (e.g. label_id, user_id, sprint_id, status).
     """
 
     id: UUID
@@ -24,7 +24,7 @@ class BoardList:
 
     def __post_init__(self) -> None:
         """Validate list type."""
-        allowed = ("label", "assignee", "milestone")
+        allowed = ("label", "assignee", "milestone", "status")
         if self.list_type not in allowed:
             raise ValueError(f"list_type must be one of {allowed}")
         if self.position < 0:
@@ -39,7 +39,7 @@ class BoardList:
         position: int = 0,
     ) -> Self:
         """Create a new board list."""
-        allowed = ("label", "assignee", "milestone")
+        allowed = ("label", "assignee", "milestone", "status")
         if list_type not in allowed:
             raise ValueError(f"list_type must be one of {allowed}")
         if position < 0:
@@ -0,0 +1,12 @@
+"""Domain events."""
+
+from src.domain.events.base import DomainEvent
+from src.domain.events.comment import CommentCreated
+from src.domain.events.issue import IssueAssigned, IssueStatusChanged
+
+__all__ = [
+    "DomainEvent",
+    "IssueStatusChanged",
+    "IssueAssigned",
+    "CommentCreated",
+]
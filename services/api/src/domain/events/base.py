@@ -0,0 +1,34 @@
+"""Base class of domain events."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import ClassVar
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """Something that happened in the domain, for handlers to react to.
+
+    Events are published in the transaction of the change and delivered to
+    their handlers once it has committed. Subclasses hold plain values only
+    and name their type with `event_type`, which is stored with every event
+    published and must not change afterwards.
+    """
+
+    event_type: ClassVar[str]
+    _types: ClassVar[dict[str, type["DomainEvent"]]] = {}
+
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        event_type = cls.__dict__.get("event_type")
+        if event_type is not None:
+            if event_type in DomainEvent._types:
+                raise ValueError(f"Duplicate domain event type: {event_type}")
+            DomainEvent._types[event_type] = cls
+
+    @staticmethod
+    def type_of(event_type: str) -> type["DomainEvent"] | None:
+        """Event class of a stored event type (None if unknown)."""
+        return DomainEvent._types.get(event_type)
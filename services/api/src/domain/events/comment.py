@@ -0,0 +1,18 @@
+"""Comment domain events."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.events.base import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class CommentCreated(DomainEvent):
+    """A comment was added to an issue."""
+
+    event_type = "comment.created"
+
+    comment_id: UUID
+    issue_id: UUID
+    author_id: UUID
+    content: str
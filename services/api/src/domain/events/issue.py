@@ -0,0 +1,35 @@
+"""Issue domain events."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.events.base import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class IssueStatusChanged(DomainEvent):
+    """The status of an issue changed."""
+
+    event_type = "issue.status_changed"
+
+    issue_id: UUID
+    project_id: UUID
+    issue_title: str
+    old_status: str
+    new_status: str
+    assignee_id: UUID | None
+    changed_by: UUID | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class IssueAssigned(DomainEvent):
+    """An issue was assigned to another user, or unassigned."""
+
+    event_type = "issue.assigned"
+
+    issue_id: UUID
+    project_id: UUID
+    issue_title: str
+    old_assignee_id: UUID | None
+    new_assignee_id: UUID | None
+    assigned_by: UUID | None
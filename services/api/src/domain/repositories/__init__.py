@@ -11,7 +11,10 @@ from src.domain.repositories.dashboard_repository import DashboardRepository
 from src.domain.repositories.favorite_repository import FavoriteRepository
 from src.domain.repositories.folder_repository import FolderRepository
 from src.domain.repositories.invitation_repository import InvitationRepository
-from src.domain.repositories.issue_activity_repository import IssueActivityRepository
+from src.domain.repositories.issue_activity_repository import (
+    IssueActivityEntry,
+    IssueActivityRepository,
+)
 from src.domain.repositories.issue_link_repository import IssueLinkRepository
 from src.domain.repositories.issue_repository import IssueRepository
 from src.domain.repositories.label_repository import LabelRepository
@@ -41,6 +44,7 @@ __all__ = [
     "InvitationRepository",
     "ProjectRepository",
     "IssueRepository",
+    "IssueActivityEntry",
     "IssueActivityRepository",
     "CommentRepository",
     "AttachmentRepository",
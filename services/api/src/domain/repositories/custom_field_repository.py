@@ -100,6 +100,18 @@ class CustomFieldValueRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_by_issue_ids(self, issue_ids: list[UUID]) -> dict[UUID, list[CustomFieldValue]]:
+        """Get the custom field values of many issues in one query.
+
+        Args:
+            issue_ids: Issue UUIDs
+
+        Returns:
+            Values by issue ID (issues without values are absent)
+        """
+        ...
+
     @abstractmethod
     async def get_by_custom_field_id(self, custom_field_id: UUID) -> list[CustomFieldValue]:
         """Get all values for a custom field.
@@ -1,11 +1,25 @@
 """Issue activity repository interface (port)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from uuid import UUID
 
 from src.infrastructure.database.models import IssueActivityModel
 
 
+@dataclass(frozen=True, slots=True)
+class IssueActivityEntry:
+    """Activity log entry waiting to be written."""
+
+    issue_id: UUID
+    user_id: UUID | None
+    action: str
+    field_name: str | None = None
+    old_value: str | None = None
+    new_value: str | None = None
+
+
 class IssueActivityRepository(ABC):
     """Abstract issue activity repository interface.
 
@@ -38,6 +52,43 @@ class IssueActivityRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def create_many(
+        self,
+        issue_ids: list[UUID],
+        user_id: UUID | None,
+        action: str,
+        field_name: str | None = None,
+        old_value: str | None = None,
+        new_value: str | None = None,
+    ) -> int:
+        """Create the same activity log entry for several issues in one statement.
+
+        Args:
+            issue_ids: Issue UUIDs
+            user_id: User UUID who performed the action (can be None for system actions)
+            action: Action type (created, updated, deleted, status_changed, etc.)
+            field_name: Optional field name that was changed
+            old_value: Optional old value (as string)
+            new_value: Optional new value (as string)
+
+        Returns:
+            Number of entries created
+        """
+        ...
+
+    @abstractmethod
+    async def create_batch(self, entries: Sequence[IssueActivityEntry]) -> int:
+        """Create activity log entries in one multi-row statement.
+
+        Args:
+            entries: Entries to write, in order
+
+        Returns:
+            Number of entries created
+        """
+        ...
+
     @abstractmethod
     async def get_by_issue_id(
         self,
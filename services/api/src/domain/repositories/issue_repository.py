@@ -1,6 +1,7 @@
 """Issue repository interface (port)."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 from src.domain.entities import Issue
@@ -27,6 +28,22 @@ class IssueRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def reserve_issue_numbers(self, project_id: UUID, count: int) -> range:
+        """Reserve a block of consecutive issue numbers for a project.
+
+        This should be atomic to ensure no duplicates (bulk imports allocate
+        all their numbers with one call).
+
+        Args:
+            project_id: Project UUID
+            count: Number of issue numbers to reserve
+
+        Returns:
+            Reserved issue numbers
+        """
+        ...
+
     @abstractmethod
     async def create(self, issue: Issue) -> Issue:
         """Create a new issue.
@@ -52,10 +69,13 @@ class IssueRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_by_key(self, project_key: str, issue_number: int) -> Issue | None:
-        """Get issue by project key and issue number.
+    async def get_by_key(
+        self, organization_id: UUID, project_key: str, issue_number: int
+    ) -> Issue | None:
+        """Get issue by project key and issue number within an organization.
 
         Args:
+            organization_id: Organization UUID (project keys are unique per organization)
             project_key: Project key (e.g., "PROJ")
             issue_number: Issue number (e.g., 123)
 
@@ -106,8 +126,17 @@ class IssueRepository(ABC):
         sprint_id: UUID | None = None,
         label_ids: list[UUID] | None = None,
         parent_issue_id: UUID | None = None,
+        custom_field_values: dict[UUID, Any] | None = None,
+        sort_custom_field_id: UUID | None = None,
+        sort_descending: bool = False,
     ) -> list[Issue]:
-        """Get all issues in a project with filters and pagination."""
+        """Get all issues in a project with filters and pagination.
+
+        `custom_field_values` maps custom field IDs to the value an issue must
+        have (a list field matches when it contains the value). With
+        `sort_custom_field_id`, issues are ordered by that field's value, issues
+        without a value last; otherwise newest first.
+        """
         ...
 
     @abstractmethod
@@ -123,6 +152,7 @@ class IssueRepository(ABC):
         sprint_id: UUID | None = None,
         label_ids: list[UUID] | None = None,
         parent_issue_id: UUID | None = None,
+        custom_field_values: dict[UUID, Any] | None = None,
     ) -> int:
         """Count total issues in a project with filters."""
         ...
@@ -147,3 +177,39 @@ class IssueRepository(ABC):
             List of matching issues
         """
         ...
+
+    @abstractmethod
+    async def get_children(self, parent_issue_id: UUID) -> list[Issue]:
+        """Get the direct children of an issue (subtasks, stories of an epic).
+
+        Args:
+            parent_issue_id: Parent issue UUID
+
+        Returns:
+            Live child issues, by issue number
+        """
+        ...
+
+    @abstractmethod
+    async def get_descendant_ids(self, issue_id: UUID) -> list[UUID]:
+        """Get the IDs of all live descendants of an issue.
+
+        Args:
+            issue_id: Issue UUID
+
+        Returns:
+            Descendant IDs, nearest first
+        """
+        ...
+
+    @abstractmethod
+    async def get_ancestor_ids(self, issue_id: UUID) -> list[UUID]:
+        """Get the IDs of the ancestors of an issue.
+
+        Args:
+            issue_id: Issue UUID
+
+        Returns:
+            Ancestor IDs, parent first
+        """
+        ...
@@ -1,6 +1,7 @@
 """Page repository interface (port)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from uuid import UUID
 
 from src.domain.entities import Page
@@ -85,6 +86,7 @@ class PageRepository(ABC):
         limit: int = 20,
         include_deleted: bool = False,
         parent_id: UUID | None = None,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> list[Page]:
         """Get all pages in a space with pagination.
 
@@ -94,6 +96,7 @@ class PageRepository(ABC):
             limit: Maximum number of records to return
             include_deleted: Whether to include soft-deleted pages
             parent_id: Optional parent page ID to filter by (None for root pages)
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             List of pages
@@ -106,6 +109,7 @@ class PageRepository(ABC):
         space_id: UUID,
         include_deleted: bool = False,
         parent_id: UUID | None = None,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> int:
         """Count total pages in a space.
 
@@ -113,6 +117,7 @@ class PageRepository(ABC):
             space_id: Space UUID
             include_deleted: Whether to include soft-deleted pages
             parent_id: Optional parent page ID to filter by (None for root pages)
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             Total count of pages
@@ -126,6 +131,7 @@ class PageRepository(ABC):
         query: str,
         skip: int = 0,
         limit: int = 20,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> list[Page]:
         """Search pages by title or content within a space.
 
@@ -134,6 +140,7 @@ class PageRepository(ABC):
             query: Search query
             skip: Number of records to skip
             limit: Maximum number of records to return
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             List of matching pages
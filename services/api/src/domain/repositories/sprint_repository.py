@@ -195,6 +195,27 @@ class SprintRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def move_incomplete_issues(
+        self,
+        sprint_id: UUID,
+        target_sprint_id: UUID | None = None,
+    ) -> list[UUID]:
+        """Move the incomplete issues of a sprint in one set-based statement.
+
+        Issues keep their relative sprint order: they are appended to the
+        target sprint, or to the end of the project backlog when no target
+        sprint is given.
+
+        Args:
+            sprint_id: Sprint UUID
+            target_sprint_id: Sprint to move the issues to (None for the backlog)
+
+        Returns:
+            IDs of the moved issues
+        """
+        ...
+
     @abstractmethod
     async def get_sprint_issues(
         self,
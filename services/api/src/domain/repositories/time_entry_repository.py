@@ -48,6 +48,13 @@ class TimeEntryRepository(ABC):
         """Get total hours logged by a user."""
         ...
 
+    @abstractmethod
+    async def get_hours_summary_by_issue(
+        self, issue_id: UUID
+    ) -> tuple[Decimal, dict[UUID, Decimal], dict[date, Decimal]]:
+        """Get total hours logged for an issue, with the hours by user and by date."""
+        ...
+
     @abstractmethod
     async def update(self, time_entry: TimeEntry) -> TimeEntry:
         """Update an existing time entry."""
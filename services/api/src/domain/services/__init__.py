@@ -2,6 +2,6 @@
 
 from src.domain.services.password_service import PasswordService
 from src.domain.services.permission_service import PermissionService
-from src.domain.services.storage_service import StorageService
+from src.domain.services.storage_service import StorageService, StoredFile
 
-__all__ = ["PasswordService", "PermissionService", "StorageService"]
+__all__ = ["PasswordService", "PermissionService", "StorageService", "StoredFile"]
@@ -1,6 +1,16 @@
 """Storage service interface for file operations."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class StoredFile:
+    """File of a storage listing."""
+
+    path: str  # Relative to the storage root
+    modified_at: datetime
 
 
 class StorageService(ABC):
@@ -100,3 +110,22 @@ class StorageService(ABC):
             StorageException: If file does not exist or read fails
         """
         ...
+
+    @abstractmethod
+    async def list_files(
+        self, prefix: str, after: str | None = None, limit: int = 1000
+    ) -> list[StoredFile]:
+        """List files under a prefix, in path order, one page at a time.
+
+        Args:
+            prefix: Path prefix of the files (relative to storage root)
+            after: Path the page starts after (None for the first page)
+            limit: Maximum number of files returned
+
+        Returns:
+            Files sorted by path (fewer than `limit` on the last page)
+
+        Raises:
+            StorageException: If listing fails
+        """
+        ...
@@ -33,6 +33,22 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 5
     database_max_overflow: int = 10
+    database_replica_urls: list[PostgresDsn] = Field(
+        default_factory=list,
+        description="Read replicas serving the read-only endpoints (none reads the primary)",
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0,
+        description="Replicas further behind the primary are not read from",
+    )
+    database_replica_check_interval_seconds: float = Field(
+        default=10.0,
+        description="How often the health and lag of the replicas are checked",
+    )
+    database_read_your_writes_seconds: float = Field(
+        default=10.0,
+        description="After a write, the user reads the primary for this long",
+    )
 
     # Redis
     redis_url: RedisDsn = Field(default="redis://localhost:6379/0")  # type: ignore[assignment]
@@ -59,10 +75,145 @@ class Settings(BaseSettings):
         default=5,
         description="Maximum file size in MB",
     )
+    attachment_thumbnail_size: int = Field(
+        default=320,
+        description="Maximum width and height of attachment thumbnails in pixels",
+    )
+    image_worker_processes: int = Field(
+        default=2,
+        description="Worker processes for image processing (0 runs it in a thread pool)",
+    )
 
     # Logging
     log_level: str = "INFO"
 
+    # Monitoring
+    server_timing_enabled: bool = Field(
+        default=True,
+        description="Add a Server-Timing header (auth/db/serialization phases) to responses",
+    )
+    slow_query_threshold_ms: int = Field(
+        default=500,
+        description="Log SQL statements slower than this (with parameters)",
+    )
+    slow_query_explain: bool = Field(
+        default=False,
+        description="Also log the EXPLAIN ANALYZE plan of slow SELECT statements",
+    )
+    n_plus_one_threshold: int = Field(
+        default=5,
+        description="Flag a request when one statement shape runs at least this many times",
+    )
+    metrics_token: str | None = Field(
+        default=None,
+        description="Bearer token required to scrape /metrics (the endpoint is off when unset)",
+    )
+
+    # Dashboards
+    dashboard_widget_cache_ttl_seconds: int = Field(
+        default=30,
+        description="Time to live of cached widget results (0 disables caching)",
+    )
+    dashboard_widget_concurrency: int = Field(
+        default=4,
+        description="Widget queries of one dashboard run concurrently (own connections)",
+    )
+
+    # Saved filters
+    saved_filter_count_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Time to live of cached saved filter totals (0 disables caching)",
+    )
+
+    # Workflows
+    workflow_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Time to live of compiled workflows (0 disables caching)",
+    )
+
+    # Page permissions
+    page_access_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Time to live of resolved page permissions (0 disables caching)",
+    )
+
+    # Domain events (transactional outbox)
+    outbox_dispatcher_enabled: bool = Field(
+        default=True,
+        description=(
+            "Deliver outbox events from the API process "
+            "(disable when `python -m src.outbox_worker` runs separately)"
+        ),
+    )
+    outbox_batch_size: int = Field(
+        default=100,
+        description="Maximum number of outbox events delivered per batch",
+    )
+    outbox_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Wait between polls of the outbox once no event is pending",
+    )
+    outbox_max_attempts: int = Field(
+        default=10,
+        description="Failed deliveries after which an outbox event is given up",
+    )
+    outbox_retry_delay_seconds: float = Field(
+        default=5.0,
+        description="Wait before retrying a failed outbox event (doubled on every failure)",
+    )
+
+    # Maintenance (cleanup and retention jobs)
+    maintenance_scheduler_enabled: bool = Field(
+        default=True,
+        description=(
+            "Run maintenance jobs from the API process "
+            "(disable when `python -m src.maintenance_worker` runs separately)"
+        ),
+    )
+    maintenance_batch_size: int = Field(
+        default=1000,
+        description="Maximum number of rows (or files) a maintenance job purges per batch",
+    )
+    maintenance_batch_delay_seconds: float = Field(
+        default=0.5,
+        description="Pause between the batches of a maintenance job, to spare the database",
+    )
+    maintenance_max_batches_per_run: int = Field(
+        default=100,
+        description="Batches after which a maintenance run stops, to resume at its next run",
+    )
+    maintenance_poll_interval_seconds: float = Field(
+        default=60.0,
+        description="Wait between checks for due maintenance jobs",
+    )
+    presence_stale_after_minutes: int = Field(
+        default=120,
+        description="Minutes without update after which a page presence is purged",
+    )
+    soft_deleted_retention_days: int = Field(
+        default=30,
+        description="Days deleted issues and pages are kept before being purged",
+    )
+    notification_retention_days: int = Field(
+        default=90,
+        description="Days notifications are kept",
+    )
+    expired_invitation_retention_days: int = Field(
+        default=7,
+        description="Days unaccepted invitations are kept once expired",
+    )
+    outbox_retention_days: int = Field(
+        default=7,
+        description="Days processed outbox events are kept",
+    )
+    orphaned_file_grace_hours: int = Field(
+        default=24,
+        description=(
+            "Hours before a stored attachment file without attachment is purged "
+            "(files are saved before their attachment commits)"
+        ),
+    )
+
 
 @lru_cache
 def get_settings() -> Settings:
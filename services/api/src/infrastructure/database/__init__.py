@@ -2,20 +2,35 @@
 
 from src.infrastructure.database.config import (
     Base,
+    after_commit,
     close_db,
     get_engine,
+    get_read_session,
+    get_read_session_factory,
+    get_replica_router,
     get_session,
     get_session_context,
     get_session_factory,
     init_db,
+    instrument_engine,
+    run_after_commit,
 )
+from src.infrastructure.database.replicas import ReplicaRouter, set_session_user
 
 __all__ = [
     "Base",
+    "after_commit",
     "get_engine",
+    "get_read_session",
+    "get_read_session_factory",
+    "get_replica_router",
     "get_session",
     "get_session_context",
     "get_session_factory",
     "init_db",
+    "instrument_engine",
+    "run_after_commit",
     "close_db",
+    "ReplicaRouter",
+    "set_session_user",
 ]
@@ -1,8 +1,15 @@
 """Database configuration and session management."""
 
-from collections.abc import AsyncGenerator
+import inspect
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
 
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,6 +19,17 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from src.infrastructure.config import get_settings
+from src.infrastructure.database.replicas import (
+    ROUTER_INFO_KEY,
+    ReplicaRouter,
+    ReplicaRoutingSession,
+    WriteTrackingSession,
+    get_session_user,
+    session_wrote,
+)
+from src.infrastructure.monitoring import get_metrics_registry, record_statement
+
+logger = structlog.get_logger()
 
 
 class Base(DeclarativeBase):
@@ -23,6 +41,150 @@ class Base(DeclarativeBase):
 # Global engine and session factory (initialized lazily)
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_router: ReplicaRouter | None = None
+_replicas_configured = False
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+_slow_queries = get_metrics_registry().counter(
+    "db_slow_queries_total",
+    "Statements slower than the slow query threshold",
+)
+
+
+@dataclass(frozen=True)
+class QueryLogConfig:
+    """Slow query logging configuration of the instrumented engines."""
+
+    slow_query_threshold: float = 0.5  # seconds
+    explain_slow_queries: bool = False
+    max_logged_parameters_length: int = 1000
+
+
+_query_log_config = QueryLogConfig()
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    """Remember when the statement was sent to the database."""
+    conn.info["query_started_at"] = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    """Count the statement on the current request and log it if slow."""
+    started_at = conn.info.pop("query_started_at", None)
+    if started_at is None:
+        return
+
+    duration = time.perf_counter() - started_at
+    record_statement(statement, duration)
+
+    if duration >= _query_log_config.slow_query_threshold:
+        _log_slow_query(conn, statement, parameters, duration, executemany)
+
+
+def _log_slow_query(
+    conn: Connection,
+    statement: str,
+    parameters: Any,
+    duration: float,
+    executemany: bool,
+) -> None:
+    """Log a slow statement with its parameters (and plan, if enabled)."""
+    _slow_queries.inc()
+
+    plan = None
+    if (
+        _query_log_config.explain_slow_queries
+        and not executemany
+        and statement.lstrip()[:6].upper() == "SELECT"
+    ):
+        plan = _explain_analyze(conn, statement, parameters)
+
+    logger.warning(
+        "Slow query",
+        duration_ms=round(duration * 1000, 2),
+        statement=statement,
+        parameters=repr(parameters)[: _query_log_config.max_logged_parameters_length],
+        plan=plan,
+    )
+
+
+def _explain_analyze(conn: Connection, statement: str, parameters: Any) -> list[str] | None:
+    """Run EXPLAIN ANALYZE for a statement that just executed.
+
+    Runs inside a savepoint that is always rolled back, so a failing EXPLAIN
+    cannot abort the caller's transaction. Only used for SELECT statements.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT explain_slow_query")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            return [str(row[0]) for row in cursor.fetchall()]
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT explain_slow_query")
+    except Exception as e:
+        logger.debug("EXPLAIN of slow query failed", error=str(e))
+        return None
+    finally:
+        cursor.close()
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    slow_query_threshold_ms: int | None = None,
+    explain_slow_queries: bool | None = None,
+) -> AsyncEngine:
+    """Attach the query instrumentation hooks to an engine.
+
+    Every statement executed through the engine is counted (with its
+    duration) on the current request, see `record_statement`, and statements
+    slower than the threshold are logged with their parameters.
+
+    Args:
+        engine: Async engine to instrument
+        slow_query_threshold_ms: Log statements slower than this (defaults to settings)
+        explain_slow_queries: Log the EXPLAIN ANALYZE plan of slow SELECTs
+            (defaults to settings)
+
+    Returns:
+        The same engine, for chaining
+    """
+    global _query_log_config
+
+    settings = get_settings()
+    _query_log_config = QueryLogConfig(
+        slow_query_threshold=(
+            slow_query_threshold_ms
+            if slow_query_threshold_ms is not None
+            else settings.slow_query_threshold_ms
+        )
+        / 1000,
+        explain_slow_queries=(
+            explain_slow_queries
+            if explain_slow_queries is not None
+            else settings.slow_query_explain
+        ),
+    )
+
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
 
 
 def get_engine() -> AsyncEngine:
@@ -30,18 +192,45 @@ def get_engine() -> AsyncEngine:
     global _engine
 
     if _engine is None:
-        settings = get_settings()
-        _engine = create_async_engine(
-            str(settings.database_url),
-            echo=settings.debug,
-            pool_size=settings.database_pool_size,
-            max_overflow=settings.database_max_overflow,
-            pool_pre_ping=True,
-        )
+        _engine = _create_engine(str(get_settings().database_url))
 
     return _engine
 
 
+def _create_engine(url: str) -> AsyncEngine:
+    settings = get_settings()
+    engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=True,
+    )
+    return instrument_engine(engine)
+
+
+def get_replica_router() -> ReplicaRouter | None:
+    """Get or create the router of the read replicas.
+
+    Returns:
+        Replica router, or None when no replica is configured
+    """
+    global _replica_router, _replicas_configured
+
+    if not _replicas_configured:
+        settings = get_settings()
+        if settings.database_replica_urls:
+            _replica_router = ReplicaRouter(
+                [_create_engine(str(url)) for url in settings.database_replica_urls],
+                max_lag_seconds=settings.database_replica_max_lag_seconds,
+                check_interval_seconds=settings.database_replica_check_interval_seconds,
+                read_your_writes_seconds=settings.database_read_your_writes_seconds,
+            )
+        _replicas_configured = True
+
+    return _replica_router
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the async session factory."""
     global _session_factory
@@ -50,6 +239,7 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
         _session_factory = async_sessionmaker(
             bind=get_engine(),
             class_=AsyncSession,
+            sync_session_class=WriteTrackingSession,
             expire_on_commit=False,
             autocommit=False,
             autoflush=False,
@@ -58,6 +248,61 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get or create the factory of read-only sessions.
+
+    Its sessions read from a replica (see `ReplicaRouter`) and fall back to
+    the primary; without replicas this is the primary session factory.
+    """
+    global _read_session_factory
+
+    router = get_replica_router()
+    if router is None:
+        return get_session_factory()
+
+    if _read_session_factory is None:
+        _read_session_factory = async_sessionmaker(
+            bind=get_engine(),
+            class_=AsyncSession,
+            sync_session_class=ReplicaRoutingSession,
+            info={ROUTER_INFO_KEY: router},
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+
+    return _read_session_factory
+
+
+# session.info key of the callbacks waiting for the commit
+_AFTER_COMMIT_INFO_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None] | None]) -> None:
+    """Run a callback once the transaction of a session has committed.
+
+    For cache invalidations: run before the commit, a read in between would
+    cache the old rows again. Callbacks are dropped when the session rolls back.
+
+    Args:
+        session: Session whose commit the callback waits for
+        callback: Invalidation to run (sync or async)
+    """
+    session.info.setdefault(_AFTER_COMMIT_INFO_KEY, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """Run the callbacks registered with `after_commit` (once the session committed)."""
+    for callback in session.info.pop(_AFTER_COMMIT_INFO_KEY, []):
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
+def _discard_after_commit(session: AsyncSession) -> None:
+    session.info.pop(_AFTER_COMMIT_INFO_KEY, None)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions.
 
@@ -67,6 +312,35 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             ...
     """
     session_factory = get_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            _discard_after_commit(session)
+            await session.rollback()
+            raise
+        await run_after_commit(session)
+
+        # Read-your-writes: the user's next reads skip the replicas for a while
+        router = get_replica_router()
+        user_id = get_session_user()
+        if router is not None and user_id is not None and session_wrote(session.sync_session):
+            router.record_write(user_id)
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting read-only database sessions.
+
+    For the use cases that only read (lists, reports, search, trees): their
+    queries run on a read replica when one is healthy and caught up, and on
+    the primary otherwise or when the user has just written.
+    """
+    router = get_replica_router()
+    if router is not None:
+        await router.refresh_if_stale()
+
+    session_factory = get_read_session_factory()
     async with session_factory() as session:
         try:
             yield session
@@ -90,8 +364,10 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
             yield session
             await session.commit()
         except Exception:
+            _discard_after_commit(session)
             await session.rollback()
             raise
+        await run_after_commit(session)
 
 
 async def init_db() -> None:
@@ -106,7 +382,14 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _replica_router, _replicas_configured
+    global _read_session_factory
+
+    if _replica_router is not None:
+        await _replica_router.dispose()
+    _replica_router = None
+    _replicas_configured = False
+    _read_session_factory = None
 
     if _engine is not None:
         await _engine.dispose()
@@ -21,28 +21,37 @@ from src.infrastructure.database.models.invitation import InvitationModel
 from src.infrastructure.database.models.issue import IssueModel
 from src.infrastructure.database.models.issue_activity import IssueActivityModel
 from src.infrastructure.database.models.issue_link import IssueLinkModel
+from src.infrastructure.database.models.issue_rollup import IssueRollupModel
 from src.infrastructure.database.models.label import IssueLabelModel, LabelModel
 from src.infrastructure.database.models.macro import MacroModel
+from src.infrastructure.database.models.maintenance import MaintenanceJobModel
 from src.infrastructure.database.models.notification import NotificationModel
 from src.infrastructure.database.models.organization import (
     OrganizationMemberModel,
     OrganizationModel,
 )
+from src.infrastructure.database.models.outbox import OutboxEventModel
 from src.infrastructure.database.models.page import PageModel, SpaceModel
 from src.infrastructure.database.models.page_permission import (
     PagePermissionModel,
+    SpaceAccessVersionModel,
     SpacePermissionModel,
 )
 from src.infrastructure.database.models.page_version import PageVersionModel
 from src.infrastructure.database.models.presence import PresenceModel
 from src.infrastructure.database.models.project import (
+    ProjectIssueCounterModel,
     ProjectMemberModel,
     ProjectModel,
 )
 from src.infrastructure.database.models.saved_filter import SavedFilterModel
-from src.infrastructure.database.models.sprint import SprintIssueModel, SprintModel
+from src.infrastructure.database.models.sprint import (
+    SprintIssueModel,
+    SprintModel,
+    SprintSnapshotModel,
+)
 from src.infrastructure.database.models.template import TemplateModel
-from src.infrastructure.database.models.time_entry import TimeEntryModel
+from src.infrastructure.database.models.time_entry import TimeEntryModel, TimeEntryRollupModel
 from src.infrastructure.database.models.user import UserModel
 from src.infrastructure.database.models.whiteboard import WhiteboardModel
 from src.infrastructure.database.models.workflow import (
@@ -58,6 +67,7 @@ __all__ = [
     "InvitationModel",
     "ProjectModel",
     "ProjectMemberModel",
+    "ProjectIssueCounterModel",
     "IssueModel",
     "IssueActivityModel",
     "CommentModel",
@@ -66,6 +76,7 @@ __all__ = [
     "PageVersionModel",
     "PagePermissionModel",
     "SpacePermissionModel",
+    "SpaceAccessVersionModel",
     "PresenceModel",
     "MacroModel",
     "TemplateModel",
@@ -74,6 +85,7 @@ __all__ = [
     "NotificationModel",
     "SprintModel",
     "SprintIssueModel",
+    "SprintSnapshotModel",
     "WorkflowModel",
     "WorkflowStatusModel",
     "WorkflowTransitionModel",
@@ -81,8 +93,10 @@ __all__ = [
     "CustomFieldValueModel",
     "IssueLabelModel",
     "IssueLinkModel",
+    "IssueRollupModel",
     "LabelModel",
     "TimeEntryModel",
+    "TimeEntryRollupModel",
     "DashboardModel",
     "DashboardWidgetModel",
     "SavedFilterModel",
@@ -91,4 +105,6 @@ __all__ = [
     "BoardModel",
     "BoardListModel",
     "GroupBoardProjectModel",
+    "OutboxEventModel",
+    "MaintenanceJobModel",
 ]
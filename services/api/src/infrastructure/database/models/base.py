@@ -1,11 +1,17 @@
 """Base model with common fields."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import ColumnElement, DateTime, func, text
+from sqlalchemy.dialects.postgresql import TSQUERY, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column
+
+# Text search configuration of search documents: no stemming, so words of any
+# language are matched as written
+SEARCH_CONFIG = text("'simple'::regconfig")
 
 
 class TimestampMixin:
@@ -42,3 +48,24 @@ class UUIDPrimaryKeyMixin:
         primary_key=True,
         default=uuid4,
     )
+
+
+def search_document(
+    title: InstrumentedAttribute[str], body: InstrumentedAttribute[str | None]
+) -> ColumnElement[Any]:
+    """Full-text search document of a row, title words ranking above body words.
+
+    Literals are inlined rather than bound so that queries repeat the
+    expression of the GIN index exactly, which the planner needs to use it.
+    """
+
+    def weighted(column: InstrumentedAttribute[Any], weight: str) -> ColumnElement[Any]:
+        vector = func.to_tsvector(SEARCH_CONFIG, func.coalesce(column, text("''")))
+        return func.setweight(vector, text(f"'{weight}'"), type_=TSVECTOR)
+
+    return weighted(title, "A").op("||", return_type=TSVECTOR)(weighted(body, "B"))
+
+
+def search_query(query: str) -> ColumnElement[Any]:
+    """Full-text query of a search term (web search syntax: quotes, `or`, `-`)."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, query, type_=TSQUERY)
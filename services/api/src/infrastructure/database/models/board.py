@@ -108,7 +108,7 @@ class BoardListModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     list_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-    )  # 'label', 'assignee', 'milestone'
+    )  # 'label', 'assignee', 'milestone', 'status'
     list_config: Mapped[dict[str, Any] | None] = mapped_column(
         JSON,
         nullable=True,
@@ -1,9 +1,11 @@
 """Custom field database models."""
 
+from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import JSON, Boolean, ForeignKey, String
+from sqlalchemy import JSON, Boolean, Computed, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -52,11 +54,13 @@ class CustomFieldModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         "ProjectModel",
         back_populates="custom_fields",
     )
+    # Values span every issue of the project: never loaded through the field
     values = relationship(
         "CustomFieldValueModel",
         back_populates="custom_field",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -64,9 +68,27 @@ class CustomFieldModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
 
 class CustomFieldValueModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
-    """Custom field value database model."""
+    """Custom field value database model.
+
+    `value` holds the JSON value; `number_value` and `text_value` are typed
+    projections of scalar values, generated by the database, so issues can be
+    filtered and sorted by a field through an index. Dates are ISO strings,
+    whose text order is chronological.
+    """
 
     __tablename__ = "custom_field_values"
+    __table_args__ = (
+        # Containment (@>): select, multi-select and user values
+        Index(
+            "ix_custom_field_values_value",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "jsonb_path_ops"},
+        ),
+        # Ranges and order of number, date and text fields
+        Index("ix_custom_field_values_field_number", "custom_field_id", "number_value"),
+        Index("ix_custom_field_values_field_text", "custom_field_id", "text_value"),
+    )
 
     custom_field_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -81,9 +103,23 @@ class CustomFieldValueModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         index=True,
     )
     value: Mapped[Any] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
     )  # Can be str, int, float, date, list, etc.
+    number_value: Mapped[Decimal | None] = mapped_column(
+        Numeric,
+        Computed(
+            "CASE WHEN jsonb_typeof(value) = 'number' THEN (value #>> '{}')::numeric END",
+            persisted=True,
+        ),
+    )
+    text_value: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            "CASE WHEN jsonb_typeof(value) = 'string' THEN value #>> '{}' END",
+            persisted=True,
+        ),
+    )
 
     # Relationships
     custom_field = relationship(
@@ -3,7 +3,7 @@
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,7 @@ from src.infrastructure.database.models.base import (
     SoftDeleteMixin,
     TimestampMixin,
     UUIDPrimaryKeyMixin,
+    search_document,
 )
 
 
@@ -22,6 +23,35 @@ class IssueModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = "issues"
+    __table_args__ = (
+        # Backlog page, count (index-only) and ordering of a project, live issues only
+        Index(
+            "ix_issues_backlog",
+            "project_id",
+            "backlog_order",
+            "created_at",
+            postgresql_include=["id"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Keyset pages of saved filters (newest first) within a project, live issues only
+        Index(
+            "ix_issues_project_created",
+            "project_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Issue key lookups (PROJ-123)
+        Index("ix_issues_project_number", "project_id", "issue_number"),
+        # Soft-deleted issues, in purge order
+        Index(
+            "ix_issues_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+        # The trigram indexes of the typeahead (issue titles, project and user
+        # names) are only created by migration: they need the pg_trgm extension
+    )
 
     project_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -175,3 +205,12 @@ class IssueModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
 
     def __repr__(self) -> str:
         return f"<Issue(id={self.id}, number={self.issue_number}, title={self.title[:30]})>"
+
+
+# Full-text search of live issues (declared here: the expression needs the columns)
+Index(
+    "ix_issues_search",
+    search_document(IssueModel.title, IssueModel.description),
+    postgresql_using="gin",
+    postgresql_where=text("deleted_at IS NULL"),
+)
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,10 @@ class IssueActivityModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
 
     __tablename__ = "issue_activities"
+    __table_args__ = (
+        # Issues a user recently worked on (typeahead boost)
+        Index("ix_issue_activities_user_created", "user_id", "created_at"),
+    )
 
     issue_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -0,0 +1,67 @@
+"""Issue rollup database model."""
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models.base import TimestampMixin
+
+
+class IssueRollupModel(Base, TimestampMixin):
+    """Aggregates of the descendants of a parent issue (epic, story).
+
+    One row per issue that has live descendants, maintained by
+    IssueHierarchyService whenever a descendant changes, so reading the
+    progress of an epic is a primary key lookup. The issue itself is not
+    counted.
+    """
+
+    __tablename__ = "issue_rollups"
+
+    issue_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("issues.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    child_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )  # Direct children
+    descendant_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    status_counts: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )  # Descendants by status
+    story_points_total: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    story_points_done: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    hours_logged: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2),
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<IssueRollup(issue_id={self.issue_id}, descendants={self.descendant_count}, "
+            f"points={self.story_points_done}/{self.story_points_total})>"
+        )
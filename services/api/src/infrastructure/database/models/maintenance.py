@@ -0,0 +1,63 @@
+"""Maintenance job database model."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.config import Base
+
+
+class MaintenanceJobModel(Base):
+    """Schedule, progress and last outcome of a maintenance job.
+
+    MaintenanceScheduler claims a due job by pushing `next_run_at` forward,
+    so one process runs it per interval however many schedulers there are.
+    The cursor of a job walking a listing (storage files) is saved with every
+    batch: an interrupted run resumes where it stopped.
+    """
+
+    __tablename__ = "maintenance_jobs"
+
+    name: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+    )
+    next_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    cursor: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    last_started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    last_finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Rows (or files) purged by the last run, and by all runs
+    last_purged: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    total_purged: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MaintenanceJob(name={self.name}, next_run_at={self.next_run_at}, "
+            f"last_purged={self.last_purged})>"
+        )
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +20,8 @@ class NotificationModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     """
 
     __tablename__ = "notifications"
+    # Old notifications, in purge order
+    __table_args__ = (Index("ix_notifications_created_at", "created_at"),)
 
     user_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -0,0 +1,83 @@
+"""Outbox event database model."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.config import Base
+from src.infrastructure.database.models.base import UUIDPrimaryKeyMixin
+
+
+class OutboxEventModel(Base, UUIDPrimaryKeyMixin):
+    """Domain event waiting to be delivered to its handlers.
+
+    Inserted in the transaction of the change that raised the event, so an
+    event exists if and only if its change committed. OutboxDispatcher claims
+    pending events in batches and marks them processed once every handler has
+    run; the handlers that already ran are kept, so a retry only runs the
+    ones that failed.
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Pending events, in delivery order
+        Index(
+            "ix_outbox_events_pending",
+            "available_at",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+        # Processed events, in purge order
+        Index(
+            "ix_outbox_events_processed",
+            "processed_at",
+            postgresql_where=text("processed_at IS NOT NULL"),
+        ),
+    )
+
+    event_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Not delivered before (pushed back after a failed attempt)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    # Names of the handlers that already ran
+    completed_handlers: Mapped[list[str]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<OutboxEvent(id={self.id}, type={self.event_type}, "
+            f"attempts={self.attempts}, processed_at={self.processed_at})>"
+        )
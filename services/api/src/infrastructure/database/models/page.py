@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,7 @@ from src.infrastructure.database.models.base import (
     SoftDeleteMixin,
     TimestampMixin,
     UUIDPrimaryKeyMixin,
+    search_document,
 )
 
 
@@ -119,6 +120,14 @@ class PageModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = "pages"
+    __table_args__ = (
+        # Soft-deleted pages, in purge order
+        Index(
+            "ix_pages_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     space_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -213,3 +222,12 @@ class PageModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
 
     def __repr__(self) -> str:
         return f"<Page(id={self.id}, title={self.title[:30]}, space={self.space_id})>"
+
+
+# Full-text search of live pages (declared here: the expression needs the columns)
+Index(
+    "ix_pages_search",
+    search_document(PageModel.title, PageModel.content),
+    postgresql_using="gin",
+    postgresql_where=text("deleted_at IS NULL"),
+)
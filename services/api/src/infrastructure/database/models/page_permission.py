@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import Boolean, ForeignKey, String
+from sqlalchemy import Boolean, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -91,3 +91,30 @@ class SpacePermissionModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<SpacePermission(id={self.id}, space_id={self.space_id}, user_id={self.user_id}, role={self.role})>"
+
+
+class SpaceAccessVersionModel(Base):
+    """Version of the page permissions of a space.
+
+    Incremented whenever a change can alter what a user may read or edit in
+    the space (page or space grants, a page moving under another parent).
+    Resolved page permissions are cached under this version, so every worker
+    process stops reading them as soon as the change is committed. Kept out
+    of the spaces table so bumps do not rewrite space rows.
+    """
+
+    __tablename__ = "space_access_versions"
+
+    space_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("spaces.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return f"<SpaceAccessVersion(space={self.space_id}, version={self.version})>"
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -168,3 +168,29 @@ class ProjectMemberModel(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<ProjectMember(project={self.project_id}, user={self.user_id}, role={self.role})>"
+
+
+class ProjectIssueCounterModel(Base):
+    """Last issue number allocated in a project.
+
+    Issue numbers are allocated by incrementing this row (UPDATE ...
+    RETURNING), which takes a row lock until the transaction ends: numbers
+    are unique without scanning the project's issues. Kept out of the
+    projects table so allocations do not rewrite project rows.
+    """
+
+    __tablename__ = "project_issue_counters"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    last_issue_number: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectIssueCounter(project={self.project_id}, last={self.last_issue_number})>"
@@ -1,9 +1,11 @@
 """Sprint database models."""
 
 from datetime import date
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import Date, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -60,10 +62,10 @@ class SprintModel(Base, UUIDPrimaryKeyMixin, TimestampMixin, SoftDeleteMixin):
         "ProjectModel",
         back_populates="sprints",
     )
+    # Not eager: sprint issues are read through SprintRepository queries
     sprint_issues = relationship(
         "SprintIssueModel",
         back_populates="sprint",
-        lazy="selectin",
         cascade="all, delete-orphan",
         order_by="SprintIssueModel.order",
     )
@@ -108,8 +110,70 @@ class SprintIssueModel(Base, TimestampMixin):
     )
     issue = relationship(
         "IssueModel",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
         return f"<SprintIssue(sprint_id={self.sprint_id}, issue_id={self.issue_id}, order={self.order})>"
+
+
+class SprintSnapshotModel(Base, TimestampMixin):
+    """Sprint snapshot recorded when a sprint is completed.
+
+    Freezes the scope and metrics of the sprint at close, before incomplete
+    issues are moved out, so reports (velocity, commitment) on completed
+    sprints do not depend on where those issues went afterwards.
+    """
+
+    __tablename__ = "sprint_snapshots"
+
+    sprint_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("sprints.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_issues: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    completed_issues: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    total_story_points: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    completed_story_points: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    incomplete_issues: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )  # Neither done nor cancelled at close
+    moved_to_sprint_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("sprints.id", ondelete="SET NULL"),
+        nullable=True,
+    )  # None when incomplete issues went to the backlog (or stayed)
+    issues: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+    )  # Issues in the sprint at close: issue_id, status, story_points
+    metrics: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )  # Sprint metrics at close (SprintMetricsResponse)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SprintSnapshot(sprint_id={self.sprint_id}, "
+            f"points={self.completed_story_points}/{self.total_story_points})>"
+        )
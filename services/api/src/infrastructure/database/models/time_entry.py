@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Date, ForeignKey, Numeric, Text
+from sqlalchemy import Date, ForeignKey, Index, Integer, Numeric, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -61,3 +61,52 @@ class TimeEntryModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
             f"<TimeEntry(id={self.id}, issue_id={self.issue_id}, "
             f"user_id={self.user_id}, hours={self.hours})>"
         )
+
+
+class TimeEntryRollupModel(Base):
+    """Hours logged by a user in a project on a day.
+
+    Maintained by TimesheetService in the transaction of every time entry
+    change, with upserts adding the hours (removed hours are added as
+    negative values), so timesheets aggregate one row per user and day
+    instead of the entries of every issue. Hours logged on deleted issues
+    are still worked hours and stay counted.
+    """
+
+    __tablename__ = "time_entry_daily_rollups"
+    __table_args__ = (
+        # Timesheets of a user across projects
+        Index("ix_time_entry_daily_rollups_user_date", "user_id", "date"),
+    )
+
+    # Primary key order serves project timesheets (project, then date range)
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    date: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    hours: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=0,
+    )
+    entry_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TimeEntryRollup(project={self.project_id}, user={self.user_id}, "
+            f"date={self.date}, hours={self.hours})>"
+        )
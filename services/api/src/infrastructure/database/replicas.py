@@ -0,0 +1,246 @@
+"""Read replica routing for the read-only sessions."""
+
+import asyncio
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = structlog.get_logger()
+
+# Seconds the replica is behind the primary (0 when it has replayed all it received)
+_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """)
+
+# session.info keys
+ROUTER_INFO_KEY = "replica_router"
+_WROTE_INFO_KEY = "wrote"
+_BIND_INFO_KEY = "replica_bind"
+
+# User of the current request, set once authenticated
+_session_user: ContextVar[UUID | None] = ContextVar("session_user", default=None)
+
+
+def set_session_user(user_id: UUID) -> None:
+    """Record the user of the current request (for read-your-writes)."""
+    _session_user.set(user_id)
+
+
+def get_session_user() -> UUID | None:
+    """User of the current request, if authenticated."""
+    return _session_user.get()
+
+
+@dataclass
+class ReplicaState:
+    """Last known health of a replica."""
+
+    engine: AsyncEngine
+    healthy: bool = False
+    lag_seconds: float | None = None
+
+
+class ReplicaRouter:
+    """Chooses the engine the read-only sessions run on.
+
+    Replicas are checked at most every `check_interval_seconds` (on the next
+    read after the interval, no background task): a replica is used while it
+    answers and is less than `max_lag_seconds` behind the primary. A user who
+    wrote in the last `read_your_writes_seconds` reads the primary, so they see
+    their own changes. Writes are remembered per process.
+    """
+
+    def __init__(
+        self,
+        replicas: list[AsyncEngine],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 10.0,
+        read_your_writes_seconds: float = 10.0,
+        check_timeout_seconds: float = 2.0,
+    ) -> None:
+        """Initialize router.
+
+        Args:
+            replicas: Engines of the read replicas
+            max_lag_seconds: Replicas further behind are not read from
+            check_interval_seconds: Minimum time between two health checks
+            read_your_writes_seconds: How long a user reads the primary after a write
+            check_timeout_seconds: A replica slower to answer the check is unhealthy
+        """
+        self._replicas = [ReplicaState(engine) for engine in replicas]
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._check_timeout_seconds = check_timeout_seconds
+        self._checked_at: float | None = None
+        self._check_lock = asyncio.Lock()
+        self._round_robin = itertools.count()
+        self._last_writes: dict[UUID, float] = {}
+
+    @property
+    def replicas(self) -> list[ReplicaState]:
+        """Replicas with their last known health."""
+        return self._replicas
+
+    def choose(self, user_id: UUID | None = None) -> AsyncEngine | None:
+        """Replica to read from, or None to read the primary.
+
+        Args:
+            user_id: User the read is for (None when anonymous)
+
+        Returns:
+            Engine of a healthy, caught-up replica (in turn), else None
+        """
+        if user_id is not None and self._wrote_recently(user_id):
+            return None
+
+        candidates = [
+            replica
+            for replica in self._replicas
+            if replica.healthy
+            and replica.lag_seconds is not None
+            and replica.lag_seconds <= self._max_lag_seconds
+        ]
+        if not candidates:
+            return None
+        return candidates[next(self._round_robin) % len(candidates)].engine
+
+    def record_write(self, user_id: UUID) -> None:
+        """Remember that a user just wrote (their next reads go to the primary)."""
+        self._last_writes[user_id] = time.monotonic()
+
+    async def refresh_if_stale(self) -> None:
+        """Check the replicas when the last check is older than the interval.
+
+        Concurrent callers do not wait for a check already running, they keep
+        the previous health until it completes.
+        """
+        if self._checked_at is not None and (
+            time.monotonic() - self._checked_at < self._check_interval_seconds
+        ):
+            return
+        if self._check_lock.locked():
+            return
+        async with self._check_lock:
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Check the health and lag of every replica."""
+        lags = await asyncio.gather(
+            *(self._check(replica) for replica in self._replicas), return_exceptions=True
+        )
+        for replica, lag in zip(self._replicas, lags, strict=True):
+            if isinstance(lag, BaseException):
+                if replica.healthy or replica.lag_seconds is None:
+                    logger.warning(
+                        "Read replica unavailable",
+                        replica=replica.engine.url.render_as_string(),
+                        error=str(lag) or type(lag).__name__,
+                    )
+                replica.healthy, replica.lag_seconds = False, None
+            else:
+                replica.healthy, replica.lag_seconds = True, lag
+                if lag > self._max_lag_seconds:
+                    logger.warning(
+                        "Read replica lagging",
+                        replica=replica.engine.url.render_as_string(),
+                        lag_seconds=round(lag, 2),
+                    )
+
+        self._checked_at = time.monotonic()
+        self._forget_old_writes()
+
+    async def dispose(self) -> None:
+        """Close the connections of the replicas."""
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    async def _check(self, replica: ReplicaState) -> float:
+        """Seconds a replica is behind the primary."""
+        return await asyncio.wait_for(
+            self._measure_lag(replica.engine), timeout=self._check_timeout_seconds
+        )
+
+    @staticmethod
+    async def _measure_lag(engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            lag = await conn.scalar(_LAG_QUERY)
+        return float(lag or 0)
+
+    def _wrote_recently(self, user_id: UUID) -> bool:
+        written_at = self._last_writes.get(user_id)
+        return (
+            written_at is not None
+            and time.monotonic() - written_at < self._read_your_writes_seconds
+        )
+
+    def _forget_old_writes(self) -> None:
+        expired_before = time.monotonic() - self._read_your_writes_seconds
+        for user_id, written_at in list(self._last_writes.items()):
+            if written_at < expired_before:
+                del self._last_writes[user_id]
+
+
+class ReplicaRoutingSession(Session):
+    """Session reading from the replica its router chooses.
+
+    The replica is chosen on the first statement and kept for the session, so
+    its reads share one snapshot. Flushes and INSERT/UPDATE/DELETE statements
+    go to the primary (the session bind), as do all the reads following them.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        clause: Any = None,
+        **kw: Any,
+    ) -> Engine | Connection:
+        """Engine of a statement: the chosen replica for reads, else the primary."""
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_WROTE_INFO_KEY] = True
+        if self.info.get(_WROTE_INFO_KEY):
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if _BIND_INFO_KEY not in self.info:
+            router: ReplicaRouter | None = self.info.get(ROUTER_INFO_KEY)
+            replica = router.choose(get_session_user()) if router is not None else None
+            self.info[_BIND_INFO_KEY] = replica.sync_engine if replica is not None else None
+
+        replica_bind: Engine | None = self.info[_BIND_INFO_KEY]
+        if replica_bind is None:
+            return super().get_bind(mapper, clause=clause, **kw)
+        return replica_bind
+
+
+class WriteTrackingSession(Session):
+    """Session remembering whether it wrote (see `session_wrote`)."""
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _after_flush(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE_INFO_KEY] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE_INFO_KEY] = True
+
+
+def session_wrote(session: Session) -> bool:
+    """Whether a session flushed or executed an INSERT/UPDATE/DELETE."""
+    return bool(session.info.get(_WROTE_INFO_KEY))
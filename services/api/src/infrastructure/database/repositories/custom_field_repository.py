@@ -148,6 +148,20 @@ class SQLAlchemyCustomFieldValueRepository(CustomFieldValueRepository):
 
         return [self._to_entity(model) for model in models]
 
+    async def get_by_issue_ids(self, issue_ids: list[UUID]) -> dict[UUID, list[CustomFieldValue]]:
+        """Get the custom field values of many issues in one query."""
+        if not issue_ids:
+            return {}
+
+        result = await self._session.execute(
+            select(CustomFieldValueModel).where(CustomFieldValueModel.issue_id.in_(issue_ids))
+        )
+
+        values: dict[UUID, list[CustomFieldValue]] = {}
+        for model in result.scalars().all():
+            values.setdefault(model.issue_id, []).append(self._to_entity(model))
+        return values
+
     async def get_by_custom_field_id(self, custom_field_id: UUID) -> list[CustomFieldValue]:
         """Get all values for a custom field."""
         result = await self._session.execute(
@@ -1,11 +1,16 @@
 """SQLAlchemy implementation of IssueActivityRepository."""
 
+from collections.abc import Sequence
+from dataclasses import asdict
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.repositories.issue_activity_repository import IssueActivityRepository
+from src.domain.repositories.issue_activity_repository import (
+    IssueActivityEntry,
+    IssueActivityRepository,
+)
 from src.infrastructure.database.models import IssueActivityModel
 
 
@@ -58,6 +63,65 @@ class SQLAlchemyIssueActivityRepository(IssueActivityRepository):
         await self._session.refresh(activity)
         return activity
 
+    async def create_many(
+        self,
+        issue_ids: list[UUID],
+        user_id: UUID | None,
+        action: str,
+        field_name: str | None = None,
+        old_value: str | None = None,
+        new_value: str | None = None,
+    ) -> int:
+        """Create the same activity log entry for several issues in one statement.
+
+        Args:
+            issue_ids: Issue UUIDs
+            user_id: User UUID who performed the action
+            action: Action type
+            field_name: Optional field name that was changed
+            old_value: Optional old value
+            new_value: Optional new value
+
+        Returns:
+            Number of entries created
+        """
+        if not issue_ids:
+            return 0
+
+        await self._session.execute(
+            insert(IssueActivityModel),
+            [
+                {
+                    "issue_id": issue_id,
+                    "user_id": user_id,
+                    "action": action,
+                    "field_name": field_name,
+                    "old_value": old_value,
+                    "new_value": new_value,
+                }
+                for issue_id in issue_ids
+            ],
+        )
+        return len(issue_ids)
+
+    async def create_batch(self, entries: Sequence[IssueActivityEntry]) -> int:
+        """Create activity log entries in one multi-row statement.
+
+        Args:
+            entries: Entries to write, in order
+
+        Returns:
+            Number of entries created
+        """
+        if not entries:
+            return 0
+
+        # One INSERT ... VALUES (...), (...) rather than an executemany
+        await self._session.execute(
+            insert(IssueActivityModel).values([asdict(entry) for entry in entries])
+        )
+        return len(entries)
+
     async def get_by_issue_id(
         self,
         issue_id: UUID,
@@ -1,20 +1,28 @@
 """SQLAlchemy implementation of IssueRepository."""
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, text
+from sqlalchemy import ColumnElement, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.domain.entities import Issue
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import IssueRepository
 from src.infrastructure.database.models import (
+    CustomFieldValueModel,
     IssueLabelModel,
     IssueModel,
+    ProjectIssueCounterModel,
     ProjectModel,
     SprintIssueModel,
 )
 
+# Bound on hierarchy walks, guarding against parent cycles
+MAX_HIERARCHY_DEPTH = 32
+
 
 class SQLAlchemyIssueRepository(IssueRepository):
     """SQLAlchemy implementation of IssueRepository.
@@ -33,7 +41,8 @@ class SQLAlchemyIssueRepository(IssueRepository):
     async def get_next_issue_number(self, project_id: UUID) -> int:
         """Get the next issue number for a project.
 
-        This uses an advisory lock to ensure atomicity and prevent duplicates.
+        Numbers come from the project's counter row (see
+        `reserve_issue_numbers`), so allocation does not scan issues.
 
         Args:
             project_id: Project UUID
@@ -41,23 +50,53 @@ class SQLAlchemyIssueRepository(IssueRepository):
         Returns:
             Next issue number (starting from 1)
         """
-        # Use PostgreSQL advisory lock to ensure atomicity
-        # Convert project_id to int for advisory lock (using hash)
-        lock_id = hash(str(project_id)) % (2**31)  # PostgreSQL advisory lock range
+        numbers = await self.reserve_issue_numbers(project_id, 1)
+        return numbers[0]
+
+    async def reserve_issue_numbers(self, project_id: UUID, count: int) -> range:
+        """Reserve a block of consecutive issue numbers for a project.
+
+        The counter row is incremented with UPDATE ... RETURNING: its row lock
+        serializes concurrent allocations of a project (across processes)
+        until the transaction ends, and a rollback releases the numbers.
+
+        Args:
+            project_id: Project UUID
+            count: Number of issue numbers to reserve
 
-        # Acquire advisory lock (transaction-level, automatically released on commit/rollback)
-        await self._session.execute(text(f"SELECT pg_advisory_xact_lock({lock_id})"))
+        Returns:
+            Reserved issue numbers
+        """
+        if count < 1:
+            raise ValueError("count must be positive")
 
-        # Get the maximum issue number for this project
+        counter = ProjectIssueCounterModel
         result = await self._session.execute(
-            select(func.coalesce(func.max(IssueModel.issue_number), 0))
-            .select_from(IssueModel)
-            .where(IssueModel.project_id == project_id)
+            update(counter)
+            .where(counter.project_id == project_id)
+            .values(last_issue_number=counter.last_issue_number + count)
+            .returning(counter.last_issue_number)
         )
-        max_number: int = result.scalar_one() or 0
+        last = result.scalar_one_or_none()
+
+        if last is None:
+            # First allocation of the project: start after its existing issues
+            # (projects seeded outside the application have issues but no counter)
+            start = (
+                select(func.coalesce(func.max(IssueModel.issue_number), 0) + count)
+                .where(IssueModel.project_id == project_id)
+                .scalar_subquery()
+            )
+            insert_counter = insert(counter).values(project_id=project_id, last_issue_number=start)
+            result = await self._session.execute(
+                insert_counter.on_conflict_do_update(
+                    index_elements=[counter.project_id],
+                    set_={"last_issue_number": counter.last_issue_number + count},
+                ).returning(counter.last_issue_number)
+            )
+            last = result.scalar_one()
 
-        # Return next number (max + 1)
-        return max_number + 1
+        return range(last - count + 1, last + 1)
 
     async def create(self, issue: Issue) -> Issue:
         """Create a new issue in the database.
@@ -116,21 +155,30 @@ class SQLAlchemyIssueRepository(IssueRepository):
 
         return self._to_entity(model)
 
-    async def get_by_key(self, project_key: str, issue_number: int) -> Issue | None:
-        """Get issue by project key and issue number.
+    async def get_by_key(
+        self, organization_id: UUID, project_key: str, issue_number: int
+    ) -> Issue | None:
+        """Get issue by project key and issue number within an organization.
 
         Args:
+            organization_id: Organization UUID (project keys are unique per organization)
             project_key: Project key (e.g., "PROJ")
             issue_number: Issue number (e.g., 123)
 
         Returns:
             Issue if found, None otherwise
         """
-        # Join with ProjectModel to get project by key
+        # uq_project_key finds the project, ix_issues_project_number the issue
         result = await self._session.execute(
             select(IssueModel)
             .join(ProjectModel, IssueModel.project_id == ProjectModel.id)
-            .where(ProjectModel.key == project_key, IssueModel.issue_number == issue_number)
+            .where(
+                ProjectModel.organization_id == organization_id,
+                ProjectModel.key == project_key.upper(),
+                ProjectModel.deleted_at.is_(None),
+                IssueModel.issue_number == issue_number,
+                IssueModel.deleted_at.is_(None),
+            )
         )
         model = result.scalar_one_or_none()
 
@@ -207,6 +255,9 @@ class SQLAlchemyIssueRepository(IssueRepository):
         sprint_id: UUID | None = None,
         label_ids: list[UUID] | None = None,
         parent_issue_id: UUID | None = None,
+        custom_field_values: dict[UUID, Any] | None = None,
+        sort_custom_field_id: UUID | None = None,
+        sort_descending: bool = False,
     ) -> list[Issue]:
         """Get all issues in a project with filters and pagination."""
         query = select(IssueModel).where(IssueModel.project_id == project_id)
@@ -245,6 +296,23 @@ class SQLAlchemyIssueRepository(IssueRepository):
         if parent_issue_id:
             query = query.where(IssueModel.parent_issue_id == parent_issue_id)
 
+        if custom_field_values:
+            query = query.where(*_custom_field_conditions(custom_field_values))
+
+        if sort_custom_field_id:
+            # Typed projections: numbers by value, dates (ISO) and text by text
+            sort_value = aliased(CustomFieldValueModel)
+            query = query.outerjoin(
+                sort_value,
+                (sort_value.issue_id == IssueModel.id)
+                & (sort_value.custom_field_id == sort_custom_field_id),
+            ).order_by(
+                *(
+                    (column.desc() if sort_descending else column.asc()).nulls_last()
+                    for column in (sort_value.number_value, sort_value.text_value)
+                )
+            )
+
         query = query.offset(skip).limit(limit).order_by(IssueModel.created_at.desc())
 
         result = await self._session.execute(query)
@@ -264,6 +332,7 @@ class SQLAlchemyIssueRepository(IssueRepository):
         sprint_id: UUID | None = None,
         label_ids: list[UUID] | None = None,
         parent_issue_id: UUID | None = None,
+        custom_field_values: dict[UUID, Any] | None = None,
     ) -> int:
         """Count total issues in a project with filters."""
         query = (
@@ -304,6 +373,9 @@ class SQLAlchemyIssueRepository(IssueRepository):
         if parent_issue_id:
             query = query.where(IssueModel.parent_issue_id == parent_issue_id)
 
+        if custom_field_values:
+            query = query.where(*_custom_field_conditions(custom_field_values))
+
         result = await self._session.execute(query)
         count: int = result.scalar_one()
         return count
@@ -344,6 +416,51 @@ class SQLAlchemyIssueRepository(IssueRepository):
 
         return [self._to_entity(model) for model in models]
 
+    async def get_children(self, parent_issue_id: UUID) -> list[Issue]:
+        """Get the direct children of an issue (indexed on parent_issue_id)."""
+        result = await self._session.execute(
+            select(IssueModel)
+            .where(
+                IssueModel.parent_issue_id == parent_issue_id,
+                IssueModel.deleted_at.is_(None),
+            )
+            .order_by(IssueModel.issue_number)
+        )
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def get_descendant_ids(self, issue_id: UUID) -> list[UUID]:
+        """Get the IDs of all live descendants of an issue (recursive CTE)."""
+        descendants = (
+            select(IssueModel.id, literal(1).label("depth"))
+            .where(IssueModel.parent_issue_id == issue_id, IssueModel.deleted_at.is_(None))
+            .cte("descendants", recursive=True)
+        )
+        descendants = descendants.union_all(
+            select(IssueModel.id, descendants.c.depth + 1)
+            .join(descendants, IssueModel.parent_issue_id == descendants.c.id)
+            .where(IssueModel.deleted_at.is_(None), descendants.c.depth < MAX_HIERARCHY_DEPTH)
+        )
+        result = await self._session.execute(select(descendants.c.id).order_by(descendants.c.depth))
+        return list(result.scalars().all())
+
+    async def get_ancestor_ids(self, issue_id: UUID) -> list[UUID]:
+        """Get the IDs of the ancestors of an issue (recursive CTE)."""
+        ancestors = (
+            select(IssueModel.parent_issue_id.label("id"), literal(1).label("depth"))
+            .where(IssueModel.id == issue_id, IssueModel.parent_issue_id.is_not(None))
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union_all(
+            select(IssueModel.parent_issue_id, ancestors.c.depth + 1)
+            .join(ancestors, IssueModel.id == ancestors.c.id)
+            .where(
+                IssueModel.parent_issue_id.is_not(None),
+                ancestors.c.depth < MAX_HIERARCHY_DEPTH,
+            )
+        )
+        result = await self._session.execute(select(ancestors.c.id).order_by(ancestors.c.depth))
+        return list(dict.fromkeys(result.scalars().all()))
+
     def _to_entity(self, model: IssueModel) -> Issue:
         """Convert SQLAlchemy model to domain entity.
 
@@ -371,3 +488,20 @@ class SQLAlchemyIssueRepository(IssueRepository):
             updated_at=model.updated_at,
             deleted_at=model.deleted_at,
         )
+
+
+def _custom_field_conditions(values: dict[UUID, Any]) -> list[ColumnElement[bool]]:
+    """Conditions selecting the issues having the given custom field values.
+
+    Each value is matched by JSONB containment (equality for scalars, membership
+    for list fields), served by the GIN index on `custom_field_values.value`.
+    """
+    return [
+        IssueModel.id.in_(
+            select(CustomFieldValueModel.issue_id).where(
+                CustomFieldValueModel.custom_field_id == custom_field_id,
+                CustomFieldValueModel.value.contains(literal(value, JSONB)),
+            )
+        )
+        for custom_field_id, value in values.items()
+    ]
@@ -1,5 +1,6 @@
 """SQLAlchemy implementation of PageRepository."""
 
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlalchemy import func, or_, select
@@ -160,6 +161,7 @@ class SQLAlchemyPageRepository(PageRepository):
         limit: int = 20,
         include_deleted: bool = False,
         parent_id: UUID | None = None,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> list[Page]:
         """Get all pages in a space with pagination.
 
@@ -169,6 +171,7 @@ class SQLAlchemyPageRepository(PageRepository):
             limit: Maximum number of records to return
             include_deleted: Whether to include soft-deleted pages
             parent_id: Optional parent page ID to filter by (None for root pages)
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             List of pages
@@ -183,6 +186,9 @@ class SQLAlchemyPageRepository(PageRepository):
         if not include_deleted:
             query = query.where(PageModel.deleted_at.is_(None))
 
+        if exclude_ids:
+            query = query.where(PageModel.id.not_in(exclude_ids))
+
         query = query.order_by(PageModel.position.asc(), PageModel.created_at.asc())
         query = query.offset(skip).limit(limit)
 
@@ -196,6 +202,7 @@ class SQLAlchemyPageRepository(PageRepository):
         space_id: UUID,
         include_deleted: bool = False,
         parent_id: UUID | None = None,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> int:
         """Count total pages in a space.
 
@@ -203,6 +210,7 @@ class SQLAlchemyPageRepository(PageRepository):
             space_id: Space UUID
             include_deleted: Whether to include soft-deleted pages
             parent_id: Optional parent page ID to filter by (None for root pages)
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             Total count of pages
@@ -217,6 +225,9 @@ class SQLAlchemyPageRepository(PageRepository):
         if not include_deleted:
             query = query.where(PageModel.deleted_at.is_(None))
 
+        if exclude_ids:
+            query = query.where(PageModel.id.not_in(exclude_ids))
+
         result = await self._session.execute(query)
         count: int = result.scalar_one()
         return count
@@ -227,6 +238,7 @@ class SQLAlchemyPageRepository(PageRepository):
         query: str,
         skip: int = 0,
         limit: int = 20,
+        exclude_ids: Collection[UUID] | None = None,
     ) -> list[Page]:
         """Search pages by title or content within a space.
 
@@ -235,6 +247,7 @@ class SQLAlchemyPageRepository(PageRepository):
             query: Search query
             skip: Number of records to skip
             limit: Maximum number of records to return
+            exclude_ids: Pages to leave out (e.g. those the user may not read)
 
         Returns:
             List of matching pages
@@ -250,6 +263,9 @@ class SQLAlchemyPageRepository(PageRepository):
             ),
         )
 
+        if exclude_ids:
+            stmt = stmt.where(PageModel.id.not_in(exclude_ids))
+
         stmt = stmt.order_by(PageModel.title).offset(skip).limit(limit)
 
         result = await self._session.execute(stmt)
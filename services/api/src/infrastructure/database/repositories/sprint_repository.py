@@ -3,7 +3,8 @@
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import Sprint
@@ -16,6 +17,9 @@ from src.infrastructure.database.models import (
     SprintModel,
 )
 
+# Statuses of the issues that stay in a sprint when it is completed
+CLOSED_ISSUE_STATUSES = ("done", "cancelled")
+
 
 class SQLAlchemySprintRepository(SprintRepository):
     """SQLAlchemy implementation of SprintRepository.
@@ -405,6 +409,83 @@ class SQLAlchemySprintRepository(SprintRepository):
 
         await self._session.flush()
 
+    async def move_incomplete_issues(
+        self,
+        sprint_id: UUID,
+        target_sprint_id: UUID | None = None,
+    ) -> list[UUID]:
+        """Move the incomplete issues of a sprint in one set-based statement.
+
+        Args:
+            sprint_id: Sprint UUID
+            target_sprint_id: Sprint to move the issues to (None for the backlog)
+
+        Returns:
+            IDs of the moved issues
+        """
+        moved = (
+            delete(SprintIssueModel)
+            .where(
+                SprintIssueModel.sprint_id == sprint_id,
+                SprintIssueModel.issue_id == IssueModel.id,
+                IssueModel.status.not_in(CLOSED_ISSUE_STATUSES),
+                IssueModel.deleted_at.is_(None),
+            )
+            .returning(SprintIssueModel.issue_id, SprintIssueModel.order)
+            .cte("moved")
+        )
+        ranked = select(
+            moved.c.issue_id,
+            (func.row_number().over(order_by=(moved.c.order, moved.c.issue_id)) - 1).label("rank"),
+        ).cte("ranked")
+
+        if target_sprint_id is not None:
+            # Append after the issues already planned in the target sprint
+            base = (
+                select(func.coalesce(func.max(SprintIssueModel.order) + 1, 0))
+                .where(SprintIssueModel.sprint_id == target_sprint_id)
+                .scalar_subquery()
+            )
+            placement = (
+                insert(SprintIssueModel)
+                .from_select(
+                    ["sprint_id", "issue_id", "order", "created_at", "updated_at"],
+                    select(
+                        literal(target_sprint_id),
+                        ranked.c.issue_id,
+                        base + ranked.c.rank,
+                        func.now(),
+                        func.now(),
+                    ),
+                )
+                .on_conflict_do_nothing()
+                .cte("placement")
+            )
+        else:
+            # Append to the end of the project backlog
+            base = (
+                select(func.coalesce(func.max(IssueModel.backlog_order) + 1, 0))
+                .where(
+                    IssueModel.project_id
+                    == select(SprintModel.project_id)
+                    .where(SprintModel.id == sprint_id)
+                    .scalar_subquery(),
+                    IssueModel.deleted_at.is_(None),
+                )
+                .scalar_subquery()
+            )
+            placement = (
+                update(IssueModel)
+                .where(IssueModel.id == ranked.c.issue_id)
+                .values(backlog_order=base + ranked.c.rank)
+                .cte("placement")
+            )
+
+        result = await self._session.execute(
+            select(moved.c.issue_id).order_by(moved.c.order).add_cte(placement)
+        )
+        return list(result.scalars().all())
+
     async def get_sprint_issues(
         self,
         sprint_id: UUID,
@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.time_entry import TimeEntry
@@ -104,6 +104,43 @@ class SQLAlchemyTimeEntryRepository(TimeEntryRepository):
         total = result.scalar_one() or Decimal("0")
         return Decimal(str(total))
 
+    async def get_hours_summary_by_issue(
+        self, issue_id: UUID
+    ) -> tuple[Decimal, dict[UUID, Decimal], dict[date, Decimal]]:
+        """Get total hours logged for an issue, with the hours by user and by date.
+
+        One aggregate query: the grouping sets return the total, a row per
+        user and a row per date.
+        """
+        result = await self._session.execute(
+            select(
+                TimeEntryModel.user_id,
+                TimeEntryModel.date,
+                func.sum(TimeEntryModel.hours).label("hours"),
+                func.grouping(TimeEntryModel.user_id).label("all_users"),
+                func.grouping(TimeEntryModel.date).label("all_dates"),
+            )
+            .where(TimeEntryModel.issue_id == issue_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(TimeEntryModel.user_id), tuple_(TimeEntryModel.date), tuple_()
+                )
+            )
+        )
+
+        total = Decimal("0")
+        hours_by_user: dict[UUID, Decimal] = {}
+        hours_by_date: dict[date, Decimal] = {}
+        for row in result:
+            if not row.all_users:
+                hours_by_user[row.user_id] = row.hours
+            elif not row.all_dates:
+                hours_by_date[row.date] = row.hours
+            elif row.hours is not None:
+                total = row.hours
+
+        return total, hours_by_user, dict(sorted(hours_by_date.items()))
+
     async def update(self, time_entry: TimeEntry) -> TimeEntry:
         """Update an existing time entry."""
         result = await self._session.execute(
@@ -0,0 +1,45 @@
+"""Monitoring infrastructure (metrics registry and request timings)."""
+
+from src.infrastructure.monitoring.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from src.infrastructure.monitoring.query_analysis import (
+    find_repeated_statements,
+    normalize_statement,
+)
+from src.infrastructure.monitoring.request_timing import (
+    PHASE_AUTH,
+    PHASE_DB,
+    PHASE_SERIALIZATION,
+    RequestTimings,
+    get_request_timings,
+    record_phase,
+    record_statement,
+    reset_request_timings,
+    start_request_timings,
+    timed_phase,
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "find_repeated_statements",
+    "normalize_statement",
+    "PHASE_AUTH",
+    "PHASE_DB",
+    "PHASE_SERIALIZATION",
+    "RequestTimings",
+    "get_request_timings",
+    "record_phase",
+    "record_statement",
+    "reset_request_timings",
+    "start_request_timings",
+    "timed_phase",
+]
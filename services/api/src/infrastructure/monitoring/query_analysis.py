@@ -0,0 +1,53 @@
+"""SQL statement shape analysis (N+1 detection)."""
+
+import re
+
+# Lists of bind placeholders, e.g. `IN ($1, $2, $3)` -> `IN (?...)`
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\$\d+|%s|\?|:\w+)(?:\s*,\s*(?:\$\d+|%s|\?|:\w+))+\s*\)")
+_PLACEHOLDER = re.compile(r"\$\d+|%s|:\w+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape.
+
+    Bind placeholders, literals and placeholder lists of any length are
+    replaced so that statements differing only by their values compare equal.
+
+    Args:
+        statement: SQL statement text as sent to the database
+
+    Returns:
+        Normalized statement shape
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("(?...)", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def find_repeated_statements(statements: dict[str, int], threshold: int) -> list[tuple[str, int]]:
+    """Find statement shapes executed at least `threshold` times (N+1 suspects).
+
+    Args:
+        statements: Executions per statement text for one request
+        threshold: Minimum executions of one shape to be reported
+
+    Returns:
+        (shape, executions) pairs, most executed first
+    """
+    # Cheap pre-check on the raw texts: a request rarely runs enough statements
+    if sum(statements.values()) < threshold:
+        return []
+
+    shapes: dict[str, int] = {}
+    for statement, count in statements.items():
+        shape = normalize_statement(statement)
+        shapes[shape] = shapes.get(shape, 0) + count
+
+    repeated = [(shape, count) for shape, count in shapes.items() if count >= threshold]
+    repeated.sort(key=lambda item: item[1], reverse=True)
+    return repeated
@@ -0,0 +1,94 @@
+"""Per-request phase timings (auth, db, serialization, ...) and SQL statements.
+
+The timing middleware opens a `RequestTimings` for every HTTP request and
+binds it to a context variable. Code running inside the request (auth
+dependency, database event hooks, route handler) adds the time it spends in
+a named phase; the middleware then reports the phases in the
+`Server-Timing` response header and in the metrics registry.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+# Well-known phase names
+PHASE_AUTH = "auth"
+PHASE_DB = "db"
+PHASE_SERIALIZATION = "serialization"
+
+
+@dataclass
+class RequestTimings:
+    """Accumulated phase durations (in seconds) for one request."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    handler_finished_at: float | None = None
+    # Executions per SQL statement text (the text is parameterized, so it is
+    # the statement "shape"; identical shapes repeated many times hint at N+1)
+    statements: dict[str, int] = field(default_factory=dict)
+    statement_count: int = 0
+
+    def add(self, phase: str, duration: float) -> None:
+        """Add time spent in a phase (phases may be entered several times)."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def add_statement(self, statement: str, duration: float) -> None:
+        """Record one executed SQL statement and its duration."""
+        self.add(PHASE_DB, duration)
+        self.statement_count += 1
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started_at
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> tuple[RequestTimings, Token[RequestTimings | None]]:
+    """Open timings for a new request and bind them to the current context."""
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def reset_request_timings(token: Token[RequestTimings | None]) -> None:
+    """Unbind the timings opened by `start_request_timings`."""
+    _current_timings.reset(token)
+
+
+def get_request_timings() -> RequestTimings | None:
+    """Get the timings of the current request (None outside a request)."""
+    return _current_timings.get()
+
+
+def record_phase(phase: str, duration: float) -> None:
+    """Add time spent in a phase to the current request, if any."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(phase, duration)
+
+
+def record_statement(statement: str, duration: float) -> None:
+    """Record an executed SQL statement on the current request, if any."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_statement(statement, duration)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """Measure the wrapped block as time spent in `phase`.
+
+    Usage:
+        with timed_phase(PHASE_AUTH):
+            user = await authenticate(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - started)
@@ -1,7 +1,18 @@
 """Infrastructure services implementations."""
 
+from src.infrastructure.services.attachment_preview_service import WorkerPoolPreviewService
 from src.infrastructure.services.local_storage_service import LocalStorageService
+from src.infrastructure.services.maintenance import MaintenanceScheduler
+from src.infrastructure.services.memory_cache_service import InMemoryCacheService
+from src.infrastructure.services.outbox import OutboxDispatcher, OutboxEventPublisher
 
-__all__ = ["LocalStorageService"]
+__all__ = [
+    "InMemoryCacheService",
+    "LocalStorageService",
+    "MaintenanceScheduler",
+    "OutboxDispatcher",
+    "OutboxEventPublisher",
+    "WorkerPoolPreviewService",
+]
 
 # External services (email, etc.) will be implemented as needed
@@ -0,0 +1,134 @@
+"""Worker pool attachment preview service implementation."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, cast
+from uuid import UUID
+
+import structlog
+from sqlalchemy import CursorResult, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces import AttachmentPreviewService
+from src.domain.services import StorageService
+from src.infrastructure.database.models import AttachmentModel
+from src.infrastructure.services.image_service import ImageProcessingService
+
+logger = structlog.get_logger()
+
+# Waits before retrying to record a thumbnail whose attachment row is not committed yet
+RECORD_RETRY_DELAYS = (0.1, 0.5, 1.0, 2.0, 5.0)
+
+
+def thumbnail_storage_path(attachment_id: UUID) -> str:
+    """Storage path of an attachment's thumbnail (next to the original file)."""
+    return f"attachments/{attachment_id}/thumbnail.webp"
+
+
+class WorkerPoolPreviewService(AttachmentPreviewService):
+    """Generates attachment thumbnails in a worker pool.
+
+    Decoding and resizing run in the executor (a process pool in production),
+    so uploads respond as soon as the original is stored. The thumbnail is saved
+    through the storage service and recorded on the attachment with its own
+    session, once the upload transaction has committed.
+    """
+
+    def __init__(
+        self,
+        storage_service: StorageService,
+        session_factory: async_sessionmaker[AsyncSession],
+        executor: Executor,
+        max_size: int = 320,
+    ) -> None:
+        """Initialize preview service.
+
+        Args:
+            storage_service: Storage service the thumbnails are saved to
+            session_factory: Factory of sessions used to record thumbnail paths
+            executor: Pool the image processing runs in
+            max_size: Maximum width and height of thumbnails in pixels
+        """
+        self._storage_service = storage_service
+        self._session_factory = session_factory
+        self._executor = executor
+        self._max_size = max_size
+        # Keep references so pending tasks are not garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def schedule(self, attachment_id: UUID, file_content: bytes, mime_type: str) -> None:
+        """Schedule thumbnail generation (no-op for unsupported file types)."""
+        if mime_type not in ImageProcessingService.THUMBNAIL_MIME_TYPES:
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            self._generate(attachment_id, file_content, mime_type)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def shutdown(self) -> None:
+        """Wait for pending thumbnails, then shut the worker pool down."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def _generate(self, attachment_id: UUID, file_content: bytes, mime_type: str) -> None:
+        """Generate, store and record the thumbnail of one attachment."""
+        try:
+            thumbnail = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                ImageProcessingService.create_thumbnail,
+                file_content,
+                mime_type,
+                self._max_size,
+            )
+            if thumbnail is None:
+                return
+
+            path = thumbnail_storage_path(attachment_id)
+            await self._storage_service.save(thumbnail, path, "image/webp")
+
+            if not await self._record(attachment_id, path):
+                # The upload was rolled back (or the attachment deleted meanwhile)
+                logger.warning(
+                    "Attachment gone, discarding thumbnail", attachment_id=str(attachment_id)
+                )
+                await self._storage_service.delete(path)
+                return
+
+            logger.info(
+                "Attachment thumbnail generated",
+                attachment_id=str(attachment_id),
+                thumbnail_size=len(thumbnail),
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to generate attachment thumbnail",
+                attachment_id=str(attachment_id),
+                mime_type=mime_type,
+                error=str(e),
+            )
+
+    async def _record(self, attachment_id: UUID, path: str) -> bool:
+        """Set thumbnail_path, retrying while the attachment row is not visible yet.
+
+        Returns:
+            True if the attachment was updated
+        """
+        for delay in (0.0, *RECORD_RETRY_DELAYS):
+            if delay:
+                await asyncio.sleep(delay)
+            async with self._session_factory() as session:
+                result = cast(
+                    CursorResult[Any],
+                    await session.execute(
+                        update(AttachmentModel)
+                        .where(AttachmentModel.id == attachment_id)
+                        .values(thumbnail_path=path)
+                    ),
+                )
+                await session.commit()
+            if result.rowcount:
+                return True
+        return False
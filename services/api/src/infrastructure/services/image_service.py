@@ -1,10 +1,10 @@
-"""Image processing service for avatar uploads."""
+"""Image processing service for avatar uploads and attachment thumbnails."""
 
 import io
 from typing import NamedTuple
 
 import structlog
-from PIL import Image
+from PIL import Image, features
 
 from src.domain.exceptions import ValidationException
 
@@ -29,6 +29,15 @@ class ImageProcessingService:
         "image/webp",
     }
 
+    # Attachment types a thumbnail can be generated for (PDFs need pypdfium2)
+    THUMBNAIL_MIME_TYPES = {
+        "image/jpeg",
+        "image/png",
+        "image/gif",
+        "image/webp",
+        "application/pdf",
+    }
+
     # Standard avatar sizes
     AVATAR_SIZES = [
         ImageSize(64, 64, "64x64"),
@@ -36,6 +45,23 @@ class ImageProcessingService:
         ImageSize(256, 256, "256x256"),
     ]
 
+    # Size generated at upload (the avatar_url), other sizes are generated on demand
+    DEFAULT_AVATAR_SIZE = AVATAR_SIZES[-1]
+
+    # Output formats, with their MIME type and file extension
+    FORMAT_MIME_TYPES = {
+        "PNG": "image/png",
+        "JPEG": "image/jpeg",
+        "WEBP": "image/webp",
+        "AVIF": "image/avif",
+    }
+    FORMAT_EXTENSIONS = {
+        "PNG": ".png",
+        "JPEG": ".jpg",
+        "WEBP": ".webp",
+        "AVIF": ".avif",
+    }
+
     @classmethod
     def is_allowed_mime_type(cls, mime_type: str) -> bool:
         """Check if MIME type is allowed for images.
@@ -48,6 +74,49 @@ class ImageProcessingService:
         """
         return mime_type in cls.ALLOWED_MIME_TYPES
 
+    @classmethod
+    def get_avatar_size(cls, name: str) -> ImageSize | None:
+        """Get an allowed avatar size by name (e.g. "64x64").
+
+        Args:
+            name: Size name
+
+        Returns:
+            Image size, or None if the size is not allowed
+        """
+        return next((size for size in cls.AVATAR_SIZES if size.name == name), None)
+
+    @classmethod
+    def negotiate_output_format(cls, accept: str | None, fallback: str) -> str:
+        """Pick the most compact output format the client accepts.
+
+        Args:
+            accept: Accept header of the request
+            fallback: Format used when the client accepts neither AVIF nor WEBP
+
+        Returns:
+            Format string for PIL (AVIF, WEBP or the fallback)
+        """
+        accepted = set()
+        for media_range in (accept or "").split(","):
+            media_type, *params = (part.strip() for part in media_range.split(";"))
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        pass
+            if quality > 0:
+                accepted.add(media_type.lower())
+
+        if "image/avif" in accepted and features.check("avif"):
+            return "AVIF"
+        if "image/webp" in accepted:
+            return "WEBP"
+        return fallback
+
     @classmethod
     def validate_image(
         cls,
@@ -87,12 +156,16 @@ class ImageProcessingService:
         cls,
         file_content: bytes,
         output_format: str = "PNG",
+        sizes: list[ImageSize] | None = None,
     ) -> dict[str, bytes]:
         """Process avatar image and create multiple sizes.
 
+        CPU bound: meant to run in a worker pool, not in the event loop.
+
         Args:
             file_content: Original image file content
-            output_format: Output format (PNG, JPEG, WEBP)
+            output_format: Output format (PNG, JPEG, WEBP, AVIF)
+            sizes: Sizes to create (defaults to all AVATAR_SIZES)
 
         Returns:
             Dictionary mapping size names to processed image bytes
@@ -101,8 +174,12 @@ class ImageProcessingService:
             ValidationException: If processing fails
         """
         try:
-            # Open original image
+            sizes = sizes or cls.AVATAR_SIZES
+
+            # Open original image, letting the JPEG decoder downscale while decoding
             original_image: Image.Image = Image.open(io.BytesIO(file_content))
+            largest = max(max(size.width, size.height) for size in sizes)
+            original_image.draft("RGB", (largest, largest))
 
             # Convert RGBA to RGB if necessary (for JPEG)
             if output_format == "JPEG" and original_image.mode in ("RGBA", "LA", "P"):
@@ -121,7 +198,7 @@ class ImageProcessingService:
             processed_images = {}
 
             # Generate each size
-            for size_config in cls.AVATAR_SIZES:
+            for size_config in sizes:
                 # Resize image maintaining aspect ratio
                 resized_image = cls._resize_image(
                     original_image,
@@ -137,6 +214,8 @@ class ImageProcessingService:
                     resized_image.save(output_buffer, format="JPEG", quality=85, optimize=True)
                 elif output_format == "WEBP":
                     resized_image.save(output_buffer, format="WEBP", quality=85, method=6)
+                elif output_format == "AVIF":
+                    resized_image.save(output_buffer, format="AVIF", quality=60)
                 else:  # PNG
                     resized_image.save(output_buffer, format="PNG", optimize=True)
 
@@ -157,6 +236,66 @@ class ImageProcessingService:
                 field="file",
             ) from e
 
+    @classmethod
+    def create_thumbnail(
+        cls,
+        file_content: bytes,
+        mime_type: str,
+        max_size: int = 320,
+    ) -> bytes | None:
+        """Create a WEBP thumbnail of an image, or of the first page of a PDF.
+
+        CPU bound: meant to run in a worker pool, not in the event loop.
+
+        Args:
+            file_content: Original file content
+            mime_type: MIME type of the original file
+            max_size: Maximum width and height of the thumbnail in pixels
+
+        Returns:
+            Thumbnail bytes, or None if no thumbnail can be made for this file
+        """
+        if mime_type not in cls.THUMBNAIL_MIME_TYPES:
+            return None
+
+        if mime_type == "application/pdf":
+            image = cls._render_pdf_first_page(file_content, max_size)
+            if image is None:
+                return None
+        else:
+            image = Image.open(io.BytesIO(file_content))
+            # Let the JPEG decoder downscale while decoding (much cheaper than resizing)
+            image.draft("RGB", (max_size, max_size))
+
+        # Keeps the aspect ratio, never upscales
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        output_buffer = io.BytesIO()
+        image.save(output_buffer, format="WEBP", quality=80)
+        return output_buffer.getvalue()
+
+    @classmethod
+    def _render_pdf_first_page(cls, file_content: bytes, max_size: int) -> Image.Image | None:
+        """Render the first page of a PDF (None if pypdfium2 is not installed)."""
+        try:
+            import pypdfium2
+        except ImportError:
+            logger.debug("pypdfium2 not installed, skipping PDF thumbnail")
+            return None
+
+        document = pypdfium2.PdfDocument(file_content)
+        try:
+            page = document[0]
+            width, height = page.get_size()
+            # Render close to the thumbnail size instead of at full resolution
+            scale = max_size / max(width, height, 1)
+            rendered: Image.Image = page.render(scale=max(scale, 0.1)).to_pil()
+            return rendered
+        finally:
+            document.close()
+
     @classmethod
     def _resize_image(
         cls,
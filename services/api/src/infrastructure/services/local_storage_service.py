@@ -1,11 +1,14 @@
 """Local filesystem storage service implementation."""
 
+import asyncio
+from bisect import bisect_right
+from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
 
 from src.domain.exceptions import StorageException
-from src.domain.services import StorageService
+from src.domain.services import StorageService, StoredFile
 from src.infrastructure.config import get_settings
 
 logger = structlog.get_logger()
@@ -161,6 +164,54 @@ class LocalStorageService(StorageService):
             logger.error("Failed to read file", file_path=file_path, error=str(e))
             raise StorageException(f"Failed to read file: {str(e)}") from e
 
+    async def list_files(
+        self, prefix: str, after: str | None = None, limit: int = 1000
+    ) -> list[StoredFile]:
+        """List files under a prefix, in path order, one page at a time.
+
+        Args:
+            prefix: Path prefix of the files (relative to storage root)
+            after: Path the page starts after (None for the first page)
+            limit: Maximum number of files returned
+
+        Returns:
+            Files sorted by path (fewer than `limit` on the last page)
+
+        Raises:
+            StorageException: If listing fails
+        """
+        try:
+            return await asyncio.to_thread(self._list_files, prefix, after, limit)
+        except OSError as e:
+            logger.error("Failed to list files", prefix=prefix, error=str(e))
+            raise StorageException(f"Failed to list files: {str(e)}") from e
+
+    def _list_files(self, prefix: str, after: str | None, limit: int) -> list[StoredFile]:
+        """Blocking directory walk of `list_files` (run in a thread)."""
+        # Walk the deepest directory the prefix names, then filter on the full prefix
+        directory = (
+            self._storage_path / prefix.rsplit("/", 1)[0] if "/" in prefix else self._storage_path
+        )
+        if not directory.is_dir():
+            return []
+
+        paths = sorted(
+            relative
+            for path in directory.rglob("*")
+            if path.is_file()
+            and (relative := path.relative_to(self._storage_path).as_posix()).startswith(prefix)
+        )
+        start = bisect_right(paths, after) if after is not None else 0
+        return [
+            StoredFile(
+                path=path,
+                modified_at=datetime.fromtimestamp(
+                    (self._storage_path / path).stat().st_mtime, tz=UTC
+                ),
+            )
+            for path in paths[start : start + limit]
+        ]
+
     def _get_url(self, file_path: str) -> str:
         """Generate URL for a file path.
 
@@ -0,0 +1,559 @@
+"""Maintenance scheduler: batched cleanup and retention jobs."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import ColumnElement, delete, exists, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from src.domain.services import StorageService
+from src.infrastructure.database.models import (
+    AttachmentModel,
+    InvitationModel,
+    IssueModel,
+    MaintenanceJobModel,
+    NotificationModel,
+    OutboxEventModel,
+    PageModel,
+    PresenceModel,
+    TimeEntryModel,
+    TimeEntryRollupModel,
+)
+from src.infrastructure.monitoring import get_metrics_registry
+
+logger = structlog.get_logger()
+
+# Characters of a job error kept on the job
+MAX_ERROR_LENGTH = 2000
+
+_registry = get_metrics_registry()
+_purged = _registry.counter(
+    "maintenance_purged_total",
+    "Rows (or files) purged by maintenance jobs",
+    ("job",),
+)
+_runs = _registry.counter(
+    "maintenance_job_runs_total",
+    "Maintenance job runs by outcome",
+    ("job", "status"),
+)
+_duration = _registry.histogram(
+    "maintenance_job_duration_seconds",
+    "Duration of maintenance job runs",
+    ("job",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0),
+)
+_last_success = _registry.gauge(
+    "maintenance_job_last_success_timestamp_seconds",
+    "Unix time of the last successful run of maintenance jobs",
+    ("job",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PurgeBatch:
+    """Outcome of one batch of a maintenance job."""
+
+    purged: int
+    # Whether nothing is left to purge; otherwise the next batch resumes from `cursor`
+    done: bool
+    cursor: str | None = None
+
+
+class MaintenanceJob(ABC):
+    """Cleanup job run by MaintenanceScheduler, one batch per transaction."""
+
+    def __init__(self, name: str, interval: timedelta) -> None:
+        """Initialize job.
+
+        Args:
+            name: Unique name of the job (its schedule is stored under it)
+            interval: Time between two runs of the job
+        """
+        self.name = name
+        self.interval = interval
+
+    @abstractmethod
+    async def purge_batch(
+        self, session: AsyncSession, limit: int, cursor: str | None
+    ) -> PurgeBatch:
+        """Purge up to `limit` rows (or files) in the transaction of the session.
+
+        Args:
+            session: Session of the batch (committed by the scheduler)
+            limit: Maximum number of rows (or files) handled
+            cursor: Position the previous batch stopped at (None to start over)
+
+        Returns:
+            Outcome of the batch
+        """
+        ...
+
+
+class PurgeRowsJob(MaintenanceJob):
+    """Deletes the rows of a table matching a condition, oldest batch first.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED, so a batch never waits on
+    rows a request is changing. The condition is evaluated by the database
+    (against `now()`), so runs need no cursor: a run picks up what the
+    previous one left.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: timedelta,
+        model: Any,
+        condition: ColumnElement[bool],
+        order_by: Any,
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            name: Unique name of the job
+            interval: Time between two runs of the job
+            model: Model of the table purged (with an `id` primary key)
+            condition: Condition of the rows purged
+            order_by: Column the rows are purged in the order of (indexed)
+        """
+        super().__init__(name, interval)
+        self._model = model
+        self._condition = condition
+        self._order_by = order_by
+
+    async def purge_batch(
+        self, session: AsyncSession, limit: int, cursor: str | None
+    ) -> PurgeBatch:
+        """Delete up to `limit` matching rows."""
+        result = await session.execute(
+            select(self._model.id)
+            .where(self._condition)
+            .order_by(self._order_by)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        ids = list(result.scalars().all())
+        if ids:
+            await self._before_delete(session, ids)
+            await session.execute(
+                delete(self._model)
+                .where(self._model.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+        return PurgeBatch(purged=len(ids), done=len(ids) < limit)
+
+    async def _before_delete(self, session: AsyncSession, ids: list[UUID]) -> None:
+        """Clean up what the rows leave behind (in the transaction of the delete)."""
+
+
+class PurgeSoftDeletedJob(PurgeRowsJob):
+    """Deletes issues or pages soft-deleted for longer than the retention period.
+
+    Their attachments go with them (the files are purged by
+    PurgeOrphanedFilesJob). Rows with live children are kept, as deleting
+    them would move the children to the top level.
+    """
+
+    def __init__(
+        self, name: str, interval: timedelta, model: Any, entity_type: str, retention: timedelta
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            name: Unique name of the job
+            interval: Time between two runs of the job
+            model: IssueModel or PageModel
+            entity_type: Entity type of the attachments ("issue" or "page")
+            retention: Time deleted rows are kept
+        """
+        child = aliased(model)
+        parent_id = child.parent_issue_id if model is IssueModel else child.parent_id
+        super().__init__(
+            name,
+            interval,
+            model,
+            (model.deleted_at < func.now() - retention)
+            & ~exists().where(parent_id == model.id, child.deleted_at.is_(None)),
+            model.deleted_at,
+        )
+        self._entity_type = entity_type
+
+    async def _before_delete(self, session: AsyncSession, ids: list[UUID]) -> None:
+        """Delete the attachment rows of the purged rows."""
+        await session.execute(
+            delete(AttachmentModel)
+            .where(
+                AttachmentModel.entity_type == self._entity_type,
+                AttachmentModel.entity_id.in_(ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+class PurgeSoftDeletedIssuesJob(PurgeSoftDeletedJob):
+    """Deletes soft-deleted issues, removing their hours from the daily time rollups."""
+
+    def __init__(self, interval: timedelta, retention: timedelta) -> None:
+        """Initialize job.
+
+        Args:
+            interval: Time between two runs of the job
+            retention: Time deleted issues are kept
+        """
+        super().__init__("purge_deleted_issues", interval, IssueModel, "issue", retention)
+
+    async def _before_delete(self, session: AsyncSession, ids: list[UUID]) -> None:
+        """Delete attachments, and the time entries (cascaded) from the rollups."""
+        await super()._before_delete(session, ids)
+
+        entries, rollups = TimeEntryModel, TimeEntryRollupModel
+        removed = (
+            select(
+                IssueModel.project_id,
+                entries.date,
+                entries.user_id,
+                func.sum(entries.hours).label("hours"),
+                func.count().label("entry_count"),
+            )
+            .join(IssueModel, IssueModel.id == entries.issue_id)
+            .where(entries.issue_id.in_(ids))
+            .group_by(IssueModel.project_id, entries.date, entries.user_id)
+            .subquery()
+        )
+        rollup_key = tuple_(rollups.project_id, rollups.date, rollups.user_id)
+        await session.execute(
+            update(rollups)
+            .where(
+                rollups.project_id == removed.c.project_id,
+                rollups.date == removed.c.date,
+                rollups.user_id == removed.c.user_id,
+            )
+            .values(
+                hours=rollups.hours - removed.c.hours,
+                entry_count=rollups.entry_count - removed.c.entry_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        # Days without entries left are dropped rather than kept at zero
+        await session.execute(
+            delete(rollups)
+            .where(
+                rollup_key.in_(select(removed.c.project_id, removed.c.date, removed.c.user_id)),
+                rollups.entry_count <= 0,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+class PurgeSoftDeletedPagesJob(PurgeSoftDeletedJob):
+    """Deletes soft-deleted pages (versions, comments and presences cascade)."""
+
+    def __init__(self, interval: timedelta, retention: timedelta) -> None:
+        """Initialize job.
+
+        Args:
+            interval: Time between two runs of the job
+            retention: Time deleted pages are kept
+        """
+        super().__init__("purge_deleted_pages", interval, PageModel, "page", retention)
+
+
+class PurgeOrphanedFilesJob(MaintenanceJob):
+    """Deletes stored attachment files whose attachment no longer exists.
+
+    Walks the `attachments/` listing of the storage in path order, a page per
+    batch; the cursor is the last path checked, so a sweep larger than a run
+    resumes at the next run. Files younger than the grace period are kept:
+    uploads save the file before their attachment commits.
+    """
+
+    PREFIX = "attachments/"
+
+    def __init__(
+        self, interval: timedelta, storage_service: StorageService, grace: timedelta
+    ) -> None:
+        """Initialize job.
+
+        Args:
+            interval: Time between two sweeps
+            storage_service: Storage the attachment files are saved to
+            grace: Age under which files are never purged
+        """
+        super().__init__("purge_orphaned_files", interval)
+        self._storage_service = storage_service
+        self._grace = grace
+
+    async def purge_batch(
+        self, session: AsyncSession, limit: int, cursor: str | None
+    ) -> PurgeBatch:
+        """Check up to `limit` files and delete the orphaned ones."""
+        files = await self._storage_service.list_files(self.PREFIX, after=cursor, limit=limit)
+
+        # Files are stored under attachments/{attachment id}/
+        attachment_ids: dict[str, UUID | None] = {}
+        for file in files:
+            directory = file.path[len(self.PREFIX) :].split("/", 1)[0]
+            try:
+                attachment_ids[file.path] = UUID(directory)
+            except ValueError:
+                attachment_ids[file.path] = None
+
+        existing: set[UUID] = set()
+        ids = {attachment_id for attachment_id in attachment_ids.values() if attachment_id}
+        if ids:
+            result = await session.execute(
+                select(AttachmentModel.id).where(AttachmentModel.id.in_(ids))
+            )
+            existing = set(result.scalars().all())
+
+        cutoff = datetime.now(UTC) - self._grace
+        purged = 0
+        for file in files:
+            attachment_id = attachment_ids[file.path]
+            if attachment_id is None or attachment_id in existing or file.modified_at > cutoff:
+                continue
+            await self._storage_service.delete(file.path)
+            purged += 1
+
+        done = len(files) < limit
+        return PurgeBatch(purged=purged, done=done, cursor=None if done else files[-1].path)
+
+
+def build_maintenance_jobs(
+    storage_service: StorageService,
+    presence_stale_after: timedelta,
+    soft_deleted_retention: timedelta,
+    notification_retention: timedelta,
+    expired_invitation_retention: timedelta,
+    outbox_retention: timedelta,
+    orphaned_file_grace: timedelta,
+) -> list[MaintenanceJob]:
+    """Cleanup and retention jobs of the application, in run order.
+
+    Args:
+        storage_service: Storage the attachment files are saved to
+        presence_stale_after: Time without update after which a presence is stale
+            (sockets that crashed never removed theirs)
+        soft_deleted_retention: Time deleted issues and pages are kept
+        notification_retention: Time notifications are kept
+        expired_invitation_retention: Time unaccepted invitations are kept once expired
+        outbox_retention: Time processed outbox events are kept
+        orphaned_file_grace: Age under which attachment files are never purged
+
+    Returns:
+        Jobs for MaintenanceScheduler
+    """
+    # Attachments of purged issues and pages are left to the file sweep: run it after them
+    return [
+        PurgeRowsJob(
+            "purge_stale_presences",
+            timedelta(minutes=5),
+            PresenceModel,
+            PresenceModel.updated_at < func.now() - presence_stale_after,
+            PresenceModel.updated_at,
+        ),
+        PurgeRowsJob(
+            "purge_processed_outbox_events",
+            timedelta(hours=1),
+            OutboxEventModel,
+            OutboxEventModel.processed_at < func.now() - outbox_retention,
+            OutboxEventModel.processed_at,
+        ),
+        PurgeRowsJob(
+            "purge_old_notifications",
+            timedelta(hours=1),
+            NotificationModel,
+            NotificationModel.created_at < func.now() - notification_retention,
+            NotificationModel.created_at,
+        ),
+        PurgeRowsJob(
+            "purge_expired_invitations",
+            timedelta(hours=1),
+            InvitationModel,
+            InvitationModel.accepted_at.is_(None)
+            & (InvitationModel.expires_at < func.now() - expired_invitation_retention),
+            InvitationModel.expires_at,
+        ),
+        PurgeSoftDeletedIssuesJob(timedelta(hours=6), soft_deleted_retention),
+        PurgeSoftDeletedPagesJob(timedelta(hours=6), soft_deleted_retention),
+        PurgeOrphanedFilesJob(timedelta(days=1), storage_service, orphaned_file_grace),
+    ]
+
+
+class MaintenanceScheduler:
+    """Runs maintenance jobs on their interval, in batches, with metrics.
+
+    Due jobs are claimed in the `maintenance_jobs` table by pushing their
+    next run forward, so schedulers of several processes never run a job
+    twice per interval. Every batch commits on its own with the job's cursor
+    and totals: an interrupted run loses at most one batch. Runs are
+    rate-limited by a pause between batches and a maximum number of batches,
+    past which the job resumes at its next run.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        jobs: list[MaintenanceJob],
+        batch_size: int = 1000,
+        batch_delay_seconds: float = 0.5,
+        max_batches_per_run: int = 100,
+        poll_interval_seconds: float = 60.0,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            session_factory: Factory of the sessions the batches run with
+            jobs: Jobs to run (unique names)
+            batch_size: Maximum number of rows (or files) purged per batch
+            batch_delay_seconds: Pause between the batches of a run
+            max_batches_per_run: Batches after which a run stops
+            poll_interval_seconds: Wait between checks for due jobs
+        """
+        self._session_factory = session_factory
+        self._jobs = jobs
+        self._batch_size = batch_size
+        self._batch_delay_seconds = batch_delay_seconds
+        self._max_batches_per_run = max_batches_per_run
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def run_due_jobs(self) -> dict[str, int]:
+        """Run the jobs that are due and not claimed by another scheduler.
+
+        Returns:
+            Rows (or files) purged by job name, for the jobs that ran
+        """
+        purged: dict[str, int] = {}
+        for job in self._jobs:
+            if self._stopping.is_set():
+                break
+            claimed, cursor = await self._claim(job)
+            if claimed:
+                purged[job.name] = await self.run_job(job, cursor)
+        return purged
+
+    async def run_job(self, job: MaintenanceJob, cursor: str | None = None) -> int:
+        """Run a job now, batch after batch until done or the run limit.
+
+        Args:
+            job: Job to run
+            cursor: Position the job resumes from
+
+        Returns:
+            Rows (or files) purged by the run
+        """
+        started = time.perf_counter()
+        purged = 0
+        error: str | None = None
+        try:
+            for batch_number in range(self._max_batches_per_run):
+                if batch_number and self._batch_delay_seconds:
+                    await asyncio.sleep(self._batch_delay_seconds)
+
+                async with self._session_factory() as session:
+                    batch = await job.purge_batch(session, self._batch_size, cursor)
+                    cursor = None if batch.done else batch.cursor
+                    await session.execute(
+                        update(MaintenanceJobModel)
+                        .where(MaintenanceJobModel.name == job.name)
+                        .values(
+                            cursor=cursor,
+                            total_purged=MaintenanceJobModel.total_purged + batch.purged,
+                        )
+                    )
+                    await session.commit()
+
+                purged += batch.purged
+                _purged.inc(batch.purged, job=job.name)
+                if batch.done or self._stopping.is_set():
+                    break
+        except Exception as e:
+            error = str(e)
+            logger.error("Maintenance job failed", job=job.name, purged=purged, error=error)
+
+        duration = time.perf_counter() - started
+        _duration.observe(duration, job=job.name)
+        _runs.inc(job=job.name, status="failed" if error else "succeeded")
+        if error is None:
+            _last_success.set(time.time(), job=job.name)
+            logger.info("Maintenance job ran", job=job.name, purged=purged, duration=duration)
+
+        async with self._session_factory() as session:
+            await session.execute(
+                update(MaintenanceJobModel)
+                .where(MaintenanceJobModel.name == job.name)
+                .values(
+                    last_finished_at=func.now(),
+                    last_purged=purged,
+                    last_error=error[:MAX_ERROR_LENGTH] if error else None,
+                )
+            )
+            await session.commit()
+
+        return purged
+
+    async def run(self) -> None:
+        """Run due jobs until `shutdown`, checking every poll interval."""
+        while not self._stopping.is_set():
+            try:
+                await self.run_due_jobs()
+            except Exception as e:
+                # Database unavailable and the like: wait for the next check
+                logger.error("Maintenance scheduling failed", error=str(e))
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval_seconds)
+            except TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start running jobs in the background of the running loop."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def shutdown(self) -> None:
+        """Stop running jobs, once the batch in progress is done."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _claim(self, job: MaintenanceJob) -> tuple[bool, str | None]:
+        """Claim a job if it is due, scheduling its next run.
+
+        Returns:
+            Whether the job was claimed, and the cursor it resumes from
+        """
+        async with self._session_factory() as session:
+            await session.execute(
+                insert(MaintenanceJobModel)
+                .values(name=job.name, last_purged=0, total_purged=0)
+                .on_conflict_do_nothing(index_elements=[MaintenanceJobModel.name])
+            )
+            result = await session.execute(
+                update(MaintenanceJobModel)
+                .where(
+                    MaintenanceJobModel.name == job.name,
+                    MaintenanceJobModel.next_run_at <= func.now(),
+                )
+                .values(
+                    next_run_at=func.now() + job.interval,
+                    last_started_at=func.now(),
+                )
+                .returning(MaintenanceJobModel.cursor)
+            )
+            row = result.first()
+            await session.commit()
+
+        return (row is not None, row.cursor if row else None)
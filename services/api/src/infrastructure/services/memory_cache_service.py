@@ -0,0 +1,51 @@
+"""In-process cache service implementation."""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.application.interfaces import CacheService
+
+# Default maximum number of entries before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class InMemoryCacheService(CacheService):
+    """Per-process TTL cache with least-recently-used eviction.
+
+    Entries are kept in the worker process, so each worker has its own cache;
+    suited to results that may be slightly stale (short TTLs).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+        """
+        self._max_entries = max_entries
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value (None if missing or expired)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Cache a value for `ttl_seconds`."""
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        self._entries.pop(key, None)
@@ -0,0 +1,224 @@
+"""Transactional outbox: event publisher and dispatcher."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces import EventPublisher
+from src.application.services.event_bus import EventHandlerRegistry
+from src.domain.events import DomainEvent
+from src.infrastructure.database.models import OutboxEventModel
+
+logger = structlog.get_logger()
+
+# Longest wait before retrying a failed event
+MAX_RETRY_DELAY_SECONDS = 3600.0
+# Characters of a handler error kept on the event
+MAX_ERROR_LENGTH = 2000
+
+
+def serialize_event(event: DomainEvent) -> dict[str, Any]:
+    """JSON payload of an event."""
+    payload: dict[str, Any] = TypeAdapter(type(event)).dump_python(event, mode="json")
+    return payload
+
+
+def deserialize_event(event_type: str, payload: dict[str, Any]) -> DomainEvent:
+    """Event of a stored payload.
+
+    Raises:
+        ValueError: If the event type is unknown
+    """
+    event_class = DomainEvent.type_of(event_type)
+    if event_class is None:
+        raise ValueError(f"Unknown domain event type: {event_type}")
+    return TypeAdapter(event_class).validate_python(payload)
+
+
+class OutboxEventPublisher(EventPublisher):
+    """Publishes events as outbox rows in the transaction of the session.
+
+    The events are written with the change that raised them (and rolled back
+    with it), in one multi-row INSERT per call; nothing else runs in the
+    request, whatever the number of handlers.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize publisher.
+
+        Args:
+            session: Database session of the unit of work
+        """
+        self._session = session
+
+    async def publish(self, *events: DomainEvent) -> None:
+        """Publish events (written in the current transaction).
+
+        Args:
+            events: Events to publish, in order
+        """
+        if not events:
+            return
+
+        await self._session.execute(
+            insert(OutboxEventModel).values(
+                [
+                    {"event_type": event.event_type, "payload": serialize_event(event)}
+                    for event in events
+                ]
+            )
+        )
+
+
+class OutboxDispatcher:
+    """Delivers outbox events to their handlers, in batches, with retries.
+
+    A batch of pending events is claimed with FOR UPDATE SKIP LOCKED, so
+    dispatchers of several processes share the work without delivering an
+    event twice. Every handler runs in a savepoint on the batch session: its
+    writes commit with the event marked as handled, or roll back on failure,
+    when the event is retried later (with exponential backoff) for the
+    handlers that failed only. Events failing `max_attempts` times are left
+    pending with their last error, for inspection.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        registry: EventHandlerRegistry,
+        batch_size: int = 100,
+        max_attempts: int = 10,
+        retry_delay_seconds: float = 5.0,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            session_factory: Factory of the sessions batches are delivered with
+            registry: Handlers of the event types
+            batch_size: Maximum number of events claimed per batch
+            max_attempts: Failed deliveries after which an event is given up
+            retry_delay_seconds: Wait before the first retry (doubled on every failure)
+            poll_interval_seconds: Wait between polls once no event is pending
+        """
+        self._session_factory = session_factory
+        self._registry = registry
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_delay_seconds = retry_delay_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def dispatch_batch(self) -> int:
+        """Deliver one batch of pending events.
+
+        Returns:
+            Number of events claimed
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(OutboxEventModel)
+                .where(
+                    OutboxEventModel.processed_at.is_(None),
+                    OutboxEventModel.available_at <= func.now(),
+                    OutboxEventModel.attempts < self._max_attempts,
+                )
+                .order_by(OutboxEventModel.available_at, OutboxEventModel.created_at)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = list(result.scalars().all())
+
+            for event in events:
+                await self._deliver(session, event)
+
+            await session.commit()
+
+        return len(events)
+
+    async def run(self) -> None:
+        """Deliver events until `shutdown`, polling while none are pending."""
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.dispatch_batch()
+            except Exception as e:
+                # Database unavailable and the like: wait for the next poll
+                logger.error("Outbox dispatch failed", error=str(e))
+                claimed = 0
+
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self._poll_interval_seconds
+                    )
+                except TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Start delivering events in the background of the running loop."""
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def shutdown(self) -> None:
+        """Stop delivering events, once the batch in progress is done."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _deliver(self, session: AsyncSession, event: OutboxEventModel) -> None:
+        """Run the handlers of an event that did not run yet, and record the outcome."""
+        handlers = self._registry.handlers(event.event_type)
+        completed = list(event.completed_handlers)
+        error: str | None = None
+
+        if any(name not in completed for name in handlers):
+            try:
+                domain_event = deserialize_event(event.event_type, event.payload)
+            except ValueError as e:
+                error = str(e)
+            else:
+                for name, factory in handlers.items():
+                    if name in completed:
+                        continue
+                    try:
+                        async with session.begin_nested():
+                            await factory(session)(domain_event)
+                    except Exception as e:
+                        error = f"{name}: {e}"
+                        logger.warning(
+                            "Outbox event handler failed",
+                            event_id=str(event.id),
+                            event_type=event.event_type,
+                            handler=name,
+                            attempt=event.attempts + 1,
+                            error=str(e),
+                        )
+                    else:
+                        completed.append(name)
+
+        now = datetime.now(UTC)
+        event.completed_handlers = completed
+        if error is None:
+            event.processed_at = now
+            return
+
+        event.attempts += 1
+        event.last_error = error[:MAX_ERROR_LENGTH]
+        delay = min(self._retry_delay_seconds * 2 ** (event.attempts - 1), MAX_RETRY_DELAY_SECONDS)
+        event.available_at = now + timedelta(seconds=delay)
+        if event.attempts >= self._max_attempts:
+            logger.error(
+                "Outbox event given up",
+                event_id=str(event.id),
+                event_type=event.event_type,
+                attempts=event.attempts,
+                error=event.last_error,
+            )
@@ -12,6 +12,7 @@ from src.infrastructure.config import get_settings
 from src.presentation.api import v1_router
 from src.presentation.middlewares import (
     RequestIDMiddleware,
+    TimingMiddleware,
     domain_exception_handler,
     generic_exception_handler,
     limiter,
@@ -22,6 +23,7 @@ from src.presentation.middlewares import (
 # Configure structured logging
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -63,6 +65,14 @@ def create_app(enable_rate_limiting: bool = True) -> FastAPI:
         openapi_url="/openapi.json" if settings.debug else None,
     )
 
+    # Add timing middleware (latency histograms, in-flight gauge, Server-Timing header,
+    # per-request SQL statement counts and N+1 detection)
+    app.add_middleware(
+        TimingMiddleware,
+        server_timing=settings.server_timing_enabled,
+        n_plus_one_threshold=settings.n_plus_one_threshold,
+    )
+
     # Add request ID middleware (first to track all requests)
     app.add_middleware(RequestIDMiddleware)
 
@@ -110,12 +120,40 @@ def create_app(enable_rate_limiting: bool = True) -> FastAPI:
             except Exception as e:
                 logger.warning(f"Database initialization skipped: {e}")
 
+        # Deliver domain events from this process (unless a worker process does)
+        if settings.outbox_dispatcher_enabled:
+            from src.presentation.dependencies.services import get_outbox_dispatcher
+
+            get_outbox_dispatcher().start()
+
+        # Run cleanup and retention jobs from this process (unless a worker process does)
+        if settings.maintenance_scheduler_enabled:
+            from src.presentation.dependencies.services import get_maintenance_scheduler
+
+            get_maintenance_scheduler().start()
+
     @app.on_event("shutdown")
     async def shutdown_event() -> None:
         """Application shutdown handler."""
         from src.infrastructure.database import close_db
+        from src.presentation.dependencies.services import (
+            get_attachment_preview_service,
+            get_maintenance_scheduler,
+            get_outbox_dispatcher,
+        )
 
         logger.info("Shutting down application")
+        # Only if the dispatcher was started by this process
+        if get_outbox_dispatcher.cache_info().currsize:
+            await get_outbox_dispatcher().shutdown()
+        # Only if the scheduler was started by this process
+        if get_maintenance_scheduler.cache_info().currsize:
+            await get_maintenance_scheduler().shutdown()
+        # Only if thumbnails were scheduled by this process
+        if get_attachment_preview_service.cache_info().currsize:
+            preview_service = get_attachment_preview_service()
+            if preview_service is not None:
+                await preview_service.shutdown()
         await close_db()
 
     return app
@@ -0,0 +1,37 @@
+"""Maintenance worker: runs cleanup and retention jobs outside of the API processes.
+
+Run with `python -m src.maintenance_worker` (and MAINTENANCE_SCHEDULER_ENABLED=false
+for the API), to keep long purges away from request handling. Several
+schedulers may run at once: each due job is claimed by one of them.
+"""
+
+import asyncio
+import signal
+
+import structlog
+
+from src.infrastructure.database import close_db
+from src.presentation.dependencies.services import get_maintenance_scheduler
+
+logger = structlog.get_logger()
+
+
+async def main() -> None:
+    """Run maintenance jobs until SIGINT or SIGTERM."""
+    scheduler = get_maintenance_scheduler()
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    logger.info("Maintenance worker started")
+    scheduler.start()
+    await stopped.wait()
+
+    logger.info("Maintenance worker stopping")
+    await scheduler.shutdown()
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
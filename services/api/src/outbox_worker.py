@@ -0,0 +1,37 @@
+"""Outbox worker: delivers domain events outside of the API processes.
+
+Run with `python -m src.outbox_worker` (and OUTBOX_DISPATCHER_ENABLED=false
+for the API), to scale event delivery apart from request handling. Several
+workers may run at once: each claims its own batches.
+"""
+
+import asyncio
+import signal
+
+import structlog
+
+from src.infrastructure.database import close_db
+from src.presentation.dependencies.services import get_outbox_dispatcher
+
+logger = structlog.get_logger()
+
+
+async def main() -> None:
+    """Deliver outbox events until SIGINT or SIGTERM."""
+    dispatcher = get_outbox_dispatcher()
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    logger.info("Outbox worker started")
+    dispatcher.start()
+    await stopped.wait()
+
+    logger.info("Outbox worker stopping")
+    await dispatcher.shutdown()
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -20,6 +20,7 @@ from src.presentation.api.v1.issues import router as issues_router
 from src.presentation.api.v1.labels import router as labels_router
 from src.presentation.api.v1.languages import router as languages_router
 from src.presentation.api.v1.macros import router as macros_router
+from src.presentation.api.v1.metrics import router as metrics_router
 from src.presentation.api.v1.nodes import router as nodes_router
 from src.presentation.api.v1.notifications import router as notifications_router
 from src.presentation.api.v1.organizations import router as organizations_router
@@ -43,6 +44,7 @@ router = APIRouter(prefix="/api/v1")
 
 # Include route modules
 router.include_router(health_router, tags=["Health"])
+router.include_router(metrics_router, tags=["Monitoring"])
 router.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 router.include_router(users_router, prefix="/users", tags=["Users"])
 router.include_router(languages_router, tags=["Languages"])
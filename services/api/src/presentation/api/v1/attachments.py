@@ -13,9 +13,11 @@ from src.application.dtos.attachment import (
     AttachmentResponse,
     UploadAttachmentResponse,
 )
+from src.application.interfaces import AttachmentPreviewService
 from src.application.use_cases.attachment import (
     DeleteAttachmentUseCase,
     DownloadAttachmentUseCase,
+    GetAttachmentThumbnailUseCase,
     GetAttachmentUseCase,
     ListAttachmentsUseCase,
     UploadAttachmentUseCase,
@@ -36,6 +38,7 @@ from src.presentation.dependencies.permissions import (
     require_organization_member,
 )
 from src.presentation.dependencies.services import (
+    get_attachment_preview_service,
     get_attachment_repository,
     get_issue_repository,
     get_permission_service,
@@ -43,8 +46,12 @@ from src.presentation.dependencies.services import (
     get_storage_service,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
+
+# Thumbnails never change once generated (attachments are immutable)
+THUMBNAIL_CACHE_CONTROL = "private, max-age=31536000, immutable"
 
 
 # Dependency injection for use cases
@@ -54,10 +61,18 @@ def get_upload_attachment_use_case(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    preview_service: Annotated[
+        AttachmentPreviewService | None, Depends(get_attachment_preview_service)
+    ],
 ) -> UploadAttachmentUseCase:
     """Get upload attachment use case with dependencies."""
     return UploadAttachmentUseCase(
-        attachment_repository, issue_repository, user_repository, storage_service, session
+        attachment_repository,
+        issue_repository,
+        user_repository,
+        storage_service,
+        session,
+        preview_service,
     )
 
 
@@ -97,6 +112,14 @@ def get_download_attachment_use_case(
     return DownloadAttachmentUseCase(attachment_repository, storage_service)
 
 
+def get_attachment_thumbnail_use_case(
+    attachment_repository: Annotated[AttachmentRepository, Depends(get_attachment_repository)],
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+) -> GetAttachmentThumbnailUseCase:
+    """Get attachment thumbnail use case with dependencies."""
+    return GetAttachmentThumbnailUseCase(attachment_repository, storage_service)
+
+
 @router.post(
     "/issues/{issue_id}/attachments",
     response_model=UploadAttachmentResponse,
@@ -253,6 +276,50 @@ async def download_attachment(
     )
 
 
+@router.get(
+    "/attachments/{attachment_id}/thumbnail",
+    status_code=status.HTTP_200_OK,
+)
+async def get_attachment_thumbnail(
+    attachment_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[GetAttachmentThumbnailUseCase, Depends(get_attachment_thumbnail_use_case)],
+    attachment_repository: Annotated[AttachmentRepository, Depends(get_attachment_repository)],
+    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+) -> Response:
+    """Get the thumbnail of an attachment (WEBP).
+
+    Thumbnails are generated in the background after upload: 404 until the
+    attachment's thumbnail_path is set. Requires project membership (via
+    organization membership).
+    """
+    attachment = await attachment_repository.get_by_id(attachment_id)
+    if attachment is None:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+
+    # Check user is member of the organization
+    if attachment.entity_type == "issue":
+        issue = await issue_repository.get_by_id(attachment.entity_id)
+        if issue is None:
+            raise HTTPException(status_code=404, detail="Issue not found")
+
+        project = await project_repository.get_by_id(issue.project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        await require_organization_member(project.organization_id, current_user, permission_service)
+
+    thumbnail = await use_case.execute(str(attachment_id))
+
+    return Response(
+        content=thumbnail,
+        media_type="image/webp",
+        headers={"Cache-Control": THUMBNAIL_CACHE_CONTROL},
+    )
+
+
 @router.delete("/attachments/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_attachment(
     attachment_id: UUID,
@@ -30,8 +30,9 @@ from src.presentation.dependencies import (
     get_user_repository,
 )
 from src.presentation.middlewares import limiter
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -31,8 +31,9 @@ from src.presentation.dependencies.services import (
     get_project_repository,
     get_sprint_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Backlog"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Backlog"])
 
 
 # Dependency injection for use cases
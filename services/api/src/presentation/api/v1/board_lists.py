@@ -18,8 +18,9 @@ from src.presentation.dependencies.services import (
     get_permission_service,
     get_project_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 def get_update_board_list_use_case(
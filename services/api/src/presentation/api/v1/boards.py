@@ -19,6 +19,10 @@ from src.application.dtos.board import (
     UpdateBoardScopeRequest,
     UpdateBoardSwimlanesRequest,
 )
+from src.application.interfaces import EventPublisher
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.board import (
     CreateBoardListUseCase,
     DeleteBoardListUseCase,
@@ -46,6 +50,7 @@ from src.domain.repositories import (
     ProjectRepository,
     SprintRepository,
     UserRepository,
+    WorkflowRepository,
 )
 from src.domain.services import PermissionService
 from src.presentation.dependencies.auth import get_current_active_user
@@ -56,16 +61,22 @@ from src.presentation.dependencies.permissions import (
 from src.presentation.dependencies.services import (
     get_board_repository,
     get_comment_repository,
+    get_event_publisher,
     get_issue_activity_repository,
+    get_issue_hierarchy_service,
     get_issue_repository,
     get_label_repository,
     get_permission_service,
     get_project_repository,
+    get_saved_filter_count_cache,
     get_sprint_repository,
     get_user_repository,
+    get_workflow_cache,
+    get_workflow_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 def get_get_board_use_case(
@@ -154,6 +165,7 @@ def get_get_board_issues_use_case(
     comment_repository: Annotated[CommentRepository, Depends(get_comment_repository)],
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
 ) -> GetBoardIssuesUseCase:
     """Get board issues use case."""
     return GetBoardIssuesUseCase(
@@ -163,6 +175,7 @@ def get_get_board_issues_use_case(
         comment_repository,
         project_repository,
         user_repository,
+        hierarchy_service=hierarchy_service,
     )
 
 
@@ -176,6 +189,11 @@ def get_move_board_issue_use_case(
     issue_activity_repository: Annotated[
         IssueActivityRepository, Depends(get_issue_activity_repository)
     ],
+    workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
+    event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> MoveBoardIssueUseCase:
     """Move board issue use case."""
     return MoveBoardIssueUseCase(
@@ -186,6 +204,11 @@ def get_move_board_issue_use_case(
         comment_repository,
         project_repository,
         issue_activity_repository,
+        workflow_repository=workflow_repository,
+        workflow_cache=workflow_cache,
+        event_publisher=event_publisher,
+        hierarchy_service=hierarchy_service,
+        filter_count_cache=filter_count_cache,
     )
 
 
@@ -316,6 +339,8 @@ async def move_board_issue(
         )
     except EntityNotFoundException as e:
         raise HTTPException(status_code=404, detail=e.message) from e
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.message) from e
 
 
 @router.post(
@@ -28,8 +28,9 @@ from src.presentation.dependencies.services import (
     get_space_repository,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for collaboration service
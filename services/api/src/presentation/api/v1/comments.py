@@ -13,6 +13,7 @@ from src.application.dtos.comment import (
     CreateCommentRequest,
     UpdateCommentRequest,
 )
+from src.application.interfaces import EventPublisher
 from src.application.use_cases.comment import (
     CreateCommentUseCase,
     CreatePageCommentUseCase,
@@ -27,7 +28,6 @@ from src.domain.exceptions import EntityNotFoundException
 from src.domain.repositories import (
     CommentRepository,
     IssueRepository,
-    NotificationRepository,
     PageRepository,
     ProjectRepository,
     SpaceRepository,
@@ -43,16 +43,17 @@ from src.presentation.dependencies.permissions import (
 )
 from src.presentation.dependencies.services import (
     get_comment_repository,
+    get_event_publisher,
     get_issue_repository,
-    get_notification_repository,
     get_page_repository,
     get_permission_service,
     get_project_repository,
     get_space_repository,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -60,14 +61,12 @@ def get_create_comment_use_case(
     comment_repository: Annotated[CommentRepository, Depends(get_comment_repository)],
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-    notification_repository: Annotated[
-        NotificationRepository, Depends(get_notification_repository)
-    ],
+    event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CreateCommentUseCase:
     """Get create comment use case with dependencies."""
     return CreateCommentUseCase(
-        comment_repository, issue_repository, user_repository, notification_repository, session
+        comment_repository, issue_repository, user_repository, event_publisher, session
     )
 
 
@@ -11,6 +11,7 @@ from src.application.dtos.custom_field import (
     CustomFieldResponse,
     UpdateCustomFieldRequest,
 )
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.application.use_cases.custom_field import (
     CreateCustomFieldUseCase,
     DeleteCustomFieldUseCase,
@@ -28,9 +29,11 @@ from src.presentation.dependencies.services import (
     get_custom_field_repository,
     get_permission_service,
     get_project_repository,
+    get_saved_filter_count_cache,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Custom Fields"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Custom Fields"])
 
 
 def get_create_custom_field_use_case(
@@ -64,9 +67,10 @@ def get_update_custom_field_use_case(
 
 def get_delete_custom_field_use_case(
     custom_field_repository: Annotated[CustomFieldRepository, Depends(get_custom_field_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> DeleteCustomFieldUseCase:
     """Get delete custom field use case."""
-    return DeleteCustomFieldUseCase(custom_field_repository)
+    return DeleteCustomFieldUseCase(custom_field_repository, filter_count_cache)
 
 
 @router.post(
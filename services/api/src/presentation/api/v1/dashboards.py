@@ -4,19 +4,22 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.application.dtos.dashboard import (
     CreateDashboardRequest,
+    DashboardDataResponse,
     DashboardListResponse,
     DashboardResponse,
     UpdateDashboardRequest,
     WidgetDataRequest,
     WidgetDataResponse,
 )
+from src.application.interfaces import CacheService
 from src.application.use_cases.dashboard import (
     CreateDashboardUseCase,
     DeleteDashboardUseCase,
+    GetDashboardDataUseCase,
     GetDashboardUseCase,
     GetWidgetDataUseCase,
     ListDashboardsUseCase,
@@ -26,17 +29,21 @@ from src.domain.entities import User
 from src.domain.repositories import IssueRepository, ProjectRepository
 from src.domain.repositories.dashboard_repository import DashboardRepository
 from src.domain.services import PermissionService
-from src.infrastructure.database import get_session
+from src.infrastructure.config import get_settings
+from src.infrastructure.database import get_read_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_edit_permission
 from src.presentation.dependencies.services import (
+    get_cache_service,
     get_dashboard_repository,
-    get_issue_repository,
     get_permission_service,
     get_project_repository,
+    get_query_session_factory,
+    get_read_issue_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Dashboards"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Dashboards"])
 
 
 def get_create_dashboard_use_case(
@@ -77,12 +84,40 @@ def get_delete_dashboard_use_case(
 
 def get_get_widget_data_use_case(
     dashboard_repository: Annotated[DashboardRepository, Depends(get_dashboard_repository)],
-    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    issue_repository: Annotated[IssueRepository, Depends(get_read_issue_repository)],
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
-    session: AsyncSession = Depends(get_session),
+    cache_service: Annotated[CacheService, Depends(get_cache_service)],
+    session: AsyncSession = Depends(get_read_session),
 ) -> GetWidgetDataUseCase:
     """Get widget data use case."""
-    return GetWidgetDataUseCase(dashboard_repository, issue_repository, project_repository, session)
+    return GetWidgetDataUseCase(
+        dashboard_repository,
+        issue_repository,
+        project_repository,
+        session,
+        cache_service=cache_service,
+        cache_ttl_seconds=get_settings().dashboard_widget_cache_ttl_seconds,
+    )
+
+
+def get_get_dashboard_data_use_case(
+    dashboard_repository: Annotated[DashboardRepository, Depends(get_dashboard_repository)],
+    cache_service: Annotated[CacheService, Depends(get_cache_service)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession] | None, Depends(get_query_session_factory)
+    ],
+    session: AsyncSession = Depends(get_read_session),
+) -> GetDashboardDataUseCase:
+    """Get dashboard data use case."""
+    settings = get_settings()
+    return GetDashboardDataUseCase(
+        dashboard_repository,
+        session,
+        cache_service,
+        session_factory=session_factory,
+        cache_ttl_seconds=settings.dashboard_widget_cache_ttl_seconds,
+        max_concurrency=settings.dashboard_widget_concurrency,
+    )
 
 
 @router.post(
@@ -153,6 +188,46 @@ async def get_dashboard(
     return await use_case.execute(dashboard_id)
 
 
+@router.get(
+    "/dashboards/{dashboard_id}/data",
+    response_model=DashboardDataResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get data of all dashboard widgets",
+)
+async def get_dashboard_data(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    dashboard_id: UUID,
+    use_case: Annotated[GetDashboardDataUseCase, Depends(get_get_dashboard_data_use_case)],
+    dashboard_repository: Annotated[DashboardRepository, Depends(get_dashboard_repository)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+) -> DashboardDataResponse:
+    """Get the data of every widget of a dashboard in one call.
+
+    Widgets sharing an aggregate are computed once, and recent results are
+    served from a short-lived cache.
+    """
+    dashboard = await dashboard_repository.get_by_id(dashboard_id)
+    if dashboard is None:
+        raise HTTPException(status_code=404, detail="Dashboard not found")
+
+    # Check permissions
+    if dashboard.user_id != current_user.id:
+        if dashboard.project_id:
+            project = await project_repository.get_by_id(dashboard.project_id)
+            if project:
+                await require_edit_permission(
+                    project.organization_id,
+                    current_user,
+                    permission_service,
+                    project_id=project.id,
+                )
+        else:
+            raise HTTPException(status_code=403, detail="Access denied")
+
+    return await use_case.execute(dashboard_id, dashboard)
+
+
 @router.get(
     "/dashboards",
     response_model=DashboardListResponse,
@@ -1,24 +1,58 @@
-"""Export API endpoints."""
+"""Export (and issue import) API endpoints."""
 
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.application.use_cases.export import ExportPageUseCase, ExportSpaceUseCase
+from src.application.dtos.issue_import import ImportIssuesResponse
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.use_cases.export import (
+    ExportIssuesUseCase,
+    ExportPageUseCase,
+    ExportSpaceUseCase,
+    ImportIssuesUseCase,
+)
 from src.domain.entities import User
 from src.domain.exceptions import EntityNotFoundException
-from src.domain.repositories import PageRepository, SpaceRepository
+from src.domain.repositories import (
+    IssueRepository,
+    PageRepository,
+    ProjectRepository,
+    SpaceRepository,
+)
+from src.domain.repositories.custom_field_repository import CustomFieldRepository
 from src.domain.services import PermissionService
+from src.infrastructure.database import get_session
 from src.presentation.dependencies.auth import get_current_active_user
-from src.presentation.dependencies.permissions import require_organization_member
+from src.presentation.dependencies.permissions import (
+    require_edit_permission,
+    require_organization_member,
+)
 from src.presentation.dependencies.services import (
+    get_custom_field_repository,
+    get_issue_repository,
     get_page_repository,
     get_permission_service,
+    get_project_repository,
+    get_saved_filter_count_cache,
     get_space_repository,
+    get_stream_session_factory,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -37,6 +71,34 @@ def get_export_space_use_case(
     return ExportSpaceUseCase(space_repository, page_repository)
 
 
+def get_export_issues_use_case(
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    custom_field_repository: Annotated[CustomFieldRepository, Depends(get_custom_field_repository)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_stream_session_factory)
+    ],
+) -> ExportIssuesUseCase:
+    """Get export issues use case with dependencies."""
+    return ExportIssuesUseCase(project_repository, custom_field_repository, session_factory)
+
+
+def get_import_issues_use_case(
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    custom_field_repository: Annotated[CustomFieldRepository, Depends(get_custom_field_repository)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
+) -> ImportIssuesUseCase:
+    """Get import issues use case with dependencies."""
+    return ImportIssuesUseCase(
+        project_repository,
+        issue_repository,
+        custom_field_repository,
+        session,
+        filter_count_cache=filter_count_cache,
+    )
+
+
 @router.get("/pages/{page_id}/export/{format}")
 async def export_page(
     page_id: UUID,
@@ -137,3 +199,111 @@ async def export_space(
         media_type=mime_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
+
+@router.get("/projects/{project_id}/issues/export")
+async def export_issues(
+    project_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[ExportIssuesUseCase, Depends(get_export_issues_use_case)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    format: str = Query("ndjson", description="Export format (ndjson, csv)"),
+) -> StreamingResponse:
+    """Export all issues of a project as NDJSON or CSV.
+
+    The response is streamed while the issues are read, so projects of any
+    size can be exported. Each issue includes its labels, custom field values
+    and sprints.
+
+    Args:
+        project_id: Project UUID (from path)
+        current_user: Current authenticated user
+        use_case: Export issues use case
+        project_repository: Project repository
+        permission_service: Permission service
+        format: Export format (ndjson, csv)
+
+    Returns:
+        Streamed file response
+
+    Raises:
+        HTTPException: If project not found, format invalid, or user lacks permission
+    """
+    project = await project_repository.get_by_id(project_id)
+    if project is None:
+        raise EntityNotFoundException("Project", str(project_id))
+
+    await require_organization_member(project.organization_id, current_user, permission_service)
+
+    try:
+        chunks, mime_type, filename = await use_case.execute(str(project_id), format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return StreamingResponse(
+        chunks,
+        media_type=mime_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/projects/{project_id}/issues/import", response_model=ImportIssuesResponse)
+async def import_issues(
+    project_id: UUID,
+    file: Annotated[UploadFile, File(...)],
+    response: Response,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[ImportIssuesUseCase, Depends(get_import_issues_use_case)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    format: str | None = Query(
+        None, description="Import format (ndjson, csv; defaults to the file extension)"
+    ),
+) -> ImportIssuesResponse:
+    """Import issues into a project from an NDJSON or CSV file (the export format).
+
+    Every row is validated before anything is written: if any row is invalid,
+    nothing is imported and the response (400) lists the errors.
+
+    Args:
+        project_id: Project UUID (from path)
+        file: NDJSON or CSV file (UTF-8)
+        response: Response (status code)
+        current_user: Current authenticated user
+        use_case: Import issues use case
+        project_repository: Project repository
+        permission_service: Permission service
+        format: Import format (ndjson, csv)
+
+    Returns:
+        Number of issues imported, or the validation errors
+
+    Raises:
+        HTTPException: If project not found, format invalid, or user lacks permission
+    """
+    project = await project_repository.get_by_id(project_id)
+    if project is None:
+        raise EntityNotFoundException("Project", str(project_id))
+
+    await require_edit_permission(
+        project.organization_id, current_user, permission_service, project_id=project.id
+    )
+
+    if format is None:
+        format = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+
+    try:
+        result = await use_case.execute(str(project_id), file.file, format, str(current_user.id))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if result.error_count:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+    return result
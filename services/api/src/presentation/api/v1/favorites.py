@@ -4,13 +4,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.favorite import (
     CreateFavoriteRequest,
     FavoriteListResponse,
     FavoriteResponse,
 )
+from src.application.services.node_resolver import NodeResolver
 from src.application.use_cases.favorite import (
     CreateFavoriteUseCase,
     DeleteFavoriteUseCase,
@@ -19,20 +19,17 @@ from src.application.use_cases.favorite import (
 from src.domain.entities import User
 from src.domain.repositories import (
     FavoriteRepository,
-    ProjectRepository,
-    SpaceRepository,
     UserRepository,
 )
-from src.infrastructure.database import get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import (
     get_favorite_repository,
-    get_project_repository,
-    get_space_repository,
+    get_node_resolver,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -46,12 +43,10 @@ def get_create_favorite_use_case(
 
 def get_list_favorites_use_case(
     favorite_repository: Annotated[FavoriteRepository, Depends(get_favorite_repository)],
-    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
-    space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    node_resolver: Annotated[NodeResolver, Depends(get_node_resolver)],
 ) -> ListFavoritesUseCase:
     """Get list favorites use case with dependencies."""
-    return ListFavoritesUseCase(favorite_repository, project_repository, space_repository, session)
+    return ListFavoritesUseCase(favorite_repository, node_resolver)
 
 
 def get_delete_favorite_use_case(
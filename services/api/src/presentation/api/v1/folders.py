@@ -42,8 +42,9 @@ from src.presentation.dependencies.services import (
     get_project_repository,
     get_space_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
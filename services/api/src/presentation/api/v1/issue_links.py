@@ -27,8 +27,9 @@ from src.presentation.dependencies.services import (
     get_permission_service,
     get_project_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Issue Links"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Issue Links"])
 
 
 def get_create_issue_link_use_case(
@@ -1,6 +1,8 @@
 """Issue management API endpoints."""
 
-from typing import Annotated
+import json
+import math
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
@@ -14,6 +16,10 @@ from src.application.dtos.issue import (
 )
 from src.application.dtos.issue_activity import IssueActivityListResponse
 from src.application.dtos.label import AddLabelToIssueRequest, LabelResponse
+from src.application.interfaces import EventPublisher
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.issue import (
     CreateIssueUseCase,
     DeleteIssueUseCase,
@@ -27,33 +33,43 @@ from src.application.use_cases.label import (
     ListIssueLabelsUseCase,
     RemoveLabelFromIssueUseCase,
 )
-from src.domain.entities import User
+from src.domain.entities import CustomField, User
 from src.domain.repositories import (
+    CustomFieldRepository,
+    CustomFieldValueRepository,
     IssueActivityRepository,
     IssueRepository,
     LabelRepository,
-    NotificationRepository,
     ProjectRepository,
     UserRepository,
+    WorkflowRepository,
 )
 from src.domain.services import PermissionService
-from src.infrastructure.database import get_session
+from src.infrastructure.database import get_read_session, get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import (
     require_edit_permission,
     require_organization_member,
 )
 from src.presentation.dependencies.services import (
+    get_event_publisher,
     get_issue_activity_repository,
+    get_issue_hierarchy_service,
     get_issue_repository,
     get_label_repository,
-    get_notification_repository,
     get_permission_service,
     get_project_repository,
+    get_read_custom_field_repository,
+    get_read_custom_field_value_repository,
+    get_read_issue_repository,
+    get_saved_filter_count_cache,
     get_user_repository,
+    get_workflow_cache,
+    get_workflow_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -63,10 +79,18 @@ def get_create_issue_use_case(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     activity_repository: Annotated[IssueActivityRepository, Depends(get_issue_activity_repository)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> CreateIssueUseCase:
     """Get create issue use case with dependencies."""
     return CreateIssueUseCase(
-        issue_repository, project_repository, user_repository, activity_repository, session
+        issue_repository,
+        project_repository,
+        user_repository,
+        activity_repository,
+        session,
+        hierarchy_service=hierarchy_service,
+        filter_count_cache=filter_count_cache,
     )
 
 
@@ -80,12 +104,20 @@ def get_issue_use_case(
 
 
 def get_list_issues_use_case(
-    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    issue_repository: Annotated[IssueRepository, Depends(get_read_issue_repository)],
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    custom_field_value_repository: Annotated[
+        CustomFieldValueRepository, Depends(get_read_custom_field_value_repository)
+    ],
 ) -> ListIssuesUseCase:
     """Get list issues use case with dependencies."""
-    return ListIssuesUseCase(issue_repository, project_repository, session)
+    return ListIssuesUseCase(
+        issue_repository,
+        project_repository,
+        session,
+        custom_field_value_repository=custom_field_value_repository,
+    )
 
 
 def get_update_issue_use_case(
@@ -93,10 +125,12 @@ def get_update_issue_use_case(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     activity_repository: Annotated[IssueActivityRepository, Depends(get_issue_activity_repository)],
-    notification_repository: Annotated[
-        NotificationRepository, Depends(get_notification_repository)
-    ],
+    event_publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
+    workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
 ) -> UpdateIssueUseCase:
     """Get update issue use case with dependencies."""
     return UpdateIssueUseCase(
@@ -104,17 +138,28 @@ def get_update_issue_use_case(
         project_repository,
         user_repository,
         activity_repository,
-        notification_repository,
+        event_publisher,
         session,
+        hierarchy_service=hierarchy_service,
+        filter_count_cache=filter_count_cache,
+        workflow_repository=workflow_repository,
+        workflow_cache=workflow_cache,
     )
 
 
 def get_delete_issue_use_case(
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
     activity_repository: Annotated[IssueActivityRepository, Depends(get_issue_activity_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> DeleteIssueUseCase:
     """Get delete issue use case with dependencies."""
-    return DeleteIssueUseCase(issue_repository, activity_repository)
+    return DeleteIssueUseCase(
+        issue_repository,
+        activity_repository,
+        hierarchy_service=hierarchy_service,
+        filter_count_cache=filter_count_cache,
+    )
 
 
 def get_list_issue_activities_use_case(
@@ -129,16 +174,18 @@ def get_list_issue_activities_use_case(
 def get_add_label_to_issue_use_case(
     label_repository: Annotated[LabelRepository, Depends(get_label_repository)],
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> AddLabelToIssueUseCase:
     """Get add label to issue use case."""
-    return AddLabelToIssueUseCase(label_repository, issue_repository)
+    return AddLabelToIssueUseCase(label_repository, issue_repository, filter_count_cache)
 
 
 def get_remove_label_from_issue_use_case(
     label_repository: Annotated[LabelRepository, Depends(get_label_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> RemoveLabelFromIssueUseCase:
     """Get remove label from issue use case."""
-    return RemoveLabelFromIssueUseCase(label_repository)
+    return RemoveLabelFromIssueUseCase(label_repository, filter_count_cache)
 
 
 def get_list_issue_labels_use_case(
@@ -211,6 +258,9 @@ async def list_issues(
     use_case: Annotated[ListIssuesUseCase, Depends(get_list_issues_use_case)],
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    custom_field_repository: Annotated[
+        CustomFieldRepository, Depends(get_read_custom_field_repository)
+    ],
     page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of issues per page")] = 20,
     search: Annotated[str | None, Query(description="Search query (title or description)")] = None,
@@ -220,6 +270,24 @@ async def list_issues(
     type: Annotated[str | None, Query(description="Filter by type")] = None,
     priority: Annotated[str | None, Query(description="Filter by priority")] = None,
     sprint_id: Annotated[UUID | None, Query(description="Filter by sprint ID")] = None,
+    cf: Annotated[
+        list[str] | None,
+        Query(
+            description='Filter by custom field value, as "<field_id>:<value>" (repeatable). '
+            "The value is read by the field type: a number for number fields, a JSON list "
+            "(issues having all its items) or a single item for multi select and user list "
+            "fields, text otherwise"
+        ),
+    ] = None,
+    sort_custom_field_id: Annotated[
+        UUID | None, Query(description="Sort by the value of a custom field")
+    ] = None,
+    sort_order: Annotated[
+        str, Query(pattern="^(asc|desc)$", description="Custom field sort order")
+    ] = "asc",
+    include_custom_fields: Annotated[
+        bool, Query(description="Include the custom field values of each issue")
+    ] = False,
 ) -> IssueListResponse:
     """List issues in a project.
 
@@ -234,6 +302,16 @@ async def list_issues(
 
     await require_organization_member(project.organization_id, current_user, permission_service)
 
+    custom_field_values: dict[str, Any] = {}
+    if cf:
+        custom_fields = {
+            field.id: field for field in await custom_field_repository.get_by_project_id(project_id)
+        }
+        try:
+            custom_field_values = _parse_custom_field_filters(cf, custom_fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
     return await use_case.execute(
         str(project_id),
         page=page,
@@ -245,9 +323,65 @@ async def list_issues(
         type=type,
         priority=priority,
         sprint_id=str(sprint_id) if sprint_id else None,
+        custom_field_values=custom_field_values,
+        sort_custom_field_id=str(sort_custom_field_id) if sort_custom_field_id else None,
+        sort_order=sort_order,
+        include_custom_fields=include_custom_fields,
     )
 
 
+def _parse_custom_field_filters(
+    filters: list[str], custom_fields: dict[UUID, CustomField]
+) -> dict[str, Any]:
+    """Custom field filters by field ID from `<field_id>:<value>` parameters.
+
+    Values are read by the type of their field (see `_custom_field_filter_value`),
+    so a text value of digits still matches as text.
+
+    Raises:
+        ValueError: If a filter is malformed or not on a field of the project
+    """
+    values: dict[str, Any] = {}
+    for custom_field_filter in filters:
+        field_id, separator, raw_value = custom_field_filter.partition(":")
+        try:
+            field = custom_fields.get(UUID(field_id))
+        except ValueError:
+            raise ValueError(f"Invalid custom field filter: {custom_field_filter}") from None
+        if not separator:
+            raise ValueError(f"Invalid custom field filter: {custom_field_filter}")
+        if field is None:
+            raise ValueError(f"Unknown custom field: {field_id}")
+        values[field_id] = _custom_field_filter_value(field, raw_value)
+    return values
+
+
+def _custom_field_filter_value(field: CustomField, raw_value: str) -> Any:
+    """Value a filter matches, in the shape the field stores.
+
+    Raises:
+        ValueError: If the value is not a number for a number field
+    """
+    if field.type == "number":
+        try:
+            number = float(raw_value)
+        except ValueError:
+            number = math.nan
+        if not math.isfinite(number):
+            raise ValueError(f"Custom field '{field.name}' must be a number")
+        return int(number) if number.is_integer() else number
+    if field.type in {"multi_select", "users"}:
+        if raw_value.startswith("["):
+            try:
+                items = json.loads(raw_value)
+            except ValueError:
+                items = None
+            if isinstance(items, list):
+                return items
+        return [raw_value]
+    return raw_value
+
+
 @router.put("/{issue_id}", response_model=IssueResponse, status_code=status.HTTP_200_OK)
 async def update_issue(
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -19,8 +19,9 @@ from src.domain.entities import User
 from src.domain.repositories import UserRepository
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import get_user_repository
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Languages"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Languages"])
 
 
 # Dependency injection for use cases
@@ -25,8 +25,9 @@ from src.domain.entities import User
 from src.domain.repositories import MacroRepository
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import get_macro_repository
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -0,0 +1,63 @@
+"""Metrics endpoint (Prometheus text exposition format).
+
+The endpoint is internal: it is only served when a `METRICS_TOKEN` is configured,
+and only to clients presenting that token as a bearer token.
+"""
+
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.monitoring import get_metrics_registry
+from src.presentation.middlewares.timing import TimedAPIRoute
+
+router = APIRouter(route_class=TimedAPIRoute)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+scraper_security = HTTPBearer(auto_error=False)
+
+
+async def require_metrics_token(
+    settings: Annotated[Settings, Depends(get_settings)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(scraper_security)],
+) -> None:
+    """Check the request carries the configured metrics token.
+
+    Args:
+        settings: Application settings
+        credentials: Bearer credentials of the request
+
+    Raises:
+        HTTPException: 404 when no metrics token is configured, 401 when the
+            token is missing or wrong
+    """
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)],
+)
+async def metrics() -> PlainTextResponse:
+    """Expose process metrics (request latency histograms, in-flight requests, ...).
+
+    Returns:
+        Metrics of this worker process in Prometheus text format
+    """
+    return PlainTextResponse(get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -4,33 +4,34 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.node import NodeListResponse
+from src.application.services.node_resolver import NodeResolver
 from src.application.use_cases.node import ListNodesUseCase
 from src.domain.entities import User
 from src.domain.repositories import ProjectRepository, SpaceRepository
 from src.domain.services import PermissionService
-from src.infrastructure.database import get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_organization_member
 from src.presentation.dependencies.services import (
+    get_node_resolver,
     get_permission_service,
     get_project_repository,
     get_space_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
 def get_list_nodes_use_case(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    node_resolver: Annotated[NodeResolver, Depends(get_node_resolver)],
 ) -> ListNodesUseCase:
     """Get list nodes use case with dependencies."""
-    return ListNodesUseCase(project_repository, space_repository, session)
+    return ListNodesUseCase(project_repository, space_repository, node_resolver)
 
 
 @router.get(
@@ -20,8 +20,9 @@ from src.domain.entities import User
 from src.domain.repositories import NotificationRepository
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import get_notification_repository
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Notifications"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Notifications"])
 
 
 # Dependency injection for use cases
@@ -72,8 +72,9 @@ from src.presentation.dependencies.services import (
     get_project_repository,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -11,6 +11,7 @@ from src.application.dtos.page_permission import (
     UpdatePagePermissionRequest,
     UpdateSpacePermissionRequest,
 )
+from src.application.services.page_access import PageAccessResolver
 from src.application.use_cases.page_permission import (
     GetPagePermissionsUseCase,
     GetSpacePermissionsUseCase,
@@ -29,14 +30,16 @@ from src.domain.services import PermissionService
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_organization_admin
 from src.presentation.dependencies.services import (
+    get_page_access_resolver,
     get_page_permission_repository,
     get_page_repository,
     get_permission_service,
     get_space_permission_repository,
     get_space_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -55,9 +58,12 @@ def get_update_page_permissions_use_case(
     page_permission_repository: Annotated[
         PagePermissionRepository, Depends(get_page_permission_repository)
     ],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> UpdatePagePermissionsUseCase:
     """Update page permissions use case with dependencies."""
-    return UpdatePagePermissionsUseCase(page_repository, page_permission_repository)
+    return UpdatePagePermissionsUseCase(
+        page_repository, page_permission_repository, page_access_resolver=page_access_resolver
+    )
 
 
 def get_get_space_permissions_use_case(
@@ -75,9 +81,12 @@ def get_update_space_permissions_use_case(
     space_permission_repository: Annotated[
         SpacePermissionRepository, Depends(get_space_permission_repository)
     ],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> UpdateSpacePermissionsUseCase:
     """Update space permissions use case with dependencies."""
-    return UpdateSpacePermissionsUseCase(space_repository, space_permission_repository)
+    return UpdateSpacePermissionsUseCase(
+        space_repository, space_permission_repository, page_access_resolver=page_access_resolver
+    )
 
 
 @router.get(
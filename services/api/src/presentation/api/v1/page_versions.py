@@ -32,8 +32,9 @@ from src.presentation.dependencies.services import (
     get_permission_service,
     get_space_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
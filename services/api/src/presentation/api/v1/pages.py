@@ -3,7 +3,7 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.page import (
@@ -13,6 +13,7 @@ from src.application.dtos.page import (
     PageTreeResponse,
     UpdatePageRequest,
 )
+from src.application.services.page_access import PageAccessResolver
 from src.application.use_cases.page import (
     CreatePageUseCase,
     DeletePageUseCase,
@@ -35,17 +36,21 @@ from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import (
     require_edit_permission,
     require_organization_admin,
-    require_organization_member,
+    require_space_access,
 )
 from src.presentation.dependencies.services import (
+    get_page_access_resolver,
     get_page_repository,
     get_page_version_repository,
     get_permission_service,
+    get_read_page_access_resolver,
+    get_read_page_repository,
     get_space_repository,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -54,9 +59,16 @@ def get_create_page_use_case(
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> CreatePageUseCase:
     """Get create page use case with dependencies."""
-    return CreatePageUseCase(page_repository, space_repository, user_repository, session)
+    return CreatePageUseCase(
+        page_repository,
+        space_repository,
+        user_repository,
+        session,
+        page_access_resolver=page_access_resolver,
+    )
 
 
 def get_page_use_case(
@@ -79,9 +91,15 @@ def get_update_page_use_case(
     page_repository: Annotated[PageRepository, Depends(get_page_repository)],
     page_version_repository: Annotated[PageVersionRepository, Depends(get_page_version_repository)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> UpdatePageUseCase:
     """Get update page use case with dependencies."""
-    return UpdatePageUseCase(page_repository, page_version_repository, session)
+    return UpdatePageUseCase(
+        page_repository,
+        page_version_repository,
+        session,
+        page_access_resolver=page_access_resolver,
+    )
 
 
 def get_delete_page_use_case(
@@ -92,7 +110,7 @@ def get_delete_page_use_case(
 
 
 def get_page_tree_use_case(
-    page_repository: Annotated[PageRepository, Depends(get_page_repository)],
+    page_repository: Annotated[PageRepository, Depends(get_read_page_repository)],
 ) -> GetPageTreeUseCase:
     """Get page tree use case with dependencies."""
     return GetPageTreeUseCase(page_repository)
@@ -105,10 +123,12 @@ async def create_page(
     use_case: Annotated[CreatePageUseCase, Depends(get_create_page_use_case)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> PageResponse:
     """Create a new page.
 
-    Requires space membership (via organization membership).
+    Requires space membership (via organization membership) and edit access to
+    the parent page, or to the space for a root page.
     """
     # Check user has edit permissions
     space = await space_repository.get_by_id(request.space_id)
@@ -116,6 +136,15 @@ async def create_page(
         raise EntityNotFoundException("Space", str(request.space_id))
 
     await require_edit_permission(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
+    can_create = access.can_edit(request.parent_id) if request.parent_id else access.can_edit_space
+    if not can_create:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to create pages here",
+        )
 
     return await use_case.execute(request, str(current_user.id))
 
@@ -128,10 +157,11 @@ async def get_page(
     page_repository: Annotated[PageRepository, Depends(get_page_repository)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
 ) -> PageResponse:
     """Get page by ID.
 
-    Requires space membership (via organization membership).
+    Requires space membership (via organization membership) and read access to the page.
     """
     page = await page_repository.get_by_id(page_id)
 
@@ -143,7 +173,14 @@ async def get_page(
     if space is None:
         raise EntityNotFoundException("Space", str(page.space_id))
 
-    await require_organization_member(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
+    if not access.can_read(page_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this page",
+        )
 
     return await use_case.execute(str(page_id))
 
@@ -155,6 +192,7 @@ async def list_pages(
     use_case: Annotated[ListPagesUseCase, Depends(get_list_pages_use_case)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
     page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of pages per page")] = 20,
     search: Annotated[str | None, Query(description="Search query (title or content)")] = None,
@@ -164,14 +202,17 @@ async def list_pages(
 ) -> PageListResponse:
     """List pages in a space.
 
-    Requires space membership (via organization membership).
+    Requires space membership (via organization membership). Pages the user
+    may not read are left out.
     """
     # Check user is member of the organization
     space = await space_repository.get_by_id(space_id)
     if space is None:
         raise EntityNotFoundException("Space", str(space_id))
 
-    await require_organization_member(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
 
     return await use_case.execute(
         str(space_id),
@@ -179,6 +220,7 @@ async def list_pages(
         limit=limit,
         search=search,
         parent_id=str(parent_id) if parent_id else None,
+        access=access,
     )
 
 
@@ -191,10 +233,11 @@ async def update_page(
     page_repository: Annotated[PageRepository, Depends(get_page_repository)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_page_access_resolver)],
 ) -> PageResponse:
     """Update a page.
 
-    Requires space membership (via organization membership).
+    Requires space membership (via organization membership) and edit access to the page.
     """
     page = await page_repository.get_by_id(page_id)
 
@@ -207,6 +250,14 @@ async def update_page(
         raise EntityNotFoundException("Space", str(page.space_id))
 
     await require_edit_permission(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
+    if not access.can_edit(page_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to edit this page",
+        )
 
     return await use_case.execute(str(page_id), request, str(current_user.id))
 
@@ -252,15 +303,19 @@ async def get_page_tree(
     use_case: Annotated[GetPageTreeUseCase, Depends(get_page_tree_use_case)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
 ) -> PageTreeResponse:
     """Get page tree structure for a space.
 
-    Requires space membership (via organization membership).
+    Requires space membership (via organization membership). Pages the user
+    may not read are left out, with their children.
     """
     space = await space_repository.get_by_id(space_id)
     if space is None:
         raise EntityNotFoundException("Space", str(space_id))
 
-    await require_organization_member(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
 
-    return await use_case.execute(str(space_id))
+    return await use_case.execute(str(space_id), access=access)
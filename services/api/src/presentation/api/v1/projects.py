@@ -61,7 +61,7 @@ from src.domain.repositories import (
     UserRepository,
 )
 from src.domain.services import PermissionService
-from src.infrastructure.database import get_session
+from src.infrastructure.database import get_read_session, get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import (
     require_edit_permission,
@@ -77,8 +77,9 @@ from src.presentation.dependencies.services import (
     get_sprint_repository,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -289,7 +290,7 @@ def get_remove_project_member_use_case(
 def get_get_project_velocity_use_case(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetProjectVelocityUseCase:
     """Get project velocity use case with dependencies."""
     return GetProjectVelocityUseCase(project_repository, sprint_repository, session)
@@ -297,7 +298,7 @@ def get_get_project_velocity_use_case(
 
 def get_get_project_cumulative_flow_use_case(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetProjectCumulativeFlowUseCase:
     """Get project cumulative flow use case with dependencies."""
     return GetProjectCumulativeFlowUseCase(project_repository, session)
@@ -306,7 +307,7 @@ def get_get_project_cumulative_flow_use_case(
 def get_get_project_summary_stats_use_case(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetProjectSummaryStatsUseCase:
     """Get project summary stats use case with dependencies."""
     return GetProjectSummaryStatsUseCase(project_repository, sprint_repository, session)
@@ -4,17 +4,21 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.saved_filter import (
     CreateSavedFilterRequest,
+    SavedFilterIssuesResponse,
     SavedFilterListResponse,
     SavedFilterResponse,
     UpdateSavedFilterRequest,
 )
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.application.use_cases.saved_filter import (
     CreateSavedFilterUseCase,
     DeleteSavedFilterUseCase,
     GetSavedFilterUseCase,
+    ListSavedFilterIssuesUseCase,
     ListSavedFiltersUseCase,
     UpdateSavedFilterUseCase,
 )
@@ -22,15 +26,21 @@ from src.domain.entities import User
 from src.domain.repositories import ProjectRepository
 from src.domain.repositories.saved_filter_repository import SavedFilterRepository
 from src.domain.services import PermissionService
+from src.infrastructure.database import get_read_session
 from src.presentation.dependencies.auth import get_current_active_user
-from src.presentation.dependencies.permissions import require_edit_permission
+from src.presentation.dependencies.permissions import (
+    require_edit_permission,
+    require_organization_member,
+)
 from src.presentation.dependencies.services import (
     get_permission_service,
     get_project_repository,
+    get_saved_filter_count_cache,
     get_saved_filter_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Saved Filters"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Saved Filters"])
 
 
 def get_create_saved_filter_use_case(
@@ -55,6 +65,15 @@ def get_list_saved_filters_use_case(
     return ListSavedFiltersUseCase(saved_filter_repository)
 
 
+def get_list_saved_filter_issues_use_case(
+    saved_filter_repository: Annotated[SavedFilterRepository, Depends(get_saved_filter_repository)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
+) -> ListSavedFilterIssuesUseCase:
+    """Get list saved filter issues use case."""
+    return ListSavedFilterIssuesUseCase(saved_filter_repository, session, count_cache=count_cache)
+
+
 def get_update_saved_filter_use_case(
     saved_filter_repository: Annotated[SavedFilterRepository, Depends(get_saved_filter_repository)],
 ) -> UpdateSavedFilterUseCase:
@@ -125,6 +144,49 @@ async def get_saved_filter(
     return await use_case.execute(filter_id)
 
 
+@router.get(
+    "/saved-filters/{filter_id}/issues",
+    response_model=SavedFilterIssuesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List saved filter issues",
+)
+async def list_saved_filter_issues(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    filter_id: UUID,
+    use_case: Annotated[
+        ListSavedFilterIssuesUseCase, Depends(get_list_saved_filter_issues_use_case)
+    ],
+    saved_filter_repository: Annotated[SavedFilterRepository, Depends(get_saved_filter_repository)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    cursor: Annotated[
+        str | None, Query(description="Cursor of the page (next_cursor of the previous one)")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Issues per page")] = 50,
+) -> SavedFilterIssuesResponse:
+    """List the issues matching a saved filter, newest first.
+
+    Pages are fetched by cursor: pass the `next_cursor` of a page to get the
+    following one. Filters without a project match the issues of every
+    organization the user belongs to.
+    """
+    saved_filter = await saved_filter_repository.get_by_id(filter_id)
+    if saved_filter is None:
+        raise HTTPException(status_code=404, detail="Saved filter not found")
+
+    # Check ownership
+    if saved_filter.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    if saved_filter.project_id:
+        project = await project_repository.get_by_id(saved_filter.project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        await require_organization_member(project.organization_id, current_user, permission_service)
+
+    return await use_case.execute(filter_id, cursor=cursor, limit=limit)
+
+
 @router.get(
     "/saved-filters",
     response_model=SavedFilterListResponse,
@@ -4,25 +4,42 @@ from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.application.dtos.search import SearchResponse
+from src.application.dtos.search import (
+    OrganizationSearchResponse,
+    SearchResponse,
+    TypeaheadResponse,
+)
+from src.application.services.page_access import PageAccess, PageAccessResolver
 from src.application.services.search_query_service import SearchQueryService
+from src.application.services.typeahead_query_service import TypeaheadQueryService
 from src.application.use_cases.search.search_all import SearchAllUseCase
 from src.application.use_cases.search.search_issues import SearchIssuesUseCase
+from src.application.use_cases.search.search_organization import SearchOrganizationUseCase
 from src.application.use_cases.search.search_pages import SearchPagesUseCase
+from src.application.use_cases.search.typeahead import TypeaheadUseCase
 from src.domain.entities import User
 from src.domain.repositories import ProjectRepository, SpaceRepository
 from src.domain.services import PermissionService
 from src.presentation.dependencies.auth import get_current_active_user
-from src.presentation.dependencies.permissions import require_organization_member
+from src.presentation.dependencies.permissions import (
+    require_organization_member,
+    require_organization_page_access,
+    require_space_access,
+)
 from src.presentation.dependencies.services import (
     get_permission_service,
     get_project_repository,
+    get_query_session_factory,
+    get_read_page_access_resolver,
     get_search_query_service,
     get_space_repository,
+    get_typeahead_query_service,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Search"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Search"])
 
 
 def get_search_all_use_case(
@@ -31,6 +48,21 @@ def get_search_all_use_case(
     return SearchAllUseCase(search_service)
 
 
+def get_search_organization_use_case(
+    search_service: Annotated[SearchQueryService, Depends(get_search_query_service)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession] | None, Depends(get_query_session_factory)
+    ],
+) -> SearchOrganizationUseCase:
+    return SearchOrganizationUseCase(search_service, session_factory=session_factory)
+
+
+def get_typeahead_use_case(
+    typeahead_service: Annotated[TypeaheadQueryService, Depends(get_typeahead_query_service)],
+) -> TypeaheadUseCase:
+    return TypeaheadUseCase(typeahead_service)
+
+
 def get_search_issues_use_case(
     search_service: Annotated[SearchQueryService, Depends(get_search_query_service)],
 ) -> SearchIssuesUseCase:
@@ -50,6 +82,7 @@ async def unified_search(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
     query: Annotated[str, Query(..., description="Search term")],
     type: Annotated[Literal["all", "issues", "pages"], Query()] = "all",
     project_id: Annotated[UUID | None, Query(description="Project ID filter")] = None,
@@ -64,8 +97,9 @@ async def unified_search(
     ] = None,
     priority: Annotated[str | None, Query(description="Filter by priority")] = None,
 ) -> SearchResponse:
-    """Unified search across issues and pages."""
+    """Unified search across issues and pages (pages the user may not read are left out)."""
     # Validate permissions
+    access: PageAccess | None = None
     if type in ("all", "issues"):
         if project_id is None:
             raise ValueError("project_id is required when searching issues")
@@ -80,7 +114,9 @@ async def unified_search(
         space = await space_repository.get_by_id(space_id)
         if space is None:
             raise ValueError("Space not found")
-        await require_organization_member(space.organization_id, current_user, permission_service)
+        access = await require_space_access(
+            space, current_user, permission_service, page_access_resolver
+        )
 
     return await use_case.execute(
         query=query,
@@ -94,6 +130,70 @@ async def unified_search(
         status=status,
         type=issue_type,
         priority=priority,
+        access=access,
+    )
+
+
+@router.get(
+    "/organizations/{organization_id}/search",
+    response_model=OrganizationSearchResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def search_organization(
+    organization_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[SearchOrganizationUseCase, Depends(get_search_organization_use_case)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
+    query: Annotated[str, Query(..., description="Search term")],
+    type: Annotated[Literal["all", "issues", "pages"], Query()] = "all",
+    page: Annotated[
+        int,
+        Query(ge=1, le=SearchOrganizationUseCase.MAX_RESULTS, description="Page number (1-based)"),
+    ] = 1,
+    limit: Annotated[int, Query(ge=1, le=100, description="Number of items per page")] = 20,
+) -> OrganizationSearchResponse:
+    """Search issues and pages across every project and space of an organization.
+
+    Pages the user may not read are left out. Hits are ranked by full-text
+    relevance, with the number of hits per type, project and space.
+    """
+    page_access = await require_organization_page_access(
+        organization_id, current_user, permission_service, page_access_resolver
+    )
+
+    return await use_case.execute(
+        organization_id=organization_id,
+        query=query,
+        search_type=type,
+        page=page,
+        limit=limit,
+        page_access=page_access,
+    )
+
+
+@router.get(
+    "/organizations/{organization_id}/typeahead",
+    response_model=TypeaheadResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def typeahead(
+    organization_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[TypeaheadUseCase, Depends(get_typeahead_use_case)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    query: Annotated[str, Query(..., description="Typed term (title, name or PROJ-123 key)")],
+    limit: Annotated[int, Query(ge=1, le=20, description="Number of suggestions")] = 10,
+) -> TypeaheadResponse:
+    """Suggest issues, projects and members of an organization while typing.
+
+    Lighter than the search: titles and names are matched by prefix or
+    substring, issues and projects the user recently worked on come first.
+    """
+    await require_organization_member(organization_id, current_user, permission_service)
+
+    return await use_case.execute(
+        organization_id=organization_id, user_id=current_user.id, query=query, limit=limit
     )
 
 
@@ -149,16 +249,21 @@ async def search_pages(
     use_case: Annotated[SearchPagesUseCase, Depends(get_search_pages_use_case)],
     space_repository: Annotated[SpaceRepository, Depends(get_space_repository)],
     permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
     space_id: Annotated[UUID, Query(..., description="Space ID")],
     query: Annotated[str, Query(..., description="Search term")],
     page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of items per page")] = 20,
 ) -> SearchResponse:
-    """Search pages within a space."""
+    """Search pages within a space (pages the user may not read are left out)."""
     space = await space_repository.get_by_id(space_id)
     if space is None:
         raise ValueError("Space not found")
 
-    await require_organization_member(space.organization_id, current_user, permission_service)
+    access = await require_space_access(
+        space, current_user, permission_service, page_access_resolver
+    )
 
-    return await use_case.execute(space_id=space_id, query=query, page=page, limit=limit)
+    return await use_case.execute(
+        space_id=space_id, query=query, page=page, limit=limit, access=access
+    )
@@ -44,8 +44,9 @@ from src.presentation.dependencies.services import (
     get_user_repository,
     get_whiteboard_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
 
 
 # Dependency injection for use cases
@@ -22,6 +22,7 @@ from src.application.dtos.sprint_metrics import (
     SprintMetricsResponse,
 )
 from src.application.dtos.sprint_stats import BurndownStatsResponse, IssueStatsResponse
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.application.use_cases.sprint import (
     AddIssueToSprintUseCase,
     CompleteSprintUseCase,
@@ -39,20 +40,25 @@ from src.application.use_cases.sprint import (
 from src.domain.entities import User
 from src.domain.exceptions import ConflictException, EntityNotFoundException
 from src.domain.repositories import (
+    IssueActivityRepository,
     IssueRepository,
     ProjectRepository,
     SprintRepository,
 )
 from src.domain.value_objects.sprint_status import SprintStatus
-from src.infrastructure.database import get_session
+from src.infrastructure.database import get_read_session, get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import (
+    get_issue_activity_repository,
     get_issue_repository,
     get_project_repository,
+    get_read_issue_repository,
+    get_saved_filter_count_cache,
     get_sprint_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Sprints"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Sprints"])
 
 
 # Dependency injection for use cases
@@ -96,16 +102,18 @@ def get_delete_sprint_use_case(
 def get_add_issue_to_sprint_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> AddIssueToSprintUseCase:
     """Get add issue to sprint use case with dependencies."""
-    return AddIssueToSprintUseCase(sprint_repository, issue_repository)
+    return AddIssueToSprintUseCase(sprint_repository, issue_repository, filter_count_cache)
 
 
 def get_remove_issue_from_sprint_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> RemoveIssueFromSprintUseCase:
     """Get remove issue from sprint use case with dependencies."""
-    return RemoveIssueFromSprintUseCase(sprint_repository)
+    return RemoveIssueFromSprintUseCase(sprint_repository, filter_count_cache)
 
 
 def get_reorder_sprint_issues_use_case(
@@ -117,8 +125,8 @@ def get_reorder_sprint_issues_use_case(
 
 def get_get_sprint_metrics_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
-    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    issue_repository: Annotated[IssueRepository, Depends(get_read_issue_repository)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetSprintMetricsUseCase:
     """Get sprint metrics use case with dependencies."""
     return GetSprintMetricsUseCase(sprint_repository, issue_repository, session)
@@ -126,8 +134,8 @@ def get_get_sprint_metrics_use_case(
 
 def get_get_sprint_burndown_stats_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
-    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    issue_repository: Annotated[IssueRepository, Depends(get_read_issue_repository)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetSprintBurndownStatsUseCase:
     """Get sprint burndown stats use case with dependencies."""
     return GetSprintBurndownStatsUseCase(sprint_repository, issue_repository, session)
@@ -135,8 +143,8 @@ def get_get_sprint_burndown_stats_use_case(
 
 def get_get_sprint_issue_stats_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
-    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    issue_repository: Annotated[IssueRepository, Depends(get_read_issue_repository)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> GetSprintIssueStatsUseCase:
     """Get sprint issue stats use case with dependencies."""
     return GetSprintIssueStatsUseCase(sprint_repository, issue_repository, session)
@@ -146,9 +154,17 @@ def get_complete_sprint_use_case(
     sprint_repository: Annotated[SprintRepository, Depends(get_sprint_repository)],
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    activity_repository: Annotated[IssueActivityRepository, Depends(get_issue_activity_repository)],
+    filter_count_cache: Annotated[SavedFilterCountCache, Depends(get_saved_filter_count_cache)],
 ) -> CompleteSprintUseCase:
     """Get complete sprint use case with dependencies."""
-    return CompleteSprintUseCase(sprint_repository, issue_repository, session)
+    return CompleteSprintUseCase(
+        sprint_repository,
+        issue_repository,
+        session,
+        activity_repository=activity_repository,
+        filter_count_cache=filter_count_cache,
+    )
 
 
 @router.post(
@@ -584,7 +600,10 @@ async def get_sprint_issue_stats(
     response_model=CompleteSprintResponse,
     status_code=status.HTTP_200_OK,
     summary="Complete a sprint",
-    description="Mark a sprint as completed and optionally move incomplete issues to backlog",
+    description=(
+        "Mark a sprint as completed and optionally move incomplete issues to the backlog "
+        "or to another sprint"
+    ),
 )
 async def complete_sprint(
     sprint_id: UUID,
@@ -607,7 +626,7 @@ async def complete_sprint(
         HTTPException: If sprint not found
     """
     try:
-        return await use_case.execute(sprint_id, request)
+        return await use_case.execute(sprint_id, request, user_id=current_user.id)
     except EntityNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
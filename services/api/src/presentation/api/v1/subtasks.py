@@ -5,27 +5,39 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from src.application.dtos.issue import IssueListItemResponse
-from src.application.use_cases.subtask import ListSubtasksUseCase
+from src.application.dtos.issue import IssueListItemResponse, IssueRollupResponse
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.use_cases.subtask import GetIssueRollupUseCase, ListSubtasksUseCase
 from src.domain.entities import User
 from src.domain.repositories import IssueRepository, ProjectRepository
 from src.domain.services import PermissionService
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_edit_permission
 from src.presentation.dependencies.services import (
+    get_issue_hierarchy_service,
     get_issue_repository,
     get_permission_service,
     get_project_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Subtasks"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Subtasks"])
 
 
 def get_list_subtasks_use_case(
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
 ) -> ListSubtasksUseCase:
     """Get list subtasks use case."""
-    return ListSubtasksUseCase(issue_repository)
+    return ListSubtasksUseCase(issue_repository, project_repository)
+
+
+def get_get_issue_rollup_use_case(
+    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+) -> GetIssueRollupUseCase:
+    """Get issue rollup use case."""
+    return GetIssueRollupUseCase(issue_repository, hierarchy_service)
 
 
 @router.get(
@@ -56,3 +68,33 @@ async def list_subtasks(
     )
 
     return await use_case.execute(issue_id)
+
+
+@router.get(
+    "/issues/{issue_id}/rollup",
+    response_model=IssueRollupResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get issue rollup",
+)
+async def get_issue_rollup(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    issue_id: UUID,
+    use_case: Annotated[GetIssueRollupUseCase, Depends(get_get_issue_rollup_use_case)],
+    issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+) -> IssueRollupResponse:
+    """Get the progress of an issue's descendants (story points, statuses, hours)."""
+    issue = await issue_repository.get_by_id(issue_id)
+    if issue is None:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    project = await project_repository.get_by_id(issue.project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    await require_edit_permission(
+        project.organization_id, current_user, permission_service, project_id=project.id
+    )
+
+    return await use_case.execute(issue_id)
@@ -1,21 +1,27 @@
 """Time entry management API endpoints."""
 
+from datetime import date
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.application.dtos.time_entry import (
     TimeEntryListResponse,
     TimeEntryRequest,
     TimeEntryResponse,
+    TimesheetResponse,
     TimeSummaryResponse,
 )
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.timesheet_service import TimesheetService
 from src.application.use_cases.time_entry import (
     CreateTimeEntryUseCase,
     DeleteTimeEntryUseCase,
+    GetProjectTimesheetUseCase,
     GetTimeEntryUseCase,
     GetTimeSummaryUseCase,
+    GetUserTimesheetUseCase,
     ListTimeEntriesUseCase,
     UpdateTimeEntryUseCase,
 )
@@ -26,21 +32,32 @@ from src.domain.services import PermissionService
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_edit_permission
 from src.presentation.dependencies.services import (
+    get_issue_hierarchy_service,
     get_issue_repository,
     get_permission_service,
     get_project_repository,
+    get_read_timesheet_service,
     get_time_entry_repository,
+    get_timesheet_service,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Time Entries"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Time Entries"])
 
 
 def get_create_time_entry_use_case(
     time_entry_repository: Annotated[TimeEntryRepository, Depends(get_time_entry_repository)],
     issue_repository: Annotated[IssueRepository, Depends(get_issue_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    timesheet_service: Annotated[TimesheetService, Depends(get_timesheet_service)],
 ) -> CreateTimeEntryUseCase:
     """Get create time entry use case."""
-    return CreateTimeEntryUseCase(time_entry_repository, issue_repository)
+    return CreateTimeEntryUseCase(
+        time_entry_repository,
+        issue_repository,
+        hierarchy_service=hierarchy_service,
+        timesheet_service=timesheet_service,
+    )
 
 
 def get_get_time_entry_use_case(
@@ -59,16 +76,28 @@ def get_list_time_entries_use_case(
 
 def get_update_time_entry_use_case(
     time_entry_repository: Annotated[TimeEntryRepository, Depends(get_time_entry_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    timesheet_service: Annotated[TimesheetService, Depends(get_timesheet_service)],
 ) -> UpdateTimeEntryUseCase:
     """Get update time entry use case."""
-    return UpdateTimeEntryUseCase(time_entry_repository)
+    return UpdateTimeEntryUseCase(
+        time_entry_repository,
+        hierarchy_service=hierarchy_service,
+        timesheet_service=timesheet_service,
+    )
 
 
 def get_delete_time_entry_use_case(
     time_entry_repository: Annotated[TimeEntryRepository, Depends(get_time_entry_repository)],
+    hierarchy_service: Annotated[IssueHierarchyService, Depends(get_issue_hierarchy_service)],
+    timesheet_service: Annotated[TimesheetService, Depends(get_timesheet_service)],
 ) -> DeleteTimeEntryUseCase:
     """Get delete time entry use case."""
-    return DeleteTimeEntryUseCase(time_entry_repository)
+    return DeleteTimeEntryUseCase(
+        time_entry_repository,
+        hierarchy_service=hierarchy_service,
+        timesheet_service=timesheet_service,
+    )
 
 
 def get_get_time_summary_use_case(
@@ -78,6 +107,20 @@ def get_get_time_summary_use_case(
     return GetTimeSummaryUseCase(time_entry_repository)
 
 
+def get_get_user_timesheet_use_case(
+    timesheet_service: Annotated[TimesheetService, Depends(get_read_timesheet_service)],
+) -> GetUserTimesheetUseCase:
+    """Get user timesheet use case."""
+    return GetUserTimesheetUseCase(timesheet_service)
+
+
+def get_get_project_timesheet_use_case(
+    timesheet_service: Annotated[TimesheetService, Depends(get_read_timesheet_service)],
+) -> GetProjectTimesheetUseCase:
+    """Get project timesheet use case."""
+    return GetProjectTimesheetUseCase(timesheet_service)
+
+
 @router.post(
     "/issues/{issue_id}/time-entries",
     response_model=TimeEntryResponse,
@@ -278,3 +321,65 @@ async def get_time_summary(
     )
 
     return await use_case.execute(issue_id)
+
+
+@router.get(
+    "/organizations/{organization_id}/members/{user_id}/timesheet",
+    response_model=TimesheetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get user timesheet",
+)
+async def get_user_timesheet(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    organization_id: UUID,
+    user_id: UUID,
+    use_case: Annotated[GetUserTimesheetUseCase, Depends(get_get_user_timesheet_use_case)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    week: Annotated[
+        date | None, Query(description="Any day of the week (default: current week)")
+    ] = None,
+) -> TimesheetResponse:
+    """Get the hours of a user by project and day over a week (Monday to Sunday).
+
+    Members get their own timesheet; organization admins get anyone's.
+    """
+    if user_id == current_user.id:
+        allowed = await permission_service.can_access_organization(current_user, organization_id)
+    else:
+        allowed = await permission_service.can_manage_organization(current_user, organization_id)
+
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this timesheet",
+        )
+
+    return await use_case.execute(organization_id, user_id, week)
+
+
+@router.get(
+    "/projects/{project_id}/timesheet",
+    response_model=TimesheetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get project timesheet",
+)
+async def get_project_timesheet(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    project_id: UUID,
+    use_case: Annotated[GetProjectTimesheetUseCase, Depends(get_get_project_timesheet_use_case)],
+    project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    month: Annotated[
+        date | None, Query(description="Any day of the month (default: current month)")
+    ] = None,
+) -> TimesheetResponse:
+    """Get the hours logged in a project by user and day over a month."""
+    project = await project_repository.get_by_id(project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    await require_edit_permission(
+        project.organization_id, current_user, permission_service, project_id=project.id
+    )
+
+    return await use_case.execute(project_id, month)
@@ -1,8 +1,11 @@
 """User management API endpoints."""
 
+from concurrent.futures import Executor
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, Query, UploadFile, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.preferences import (
@@ -19,6 +22,7 @@ from src.application.dtos.user import (
 from src.application.use_cases.user import (
     DeactivateUserUseCase,
     DeleteAvatarUseCase,
+    GetAvatarUseCase,
     GetUserPreferencesUseCase,
     GetUserProfileUseCase,
     ListUsersUseCase,
@@ -36,13 +40,18 @@ from src.infrastructure.config import get_settings
 from src.infrastructure.database import get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.services import (
+    get_image_executor,
     get_password_service,
     get_permission_service,
     get_storage_service,
     get_user_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedAPIRoute)
+
+# Avatar URLs are stable across uploads: revalidate (ETag) rather than cache forever
+AVATAR_CACHE_CONTROL = "private, max-age=3600"
 
 
 # Dependency injection for use cases
@@ -79,9 +88,19 @@ def get_update_user_password_use_case(
 def get_upload_avatar_use_case(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    executor: Annotated[Executor, Depends(get_image_executor)],
 ) -> UploadAvatarUseCase:
     """Get upload avatar use case with dependencies."""
-    return UploadAvatarUseCase(user_repository, storage_service)
+    return UploadAvatarUseCase(user_repository, storage_service, executor)
+
+
+def get_get_avatar_use_case(
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    executor: Annotated[Executor, Depends(get_image_executor)],
+) -> GetAvatarUseCase:
+    """Get avatar use case with dependencies."""
+    return GetAvatarUseCase(user_repository, storage_service, executor)
 
 
 def get_delete_avatar_use_case(
@@ -316,6 +335,47 @@ async def delete_avatar(
     return await use_case.execute(str(current_user.id))
 
 
+@router.get(
+    "/{user_id}/avatar",
+    status_code=status.HTTP_200_OK,
+)
+async def get_avatar(
+    user_id: UUID,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    use_case: Annotated[GetAvatarUseCase, Depends(get_get_avatar_use_case)],
+    size: Annotated[str, Query(description="Avatar size (64x64, 128x128 or 256x256)")] = "128x128",
+    accept: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get a user avatar in the requested size.
+
+    Served as AVIF or WEBP when the Accept header allows it, in the uploaded
+    format otherwise. Sizes are generated on first request and cached in storage.
+
+    Args:
+        user_id: User whose avatar is requested
+        current_user: Current authenticated user (from dependency)
+        use_case: Get avatar use case
+        size: Avatar size
+        accept: Accept header (format negotiation)
+        if_none_match: ETag of the client's cached copy
+
+    Returns:
+        Avatar image (304 if the client's copy is current)
+
+    Raises:
+        HTTPException: If user not found, has no avatar, or size is not allowed
+    """
+    content, mime_type, etag = await use_case.execute(
+        str(user_id), size, accept=accept, if_none_match=if_none_match
+    )
+    headers = {"Cache-Control": AVATAR_CACHE_CONTROL, "ETag": etag, "Vary": "Accept"}
+
+    if content is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type=mime_type, headers=headers)
+
+
 @router.get(
     "/me/preferences",
     response_model=UserPreferencesResponse,
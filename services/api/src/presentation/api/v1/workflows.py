@@ -4,6 +4,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.workflow import (
     CreateWorkflowRequest,
@@ -13,6 +14,7 @@ from src.application.dtos.workflow import (
     WorkflowListResponse,
     WorkflowResponse,
 )
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.workflow import (
     CreateWorkflowUseCase,
     DeleteWorkflowUseCase,
@@ -24,24 +26,31 @@ from src.application.use_cases.workflow import (
 from src.domain.entities import User
 from src.domain.repositories import ProjectRepository, WorkflowRepository
 from src.domain.services import PermissionService
+from src.infrastructure.database import get_session
 from src.presentation.dependencies.auth import get_current_active_user
 from src.presentation.dependencies.permissions import require_edit_permission
 from src.presentation.dependencies.services import (
     get_permission_service,
     get_project_repository,
+    get_workflow_cache,
     get_workflow_repository,
 )
+from src.presentation.middlewares.timing import TimedAPIRoute
 
-router = APIRouter(tags=["Workflows"])
+router = APIRouter(route_class=TimedAPIRoute, tags=["Workflows"])
 
 
 # Dependency injection for use cases
 def get_create_workflow_use_case(
     workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> CreateWorkflowUseCase:
     """Get create workflow use case with dependencies."""
-    return CreateWorkflowUseCase(workflow_repository, project_repository)
+    return CreateWorkflowUseCase(
+        workflow_repository, project_repository, workflow_cache=workflow_cache, session=session
+    )
 
 
 def get_get_workflow_use_case(
@@ -60,23 +69,32 @@ def get_list_workflows_use_case(
 
 def get_update_workflow_use_case(
     workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> UpdateWorkflowUseCase:
     """Get update workflow use case with dependencies."""
-    return UpdateWorkflowUseCase(workflow_repository)
+    return UpdateWorkflowUseCase(
+        workflow_repository, workflow_cache=workflow_cache, session=session
+    )
 
 
 def get_delete_workflow_use_case(
     workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> DeleteWorkflowUseCase:
     """Get delete workflow use case with dependencies."""
-    return DeleteWorkflowUseCase(workflow_repository)
+    return DeleteWorkflowUseCase(
+        workflow_repository, workflow_cache=workflow_cache, session=session
+    )
 
 
 def get_validate_transition_use_case(
     workflow_repository: Annotated[WorkflowRepository, Depends(get_workflow_repository)],
+    workflow_cache: Annotated[WorkflowCache, Depends(get_workflow_cache)],
 ) -> ValidateTransitionUseCase:
     """Get validate transition use case with dependencies."""
-    return ValidateTransitionUseCase(workflow_repository)
+    return ValidateTransitionUseCase(workflow_repository, workflow_cache=workflow_cache)
 
 
 @router.post(
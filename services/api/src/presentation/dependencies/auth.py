@@ -9,6 +9,8 @@ from src.application.interfaces import TokenService
 from src.domain.entities import User
 from src.domain.exceptions import AuthenticationException
 from src.domain.repositories import UserRepository
+from src.infrastructure.database import set_session_user
+from src.infrastructure.monitoring import PHASE_AUTH, timed_phase
 from src.presentation.dependencies.services import get_token_service, get_user_repository
 
 # HTTP Bearer scheme for JWT authentication
@@ -40,16 +42,17 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    try:
-        user_id = token_service.get_user_id_from_token(credentials.credentials)
-    except AuthenticationException as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from e
+    with timed_phase(PHASE_AUTH):
+        try:
+            user_id = token_service.get_user_id_from_token(credentials.credentials)
+        except AuthenticationException as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(e),
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from e
 
-    user = await user_repository.get_by_id(user_id)
+        user = await user_repository.get_by_id(user_id)
 
     if user is None:
         raise HTTPException(
@@ -58,6 +61,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Read-your-writes routing of the read-only sessions
+    set_session_user(user.id)
+
     return user
 
 
@@ -112,11 +118,12 @@ async def get_optional_user(
     if not credentials:
         return None
 
-    try:
-        user_id = token_service.get_user_id_from_token(credentials.credentials)
-        return await user_repository.get_by_id(user_id)
-    except AuthenticationException:
-        return None
+    with timed_phase(PHASE_AUTH):
+        try:
+            user_id = token_service.get_user_id_from_token(credentials.credentials)
+            return await user_repository.get_by_id(user_id)
+        except AuthenticationException:
+            return None
 
 
 # Type aliases for cleaner dependency injection
@@ -5,11 +5,15 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 
-from src.domain.entities import User
+from src.application.services.page_access import UNRESTRICTED, PageAccess, PageAccessResolver
+from src.domain.entities import Space, User
 from src.domain.services import PermissionService
 from src.domain.value_objects import Role
 from src.presentation.dependencies.auth import CurrentActiveUser
-from src.presentation.dependencies.services import get_permission_service
+from src.presentation.dependencies.services import (
+    get_permission_service,
+    get_read_page_access_resolver,
+)
 
 
 async def require_organization_member(
@@ -70,6 +74,84 @@ async def require_organization_admin(
     return current_user
 
 
+async def require_space_access(
+    space: Space,
+    current_user: CurrentActiveUser,
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
+) -> PageAccess:
+    """Require user to have access to the space, and resolve their page permissions.
+
+    Organization admins are not restricted by page or space grants.
+
+    Args:
+        space: Space to check
+        current_user: Current authenticated user
+        permission_service: Permission service instance
+        page_access_resolver: Resolves the page permissions of the user
+
+    Returns:
+        Pages of the space the user may read and edit
+
+    Raises:
+        HTTPException: If user is not a member of the organization or cannot read the space
+    """
+    role = await permission_service.get_organization_role(current_user.id, space.organization_id)
+
+    if not role:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a member of this organization",
+        )
+    if role == Role.ADMIN:
+        return UNRESTRICTED
+
+    access = await page_access_resolver.resolve(space.id, current_user.id)
+
+    if not access.can_read_space:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this space",
+        )
+
+    return access
+
+
+async def require_organization_page_access(
+    organization_id: UUID,
+    current_user: CurrentActiveUser,
+    permission_service: Annotated[PermissionService, Depends(get_permission_service)],
+    page_access_resolver: Annotated[PageAccessResolver, Depends(get_read_page_access_resolver)],
+) -> dict[UUID, PageAccess]:
+    """Require user to be a member of the organization, and resolve their page permissions.
+
+    Organization admins are not restricted by page or space grants.
+
+    Args:
+        organization_id: Organization UUID to check
+        current_user: Current authenticated user
+        permission_service: Permission service instance
+        page_access_resolver: Resolves the page permissions of the user
+
+    Returns:
+        Page access of the user by space UUID, for the spaces with grants only
+
+    Raises:
+        HTTPException: If user is not a member of the organization
+    """
+    role = await permission_service.get_organization_role(current_user.id, organization_id)
+
+    if not role:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a member of this organization",
+        )
+    if role == Role.ADMIN:
+        return {}
+
+    return await page_access_resolver.resolve_restricted(organization_id, current_user.id)
+
+
 async def require_project_access(
     project_id: UUID,
     current_user: CurrentActiveUser,
@@ -1,14 +1,32 @@
 """Service dependencies for FastAPI dependency injection."""
 
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
 from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.application.interfaces import TokenService
+from src.application.interfaces import (
+    AttachmentPreviewService,
+    CacheService,
+    EventPublisher,
+    TokenService,
+)
+from src.application.services.event_bus import EventHandlerRegistry
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.application.services.node_resolver import NodeResolver
+from src.application.services.notification_event_handler import NotificationEventHandler
+from src.application.services.page_access import PageAccessResolver
 from src.application.services.permission_service import DatabasePermissionService
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.application.services.search_query_service import SearchQueryService
+from src.application.services.timesheet_service import TimesheetService
+from src.application.services.typeahead_query_service import TypeaheadQueryService
+from src.application.services.workflow_cache import WorkflowCache
+from src.domain.events import CommentCreated, IssueAssigned, IssueStatusChanged
 from src.domain.repositories import (
     AttachmentRepository,
     BoardRepository,
@@ -34,19 +52,29 @@ from src.domain.repositories import (
     WhiteboardRepository,
     WorkflowRepository,
 )
-from src.domain.repositories.custom_field_repository import CustomFieldRepository
+from src.domain.repositories.custom_field_repository import (
+    CustomFieldRepository,
+    CustomFieldValueRepository,
+)
 from src.domain.repositories.dashboard_repository import DashboardRepository
 from src.domain.repositories.issue_link_repository import IssueLinkRepository
 from src.domain.repositories.label_repository import LabelRepository
 from src.domain.repositories.saved_filter_repository import SavedFilterRepository
 from src.domain.repositories.time_entry_repository import TimeEntryRepository
 from src.domain.services import PasswordService, PermissionService, StorageService
-from src.infrastructure.database import get_session
+from src.infrastructure.config import get_settings
+from src.infrastructure.database import (
+    get_read_session,
+    get_read_session_factory,
+    get_session,
+    get_session_factory,
+)
 from src.infrastructure.database.repositories import (
     SQLAlchemyAttachmentRepository,
     SQLAlchemyBoardRepository,
     SQLAlchemyCommentRepository,
     SQLAlchemyCustomFieldRepository,
+    SQLAlchemyCustomFieldValueRepository,
     SQLAlchemyDashboardRepository,
     SQLAlchemyFavoriteRepository,
     SQLAlchemyFolderRepository,
@@ -74,7 +102,11 @@ from src.infrastructure.database.repositories import (
     SQLAlchemyWorkflowRepository,
 )
 from src.infrastructure.security import BcryptPasswordService, JWTTokenService
+from src.infrastructure.services.attachment_preview_service import WorkerPoolPreviewService
 from src.infrastructure.services.local_storage_service import LocalStorageService
+from src.infrastructure.services.maintenance import MaintenanceScheduler, build_maintenance_jobs
+from src.infrastructure.services.memory_cache_service import InMemoryCacheService
+from src.infrastructure.services.outbox import OutboxDispatcher, OutboxEventPublisher
 
 
 @lru_cache
@@ -159,6 +191,20 @@ async def get_issue_repository(
     return SQLAlchemyIssueRepository(session)
 
 
+async def get_read_issue_repository(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> IssueRepository:
+    """Get issue repository instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        SQLAlchemy implementation of IssueRepository
+    """
+    return SQLAlchemyIssueRepository(session)
+
+
 async def get_issue_activity_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> IssueActivityRepository:
@@ -229,6 +275,20 @@ async def get_page_repository(
     return SQLAlchemyPageRepository(session)
 
 
+async def get_read_page_repository(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> PageRepository:
+    """Get page repository instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        SQLAlchemy implementation of PageRepository
+    """
+    return SQLAlchemyPageRepository(session)
+
+
 async def get_page_version_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> PageVersionRepository:
@@ -383,6 +443,48 @@ async def get_custom_field_repository(
     return SQLAlchemyCustomFieldRepository(session)
 
 
+async def get_read_custom_field_repository(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> CustomFieldRepository:
+    """Get custom field repository instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        SQLAlchemy implementation of CustomFieldRepository
+    """
+    return SQLAlchemyCustomFieldRepository(session)
+
+
+async def get_custom_field_value_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> CustomFieldValueRepository:
+    """Get custom field value repository instance with database session.
+
+    Args:
+        session: Async database session from dependency injection
+
+    Returns:
+        SQLAlchemy implementation of CustomFieldValueRepository
+    """
+    return SQLAlchemyCustomFieldValueRepository(session)
+
+
+async def get_read_custom_field_value_repository(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> CustomFieldValueRepository:
+    """Get custom field value repository instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        SQLAlchemy implementation of CustomFieldValueRepository
+    """
+    return SQLAlchemyCustomFieldValueRepository(session)
+
+
 async def get_time_entry_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> TimeEntryRepository:
@@ -482,13 +584,21 @@ async def get_favorite_repository(
 
 
 async def get_search_query_service(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> SearchQueryService:
     """Get search query service (issues/pages)."""
 
     return SearchQueryService(session)
 
 
+async def get_typeahead_query_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> TypeaheadQueryService:
+    """Get typeahead query service (issues/projects/users)."""
+
+    return TypeaheadQueryService(session)
+
+
 async def get_permission_service(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> PermissionService:
@@ -503,6 +613,94 @@ async def get_permission_service(
     return DatabasePermissionService(session)
 
 
+async def get_issue_hierarchy_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> IssueHierarchyService:
+    """Get issue hierarchy service instance with database session.
+
+    Args:
+        session: Async database session from dependency injection
+
+    Returns:
+        IssueHierarchyService instance
+    """
+    return IssueHierarchyService(session)
+
+
+async def get_timesheet_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> TimesheetService:
+    """Get timesheet service instance with database session.
+
+    Args:
+        session: Async database session from dependency injection
+
+    Returns:
+        TimesheetService instance
+    """
+    return TimesheetService(session)
+
+
+async def get_read_timesheet_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> TimesheetService:
+    """Get timesheet service instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        TimesheetService instance
+    """
+    return TimesheetService(session)
+
+
+async def get_node_resolver(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> NodeResolver:
+    """Get node resolver instance with a read-only database session.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        NodeResolver instance
+    """
+    return NodeResolver(session)
+
+
+async def get_page_access_resolver(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> PageAccessResolver:
+    """Get page access resolver instance with database session.
+
+    Args:
+        session: Async database session from dependency injection
+
+    Returns:
+        PageAccessResolver instance backed by the cache service
+    """
+    return PageAccessResolver(
+        session, get_cache_service(), ttl_seconds=get_settings().page_access_cache_ttl_seconds
+    )
+
+
+async def get_read_page_access_resolver(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> PageAccessResolver:
+    """Get page access resolver instance for read-only use cases.
+
+    Args:
+        session: Read-only database session (replica when available)
+
+    Returns:
+        PageAccessResolver instance backed by the cache service
+    """
+    return PageAccessResolver(
+        session, get_cache_service(), ttl_seconds=get_settings().page_access_cache_ttl_seconds
+    )
+
+
 @lru_cache
 def get_storage_service() -> StorageService:
     """Get storage service instance (singleton).
@@ -511,3 +709,188 @@ def get_storage_service() -> StorageService:
         LocalStorageService instance
     """
     return LocalStorageService()
+
+
+@lru_cache
+def get_cache_service() -> CacheService:
+    """Get cache service instance (singleton).
+
+    Returns:
+        InMemoryCacheService instance (one cache per worker process)
+    """
+    return InMemoryCacheService()
+
+
+def get_saved_filter_count_cache(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> SavedFilterCountCache:
+    """Get saved filter count cache for the request.
+
+    Args:
+        session: Session of the request (invalidations wait for its commit)
+
+    Returns:
+        SavedFilterCountCache instance backed by the cache service
+    """
+    return SavedFilterCountCache(
+        get_cache_service(),
+        ttl_seconds=get_settings().saved_filter_count_cache_ttl_seconds,
+        session=session,
+    )
+
+
+@lru_cache
+def get_workflow_cache() -> WorkflowCache:
+    """Get workflow cache instance (singleton).
+
+    Returns:
+        WorkflowCache instance (one cache per worker process)
+    """
+    return WorkflowCache(ttl_seconds=get_settings().workflow_cache_ttl_seconds)
+
+
+@lru_cache
+def get_image_executor() -> Executor:
+    """Get the pool image processing runs in (singleton).
+
+    Returns:
+        Process pool (spawned workers, the app process is multi-threaded), or a
+        thread pool when image_worker_processes is 0
+    """
+    settings = get_settings()
+    if settings.image_worker_processes <= 0:
+        return ThreadPoolExecutor(max_workers=2, thread_name_prefix="image")
+    return ProcessPoolExecutor(
+        max_workers=settings.image_worker_processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+@lru_cache
+def get_attachment_preview_service() -> AttachmentPreviewService | None:
+    """Get attachment preview service instance (singleton).
+
+    Returns:
+        WorkerPoolPreviewService instance, or None to skip thumbnail generation
+    """
+    return WorkerPoolPreviewService(
+        get_storage_service(),
+        get_session_factory(),
+        get_image_executor(),
+        max_size=get_settings().attachment_thumbnail_size,
+    )
+
+
+def get_query_session_factory() -> async_sessionmaker[AsyncSession] | None:
+    """Get the factory of sessions for read queries run concurrently.
+
+    Returns:
+        Session factory (reading replicas when available), or None to run every
+        query on the request session
+    """
+    return get_read_session_factory()
+
+
+def get_stream_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the factory of sessions for responses streamed from the database.
+
+    A streamed body is produced after the request session is closed, so it
+    reads through a session of its own.
+
+    Returns:
+        Session factory (reading replicas when available)
+    """
+    return get_read_session_factory()
+
+
+async def get_event_publisher(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> EventPublisher:
+    """Get event publisher instance with database session.
+
+    Args:
+        session: Async database session from dependency injection
+
+    Returns:
+        OutboxEventPublisher instance (events are written in the request transaction)
+    """
+    return OutboxEventPublisher(session)
+
+
+def _notification_event_handler(session: AsyncSession) -> NotificationEventHandler:
+    return NotificationEventHandler(
+        SQLAlchemyNotificationRepository(session), SQLAlchemyIssueRepository(session), session
+    )
+
+
+@lru_cache
+def get_event_handler_registry() -> EventHandlerRegistry:
+    """Get the handlers of domain events (singleton).
+
+    Handler names are stored with the events they handled: never rename them.
+
+    Returns:
+        EventHandlerRegistry instance
+    """
+    registry = EventHandlerRegistry()
+    registry.subscribe(
+        IssueStatusChanged,
+        "notifications",
+        lambda session: _notification_event_handler(session).issue_status_changed,
+    )
+    registry.subscribe(
+        IssueAssigned,
+        "notifications",
+        lambda session: _notification_event_handler(session).issue_assigned,
+    )
+    registry.subscribe(
+        CommentCreated,
+        "notifications",
+        lambda session: _notification_event_handler(session).comment_created,
+    )
+    return registry
+
+
+@lru_cache
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Get outbox dispatcher instance (singleton).
+
+    Returns:
+        OutboxDispatcher delivering events with sessions of the primary database
+    """
+    settings = get_settings()
+    return OutboxDispatcher(
+        get_session_factory(),
+        get_event_handler_registry(),
+        batch_size=settings.outbox_batch_size,
+        max_attempts=settings.outbox_max_attempts,
+        retry_delay_seconds=settings.outbox_retry_delay_seconds,
+        poll_interval_seconds=settings.outbox_poll_interval_seconds,
+    )
+
+
+@lru_cache
+def get_maintenance_scheduler() -> MaintenanceScheduler:
+    """Get maintenance scheduler instance (singleton).
+
+    Returns:
+        MaintenanceScheduler running the cleanup and retention jobs
+    """
+    settings = get_settings()
+    jobs = build_maintenance_jobs(
+        get_storage_service(),
+        presence_stale_after=timedelta(minutes=settings.presence_stale_after_minutes),
+        soft_deleted_retention=timedelta(days=settings.soft_deleted_retention_days),
+        notification_retention=timedelta(days=settings.notification_retention_days),
+        expired_invitation_retention=timedelta(days=settings.expired_invitation_retention_days),
+        outbox_retention=timedelta(days=settings.outbox_retention_days),
+        orphaned_file_grace=timedelta(hours=settings.orphaned_file_grace_hours),
+    )
+    return MaintenanceScheduler(
+        get_session_factory(),
+        jobs,
+        batch_size=settings.maintenance_batch_size,
+        batch_delay_seconds=settings.maintenance_batch_delay_seconds,
+        max_batches_per_run=settings.maintenance_max_batches_per_run,
+        poll_interval_seconds=settings.maintenance_poll_interval_seconds,
+    )
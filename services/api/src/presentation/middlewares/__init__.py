@@ -5,18 +5,23 @@ from src.presentation.middlewares.error_handler import (
     generic_exception_handler,
     validation_exception_handler,
 )
+from src.presentation.middlewares.language import LanguageDetectionMiddleware
 from src.presentation.middlewares.rate_limit import (
     get_rate_limiter,
     limiter,
     rate_limit_handler,
 )
 from src.presentation.middlewares.request_id import RequestIDMiddleware
+from src.presentation.middlewares.timing import TimedAPIRoute, TimingMiddleware
 
 __all__ = [
     "domain_exception_handler",
     "validation_exception_handler",
     "generic_exception_handler",
     "RequestIDMiddleware",
+    "LanguageDetectionMiddleware",
+    "TimingMiddleware",
+    "TimedAPIRoute",
     "limiter",
     "get_rate_limiter",
     "rate_limit_handler",
@@ -1,61 +1,67 @@
 """Language detection middleware."""
 
-from collections.abc import Callable
-
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.domain.value_objects.language import Language
 
 logger = structlog.get_logger()
 
 
-class LanguageDetectionMiddleware(BaseHTTPMiddleware):
+class LanguageDetectionMiddleware:
     """Middleware for detecting user language preference.
 
+    Implemented as a pure ASGI middleware (no per-request task or body
+    buffering, streaming responses pass through untouched).
+
     Detects language from:
     1. User's stored language preference (if authenticated)
     2. Accept-Language header
     3. Default language (English)
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and detect language.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware in chain
-
-        Returns:
-            Response from next middleware
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Detect language from Accept-Language header
-        language_code = self._detect_language(request)
+        language_code = self._detect_language(Headers(scope=scope))
 
         # Store detected language in request state for use in endpoints
-        request.state.language = language_code
+        scope.setdefault("state", {})["language"] = language_code
 
         logger.debug(
             "Language detected",
             language=language_code,
-            path=request.url.path,
+            path=scope["path"],
         )
 
-        response: Response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
-    def _detect_language(self, request: Request) -> str:
-        """Detect language from request.
+    def _detect_language(self, headers: Headers) -> str:
+        """Detect language from request headers.
 
         Args:
-            request: FastAPI request
+            headers: Request headers
 
         Returns:
             Detected language code (e.g., 'en', 'fr')
         """
         # Try to get language from Accept-Language header
-        accept_language = request.headers.get("Accept-Language")
+        accept_language = headers.get("Accept-Language")
         if accept_language:
             # Parse Accept-Language header
             # Format: "en-US,en;q=0.9,fr;q=0.8"
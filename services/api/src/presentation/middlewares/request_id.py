@@ -1,36 +1,50 @@
 """Request ID tracking middleware."""
 
 import uuid
-from collections.abc import Callable
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
+REQUEST_ID_HEADER = "X-Request-ID"
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+class RequestIDMiddleware:
     """Middleware to add request ID to all requests.
 
+    Implemented as a pure ASGI middleware (no per-request task or body
+    buffering, streaming responses pass through untouched).
+
     Adds a unique request ID to:
+    - Request state (`request.state.request_id`)
     - Response headers (X-Request-ID)
     - Logging context
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add request ID."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate or get request ID from header
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Add request ID to logging context
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(request_id=request_id)
 
-        # Process request
-        response: Response = await call_next(request)
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            # Add request ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_request_id)
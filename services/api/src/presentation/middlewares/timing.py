@@ -0,0 +1,226 @@
+"""Request timing middleware (latency histograms, in-flight gauge, Server-Timing)."""
+
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.monitoring import (
+    PHASE_DB,
+    PHASE_SERIALIZATION,
+    MetricsRegistry,
+    RequestTimings,
+    find_repeated_statements,
+    get_metrics_registry,
+    get_request_timings,
+    reset_request_timings,
+    start_request_timings,
+)
+
+logger = structlog.get_logger()
+
+# Buckets for the number of SQL statements per request
+STATEMENT_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Route label used when no route matched (404s), keeps label cardinality bounded
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(scope: Scope) -> str:
+    """Get the route template (e.g. `/api/v1/issues/{issue_id}`) of a handled request."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+def _server_timing_header(timings: RequestTimings, total: float) -> str:
+    """Format phase durations as a `Server-Timing` header value (milliseconds)."""
+    entries = []
+    for phase, duration in timings.phases.items():
+        entry = f"{phase};dur={duration * 1000:.2f}"
+        if phase == PHASE_DB:
+            entry += f';desc="{timings.statement_count} queries"'
+        entries.append(entry)
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class TimingMiddleware:
+    """Record per-route latency and expose per-phase timings.
+
+    For every HTTP request:
+    - observes the request duration in a histogram labelled by method,
+      route template and status code
+    - tracks the number of in-flight requests
+    - observes the duration of each phase (auth, db, serialization, ...)
+      recorded during the request
+    - observes the number of SQL statements executed and flags statement
+      shapes repeated at least `n_plus_one_threshold` times (N+1 suspects)
+    - adds a `Server-Timing` header with the phase breakdown
+
+    Implemented as a pure ASGI middleware so that it adds no per-request
+    task or body buffering.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        n_plus_one_threshold: int = 5,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application
+            server_timing: Whether to add the `Server-Timing` response header
+            n_plus_one_threshold: Executions of one statement shape in a
+                request from which it is reported as an N+1 suspect
+            registry: Metrics registry (defaults to the process-wide registry)
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+        registry = registry or get_metrics_registry()
+        self.request_duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route",
+            ("method", "route", "status"),
+        )
+        self.phase_duration = registry.histogram(
+            "http_request_phase_duration_seconds",
+            "Time spent per request phase (auth, db, serialization) by route",
+            ("route", "phase"),
+        )
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight",
+            "HTTP requests currently being processed",
+            ("method",),
+        )
+        self.statement_count = registry.histogram(
+            "http_request_db_statements",
+            "SQL statements executed per request by route",
+            ("route",),
+            buckets=STATEMENT_COUNT_BUCKETS,
+        )
+        self.n_plus_one_suspects = registry.counter(
+            "http_request_n_plus_one_suspects_total",
+            "Requests with a statement shape repeated above the N+1 threshold",
+            ("route",),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and report its phases."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        timings, token = start_request_timings()
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                now = time.perf_counter()
+                if timings.handler_finished_at is not None:
+                    timings.add(PHASE_SERIALIZATION, now - timings.handler_finished_at)
+                if self.server_timing:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", _server_timing_header(timings, now - timings.started_at)
+                    )
+            await send(message)
+
+        self.in_flight.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.in_flight.dec(method=method)
+            route = _route_template(scope)
+            self.request_duration.observe(
+                timings.elapsed(), method=method, route=route, status=str(status_code)
+            )
+            for phase, duration in timings.phases.items():
+                self.phase_duration.observe(duration, route=route, phase=phase)
+            if timings.statement_count:
+                self._report_statements(timings, route)
+            reset_request_timings(token)
+
+    def _report_statements(self, timings: RequestTimings, route: str) -> None:
+        """Record statement counts and log N+1 suspects of a finished request."""
+        self.statement_count.observe(timings.statement_count, route=route)
+        db_time_ms = round(timings.phases.get(PHASE_DB, 0.0) * 1000, 2)
+
+        suspects = find_repeated_statements(timings.statements, self.n_plus_one_threshold)
+        if suspects:
+            self.n_plus_one_suspects.inc(route=route)
+        for statement, executions in suspects:
+            logger.warning(
+                "N+1 query suspect",
+                route=route,
+                statement=statement,
+                executions=executions,
+                statement_count=timings.statement_count,
+                db_time_ms=db_time_ms,
+            )
+
+        logger.debug(
+            "Request database usage",
+            route=route,
+            statement_count=timings.statement_count,
+            db_time_ms=db_time_ms,
+        )
+
+
+def _mark_handler_finished(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an endpoint so the current request records when it returned."""
+
+    def mark() -> None:
+        timings = get_request_timings()
+        if timings is not None:
+            timings.handler_finished_at = time.perf_counter()
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            mark()
+            return result
+
+        return async_endpoint
+
+    if inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint):
+        # Streaming endpoints have no distinct serialization phase
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+        result = endpoint(*args, **kwargs)
+        mark()
+        return result
+
+    return sync_endpoint
+
+
+class TimedAPIRoute(APIRoute):
+    """API route that marks when its endpoint returns.
+
+    The time between the endpoint returning and the response starting is
+    reported by `TimingMiddleware` as the serialization phase (response
+    model validation, JSON encoding).
+
+    Usage:
+        router = APIRouter(route_class=TimedAPIRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        """Initialize route with a timed endpoint."""
+        super().__init__(path, _mark_handler_finished(endpoint), **kwargs)
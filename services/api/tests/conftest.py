@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from src.domain.entities import User
 from src.domain.value_objects import Email, HashedPassword, Password
 from src.infrastructure.config.test_settings import TestSettings
-from src.infrastructure.database.config import Base
+from src.infrastructure.database.config import Base, instrument_engine
 
 # Import all models to ensure they are registered in Base.metadata
 from src.infrastructure.database.models import (  # noqa: F401
@@ -105,6 +105,33 @@ for module_name in modules_to_reload:
         importlib.reload(sys.modules[module_name])
 
 
+def pytest_addoption(parser):
+    """Add the benchmark options (see tests/performance)."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the endpoint benchmarks (tests marked 'benchmark').",
+    )
+    group.addoption(
+        "--benchmark-update",
+        action="store_true",
+        default=False,
+        help="Run the endpoint benchmarks and record their results as new baselines.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless requested (they seed a large dataset)."""
+    if config.getoption("--benchmark") or config.getoption("--benchmark-update"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="session")
 def test_settings():
     """Get test settings."""
@@ -120,6 +147,7 @@ async def test_engine():
         echo=False,
         pool_pre_ping=True,
     )
+    instrument_engine(engine)
 
     # Create all tables using a connection that auto-commits
     # Use begin() which auto-commits when the context exits
@@ -191,8 +219,13 @@ async def test_app(db_session):
 
     This fixture is async to properly handle the async session.
     """
-    from src.infrastructure.database import get_session
+    from src.infrastructure.database import get_read_session, get_session, run_after_commit
     from src.main import create_app
+    from src.presentation.dependencies.services import (
+        get_attachment_preview_service,
+        get_query_session_factory,
+        get_stream_session_factory,
+    )
 
     # Create app without rate limiting
     app = create_app(enable_rate_limiting=False)
@@ -200,9 +233,27 @@ async def test_app(db_session):
     # Create a wrapper function that provides the session
     async def _get_session_override():
         yield db_session
+        # The test transaction stands in for the commit
+        await run_after_commit(db_session)
 
     # Override the dependency
     app.dependency_overrides[get_session] = _get_session_override
+    app.dependency_overrides[get_read_session] = _get_session_override
+    # Queries on other connections would not see the test transaction
+    app.dependency_overrides[get_query_session_factory] = lambda: None
+
+    # Streamed responses read in savepoints of the test transaction
+    async def _get_stream_session_factory_override():
+        return async_sessionmaker(
+            bind=await db_session.connection(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+    app.dependency_overrides[get_stream_session_factory] = _get_stream_session_factory_override
+    # Thumbnails are recorded on another connection, after the upload commits
+    app.dependency_overrides[get_attachment_preview_service] = lambda: None
 
     yield app
 
@@ -12,6 +12,8 @@ from src.infrastructure.database.models import (
     OrganizationModel,
     ProjectModel,
 )
+from src.infrastructure.services import LocalStorageService
+from src.presentation.dependencies.services import get_storage_service
 
 
 @pytest.mark.asyncio
@@ -507,3 +509,72 @@ async def test_download_attachment_success(client: AsyncClient, test_user, db_se
     assert download_response.content == b"test file content"
     assert download_response.headers["content-type"] == "application/pdf"
     assert 'attachment; filename="test.pdf"' in download_response.headers["content-disposition"]
+
+
+@pytest.mark.asyncio
+async def test_get_attachment_thumbnail(
+    client: AsyncClient, test_app, test_user, db_session, tmp_path
+):
+    """Test the thumbnail is served with long cache headers once generated."""
+    # Setup
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+    project = ProjectModel(organization_id=org.id, name="Test Project", key="TEST")
+    db_session.add(project)
+    await db_session.flush()
+
+    issue = IssueModel(
+        project_id=project.id,
+        issue_number=1,
+        title="Test Issue",
+        reporter_id=test_user.id,
+    )
+    db_session.add(issue)
+    await db_session.flush()
+
+    attachment = AttachmentModel(
+        entity_type="issue",
+        entity_id=issue.id,
+        file_name="screenshot.png",
+        original_name="screenshot.png",
+        file_size=4096,
+        mime_type="image/png",
+        storage_path="attachments/test/screenshot.png",
+        uploaded_by=test_user.id,
+    )
+    db_session.add(attachment)
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    token = login_response.json()["access_token"]
+    auth_headers = {"Authorization": f"Bearer {token}"}
+
+    # Not generated yet
+    response = await client.get(
+        f"/api/v1/attachments/{attachment.id}/thumbnail", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    # Generated by the preview pipeline
+    storage = LocalStorageService(str(tmp_path))
+    test_app.dependency_overrides[get_storage_service] = lambda: storage
+    attachment.thumbnail_path = f"attachments/{attachment.id}/thumbnail.webp"
+    await db_session.flush()
+    await storage.save(b"webp thumbnail", attachment.thumbnail_path, "image/webp")
+
+    response = await client.get(
+        f"/api/v1/attachments/{attachment.id}/thumbnail", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.content == b"webp thumbnail"
+    assert response.headers["content-type"] == "image/webp"
+    assert "max-age=31536000" in response.headers["cache-control"]
@@ -289,3 +289,53 @@ async def test_upload_avatar_replaces_existing(client: AsyncClient, test_user: U
     )
     assert profile_response.status_code == 200
     assert profile_response.json()["avatar_url"] == second_avatar_url
+
+
+@pytest.mark.asyncio
+async def test_get_avatar_negotiates_format(client: AsyncClient, test_user: User) -> None:
+    """Test avatar sizes are generated on demand in the format the client accepts."""
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": test_user.email.value,
+            "password": "TestPassword123!",
+        },
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    files = {"file": ("avatar.png", create_test_image("PNG", (300, 300)), "image/png")}
+    upload_response = await client.post("/api/v1/users/me/avatar", headers=headers, files=files)
+    assert upload_response.status_code == 200
+
+    response = await client.get(
+        f"/api/v1/users/{test_user.id}/avatar",
+        params={"size": "64x64"},
+        headers={**headers, "Accept": "image/webp,image/*;q=0.8"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert "Accept" in response.headers["vary"]
+    assert Image.open(io.BytesIO(response.content)).size == (64, 64)
+
+    # Same variant again: the client's copy is still current
+    cached_response = await client.get(
+        f"/api/v1/users/{test_user.id}/avatar",
+        params={"size": "64x64"},
+        headers={
+            **headers,
+            "Accept": "image/webp,image/*;q=0.8",
+            "If-None-Match": response.headers["etag"],
+        },
+    )
+    assert cached_response.status_code == 304
+
+    png_response = await client.get(
+        f"/api/v1/users/{test_user.id}/avatar", params={"size": "64x64"}, headers=headers
+    )
+    assert png_response.headers["content-type"] == "image/png"
+
+    invalid_response = await client.get(
+        f"/api/v1/users/{test_user.id}/avatar", params={"size": "10x10"}, headers=headers
+    )
+    assert invalid_response.status_code == 400
@@ -4,6 +4,7 @@ import pytest
 from httpx import AsyncClient
 
 from src.infrastructure.database.models import (
+    IssueModel,
     OrganizationMemberModel,
     OrganizationModel,
     ProjectMemberModel,
@@ -470,3 +471,98 @@ async def test_get_widget_data_success(client: AsyncClient, test_user, db_sessio
     assert widget_data_response.status_code == 200
     data = widget_data_response.json()
     assert "data" in data
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_data_success(client: AsyncClient, test_user, db_session):
+    """Test getting the data of all dashboard widgets in one call."""
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+    project = ProjectModel(organization_id=org.id, name="Test Project", key="TEST")
+    db_session.add(project)
+    await db_session.flush()
+
+    db_session.add(ProjectMemberModel(project_id=project.id, user_id=test_user.id, role="admin"))
+    for number, status in enumerate(["todo", "todo", "done"], start=1):
+        db_session.add(
+            IssueModel(
+                project_id=project.id,
+                issue_number=number,
+                title=f"Issue {number}",
+                type="task",
+                status=status,
+                priority="medium",
+                reporter_id=test_user.id,
+            )
+        )
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": test_user.email.value,
+            "password": "TestPassword123!",
+        },
+    )
+    token = login_response.json()["access_token"]
+    auth_headers = {"Authorization": f"Bearer {token}"}
+
+    create_response = await client.post(
+        "/api/v1/dashboards",
+        json={
+            "name": "Test Dashboard",
+            "project_id": str(project.id),
+            "widgets": [
+                {"type": "issue_status_breakdown", "config": {}, "position": 0},
+                {"type": "assigned_issues_list", "config": {}, "position": 1},
+                {"type": "issue_status_breakdown", "config": {"title": "Copy"}, "position": 2},
+            ],
+        },
+        headers=auth_headers,
+    )
+    assert create_response.status_code == 201
+    dashboard_id = create_response.json()["id"]
+
+    response = await client.get(f"/api/v1/dashboards/{dashboard_id}/data", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dashboard_id"] == dashboard_id
+    widgets = data["widgets"]
+    assert [w["widget_type"] for w in widgets] == [
+        "issue_status_breakdown",
+        "assigned_issues_list",
+        "issue_status_breakdown",
+    ]
+    assert widgets[0]["data"] == {"todo": 2, "done": 1}
+    assert widgets[2]["data"] == widgets[0]["data"]
+    assert widgets[1]["data"] == {"issues": []}
+
+    # Served from the cache on the next call
+    cached_response = await client.get(
+        f"/api/v1/dashboards/{dashboard_id}/data", headers=auth_headers
+    )
+    assert all(w["cached"] for w in cached_response.json()["widgets"])
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_data_not_found(client: AsyncClient, test_user):
+    """Test getting the data of a non-existent dashboard."""
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": test_user.email.value,
+            "password": "TestPassword123!",
+        },
+    )
+    token = login_response.json()["access_token"]
+
+    response = await client.get(
+        "/api/v1/dashboards/00000000-0000-0000-0000-000000000000/data",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 404
@@ -7,8 +7,12 @@ from httpx import AsyncClient
 
 from src.infrastructure.database.models import (
     FavoriteModel,
+    FolderModel,
+    IssueModel,
     OrganizationMemberModel,
     OrganizationModel,
+    PageModel,
+    ProjectMemberModel,
     ProjectModel,
     SpaceModel,
 )
@@ -269,6 +273,70 @@ async def test_list_favorites_success(client: AsyncClient, test_user, db_session
             assert "organization_id" in fav["node"]
 
 
+@pytest.mark.asyncio
+async def test_list_favorites_node_details(client: AsyncClient, test_user, db_session):
+    """Test favorites of several projects and spaces carry their folder and counts."""
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="member")
+    )
+    folder = FolderModel(organization_id=org.id, name="Starred")
+    db_session.add(folder)
+    await db_session.flush()
+
+    busy = ProjectModel(organization_id=org.id, name="Busy", key="BUSY", folder_id=folder.id)
+    quiet = ProjectModel(organization_id=org.id, name="Quiet", key="QUIET")
+    space = SpaceModel(organization_id=org.id, name="Docs", key="DOCS")
+    db_session.add_all([busy, quiet, space])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            ProjectMemberModel(project_id=busy.id, user_id=test_user.id, role="admin"),
+            *(
+                IssueModel(
+                    project_id=busy.id,
+                    issue_number=n,
+                    title=f"Issue {n}",
+                    reporter_id=test_user.id,
+                )
+                for n in (1, 2, 3)
+            ),
+            *(PageModel(space_id=space.id, title=f"Page {n}", slug=f"page-{n}") for n in (1, 2)),
+            *(
+                FavoriteModel(user_id=test_user.id, entity_type=entity_type, entity_id=entity_id)
+                for entity_type, entity_id in (
+                    ("project", busy.id),
+                    ("space", space.id),
+                    ("project", quiet.id),
+                    ("project", uuid4()),  # deleted since
+                )
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    auth_headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    list_response = await client.get("/api/v1/users/me/favorites", headers=auth_headers)
+
+    assert list_response.status_code == 200
+    nodes = {fav["entity_id"]: fav["node"] for fav in list_response.json()["favorites"]}
+    assert len(nodes) == 3
+    assert nodes[str(busy.id)]["details"]["folder_id"] == str(folder.id)
+    assert nodes[str(busy.id)]["details"]["member_count"] == 1
+    assert nodes[str(busy.id)]["details"]["issue_count"] == 3
+    assert nodes[str(quiet.id)]["details"]["folder_id"] is None
+    assert nodes[str(quiet.id)]["details"]["member_count"] == 0
+    assert nodes[str(quiet.id)]["details"]["issue_count"] == 0
+    assert nodes[str(space.id)]["details"]["page_count"] == 2
+
+
 @pytest.mark.asyncio
 async def test_list_favorites_with_entity_type_filter(client: AsyncClient, test_user, db_session):
     """Test favorite listing with entity type filter."""
@@ -515,6 +515,126 @@ async def test_list_issues_with_search(client: AsyncClient, test_user, db_sessio
     assert data["issues"][0]["title"] == "Frontend Bug"
 
 
+@pytest.mark.asyncio
+async def test_list_issues_with_custom_fields(client: AsyncClient, test_user, db_session):
+    """Test issue listing filtered and sorted by custom field values."""
+    from src.infrastructure.database.models import (
+        CustomFieldModel,
+        CustomFieldValueModel,
+        IssueModel,
+    )
+
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="member")
+    )
+    project = ProjectModel(organization_id=org.id, name="Test Project", key="TEST")
+    db_session.add(project)
+    await db_session.flush()
+
+    customer = CustomFieldModel(project_id=project.id, name="Customer", type="text")
+    components = CustomFieldModel(
+        project_id=project.id, name="Components", type="multi_select", options=["ui", "api"]
+    )
+    effort = CustomFieldModel(project_id=project.id, name="Effort", type="number")
+    issues = [
+        IssueModel(
+            project_id=project.id, issue_number=n, title=f"Issue {n}", reporter_id=test_user.id
+        )
+        for n in range(1, 5)
+    ]
+    db_session.add_all([customer, components, effort, *issues])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            CustomFieldValueModel(custom_field_id=customer.id, issue_id=issues[0].id, value="Acme"),
+            CustomFieldValueModel(custom_field_id=customer.id, issue_id=issues[1].id, value="Acme"),
+            CustomFieldValueModel(custom_field_id=customer.id, issue_id=issues[2].id, value="Umbr"),
+            CustomFieldValueModel(
+                custom_field_id=customer.id, issue_id=issues[3].id, value="12345"
+            ),
+            CustomFieldValueModel(
+                custom_field_id=components.id, issue_id=issues[0].id, value=["ui", "api"]
+            ),
+            CustomFieldValueModel(
+                custom_field_id=components.id, issue_id=issues[1].id, value=["ui"]
+            ),
+            CustomFieldValueModel(custom_field_id=effort.id, issue_id=issues[0].id, value=3),
+            CustomFieldValueModel(custom_field_id=effort.id, issue_id=issues[1].id, value=13),
+            CustomFieldValueModel(custom_field_id=effort.id, issue_id=issues[2].id, value=8),
+        ]
+    )
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    auth_headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    # Equality on a text field, containment on a multi select
+    list_response = await client.get(
+        "/api/v1/issues/",
+        headers=auth_headers,
+        params={
+            "project_id": str(project.id),
+            "cf": [f"{customer.id}:Acme", f'{components.id}:["api"]'],
+            "include_custom_fields": "true",
+        },
+    )
+
+    assert list_response.status_code == 200
+    data = list_response.json()
+    assert data["total"] == 1
+    assert data["issues"][0]["issue_number"] == 1
+    assert data["issues"][0]["custom_fields"] == {
+        str(customer.id): "Acme",
+        str(components.id): ["ui", "api"],
+        str(effort.id): 3,
+    }
+
+    # Numeric sort, issues without a value last
+    list_response = await client.get(
+        "/api/v1/issues/",
+        headers=auth_headers,
+        params={
+            "project_id": str(project.id),
+            "sort_custom_field_id": str(effort.id),
+            "sort_order": "desc",
+        },
+    )
+
+    assert list_response.status_code == 200
+    assert [issue["issue_number"] for issue in list_response.json()["issues"]] == [2, 3, 1, 4]
+
+    # Values are read by the field type: digits stay text on a text field
+    for filters, expected in [
+        ([f"{customer.id}:12345"], [4]),
+        ([f"{effort.id}:13"], [2]),
+        ([f"{components.id}:ui"], [1, 2]),
+    ]:
+        list_response = await client.get(
+            "/api/v1/issues/",
+            headers=auth_headers,
+            params={"project_id": str(project.id), "cf": filters},
+        )
+
+        assert list_response.status_code == 200
+        assert sorted(issue["issue_number"] for issue in list_response.json()["issues"]) == expected
+
+    # Malformed filters
+    for custom_field_filter in ["not-a-field:1", f"{effort.id}:many", f"{uuid4()}:1"]:
+        list_response = await client.get(
+            "/api/v1/issues/",
+            headers=auth_headers,
+            params={"project_id": str(project.id), "cf": custom_field_filter},
+        )
+
+        assert list_response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_update_issue_success(client: AsyncClient, test_user, db_session):
     """Test successful issue update."""
@@ -0,0 +1,206 @@
+"""Integration tests for the issue hierarchy (subtasks and rollups)."""
+
+import asyncio
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.issue_hierarchy_service import IssueHierarchyService
+from src.infrastructure.database.models import (
+    IssueModel,
+    IssueRollupModel,
+    OrganizationMemberModel,
+    OrganizationModel,
+    ProjectMemberModel,
+    ProjectModel,
+)
+
+
+async def _setup_project(client: AsyncClient, test_user, db_session):
+    """Create an organization and a project the user administers, and log in."""
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+    project = ProjectModel(organization_id=org.id, name="Test Project", key="TEST")
+    db_session.add(project)
+    await db_session.flush()
+
+    db_session.add(ProjectMemberModel(project_id=project.id, user_id=test_user.id, role="admin"))
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    assert login_response.status_code == 200
+    token = login_response.json()["access_token"]
+    return project, {"Authorization": f"Bearer {token}"}
+
+
+async def _create_issue(client: AsyncClient, headers, project_id, **fields):
+    response = await client.post(
+        "/api/v1/issues/",
+        json={"project_id": str(project_id), **fields},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_rollup_aggregates_descendants(client: AsyncClient, test_user, db_session):
+    """Test that an epic rolls up the points, statuses and hours of its whole subtree."""
+    project, headers = await _setup_project(client, test_user, db_session)
+
+    epic = await _create_issue(client, headers, project.id, title="Epic", type="epic")
+    story = await _create_issue(
+        client, headers, project.id, title="Story", type="story", parent_issue_id=epic["id"]
+    )
+    subtask_done = await _create_issue(
+        client,
+        headers,
+        project.id,
+        title="Subtask 1",
+        story_points=3,
+        parent_issue_id=story["id"],
+    )
+    await _create_issue(
+        client,
+        headers,
+        project.id,
+        title="Subtask 2",
+        story_points=5,
+        parent_issue_id=story["id"],
+    )
+
+    update_response = await client.put(
+        f"/api/v1/issues/{subtask_done['id']}", json={"status": "done"}, headers=headers
+    )
+    assert update_response.status_code == 200
+
+    time_response = await client.post(
+        f"/api/v1/issues/{subtask_done['id']}/time-entries",
+        json={"hours": 1.5, "date": date.today().isoformat()},
+        headers=headers,
+    )
+    assert time_response.status_code == 201
+
+    response = await client.get(f"/api/v1/issues/{epic['id']}/rollup", headers=headers)
+
+    assert response.status_code == 200
+    rollup = response.json()
+    assert rollup["child_count"] == 1
+    assert rollup["descendant_count"] == 3
+    assert rollup["status_counts"] == {"todo": 2, "done": 1}
+    assert rollup["story_points_total"] == 8
+    assert rollup["story_points_done"] == 3
+    assert float(rollup["hours_logged"]) == 1.5
+
+    story_response = await client.get(f"/api/v1/issues/{story['id']}/rollup", headers=headers)
+    assert story_response.json()["child_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rollup_follows_deleted_children(client: AsyncClient, test_user, db_session):
+    """Test that deleting the last child clears the rollup of its parent."""
+    project, headers = await _setup_project(client, test_user, db_session)
+
+    parent = await _create_issue(client, headers, project.id, title="Parent", type="story")
+    child = await _create_issue(
+        client, headers, project.id, title="Child", story_points=2, parent_issue_id=parent["id"]
+    )
+
+    response = await client.get(f"/api/v1/issues/{parent['id']}/rollup", headers=headers)
+    assert response.json()["story_points_total"] == 2
+
+    delete_response = await client.delete(f"/api/v1/issues/{child['id']}", headers=headers)
+    assert delete_response.status_code == 204
+
+    response = await client.get(f"/api/v1/issues/{parent['id']}/rollup", headers=headers)
+    assert response.status_code == 200
+    rollup = response.json()
+    assert rollup["child_count"] == 0
+    assert rollup["story_points_total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_subtasks_returns_direct_children(client: AsyncClient, test_user, db_session):
+    """Test that listing subtasks returns direct children with their keys."""
+    project, headers = await _setup_project(client, test_user, db_session)
+
+    parent = await _create_issue(client, headers, project.id, title="Parent", type="story")
+    child = await _create_issue(
+        client, headers, project.id, title="Child", parent_issue_id=parent["id"]
+    )
+    await _create_issue(
+        client, headers, project.id, title="Grandchild", parent_issue_id=child["id"]
+    )
+
+    response = await client.get(f"/api/v1/issues/{parent['id']}/subtasks", headers=headers)
+
+    assert response.status_code == 200
+    subtasks = response.json()
+    assert [s["id"] for s in subtasks] == [child["id"]]
+    assert subtasks[0]["key"] == child["key"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sibling_changes_keep_both(test_engine):
+    """Test two transactions changing siblings both end up in the parent's rollup."""
+    # Committed data, seen by the two connections below
+    async with AsyncSession(test_engine, expire_on_commit=False) as setup:
+        org = OrganizationModel(name="Concurrent Org", slug="concurrent-rollups")
+        setup.add(org)
+        await setup.flush()
+        project = ProjectModel(organization_id=org.id, name="Concurrent", key="CONC")
+        setup.add(project)
+        await setup.flush()
+        parent = IssueModel(project_id=project.id, issue_number=1, title="Epic", type="epic")
+        setup.add(parent)
+        await setup.flush()
+        children = [
+            IssueModel(
+                project_id=project.id,
+                issue_number=number,
+                title=f"Child {number}",
+                status="todo",
+                parent_issue_id=parent.id,
+            )
+            for number in (2, 3)
+        ]
+        setup.add_all(children)
+        await setup.flush()
+        await IssueHierarchyService(setup).refresh_rollups([children[0].id])
+        await setup.commit()
+
+    async def mark_done(session: AsyncSession, child: IssueModel) -> None:
+        await session.execute(
+            update(IssueModel).where(IssueModel.id == child.id).values(status="done")
+        )
+        await IssueHierarchyService(session).refresh_rollups([child.id])
+
+    try:
+        async with AsyncSession(test_engine) as first, AsyncSession(test_engine) as second:
+            await mark_done(first, children[0])
+            # The second recompute waits for the first transaction
+            second_done = asyncio.create_task(mark_done(second, children[1]))
+            await asyncio.sleep(0.2)
+            assert not second_done.done()
+            await first.commit()
+            await second_done
+            await second.commit()
+
+        async with AsyncSession(test_engine) as check:
+            rollup = await check.get(IssueRollupModel, parent.id)
+            assert rollup is not None
+            assert rollup.status_counts == {"done": 2}
+    finally:
+        async with test_engine.begin() as conn:
+            await conn.execute(delete(OrganizationModel).where(OrganizationModel.id == org.id))
@@ -0,0 +1,76 @@
+"""Integration tests for per-project issue number allocation."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    IssueModel,
+    OrganizationModel,
+    ProjectIssueCounterModel,
+    ProjectModel,
+)
+from src.infrastructure.database.repositories import SQLAlchemyIssueRepository
+
+
+async def _create_project(db_session: AsyncSession, key: str) -> ProjectModel:
+    org = OrganizationModel(name=f"Org {key}", slug=f"org-{key.lower()}")
+    db_session.add(org)
+    await db_session.flush()
+    project = ProjectModel(organization_id=org.id, name=f"Project {key}", key=key)
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+@pytest.mark.asyncio
+async def test_issue_numbers_start_at_one(db_session: AsyncSession) -> None:
+    """Test a new project allocates 1, 2, 3..."""
+    project = await _create_project(db_session, "NEW")
+    repository = SQLAlchemyIssueRepository(db_session)
+
+    numbers = [await repository.get_next_issue_number(project.id) for _ in range(3)]
+
+    assert numbers == [1, 2, 3]
+    counter = await db_session.get(ProjectIssueCounterModel, project.id)
+    assert counter is not None
+    assert counter.last_issue_number == 3
+
+
+@pytest.mark.asyncio
+async def test_issue_numbers_continue_after_existing_issues(
+    db_session: AsyncSession, test_user
+) -> None:
+    """Test a project with issues but no counter continues after its highest number."""
+    project = await _create_project(db_session, "OLD")
+    db_session.add_all(
+        [
+            IssueModel(
+                project_id=project.id,
+                issue_number=number,
+                title=f"Issue {number}",
+                reporter_id=test_user.id,
+            )
+            for number in (1, 7)
+        ]
+    )
+    await db_session.flush()
+    repository = SQLAlchemyIssueRepository(db_session)
+
+    assert await repository.get_next_issue_number(project.id) == 8
+
+
+@pytest.mark.asyncio
+async def test_reserve_issue_numbers_block(db_session: AsyncSession) -> None:
+    """Test a block reservation is contiguous and later allocations follow it."""
+    project = await _create_project(db_session, "BLK")
+    other = await _create_project(db_session, "OTH")
+    repository = SQLAlchemyIssueRepository(db_session)
+
+    first = await repository.get_next_issue_number(project.id)
+    block = await repository.reserve_issue_numbers(project.id, 100)
+
+    assert first == 1
+    assert block == range(2, 102)
+    assert await repository.get_next_issue_number(project.id) == 102
+    # Counters are per project
+    assert await repository.get_next_issue_number(other.id) == 1
@@ -0,0 +1,299 @@
+"""Integration tests for issue export (NDJSON/CSV) and bulk import endpoints."""
+
+import csv
+import io
+import json
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    CustomFieldModel,
+    CustomFieldValueModel,
+    IssueActivityModel,
+    IssueLabelModel,
+    IssueModel,
+    LabelModel,
+    OrganizationMemberModel,
+    OrganizationModel,
+    ProjectModel,
+    SprintIssueModel,
+    SprintModel,
+)
+
+
+@pytest_asyncio.fixture
+async def auth_headers(test_user, token_service) -> dict:
+    """Authentication headers of the test user."""
+    token = token_service.create_access_token(test_user.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _create_project(db_session: AsyncSession, test_user, key: str) -> ProjectModel:
+    org = OrganizationModel(name=f"Org {key}", slug=f"org-{key.lower()}")
+    db_session.add(org)
+    await db_session.flush()
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+    project = ProjectModel(organization_id=org.id, name=f"Project {key}", key=key)
+    db_session.add(project)
+    await db_session.flush()
+    return project
+
+
+async def _seed_issues(db_session: AsyncSession, test_user, project: ProjectModel) -> None:
+    """Two issues: the first labelled, with a custom field value and in a sprint."""
+    first = IssueModel(
+        project_id=project.id,
+        issue_number=1,
+        title='First, with "quotes"',
+        description="Line one\nline two",
+        type="bug",
+        priority="high",
+        reporter_id=test_user.id,
+        assignee_id=test_user.id,
+        story_points=3,
+    )
+    second = IssueModel(
+        project_id=project.id, issue_number=2, title="Second", reporter_id=test_user.id
+    )
+    db_session.add_all([first, second])
+    await db_session.flush()
+
+    labels = [
+        LabelModel(project_id=project.id, name=name, color="#ff0000") for name in ("ui", "api")
+    ]
+    field = CustomFieldModel(
+        project_id=project.id, name="Severity", type="select", options=["S1", "S2"]
+    )
+    sprint = SprintModel(project_id=project.id, name="Sprint 1")
+    db_session.add_all([*labels, field, sprint])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            *(IssueLabelModel(issue_id=first.id, label_id=label.id) for label in labels),
+            CustomFieldValueModel(custom_field_id=field.id, issue_id=first.id, value="S1"),
+            SprintIssueModel(sprint_id=sprint.id, issue_id=first.id),
+        ]
+    )
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_export_issues_ndjson(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test NDJSON export includes labels, custom fields and sprints."""
+    project = await _create_project(db_session, test_user, "EXP")
+    await _seed_issues(db_session, test_user, project)
+
+    response = await client.get(
+        f"/api/v1/projects/{project.id}/issues/export", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="exp-issues.ndjson"' in response.headers["content-disposition"]
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["key"] for record in records] == ["EXP-1", "EXP-2"]
+    assert records[0]["labels"] == ["api", "ui"]
+    assert records[0]["custom_fields"] == {"Severity": "S1"}
+    assert records[0]["sprints"] == ["Sprint 1"]
+    assert records[0]["assignee"] == test_user.email.value
+    assert records[1]["labels"] == []
+    assert records[1]["assignee"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_issues_csv(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test CSV export has one column per custom field and joined list cells."""
+    project = await _create_project(db_session, test_user, "CSV")
+    await _seed_issues(db_session, test_user, project)
+
+    response = await client.get(
+        f"/api/v1/projects/{project.id}/issues/export?format=csv", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert rows[0]["title"] == 'First, with "quotes"'
+    assert rows[0]["description"] == "Line one\nline two"
+    assert rows[0]["labels"] == "api;ui"
+    assert rows[0]["cf:Severity"] == "S1"
+    assert rows[1]["cf:Severity"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_issues_invalid_format(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test an unknown export format is rejected."""
+    project = await _create_project(db_session, test_user, "BAD")
+
+    response = await client.get(
+        f"/api/v1/projects/{project.id}/issues/export?format=xml", headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_then_import_csv_round_trip(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test a CSV export imports into another project with labels and field values."""
+    source = await _create_project(db_session, test_user, "SRC")
+    await _seed_issues(db_session, test_user, source)
+    target = await _create_project(db_session, test_user, "DST")
+    db_session.add(
+        CustomFieldModel(project_id=target.id, name="Severity", type="select", options=["S1", "S2"])
+    )
+    db_session.add(
+        IssueModel(project_id=target.id, issue_number=1, title="Existing", reporter_id=test_user.id)
+    )
+    await db_session.flush()
+    exported = await client.get(
+        f"/api/v1/projects/{source.id}/issues/export?format=csv", headers=auth_headers
+    )
+
+    response = await client.post(
+        f"/api/v1/projects/{target.id}/issues/import",
+        files={"file": ("src-issues.csv", exported.content, "text/csv")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert response.json()["first_issue_number"] == 2
+
+    issues = (
+        (
+            await db_session.execute(
+                select(IssueModel)
+                .where(IssueModel.project_id == target.id)
+                .order_by(IssueModel.issue_number)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [(issue.issue_number, issue.title) for issue in issues] == [
+        (1, "Existing"),
+        (2, 'First, with "quotes"'),
+        (3, "Second"),
+    ]
+    assert issues[1].type == "bug"
+    assert issues[1].assignee_id == test_user.id
+    assert issues[1].story_points == 3
+
+    label_names = (
+        (
+            await db_session.execute(
+                select(LabelModel.name)
+                .join(IssueLabelModel, IssueLabelModel.label_id == LabelModel.id)
+                .where(IssueLabelModel.issue_id == issues[1].id)
+                .order_by(LabelModel.name)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert label_names == ["api", "ui"]
+    value = await db_session.scalar(
+        select(CustomFieldValueModel.value).where(CustomFieldValueModel.issue_id == issues[1].id)
+    )
+    assert value == "S1"
+    activities = await db_session.scalar(
+        select(func.count())
+        .select_from(IssueActivityModel)
+        .where(IssueActivityModel.issue_id.in_([issues[1].id, issues[2].id]))
+    )
+    assert activities == 2
+
+
+@pytest.mark.asyncio
+async def test_import_issues_ndjson(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test NDJSON import creates contiguous issues and reuses existing labels."""
+    project = await _create_project(db_session, test_user, "NDJ")
+    existing = LabelModel(project_id=project.id, name="backend", color="#00ff00")
+    db_session.add(existing)
+    await db_session.flush()
+    content = "\n".join(
+        json.dumps(
+            {"title": f"Issue {n}", "labels": ["backend"], "reporter": test_user.email.value}
+        )
+        for n in range(1, 26)
+    )
+
+    response = await client.post(
+        f"/api/v1/projects/{project.id}/issues/import",
+        files={"file": ("issues.ndjson", content.encode(), "application/x-ndjson")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "imported": 25,
+        "first_issue_number": 1,
+        "error_count": 0,
+        "errors": [],
+    }
+    numbers = (
+        (
+            await db_session.execute(
+                select(IssueModel.issue_number)
+                .where(IssueModel.project_id == project.id)
+                .order_by(IssueModel.issue_number)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert numbers == list(range(1, 26))
+    label_count = await db_session.scalar(
+        select(func.count()).select_from(LabelModel).where(LabelModel.project_id == project.id)
+    )
+    assert label_count == 1
+
+
+@pytest.mark.asyncio
+async def test_import_issues_invalid_rows_import_nothing(
+    client: AsyncClient, test_user, db_session: AsyncSession, auth_headers
+):
+    """Test invalid rows are reported and no issue is created."""
+    project = await _create_project(db_session, test_user, "INV")
+    lines = [
+        json.dumps({"title": "Valid"}),
+        json.dumps({"title": "Bad type", "type": "feature"}),
+        "not json",
+        json.dumps({"title": "Stranger", "assignee": "nobody@example.com"}),
+        json.dumps({"title": "Unknown field", "custom_fields": {"Missing": 1}}),
+    ]
+
+    response = await client.post(
+        f"/api/v1/projects/{project.id}/issues/import",
+        files={"file": ("issues.ndjson", "\n".join(lines).encode(), "application/x-ndjson")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+    data = response.json()
+    assert data["imported"] == 0
+    assert data["error_count"] == 4
+    assert [error["row"] for error in data["errors"]] == [2, 3, 4, 5]
+    assert "nobody@example.com" in data["errors"][2]["message"]
+    issue_count = await db_session.scalar(
+        select(func.count()).select_from(IssueModel).where(IssueModel.project_id == project.id)
+    )
+    assert issue_count == 0
@@ -0,0 +1,250 @@
+"""Integration tests for the maintenance jobs and their scheduler."""
+
+import os
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.models import (
+    AttachmentModel,
+    InvitationModel,
+    IssueModel,
+    MaintenanceJobModel,
+    NotificationModel,
+    OrganizationModel,
+    OutboxEventModel,
+    PageModel,
+    PresenceModel,
+    ProjectModel,
+    SpaceModel,
+    TimeEntryModel,
+    TimeEntryRollupModel,
+)
+from src.infrastructure.services import LocalStorageService
+from src.infrastructure.services.maintenance import (
+    MaintenanceScheduler,
+    PurgeOrphanedFilesJob,
+    build_maintenance_jobs,
+)
+
+LONG_AGO = datetime.now(UTC) - timedelta(days=365)
+
+
+def _session_factory(connection) -> async_sessionmaker[AsyncSession]:
+    """Sessions whose commits are savepoints of the test transaction."""
+    return async_sessionmaker(
+        bind=connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+async def _scheduler(db_session, storage, **options) -> MaintenanceScheduler:
+    jobs = build_maintenance_jobs(
+        storage,
+        presence_stale_after=timedelta(hours=2),
+        soft_deleted_retention=timedelta(days=30),
+        notification_retention=timedelta(days=90),
+        expired_invitation_retention=timedelta(days=7),
+        outbox_retention=timedelta(days=7),
+        orphaned_file_grace=timedelta(hours=24),
+    )
+    options.setdefault("batch_delay_seconds", 0)
+    return MaintenanceScheduler(_session_factory(await db_session.connection()), jobs, **options)
+
+
+async def _ids(db_session, model) -> set:
+    result = await db_session.execute(select(model.id))
+    return set(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_retention_jobs_purge_old_rows_only(db_session, test_user, tmp_path):
+    """Test stale presences, old notifications, expired invitations and outbox events go."""
+    org = OrganizationModel(name="Maintenance Org", slug="maintenance-org")
+    db_session.add(org)
+    await db_session.flush()
+    space = SpaceModel(organization_id=org.id, name="Space", key="MNT")
+    db_session.add(space)
+    await db_session.flush()
+    page = PageModel(space_id=space.id, title="Page", slug="page", created_by=test_user.id)
+    db_session.add(page)
+    await db_session.flush()
+
+    stale_presence = PresenceModel(page_id=page.id, user_id=test_user.id, updated_at=LONG_AGO)
+    live_presence = PresenceModel(page_id=page.id, user_id=test_user.id)
+    old_notification = NotificationModel(
+        user_id=test_user.id, type="issue_assigned", title="Old", created_at=LONG_AGO
+    )
+    new_notification = NotificationModel(user_id=test_user.id, type="issue_assigned", title="New")
+    invitation = {"organization_id": org.id, "email": "x@example.com", "invited_by": test_user.id}
+    expired_invitation = InvitationModel(**invitation, token="expired", expires_at=LONG_AGO)
+    accepted_invitation = InvitationModel(
+        **invitation, token="accepted", expires_at=LONG_AGO, accepted_at=LONG_AGO
+    )
+    open_invitation = InvitationModel(
+        **invitation, token="open", expires_at=datetime.now(UTC) + timedelta(days=1)
+    )
+    processed_event = OutboxEventModel(event_type="x", payload={}, processed_at=LONG_AGO)
+    pending_event = OutboxEventModel(event_type="x", payload={}, created_at=LONG_AGO)
+    db_session.add_all(
+        [
+            stale_presence,
+            live_presence,
+            old_notification,
+            new_notification,
+            expired_invitation,
+            accepted_invitation,
+            open_invitation,
+            processed_event,
+            pending_event,
+        ]
+    )
+    await db_session.flush()
+
+    scheduler = await _scheduler(db_session, LocalStorageService(str(tmp_path)))
+    purged = await scheduler.run_due_jobs()
+
+    assert purged["purge_stale_presences"] == 1
+    assert purged["purge_old_notifications"] == 1
+    assert purged["purge_expired_invitations"] == 1
+    assert purged["purge_processed_outbox_events"] == 1
+    assert await _ids(db_session, PresenceModel) == {live_presence.id}
+    assert await _ids(db_session, NotificationModel) == {new_notification.id}
+    assert await _ids(db_session, InvitationModel) == {accepted_invitation.id, open_invitation.id}
+    assert await _ids(db_session, OutboxEventModel) == {pending_event.id}
+
+    # Outcome recorded; the jobs are not due again before their interval
+    job = await db_session.get(MaintenanceJobModel, "purge_stale_presences")
+    await db_session.refresh(job)
+    assert (job.last_purged, job.total_purged, job.last_error) == (1, 1, None)
+    assert await scheduler.run_due_jobs() == {}
+
+
+@pytest.mark.asyncio
+async def test_deleted_issues_purged_with_attachments_and_hours(db_session, test_user, tmp_path):
+    """Test purged issues leave no attachments nor hours, and parents of live issues stay."""
+    org = OrganizationModel(name="Maintenance Org", slug="maintenance-org")
+    db_session.add(org)
+    await db_session.flush()
+    project = ProjectModel(organization_id=org.id, name="Project", key="MNT")
+    db_session.add(project)
+    await db_session.flush()
+
+    def issue(number, **fields):
+        return IssueModel(
+            project_id=project.id,
+            issue_number=number,
+            title=f"Issue {number}",
+            reporter_id=test_user.id,
+            **fields,
+        )
+
+    deleted = issue(1, deleted_at=LONG_AGO)
+    recently_deleted = issue(2, deleted_at=datetime.now(UTC))
+    deleted_parent = issue(3, deleted_at=LONG_AGO)
+    live = issue(4)
+    db_session.add_all([deleted, recently_deleted, deleted_parent, live])
+    await db_session.flush()
+    live.parent_issue_id = deleted_parent.id
+
+    day = date(2026, 10, 5)
+    db_session.add_all(
+        [
+            TimeEntryModel(issue_id=deleted.id, user_id=test_user.id, hours=Decimal("2"), date=day),
+            TimeEntryModel(issue_id=live.id, user_id=test_user.id, hours=Decimal("3"), date=day),
+            TimeEntryRollupModel(
+                project_id=project.id,
+                user_id=test_user.id,
+                date=day,
+                hours=Decimal("5"),
+                entry_count=2,
+            ),
+            AttachmentModel(
+                entity_type="issue",
+                entity_id=deleted.id,
+                file_name="a.txt",
+                original_name="a.txt",
+                file_size=1,
+                mime_type="text/plain",
+                storage_path="attachments/a/a.txt",
+                uploaded_by=test_user.id,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    scheduler = await _scheduler(db_session, LocalStorageService(str(tmp_path)))
+    purged = await scheduler.run_due_jobs()
+
+    assert purged["purge_deleted_issues"] == 1
+    assert await _ids(db_session, IssueModel) == {recently_deleted.id, deleted_parent.id, live.id}
+    assert await _ids(db_session, AttachmentModel) == set()
+    result = await db_session.execute(
+        select(TimeEntryRollupModel.hours, TimeEntryRollupModel.entry_count)
+    )
+    assert result.all() == [(Decimal("3.00"), 1)]
+
+
+@pytest.mark.asyncio
+async def test_orphaned_files_sweep_resumes_across_runs(db_session, test_user, tmp_path):
+    """Test orphaned attachment files are deleted, a few per run, from where a run stopped."""
+    storage = LocalStorageService(str(tmp_path))
+    # Listed after the orphans (files are swept in path order)
+    attachment_id = UUID("ffffffff-0000-0000-0000-000000000000")
+    kept = f"attachments/{attachment_id}/kept.txt"
+    db_session.add(
+        AttachmentModel(
+            id=attachment_id,
+            entity_type="issue",
+            entity_id=test_user.id,
+            file_name="kept.txt",
+            original_name="kept.txt",
+            file_size=1,
+            mime_type="text/plain",
+            storage_path=kept,
+            uploaded_by=test_user.id,
+        )
+    )
+    await db_session.flush()
+
+    orphans = [
+        "attachments/00000000-0000-0000-0000-000000000001/a.txt",
+        "attachments/00000000-0000-0000-0000-000000000002/b.txt",
+    ]
+    for path in [kept, *orphans, "avatars/avatar.webp"]:
+        await storage.save(b"x", path, "text/plain")
+    # Old enough to be past the grace period
+    old = LONG_AGO.timestamp()
+    for file in tmp_path.rglob("*.*"):
+        os.utime(file, (old, old))
+
+    job = PurgeOrphanedFilesJob(timedelta(days=1), storage, timedelta(hours=24))
+    scheduler = MaintenanceScheduler(
+        _session_factory(await db_session.connection()),
+        [job],
+        batch_size=1,
+        batch_delay_seconds=0,
+        max_batches_per_run=2,
+    )
+
+    # The run stops after two batches, with the position of the sweep saved
+    assert await scheduler.run_due_jobs() == {job.name: 2}
+    state = await db_session.get(MaintenanceJobModel, job.name)
+    await db_session.refresh(state)
+    assert state.cursor == orphans[1]
+
+    # Resumes after the cursor (run directly, the job is not due yet) and finishes the sweep
+    assert await scheduler.run_job(job, state.cursor) == 0
+    await db_session.refresh(state)
+    assert state.cursor is None
+
+    assert not await storage.exists(orphans[0])
+    assert not await storage.exists(orphans[1])
+    assert await storage.exists(kept)
+    assert await storage.exists("avatars/avatar.webp")
@@ -0,0 +1,46 @@
+"""Integration tests for the metrics endpoint."""
+
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.config import Settings, get_settings
+
+
+@pytest.fixture
+def metrics_token(test_app) -> str:
+    """Configure a metrics token for the test app."""
+    token = "scraper-secret"
+    test_app.dependency_overrides[get_settings] = lambda: Settings(metrics_token=token)
+    return token
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_without_token(client: AsyncClient, test_app):
+    """Test the endpoint is not served when no metrics token is configured."""
+    test_app.dependency_overrides[get_settings] = lambda: Settings(metrics_token=None)
+
+    response = await client.get("/api/v1/metrics")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_token(client: AsyncClient, metrics_token):
+    """Test a missing or wrong token is rejected."""
+    response = await client.get("/api/v1/metrics")
+    assert response.status_code == 401
+
+    response = await client.get("/api/v1/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_metrics_with_token(client: AsyncClient, metrics_token):
+    """Test the scraper gets the metrics in Prometheus text format."""
+    response = await client.get(
+        "/api/v1/metrics", headers={"Authorization": f"Bearer {metrics_token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE" in response.text
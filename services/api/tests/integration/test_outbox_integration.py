@@ -0,0 +1,132 @@
+"""Integration tests for domain events delivered through the transactional outbox."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.models import (
+    IssueModel,
+    NotificationModel,
+    OrganizationMemberModel,
+    OrganizationModel,
+    OutboxEventModel,
+    ProjectMemberModel,
+    ProjectModel,
+    UserModel,
+)
+from src.infrastructure.services.outbox import OutboxDispatcher
+from src.presentation.dependencies.services import get_event_handler_registry
+
+
+async def _setup_issue(db_session, test_user):
+    """Create an organization, a project and an issue assigned to another user."""
+    org = OrganizationModel(name="Outbox Org", slug="outbox-org")
+    db_session.add(org)
+    await db_session.flush()
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+
+    project = ProjectModel(organization_id=org.id, name="Outbox Project", key="OUT")
+    db_session.add(project)
+    await db_session.flush()
+    db_session.add(ProjectMemberModel(project_id=project.id, user_id=test_user.id, role="admin"))
+
+    assignee = UserModel(email="assignee@example.com", password_hash="hash", name="Assignee")
+    db_session.add(assignee)
+    await db_session.flush()
+
+    issue = IssueModel(
+        project_id=project.id,
+        issue_number=1,
+        title="Outbox Issue",
+        type="task",
+        status="todo",
+        priority="medium",
+        reporter_id=test_user.id,
+        assignee_id=assignee.id,
+    )
+    db_session.add(issue)
+    await db_session.flush()
+    return issue, assignee
+
+
+async def _login(client: AsyncClient, test_user) -> dict[str, str]:
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _dispatcher(connection) -> OutboxDispatcher:
+    """Dispatcher whose batches run in savepoints of the test transaction."""
+    session_factory = async_sessionmaker(
+        bind=connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    return OutboxDispatcher(session_factory, get_event_handler_registry())
+
+
+@pytest.mark.asyncio
+async def test_status_change_notifies_assignee_through_outbox(
+    client: AsyncClient, test_user, db_session
+):
+    """Test a status change is notified by the dispatcher, not by the request."""
+    issue, assignee = await _setup_issue(db_session, test_user)
+    headers = await _login(client, test_user)
+
+    response = await client.put(
+        f"/api/v1/issues/{issue.id}", json={"status": "in_progress"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    # The request only wrote the event
+    result = await db_session.execute(select(OutboxEventModel))
+    (event,) = result.scalars().all()
+    assert event.event_type == "issue.status_changed"
+    assert event.payload["new_status"] == "in_progress"
+    result = await db_session.execute(
+        select(NotificationModel).where(NotificationModel.user_id == assignee.id)
+    )
+    assert result.scalars().all() == []
+
+    dispatcher = _dispatcher(await db_session.connection())
+    assert await dispatcher.dispatch_batch() == 1
+    assert await dispatcher.dispatch_batch() == 0
+
+    result = await db_session.execute(
+        select(NotificationModel).where(NotificationModel.user_id == assignee.id)
+    )
+    (notification,) = result.scalars().all()
+    assert notification.type == "issue_status_changed"
+    assert "Test User" in notification.content
+
+    await db_session.refresh(event)
+    assert event.processed_at is not None
+    assert event.completed_handlers == ["notifications"]
+
+
+@pytest.mark.asyncio
+async def test_comment_notifies_assignee_through_outbox(client: AsyncClient, test_user, db_session):
+    """Test a comment by the reporter notifies the assignee once dispatched."""
+    issue, assignee = await _setup_issue(db_session, test_user)
+    headers = await _login(client, test_user)
+
+    response = await client.post(
+        f"/api/v1/issues/{issue.id}/comments", json={"content": "On it"}, headers=headers
+    )
+    assert response.status_code == 201
+
+    result = await db_session.execute(select(OutboxEventModel.event_type))
+    assert result.scalars().all() == ["comment.created"]
+
+    await _dispatcher(await db_session.connection()).dispatch_batch()
+
+    # The author (reporter) is not notified, the assignee is
+    result = await db_session.execute(select(NotificationModel.user_id, NotificationModel.type))
+    assert result.all() == [(assignee.id, "issue_commented")]
@@ -0,0 +1,201 @@
+"""Integration tests for restricted pages."""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from src.application.services.page_access import PageAccessResolver
+from src.infrastructure.database.models import (
+    OrganizationMemberModel,
+    OrganizationModel,
+    PageModel,
+    PagePermissionModel,
+    SpaceModel,
+    SpacePermissionModel,
+    UserModel,
+)
+from src.infrastructure.services import InMemoryCacheService
+
+
+async def _restricted_space(db_session, test_user, role: str = "member"):
+    """Space with a page restricted to another user: Guide, Secret > Child, Notes."""
+    org = OrganizationModel(name="Access Org", slug=f"access-org-{uuid4().hex[:6]}")
+    other_user = UserModel(
+        email=f"other-{uuid4().hex[:6]}@example.com",
+        password_hash="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4yKJeyeQUzK6M5em",
+        name="Other User",
+        is_active=True,
+    )
+    db_session.add_all([org, other_user])
+    await db_session.flush()
+
+    db_session.add(OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role=role))
+    space = SpaceModel(organization_id=org.id, name="Access Space", key="ACCESS")
+    db_session.add(space)
+    await db_session.flush()
+
+    pages = {}
+    for title, parent in (("Guide", None), ("Secret", None), ("Child", "Secret"), ("Notes", None)):
+        page = PageModel(
+            space_id=space.id,
+            title=f"{title} doc",
+            slug=title.lower(),
+            content="doc",
+            parent_id=pages[parent].id if parent else None,
+            created_by=test_user.id,
+        )
+        db_session.add(page)
+        await db_session.flush()
+        pages[title] = page
+
+    db_session.add(
+        PagePermissionModel(page_id=pages["Secret"].id, user_id=other_user.id, role="edit")
+    )
+    # Readable by everyone, editable by nobody but admins
+    db_session.add(PagePermissionModel(page_id=pages["Notes"].id, user_id=None, role="read"))
+    await db_session.flush()
+    return space, pages, other_user
+
+
+async def _auth_headers(client: AsyncClient, test_user) -> dict[str, str]:
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    assert login_response.status_code == 200
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_restricted_pages_left_out(client: AsyncClient, test_user, db_session):
+    """Test tree, list and search leave out restricted pages and their children."""
+    space, pages, _ = await _restricted_space(db_session, test_user)
+    headers = await _auth_headers(client, test_user)
+
+    tree_response = await client.get(f"/api/v1/pages/spaces/{space.id}/tree", headers=headers)
+    list_response = await client.get(
+        "/api/v1/pages/", params={"space_id": str(space.id), "search": "doc"}, headers=headers
+    )
+    search_response = await client.get(
+        "/api/v1/pages/search", params={"space_id": str(space.id), "query": "doc"}, headers=headers
+    )
+
+    assert [page["title"] for page in tree_response.json()["pages"]] == ["Guide doc", "Notes doc"]
+    assert list_response.json()["total"] == 2
+    assert {page["title"] for page in list_response.json()["pages"]} == {"Guide doc", "Notes doc"}
+    assert search_response.json()["total"] == 2
+    assert {item["title"] for item in search_response.json()["items"]} == {
+        "Guide doc",
+        "Notes doc",
+    }
+
+    for title in ("Secret", "Child"):
+        response = await client.get(f"/api/v1/pages/{pages[title].id}", headers=headers)
+        assert response.status_code == 403
+
+    update_response = await client.put(
+        f"/api/v1/pages/{pages['Notes'].id}", json={"title": "Edited"}, headers=headers
+    )
+    assert update_response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_grant_applies_once_version_bumped(client: AsyncClient, test_user, db_session):
+    """Test a new grant is seen once the space access version changes."""
+    space, pages, _ = await _restricted_space(db_session, test_user)
+    headers = await _auth_headers(client, test_user)
+    tree_url = f"/api/v1/pages/spaces/{space.id}/tree"
+    await client.get(tree_url, headers=headers)
+
+    db_session.add(
+        PagePermissionModel(page_id=pages["Secret"].id, user_id=test_user.id, role="read")
+    )
+    await db_session.flush()
+    # Cached under the current version until the grant's use case bumps it
+    assert len((await client.get(tree_url, headers=headers)).json()["pages"]) == 2
+
+    await PageAccessResolver(db_session).invalidate(space.id)
+    tree = (await client.get(tree_url, headers=headers)).json()["pages"]
+
+    assert [page["title"] for page in tree] == ["Guide doc", "Secret doc", "Notes doc"]
+    assert tree[1]["children"][0]["title"] == "Child doc"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("role", "status_code"), [("member", 403), ("admin", 200)])
+async def test_restricted_space(
+    client: AsyncClient, test_user, db_session, role: str, status_code: int
+):
+    """Test members without a grant cannot read a restricted space, organization admins can."""
+    space, _, other_user = await _restricted_space(db_session, test_user, role=role)
+    db_session.add(SpacePermissionModel(space_id=space.id, user_id=other_user.id, role="view"))
+    await db_session.flush()
+    headers = await _auth_headers(client, test_user)
+
+    response = await client.get(f"/api/v1/pages/spaces/{space.id}/tree", headers=headers)
+
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert len(response.json()["pages"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_page_requires_edit_access(client: AsyncClient, test_user, db_session):
+    """Test pages are only created under pages the user may edit."""
+    space, pages, _ = await _restricted_space(db_session, test_user)
+    headers = await _auth_headers(client, test_user)
+
+    def create(title: str, parent: str | None = None):
+        return client.post(
+            "/api/v1/pages/",
+            json={
+                "space_id": str(space.id),
+                "title": title,
+                "parent_id": str(pages[parent].id) if parent else None,
+            },
+            headers=headers,
+        )
+
+    assert (await create("Under Notes", "Notes")).status_code == 403
+    assert (await create("Under Secret", "Secret")).status_code == 403
+    assert (await create("Under Guide", "Guide")).status_code == 201
+
+    # Read-only space: no root pages either
+    db_session.add(SpacePermissionModel(space_id=space.id, user_id=test_user.id, role="view"))
+    await db_session.flush()
+    await PageAccessResolver(db_session).invalidate(space.id)
+
+    assert (await create("Root")).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_restricted_spaces_resolved_together(test_user, db_session):
+    """Test the restricted spaces of an organization are loaded in one statement."""
+    space, pages, other_user = await _restricted_space(db_session, test_user)
+    locked = SpaceModel(organization_id=space.organization_id, name="Locked", key="LOCKED")
+    open_space = SpaceModel(organization_id=space.organization_id, name="Open", key="OPEN")
+    db_session.add_all([locked, open_space])
+    await db_session.flush()
+    db_session.add(SpacePermissionModel(space_id=locked.id, user_id=other_user.id, role="view"))
+    await db_session.flush()
+
+    statements: list[object] = []
+    record = statements.append
+    event.listen(db_session.sync_session, "do_orm_execute", record)
+    resolver = PageAccessResolver(db_session, InMemoryCacheService())
+    try:
+        access = await resolver.resolve_restricted(space.organization_id, test_user.id)
+        cached = await resolver.resolve_restricted(space.organization_id, test_user.id)
+    finally:
+        event.remove(db_session.sync_session, "do_orm_execute", record)
+
+    assert set(access) == {space.id, locked.id}
+    assert access[space.id].hidden == {pages["Secret"].id, pages["Child"].id}
+    assert access[space.id].edit_overrides == {pages["Notes"].id}
+    assert not access[locked.id].can_read_space
+    assert access[space.id] == await PageAccessResolver(db_session).resolve(space.id, test_user.id)
+    assert cached == access
+    # Spaces, versions and one load, then spaces and versions from the cache
+    assert len(statements) == 5
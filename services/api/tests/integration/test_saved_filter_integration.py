@@ -1,13 +1,22 @@
 """Integration tests for saved filter endpoints."""
 
+from datetime import UTC, datetime
+
 import pytest
 from httpx import AsyncClient
 
 from src.infrastructure.database.models import (
+    CustomFieldModel,
+    CustomFieldValueModel,
+    IssueLabelModel,
+    IssueModel,
+    LabelModel,
     OrganizationMemberModel,
     OrganizationModel,
     ProjectMemberModel,
     ProjectModel,
+    SprintIssueModel,
+    SprintModel,
 )
 
 
@@ -359,3 +368,144 @@ async def test_delete_saved_filter_success(client: AsyncClient, test_user, db_se
         headers=auth_headers,
     )
     assert get_response.status_code == 404
+
+
+async def _filter_fixture(client: AsyncClient, test_user, db_session):
+    """Project with labelled, sprint and custom field issues; returns (project, headers)."""
+    org = OrganizationModel(name="Filter Org", slug="filter-org")
+    db_session.add(org)
+    await db_session.flush()
+    db_session.add(
+        OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role="admin")
+    )
+    project = ProjectModel(organization_id=org.id, name="Filter Project", key="FLT")
+    db_session.add(project)
+    await db_session.flush()
+
+    issues = [
+        IssueModel(
+            project_id=project.id,
+            issue_number=number,
+            title=f"Issue {number}",
+            status="todo" if number % 2 else "done",
+            reporter_id=test_user.id,
+            assignee_id=test_user.id if number <= 3 else None,
+            created_at=datetime(2026, 1, number, tzinfo=UTC),
+        )
+        for number in range(1, 8)
+    ]
+    label = LabelModel(project_id=project.id, name="backend", color="#00ff00")
+    sprint = SprintModel(project_id=project.id, name="Sprint 1")
+    field = CustomFieldModel(project_id=project.id, name="Team", type="select", options=["A", "B"])
+    db_session.add_all([*issues, label, sprint, field])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            IssueLabelModel(issue_id=issues[0].id, label_id=label.id),
+            IssueLabelModel(issue_id=issues[2].id, label_id=label.id),
+            SprintIssueModel(sprint_id=sprint.id, issue_id=issues[0].id),
+            CustomFieldValueModel(custom_field_id=field.id, issue_id=issues[2].id, value="A"),
+        ]
+    )
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    token = login_response.json()["access_token"]
+    return project, {"Authorization": f"Bearer {token}"}, sprint
+
+
+async def _create_filter(client: AsyncClient, headers: dict, project_id, criteria: dict) -> str:
+    response = await client.post(
+        "/api/v1/saved-filters",
+        json={"name": "Filter", "project_id": str(project_id), "filter_criteria": criteria},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_saved_filter_issues_keyset_pages(client: AsyncClient, test_user, db_session):
+    """Test a filter's issues are paged newest first by cursor."""
+    project, headers, _ = await _filter_fixture(client, test_user, db_session)
+    filter_id = await _create_filter(client, headers, project.id, {"status": "todo"})
+
+    keys = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(
+            f"/api/v1/saved-filters/{filter_id}/issues", params=params, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 4
+        keys.extend(issue["key"] for issue in data["issues"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert keys == ["FLT-7", "FLT-5", "FLT-3", "FLT-1"]
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_saved_filter_issues_criteria(client: AsyncClient, test_user, db_session):
+    """Test labels, sprint, custom field, assignee and date criteria."""
+    project, headers, sprint = await _filter_fixture(client, test_user, db_session)
+
+    async def matching(criteria: dict) -> list[str]:
+        filter_id = await _create_filter(client, headers, project.id, criteria)
+        response = await client.get(f"/api/v1/saved-filters/{filter_id}/issues", headers=headers)
+        assert response.status_code == 200
+        return [issue["key"] for issue in response.json()["issues"]]
+
+    assert await matching({"labels": ["backend"]}) == ["FLT-3", "FLT-1"]
+    assert await matching({"sprint_id": str(sprint.id)}) == ["FLT-1"]
+    assert await matching({"labels": "backend", "sprint_id": [None]}) == ["FLT-3"]
+    assert await matching({"custom_fields": {"Team": "A"}}) == ["FLT-3"]
+    assert await matching({"assignee_id": [None], "status": "todo"}) == ["FLT-7", "FLT-5"]
+    assert await matching({"created_at": {"from": "2026-01-02", "to": "2026-01-03"}}) == [
+        "FLT-3",
+        "FLT-2",
+    ]
+    assert await matching({"text": "issue 6"}) == ["FLT-6"]
+
+
+@pytest.mark.asyncio
+async def test_saved_filter_count_invalidated_by_issue_write(
+    client: AsyncClient, test_user, db_session
+):
+    """Test the cached total is refreshed when an issue of the project is created."""
+    project, headers, _ = await _filter_fixture(client, test_user, db_session)
+    filter_id = await _create_filter(client, headers, project.id, {"status": "todo"})
+    url = f"/api/v1/saved-filters/{filter_id}/issues"
+
+    assert (await client.get(url, headers=headers)).json()["total"] == 4
+
+    create_response = await client.post(
+        "/api/v1/issues/",
+        json={"project_id": str(project.id), "title": "New todo", "status": "todo"},
+        headers=headers,
+    )
+    assert create_response.status_code == 201
+
+    assert (await client.get(url, headers=headers)).json()["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_saved_filter_issues_invalid_cursor(client: AsyncClient, test_user, db_session):
+    """Test a malformed cursor is rejected."""
+    project, headers, _ = await _filter_fixture(client, test_user, db_session)
+    filter_id = await _create_filter(client, headers, project.id, {})
+
+    response = await client.get(
+        f"/api/v1/saved-filters/{filter_id}/issues",
+        params={"cursor": "garbage"},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
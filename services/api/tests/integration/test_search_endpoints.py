@@ -4,13 +4,20 @@ from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
 
 from src.infrastructure.database.models import (
+    IssueActivityModel,
+    IssueModel,
     OrganizationMemberModel,
     OrganizationModel,
+    PageModel,
+    PagePermissionModel,
     ProjectModel,
     SpaceModel,
+    UserModel,
 )
+from src.infrastructure.database.repositories import SQLAlchemyIssueRepository
 
 
 @pytest.mark.asyncio
@@ -122,3 +129,190 @@ async def test_search_pages_endpoint(client: AsyncClient, test_user, db_session)
     data = search_response.json()
     assert data["total"] >= 1
     assert any(item["entity_type"] == "page" for item in data["items"])
+
+
+async def _federated_organization(db_session, test_user, role: str) -> OrganizationModel:
+    """Organization with two projects and a space, one page of it granted to another user."""
+    org = OrganizationModel(name="Federated Org", slug=f"federated-org-{uuid4().hex[:6]}")
+    other_user = UserModel(
+        email=f"other-{uuid4().hex[:6]}@example.com",
+        password_hash="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4yKJeyeQUzK6M5em",
+        name="Other User",
+        is_active=True,
+    )
+    db_session.add_all([org, other_user])
+    await db_session.flush()
+    db_session.add(OrganizationMemberModel(organization_id=org.id, user_id=test_user.id, role=role))
+
+    backend = ProjectModel(organization_id=org.id, name="Backend", key="BACK")
+    frontend = ProjectModel(organization_id=org.id, name="Frontend", key="FRONT")
+    space = SpaceModel(organization_id=org.id, name="Handbook", key="HAND")
+    db_session.add_all([backend, frontend, space])
+    await db_session.flush()
+
+    issues = [
+        (backend, "Deploy pipeline broken", "Every deploy fails", None),
+        (backend, "Upgrade database", "Needed before the next deploy", None),
+        (frontend, "Login button misaligned", None, None),
+        (frontend, "Deploy preview apps", None, func.now()),
+    ]
+    for number, (project, title, description, deleted_at) in enumerate(issues, start=1):
+        db_session.add(
+            IssueModel(
+                project_id=project.id,
+                issue_number=number,
+                title=title,
+                description=description,
+                status="todo",
+                priority="medium",
+                reporter_id=test_user.id,
+                deleted_at=deleted_at,
+            )
+        )
+
+    pages = [
+        PageModel(
+            space_id=space.id,
+            title=title,
+            slug=title.lower().replace(" ", "-"),
+            content=content,
+            created_by=test_user.id,
+        )
+        for title, content in (("Deploy guide", "How to deploy"), ("Deploy secrets", "Keys"))
+    ]
+    db_session.add_all(pages)
+    await db_session.flush()
+    db_session.add(PagePermissionModel(page_id=pages[1].id, user_id=other_user.id, role="read"))
+    await db_session.flush()
+    return org
+
+
+@pytest.mark.asyncio
+async def test_search_organization_endpoint(client: AsyncClient, test_user, db_session):
+    """Search every project and space, best matches first, with facets and global pages."""
+    org = await _federated_organization(db_session, test_user, role="member")
+    headers = await _auth_headers(client, test_user)
+    url = f"/api/v1/organizations/{org.id}/search"
+
+    response = await client.get(url, params={"query": "deploy"}, headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    # Deleted issues and pages restricted to another user are left out
+    assert data["total"] == 3
+    assert {item["title"] for item in data["items"]} == {
+        "Deploy pipeline broken",
+        "Upgrade database",
+        "Deploy guide",
+    }
+    scores = [item["score"] for item in data["items"]]
+    assert scores == sorted(scores, reverse=True)
+    assert all(0 < score < 1 for score in scores)
+    # Title words rank above body words
+    assert data["items"][-1]["title"] == "Upgrade database"
+    assert data["facets"]["issues"] == 2
+    assert data["facets"]["pages"] == 1
+    assert [(facet["name"], facet["count"]) for facet in data["facets"]["projects"]] == [
+        ("Backend", 2)
+    ]
+    assert [(facet["name"], facet["count"]) for facet in data["facets"]["spaces"]] == [
+        ("Handbook", 1)
+    ]
+
+    pages = [
+        (
+            await client.get(
+                url, params={"query": "deploy", "page": page, "limit": 2}, headers=headers
+            )
+        ).json()
+        for page in (1, 2)
+    ]
+    assert [len(page["items"]) for page in pages] == [2, 1]
+    assert [item["id"] for page in pages for item in page["items"]] == [
+        item["id"] for item in data["items"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_organization_admin_and_non_member(client: AsyncClient, test_user, db_session):
+    """Test organization admins see restricted pages, non members are refused."""
+    org = await _federated_organization(db_session, test_user, role="admin")
+    headers = await _auth_headers(client, test_user)
+
+    response = await client.get(
+        f"/api/v1/organizations/{org.id}/search",
+        params={"query": "deploy", "type": "pages"},
+        headers=headers,
+    )
+    other_org_response = await client.get(
+        f"/api/v1/organizations/{uuid4()}/search", params={"query": "deploy"}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert {item["title"] for item in response.json()["items"]} == {
+        "Deploy guide",
+        "Deploy secrets",
+    }
+    assert response.json()["facets"]["issues"] == 0
+    assert other_org_response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_typeahead_endpoint(client: AsyncClient, test_user, db_session):
+    """Test keys, titles, projects and members are suggested, recent issues first."""
+    org = await _federated_organization(db_session, test_user, role="member")
+    headers = await _auth_headers(client, test_user)
+    url = f"/api/v1/organizations/{org.id}/typeahead"
+    login = await db_session.scalar(
+        select(IssueModel)
+        .join(ProjectModel)
+        .where(
+            ProjectModel.organization_id == org.id, IssueModel.title == "Login button misaligned"
+        )
+    )
+    db_session.add(IssueActivityModel(issue_id=login.id, user_id=test_user.id, action="updated"))
+    await db_session.flush()
+
+    async def suggest(query: str) -> list[dict]:
+        response = await client.get(url, params={"query": query}, headers=headers)
+        assert response.status_code == 200
+        return response.json()["items"]
+
+    by_key = await suggest("back-1")
+    assert (by_key[0]["key"], by_key[0]["label"]) == ("BACK-1", "Deploy pipeline broken")
+    # Deleted issues are left out
+    assert [(item["entity_type"], item["label"]) for item in await suggest("deploy")] == [
+        ("issue", "Deploy pipeline broken")
+    ]
+    # The project of the recent issue comes first
+    assert [item["label"] for item in await suggest("end")] == ["Frontend", "Backend"]
+    assert [item["key"] for item in await suggest("upgrade")] == ["BACK-2"]
+    assert any(
+        item["entity_type"] == "user" and item["id"] == str(test_user.id)
+        for item in await suggest(test_user.email.value[:6])
+    )
+    # Too short for the trigram indexes: only recent issues match titles
+    assert [item["label"] for item in await suggest("lo")] == ["Login button misaligned"]
+
+
+@pytest.mark.asyncio
+async def test_get_issue_by_key_within_organization(test_user, db_session):
+    """Test issue keys are looked up within the organization only."""
+    org = await _federated_organization(db_session, test_user, role="member")
+    repository = SQLAlchemyIssueRepository(db_session)
+
+    issue = await repository.get_by_key(org.id, "back", 1)
+
+    assert issue is not None and issue.title == "Deploy pipeline broken"
+    assert await repository.get_by_key(uuid4(), "BACK", 1) is None
+    # Deleted issues have no key
+    assert await repository.get_by_key(org.id, "FRONT", 4) is None
+
+
+async def _auth_headers(client: AsyncClient, test_user) -> dict[str, str]:
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    assert login_response.status_code == 200
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
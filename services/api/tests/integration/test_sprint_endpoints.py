@@ -5,11 +5,15 @@ from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
 from src.infrastructure.database.models import (
+    IssueModel,
     OrganizationModel,
     ProjectModel,
+    SprintIssueModel,
     SprintModel,
+    SprintSnapshotModel,
 )
 
 
@@ -557,3 +561,99 @@ async def test_complete_sprint_success(client: AsyncClient, test_user, db_sessio
     assert get_response.status_code == 200
     sprint_data = get_response.json()
     assert sprint_data["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_complete_sprint_moves_incomplete_issues_to_next_sprint(
+    client: AsyncClient, test_user, db_session
+):
+    """Test completing a sprint moves incomplete issues to the next sprint and records a snapshot."""
+    org = OrganizationModel(name="Test Org", slug="test-org")
+    db_session.add(org)
+    await db_session.flush()
+
+    project = ProjectModel(organization_id=org.id, name="Test Project", key="TEST")
+    db_session.add(project)
+    await db_session.flush()
+
+    sprint = SprintModel(
+        project_id=project.id,
+        name="Sprint 1",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 14),
+        status="active",
+    )
+    next_sprint = SprintModel(project_id=project.id, name="Sprint 2", status="planned")
+    db_session.add_all([sprint, next_sprint])
+    await db_session.flush()
+
+    issues = [
+        IssueModel(
+            project_id=project.id,
+            issue_number=number,
+            title=f"Issue {number}",
+            status=status,
+            story_points=points,
+            reporter_id=test_user.id,
+        )
+        for number, status, points in [(1, "todo", 3), (2, "done", 5), (3, "in_progress", 2)]
+    ]
+    planned = IssueModel(
+        project_id=project.id, issue_number=4, title="Planned", reporter_id=test_user.id
+    )
+    db_session.add_all([*issues, planned])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            SprintIssueModel(sprint_id=sprint.id, issue_id=issue.id, order=order)
+            for order, issue in enumerate(issues)
+        ]
+    )
+    db_session.add(SprintIssueModel(sprint_id=next_sprint.id, issue_id=planned.id, order=0))
+    await db_session.flush()
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user.email.value, "password": "TestPassword123!"},
+    )
+    auth_headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    complete_response = await client.post(
+        f"/api/v1/sprints/{sprint.id}/complete",
+        json={"move_incomplete_to_sprint_id": str(next_sprint.id)},
+        headers=auth_headers,
+    )
+
+    assert complete_response.status_code == 200
+    data = complete_response.json()
+    assert data["incomplete_issues_moved"] == 2
+    assert data["moved_to_sprint_id"] == str(next_sprint.id)
+    # Final metrics cover the sprint scope at close, moved issues included
+    assert data["metrics"]["total_story_points"] == 10
+    assert data["metrics"]["completed_story_points"] == 5
+
+    # Moved issues are appended to the next sprint in their sprint order
+    result = await db_session.execute(
+        select(SprintIssueModel.issue_id, SprintIssueModel.order)
+        .where(SprintIssueModel.sprint_id == next_sprint.id)
+        .order_by(SprintIssueModel.order)
+    )
+    assert [tuple(row) for row in result.all()] == [
+        (planned.id, 0),
+        (issues[0].id, 1),
+        (issues[2].id, 2),
+    ]
+
+    # Metrics of the completed sprint come from its snapshot
+    metrics_response = await client.get(
+        f"/api/v1/sprints/{sprint.id}/metrics", headers=auth_headers
+    )
+    assert metrics_response.status_code == 200
+    assert metrics_response.json()["total_story_points"] == 10
+
+    snapshot = await db_session.get(SprintSnapshotModel, sprint.id)
+    assert snapshot is not None
+    assert snapshot.total_issues == 3
+    assert snapshot.incomplete_issues == 2
+    assert [entry["issue_id"] for entry in snapshot.issues] == [str(i.id) for i in issues]
@@ -519,3 +519,87 @@ async def test_get_time_summary_issue_not_found(client: AsyncClient, test_user):
         headers=auth_headers,
     )
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_timesheets_follow_time_entry_changes(client: AsyncClient, test_user, db_session):
+    """Test timesheets sum the entries by day as they are created, moved and deleted."""
+    issue, auth_headers = await _add_org_project_issue_and_login(client, test_user, db_session)
+    project = await db_session.get(ProjectModel, issue.project_id)
+
+    entry_ids = []
+    for hours, day in [(2.0, "2026-10-13"), (1.5, "2026-10-13"), (3.0, "2026-10-14")]:
+        create_resp = await client.post(
+            f"/api/v1/issues/{issue.id}/time-entries",
+            json={"hours": hours, "date": day},
+            headers=auth_headers,
+        )
+        assert create_resp.status_code == 201
+        entry_ids.append(create_resp.json()["id"])
+
+    # Move the second entry to the next week, delete the third
+    update_resp = await client.put(
+        f"/api/v1/time-entries/{entry_ids[1]}",
+        json={"hours": 4.0, "date": "2026-10-20"},
+        headers=auth_headers,
+    )
+    assert update_resp.status_code == 200
+    delete_resp = await client.delete(f"/api/v1/time-entries/{entry_ids[2]}", headers=auth_headers)
+    assert delete_resp.status_code == 204
+
+    week_resp = await client.get(
+        f"/api/v1/organizations/{project.organization_id}/members/{test_user.id}/timesheet",
+        params={"week": "2026-10-15"},
+        headers=auth_headers,
+    )
+    assert week_resp.status_code == 200
+    week = week_resp.json()
+    assert week["start_date"] == "2026-10-12"
+    assert week["end_date"] == "2026-10-18"
+    assert float(week["total_hours"]) == 2.0
+    assert [row["name"] for row in week["rows"]] == ["Test Project"]
+    assert {day: float(hours) for day, hours in week["rows"][0]["hours_by_date"].items()} == {
+        "2026-10-13": 2.0
+    }
+
+    month_resp = await client.get(
+        f"/api/v1/projects/{project.id}/timesheet",
+        params={"month": "2026-10-01"},
+        headers=auth_headers,
+    )
+    assert month_resp.status_code == 200
+    month = month_resp.json()
+    assert month["end_date"] == "2026-10-31"
+    assert float(month["total_hours"]) == 6.0
+    assert [row["id"] for row in month["rows"]] == [str(test_user.id)]
+    assert {day: float(hours) for day, hours in month["hours_by_date"].items()} == {
+        "2026-10-13": 2.0,
+        "2026-10-20": 4.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_user_timesheet_of_another_member_requires_admin(
+    client: AsyncClient, test_user, db_session
+):
+    """Test members cannot read the timesheet of another member."""
+    from uuid import uuid4
+
+    issue, auth_headers = await _add_org_project_issue_and_login(client, test_user, db_session)
+    project = await db_session.get(ProjectModel, issue.project_id)
+    member = await db_session.get(OrganizationMemberModel, (project.organization_id, test_user.id))
+    member.role = "member"
+    await db_session.flush()
+
+    own_resp = await client.get(
+        f"/api/v1/organizations/{project.organization_id}/members/{test_user.id}/timesheet",
+        headers=auth_headers,
+    )
+    assert own_resp.status_code == 200
+    assert own_resp.json()["rows"] == []
+
+    other_resp = await client.get(
+        f"/api/v1/organizations/{project.organization_id}/members/{uuid4()}/timesheet",
+        headers=auth_headers,
+    )
+    assert other_resp.status_code == 403
@@ -0,0 +1,114 @@
+"""Fixtures for the endpoint benchmarks (seeded large tenant, app client, baselines)."""
+
+import os
+from collections.abc import Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.config import Base
+from src.infrastructure.security import JWTTokenService
+from tests.performance.dataset import BenchmarkTenant, seed_tenant
+from tests.performance.harness import BaselineStore, BenchmarkResult, RequestFn, run_benchmark
+
+BenchmarkFn = Callable[..., Awaitable[BenchmarkResult]]
+
+_results: list[BenchmarkResult] = []
+
+
+@pytest.fixture(scope="session")
+def benchmark_scale() -> int:
+    """Dataset scale factor (env `BENCHMARK_SCALE`, default 1)."""
+    return int(os.environ.get("BENCHMARK_SCALE", "1"))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def benchmark_tenant(test_engine, benchmark_scale) -> BenchmarkTenant:
+    """Seed the large tenant once per session and remove it afterwards."""
+    async with test_engine.begin() as conn:
+        tenant = await seed_tenant(conn, benchmark_scale)
+
+    yield tenant
+
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with test_engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def benchmark_client(test_engine, benchmark_tenant) -> AsyncClient:
+    """Client of an app whose requests each get a committing session (as in production)."""
+    from src.infrastructure.database import get_read_session, get_session
+    from src.main import create_app
+
+    app = create_app(enable_rate_limiting=False)
+    session_factory = async_sessionmaker(
+        bind=test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def _get_session_override():
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_session] = _get_session_override
+    app.dependency_overrides[get_read_session] = _get_session_override
+
+    token = JWTTokenService().create_access_token(benchmark_tenant.user_id)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def baseline_store(request) -> BaselineStore:
+    """Baselines file; rewritten at the end of the session with `--benchmark-update`."""
+    store = BaselineStore()
+    yield store
+    if request.config.getoption("--benchmark-update"):
+        store.save()
+
+
+@pytest.fixture
+def benchmark(request, baseline_store, benchmark_scale) -> BenchmarkFn:
+    """Run a benchmark and fail if it regresses from its baseline.
+
+    Usage:
+        result = await benchmark("board_issues", lambda: client.get(url))
+    """
+    update = request.config.getoption("--benchmark-update")
+
+    async def _run(name: str, call: RequestFn, iterations: int = 10) -> BenchmarkResult:
+        result = await run_benchmark(name, call, iterations=iterations)
+        _results.append(result)
+        if update:
+            baseline_store.record(benchmark_scale, result)
+            return result
+        problems = baseline_store.regressions(benchmark_scale, result)
+        if problems:
+            pytest.fail(f"Benchmark {name} regressed: " + "; ".join(problems))
+        return result
+
+    return _run
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """Print the measurements of the benchmarks that ran."""
+    if not _results:
+        return
+    terminalreporter.section("benchmarks")
+    for result in _results:
+        terminalreporter.write_line(result.summary())
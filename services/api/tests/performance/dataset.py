@@ -0,0 +1,72 @@
+"""Large tenant seeded for the endpoint benchmarks.
+
+The tenant is built by the dataset generator (scripts/generate_dataset.py)
+with a fixed seed, so statement counts measured against it are
+reproducible. Sizes scale linearly with `scale` (env `BENCHMARK_SCALE`,
+default 1): 20 users, 20 projects with 3000 issues (a third in the "hot"
+project the benchmarks request) and a space of 300 pages.
+"""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from scripts.generate_dataset import TenantSize, generate_tenant
+from src.infrastructure.database.models import IssueModel
+
+SEED = 20260301
+
+BENCHMARK_SIZE = TenantSize(
+    users=20,
+    projects=20,
+    issues=3000,
+    hot_project_share=1 / 3,
+    labels_per_project=8,
+    labels_per_issue=1.0,
+    spaces=1,
+    pages=300,
+    max_page_depth=6,
+)
+
+
+@dataclass
+class BenchmarkTenant:
+    """Identifiers of the seeded tenant used by the benchmarks."""
+
+    user_id: UUID
+    organization_id: UUID
+    project_id: UUID
+    board_id: UUID
+    space_id: UUID
+    # Backlog of the hot project, highest priority first
+    backlog_issue_ids: list[UUID] = field(default_factory=list)
+    search_term: str = "billing"
+
+
+async def seed_tenant(conn: AsyncConnection, scale: int = 1) -> BenchmarkTenant:
+    """Generate the benchmark tenant.
+
+    Args:
+        conn: Connection inside a transaction (committed by the caller)
+        scale: Linear size multiplier
+
+    Returns:
+        Identifiers the benchmarks request
+    """
+    tenant = await generate_tenant(conn, BENCHMARK_SIZE.scaled(scale), seed=SEED)
+    project_id = tenant.project_ids[0]
+    backlog = await conn.execute(
+        select(IssueModel.id)
+        .where(IssueModel.project_id == project_id, IssueModel.backlog_order.is_not(None))
+        .order_by(IssueModel.backlog_order)
+    )
+    return BenchmarkTenant(
+        user_id=tenant.admin_user_id,
+        organization_id=tenant.organization_id,
+        project_id=project_id,
+        board_id=tenant.board_ids[0],
+        space_id=tenant.space_ids[0],
+        backlog_issue_ids=list(backlog.scalars()),
+    )
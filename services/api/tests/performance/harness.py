@@ -0,0 +1,194 @@
+"""Benchmark harness: latency percentiles, statement counts, peak memory, baselines.
+
+Each benchmark issues the same request repeatedly against the in-process
+app and records:
+
+- latency percentiles (p50, p95, max) over the timed iterations
+- the number of SQL statements of one request (from the `db` entry of the
+  `Server-Timing` header written by `TimingMiddleware`)
+- the peak Python memory allocated while serving one request (tracemalloc,
+  measured in a separate run so that tracing does not skew latencies)
+
+Results are compared against `baselines.json`. Statement counts are
+deterministic for the seeded tenant, so any increase is a regression.
+Latency and memory depend on the machine: they fail only beyond a relative
+tolerance plus an absolute slack absorbing noise on very small values.
+"""
+
+import json
+import math
+import os
+import re
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from httpx import Response
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+# Relative tolerances before a measurement counts as a regression
+DEFAULT_LATENCY_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.25
+
+# Absolute slack added to the tolerances (noise on fast endpoints)
+LATENCY_SLACK_MS = 5.0
+MEMORY_SLACK_KB = 256.0
+
+_DB_STATEMENTS_RE = re.compile(r'(?:^|,\s*)db;[^,]*desc="(\d+) queries"')
+
+RequestFn = Callable[[], Awaitable[Response]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark."""
+
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    statements: int
+    peak_memory_kb: float
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"{self.name}: p50={self.p50_ms:.1f}ms p95={self.p95_ms:.1f}ms "
+            f"max={self.max_ms:.1f}ms statements={self.statements} "
+            f"peak_memory={self.peak_memory_kb:.0f}KB"
+        )
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def statement_count(response: Response) -> int:
+    """Number of SQL statements reported in the `Server-Timing` header (0 if none)."""
+    match = _DB_STATEMENTS_RE.search(response.headers.get("server-timing", ""))
+    return int(match.group(1)) if match else 0
+
+
+def _check_response(name: str, response: Response) -> None:
+    if response.status_code >= 400:
+        raise AssertionError(
+            f"Benchmark {name} failed with {response.status_code}: {response.text[:500]}"
+        )
+
+
+async def run_benchmark(
+    name: str,
+    request: RequestFn,
+    iterations: int = 10,
+    warmup: int = 2,
+) -> BenchmarkResult:
+    """Measure an endpoint.
+
+    Args:
+        name: Benchmark name (key in the baselines file)
+        request: Coroutine function issuing the request
+        iterations: Timed requests
+        warmup: Untimed requests issued first (caches, prepared statements)
+
+    Returns:
+        Benchmark measurements
+
+    Raises:
+        AssertionError: If a request returns an error status
+    """
+    for _ in range(warmup):
+        _check_response(name, await request())
+
+    durations_ms: list[float] = []
+    statements = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = await request()
+        durations_ms.append((time.perf_counter() - started) * 1000)
+        _check_response(name, response)
+        statements = max(statements, statement_count(response))
+
+    tracemalloc.start()
+    try:
+        _check_response(name, await request())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        p50_ms=round(percentile(durations_ms, 50), 2),
+        p95_ms=round(percentile(durations_ms, 95), 2),
+        max_ms=round(max(durations_ms), 2),
+        statements=statements,
+        peak_memory_kb=round(peak / 1024, 1),
+    )
+
+
+def _tolerance(env_var: str, default: float) -> float:
+    value = os.environ.get(env_var)
+    return float(value) if value else default
+
+
+class BaselineStore:
+    """Baselines file, keyed by dataset scale then benchmark name."""
+
+    def __init__(self, path: Path = BASELINES_PATH) -> None:
+        self.path = path
+        self._data: dict[str, dict[str, dict[str, Any]]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+        self.latency_tolerance = _tolerance(
+            "BENCHMARK_LATENCY_TOLERANCE", DEFAULT_LATENCY_TOLERANCE
+        )
+        self.memory_tolerance = _tolerance("BENCHMARK_MEMORY_TOLERANCE", DEFAULT_MEMORY_TOLERANCE)
+
+    def get(self, scale: int, name: str) -> dict[str, Any] | None:
+        """Get the baseline of a benchmark at a scale."""
+        return self._data.get(str(scale), {}).get(name)
+
+    def regressions(self, scale: int, result: BenchmarkResult) -> list[str]:
+        """Describe how a result regresses from its baseline (empty if it does not).
+
+        A benchmark without baseline never regresses (record one with
+        `--benchmark-update`).
+        """
+        baseline = self.get(scale, result.name)
+        if baseline is None:
+            return []
+
+        problems = []
+        if result.statements > baseline["statements"]:
+            problems.append(f"statements {result.statements} > baseline {baseline['statements']}")
+        latency_limit = baseline["p95_ms"] * (1 + self.latency_tolerance) + LATENCY_SLACK_MS
+        if result.p95_ms > latency_limit:
+            problems.append(
+                f"p95 {result.p95_ms:.1f}ms > {latency_limit:.1f}ms "
+                f"(baseline {baseline['p95_ms']:.1f}ms)"
+            )
+        memory_limit = baseline["peak_memory_kb"] * (1 + self.memory_tolerance) + MEMORY_SLACK_KB
+        if result.peak_memory_kb > memory_limit:
+            problems.append(
+                f"peak memory {result.peak_memory_kb:.0f}KB > {memory_limit:.0f}KB "
+                f"(baseline {baseline['peak_memory_kb']:.0f}KB)"
+            )
+        return problems
+
+    def record(self, scale: int, result: BenchmarkResult) -> None:
+        """Set a result as the new baseline (written by `save`)."""
+        entry = asdict(result)
+        del entry["name"]
+        self._data.setdefault(str(scale), {})[result.name] = entry
+
+    def save(self) -> None:
+        """Write the baselines file (sorted, stable diffs)."""
+        self.path.write_text(json.dumps(self._data, indent=2, sort_keys=True) + "\n")
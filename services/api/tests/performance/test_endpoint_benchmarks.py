@@ -0,0 +1,83 @@
+"""Endpoint benchmarks against the seeded large tenant.
+
+Run with `pytest tests/performance --benchmark`; record new baselines with
+`--benchmark-update` (see tests/README.md).
+"""
+
+from itertools import cycle
+
+import pytest
+from httpx import AsyncClient
+
+from tests.performance.dataset import BenchmarkTenant
+
+pytestmark = pytest.mark.benchmark
+
+
+async def test_board_issues(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /boards/{id}/issues on a board with one list per label."""
+    url = f"/api/v1/boards/{benchmark_tenant.board_id}/issues"
+    await benchmark("board_issues", lambda: benchmark_client.get(url), iterations=5)
+
+
+async def test_page_tree(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /pages/spaces/{id}/tree on a deep page tree."""
+    url = f"/api/v1/pages/spaces/{benchmark_tenant.space_id}/tree"
+    await benchmark("page_tree", lambda: benchmark_client.get(url))
+
+
+async def test_search_issues(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /search restricted to the issues of the large project."""
+    params = {
+        "query": benchmark_tenant.search_term,
+        "type": "issues",
+        "project_id": str(benchmark_tenant.project_id),
+    }
+    await benchmark("search_issues", lambda: benchmark_client.get("/api/v1/search", params=params))
+
+
+async def test_list_projects(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /projects of the organization."""
+    params = {"organization_id": str(benchmark_tenant.organization_id)}
+    await benchmark(
+        "list_projects",
+        lambda: benchmark_client.get("/api/v1/projects/", params=params),
+        iterations=5,
+    )
+
+
+async def test_list_backlog(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /projects/{id}/backlog (issues not planned in a sprint)."""
+    url = f"/api/v1/projects/{benchmark_tenant.project_id}/backlog"
+    await benchmark("list_backlog", lambda: benchmark_client.get(url))
+
+
+async def test_backlog_reorder(
+    benchmark, benchmark_client: AsyncClient, benchmark_tenant: BenchmarkTenant
+):
+    """PUT /projects/{id}/backlog/issues/{id}/reorder, moving a bottom issue to the top."""
+    # Each call moves another issue from the bottom half so every request does the same work
+    bottom_half = benchmark_tenant.backlog_issue_ids[len(benchmark_tenant.backlog_issue_ids) // 2 :]
+    issue_ids = cycle(bottom_half)
+    base_url = f"/api/v1/projects/{benchmark_tenant.project_id}/backlog/issues"
+
+    def reorder():
+        return benchmark_client.put(f"{base_url}/{next(issue_ids)}/reorder", json={"position": 0})
+
+    await benchmark("backlog_reorder", reorder)
+
+
+async def test_project_velocity(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /projects/{id}/reports/velocity over completed sprints."""
+    url = f"/api/v1/projects/{benchmark_tenant.project_id}/reports/velocity"
+    await benchmark("project_velocity", lambda: benchmark_client.get(url))
+
+
+async def test_export_space(benchmark, benchmark_client: AsyncClient, benchmark_tenant):
+    """GET /spaces/{id}/export as Markdown (all pages of the space)."""
+    url = f"/api/v1/spaces/{benchmark_tenant.space_id}/export"
+    await benchmark(
+        "export_space_markdown",
+        lambda: benchmark_client.get(url, params={"format": "markdown"}),
+        iterations=5,
+    )
@@ -0,0 +1,134 @@
+"""Unit tests for attachment thumbnail generation."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from src.infrastructure.services import WorkerPoolPreviewService
+from src.infrastructure.services.image_service import ImageProcessingService
+
+
+def _image_bytes(width: int, height: int, image_format: str = "PNG") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _session_factory(rowcount: int) -> tuple[MagicMock, AsyncMock]:
+    """Session factory whose sessions report `rowcount` updated rows."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(rowcount=rowcount)
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory, session
+
+
+class TestCreateThumbnail:
+    """Tests for ImageProcessingService.create_thumbnail."""
+
+    def test_thumbnail_keeps_aspect_ratio(self):
+        """Test a large JPEG is scaled down to fit the bounding box."""
+        thumbnail = ImageProcessingService.create_thumbnail(
+            _image_bytes(1600, 900, "JPEG"), "image/jpeg", max_size=320
+        )
+
+        assert thumbnail is not None
+        image = Image.open(io.BytesIO(thumbnail))
+        assert image.format == "WEBP"
+        assert image.size == (320, 180)
+
+    def test_small_image_is_not_upscaled(self):
+        """Test images smaller than the thumbnail keep their size."""
+        thumbnail = ImageProcessingService.create_thumbnail(
+            _image_bytes(100, 50), "image/png", max_size=320
+        )
+
+        assert thumbnail is not None
+        assert Image.open(io.BytesIO(thumbnail)).size == (100, 50)
+
+    def test_pdf_thumbnail_renders_first_page(self):
+        """Test a PDF thumbnail is its first page, scaled to fit the bounding box."""
+        thumbnail = ImageProcessingService.create_thumbnail(
+            _image_bytes(800, 400, "PDF"), "application/pdf", max_size=320
+        )
+
+        assert thumbnail is not None
+        image = Image.open(io.BytesIO(thumbnail))
+        assert image.format == "WEBP"
+        assert max(image.size) <= 320
+
+    def test_unsupported_type_has_no_thumbnail(self):
+        """Test non-previewable files are skipped."""
+        assert ImageProcessingService.create_thumbnail(b"a,b\n1,2", "text/csv") is None
+
+
+class TestWorkerPoolPreviewService:
+    """Tests for WorkerPoolPreviewService."""
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_is_stored_and_recorded(self):
+        """Test the thumbnail is saved next to the original and recorded on the attachment."""
+        storage_service = AsyncMock()
+        factory, session = _session_factory(rowcount=1)
+        service = WorkerPoolPreviewService(storage_service, factory, ThreadPoolExecutor(1))
+        attachment_id = uuid4()
+
+        service.schedule(attachment_id, _image_bytes(640, 480), "image/png")
+        await service.shutdown()
+
+        storage_service.save.assert_awaited_once()
+        content, path, content_type = storage_service.save.await_args.args
+        assert path == f"attachments/{attachment_id}/thumbnail.webp"
+        assert content_type == "image/webp"
+        assert Image.open(io.BytesIO(content)).size == (320, 240)
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unsupported_type_is_not_scheduled(self):
+        """Test nothing is generated for files without preview."""
+        storage_service = AsyncMock()
+        factory, _ = _session_factory(rowcount=1)
+        service = WorkerPoolPreviewService(storage_service, factory, ThreadPoolExecutor(1))
+
+        service.schedule(uuid4(), b"plain text", "text/plain")
+        await service.shutdown()
+
+        storage_service.save.assert_not_called()
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_discarded_when_attachment_is_gone(self, monkeypatch):
+        """Test a thumbnail whose attachment never becomes visible is deleted."""
+        monkeypatch.setattr(
+            "src.infrastructure.services.attachment_preview_service.RECORD_RETRY_DELAYS",
+            (0.01,),
+        )
+        storage_service = AsyncMock()
+        factory, session = _session_factory(rowcount=0)
+        service = WorkerPoolPreviewService(storage_service, factory, ThreadPoolExecutor(1))
+        attachment_id = uuid4()
+
+        service.schedule(attachment_id, _image_bytes(64, 64), "image/png")
+        await service.shutdown()
+
+        assert session.execute.await_count == 2
+        storage_service.delete.assert_awaited_once_with(
+            f"attachments/{attachment_id}/thumbnail.webp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_corrupt_image_is_logged_not_raised(self):
+        """Test a file that cannot be decoded leaves the attachment without thumbnail."""
+        storage_service = AsyncMock()
+        factory, _ = _session_factory(rowcount=1)
+        service = WorkerPoolPreviewService(storage_service, factory, ThreadPoolExecutor(1))
+
+        service.schedule(uuid4(), b"not an image", "image/png")
+        await service.shutdown()
+
+        storage_service.save.assert_not_called()
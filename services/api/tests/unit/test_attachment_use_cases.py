@@ -8,6 +8,7 @@ import pytest
 from src.application.use_cases.attachment import (
     DeleteAttachmentUseCase,
     DownloadAttachmentUseCase,
+    GetAttachmentThumbnailUseCase,
     GetAttachmentUseCase,
     ListAttachmentsUseCase,
     UploadAttachmentUseCase,
@@ -167,6 +168,48 @@ class TestUploadAttachmentUseCase:
         mock_attachment_repository.create.assert_called_once()
         mock_storage_service.save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_upload_attachment_schedules_thumbnail(
+        self,
+        mock_attachment_repository,
+        mock_issue_repository,
+        mock_user_repository,
+        mock_storage_service,
+        mock_session,
+        test_issue,
+        test_user,
+    ):
+        """Test that the upload hands the file to the preview service."""
+        mock_issue_repository.get_by_id.return_value = test_issue
+        mock_user_repository.get_by_id.return_value = test_user
+        user_model = MagicMock()
+        user_model.name = test_user.name
+        user_model.email = test_user.email.value
+        mock_session.execute.return_value.scalar_one = MagicMock(return_value=user_model)
+        mock_storage_service.get_url.return_value = "http://localhost:8000/storage/file.png"
+        mock_attachment_repository.create.side_effect = lambda attachment: attachment
+        preview_service = MagicMock()
+
+        use_case = UploadAttachmentUseCase(
+            mock_attachment_repository,
+            mock_issue_repository,
+            mock_user_repository,
+            mock_storage_service,
+            mock_session,
+            preview_service,
+        )
+        result = await use_case.execute(
+            issue_id=str(test_issue.id),
+            file_content=b"image bytes",
+            original_filename="screenshot.png",
+            mime_type="image/png",
+            user_id=str(test_user.id),
+        )
+
+        # Thumbnail is not ready in the response, it is generated in the background
+        assert result.thumbnail_path is None
+        preview_service.schedule.assert_called_once_with(result.id, b"image bytes", "image/png")
+
     @pytest.mark.asyncio
     async def test_upload_attachment_invalid_file_type(
         self,
@@ -445,3 +488,41 @@ class TestDownloadAttachmentUseCase:
             await use_case.execute(str(uuid4()))
 
         assert "not found" in exc_info.value.message.lower()
+
+
+class TestGetAttachmentThumbnailUseCase:
+    """Tests for GetAttachmentThumbnailUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_get_thumbnail_success(
+        self,
+        mock_attachment_repository,
+        mock_storage_service,
+        test_attachment,
+    ):
+        """Test reading a generated thumbnail."""
+        test_attachment.thumbnail_path = f"attachments/{test_attachment.id}/thumbnail.webp"
+        mock_attachment_repository.get_by_id.return_value = test_attachment
+        mock_storage_service.get_file.return_value = b"webp"
+
+        use_case = GetAttachmentThumbnailUseCase(mock_attachment_repository, mock_storage_service)
+        thumbnail = await use_case.execute(str(test_attachment.id))
+
+        assert thumbnail == b"webp"
+        mock_storage_service.get_file.assert_called_once_with(test_attachment.thumbnail_path)
+
+    @pytest.mark.asyncio
+    async def test_get_thumbnail_not_generated(
+        self,
+        mock_attachment_repository,
+        mock_storage_service,
+        test_attachment,
+    ):
+        """Test an attachment without thumbnail (not generated yet, or not an image)."""
+        mock_attachment_repository.get_by_id.return_value = test_attachment
+
+        use_case = GetAttachmentThumbnailUseCase(mock_attachment_repository, mock_storage_service)
+        with pytest.raises(EntityNotFoundException):
+            await use_case.execute(str(test_attachment.id))
+
+        mock_storage_service.get_file.assert_not_called()
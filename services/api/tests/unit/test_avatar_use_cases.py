@@ -1,14 +1,27 @@
 """Unit tests for avatar upload and deletion use cases."""
 
+import io
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from PIL import Image
 
-from src.application.use_cases.user import DeleteAvatarUseCase, UploadAvatarUseCase
+from src.application.use_cases.user import (
+    DeleteAvatarUseCase,
+    GetAvatarUseCase,
+    UploadAvatarUseCase,
+)
 from src.domain.entities import User
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.value_objects import Email
+from src.infrastructure.services.image_service import ImageProcessingService
+
+
+def _png_bytes(size: int = 300) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (size, size), (73, 109, 137)).save(buffer, format="PNG")
+    return buffer.getvalue()
 
 
 class TestUploadAvatarUseCase:
@@ -167,6 +180,36 @@ class TestUploadAvatarUseCase:
         # Assert - old avatar should be deleted
         assert storage_service.delete.called
 
+    @pytest.mark.asyncio
+    async def test_upload_avatar_stores_original_and_default_size(self, test_user) -> None:
+        """Test only the default size is created at upload, next to the original."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+        user_repository.update.return_value = test_user
+        storage_service.save.side_effect = lambda content, path, content_type: (
+            f"http://localhost:8000/storage/{path}"
+        )
+        original = _png_bytes()
+
+        use_case = UploadAvatarUseCase(user_repository, storage_service)
+        result = await use_case.execute(
+            user_id=str(test_user.id),
+            file_content=original,
+            file_name="avatar.png",
+            content_type="image/png",
+        )
+
+        saved = {call.args[1]: call.args[0] for call in storage_service.save.call_args_list}
+        assert len(saved) == 2
+        original_path = next(path for path in saved if path.endswith("_original.png"))
+        assert saved[original_path] == original
+        assert result.avatar_url.endswith("_256x256.png")
+        assert Image.open(io.BytesIO(saved[result.avatar_url.split("/storage/")[1]])).size == (
+            256,
+            256,
+        )
+
 
 class TestDeleteAvatarUseCase:
     """Tests for DeleteAvatarUseCase."""
@@ -254,3 +297,139 @@ class TestDeleteAvatarUseCase:
         # Execute & Assert
         with pytest.raises(EntityNotFoundException):
             await use_case.execute(str(uuid4()))
+
+
+class TestGetAvatarUseCase:
+    """Tests for GetAvatarUseCase."""
+
+    @pytest.fixture
+    def test_user(self):
+        """Create a test user with an uploaded avatar."""
+        from src.domain.value_objects import HashedPassword
+
+        user = User.create(
+            email=Email("test@example.com"),
+            password_hash=HashedPassword(
+                "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4yKJeyeQUzK6M5em"
+            ),
+            name="Test User",
+        )
+        user.update_avatar(f"http://localhost:8000/storage/avatars/{user.id}/abc_256x256.png")
+        return user
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_generates_and_caches_variant(self, test_user) -> None:
+        """Test a missing variant is generated from the original and stored."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+        storage_service.exists.side_effect = lambda path: path.endswith("_original.png")
+        storage_service.get_file.return_value = _png_bytes()
+
+        use_case = GetAvatarUseCase(user_repository, storage_service)
+        content, mime_type, etag = await use_case.execute(
+            str(test_user.id), "64x64", accept="image/webp,image/*;q=0.8"
+        )
+
+        assert mime_type == "image/webp"
+        assert etag == '"abc_64x64.webp"'
+        image = Image.open(io.BytesIO(content))
+        assert (image.format, image.size) == ("WEBP", (64, 64))
+        storage_service.get_file.assert_called_once_with(f"avatars/{test_user.id}/abc_original.png")
+        storage_service.save.assert_called_once_with(
+            content, f"avatars/{test_user.id}/abc_64x64.webp", "image/webp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_serves_cached_variant(self, test_user) -> None:
+        """Test a stored variant is served without processing."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+        storage_service.exists.return_value = True
+        storage_service.get_file.return_value = b"cached"
+
+        use_case = GetAvatarUseCase(user_repository, storage_service)
+        content, mime_type, _ = await use_case.execute(str(test_user.id), "128x128")
+
+        # No AVIF/WEBP in Accept: the uploaded format
+        assert (content, mime_type) == (b"cached", "image/png")
+        storage_service.get_file.assert_called_once_with(f"avatars/{test_user.id}/abc_128x128.png")
+        storage_service.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_not_modified(self, test_user) -> None:
+        """Test nothing is read when the client's ETag is current."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+
+        use_case = GetAvatarUseCase(user_repository, storage_service)
+        content, _, etag = await use_case.execute(
+            str(test_user.id), "128x128", if_none_match='"abc_128x128.png"'
+        )
+
+        assert content is None
+        assert etag == '"abc_128x128.png"'
+        storage_service.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_corrupt_original_serves_stored_size(self, test_user) -> None:
+        """Test a variant that cannot be generated falls back to the size stored at upload."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+        storage_service.exists.side_effect = lambda path: path.endswith(
+            ("_original.png", "_256x256.png")
+        )
+        storage_service.get_file.side_effect = lambda path: (
+            b"not an image" if path.endswith("_original.png") else b"stored"
+        )
+
+        use_case = GetAvatarUseCase(user_repository, storage_service)
+        content, mime_type, etag = await use_case.execute(
+            str(test_user.id), "64x64", accept="image/webp"
+        )
+
+        assert (content, mime_type, etag) == (b"stored", "image/png", '"abc_256x256.png"')
+        storage_service.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_corrupt_without_stored_size(self, test_user) -> None:
+        """Test an avatar that cannot be served at all is not found."""
+        user_repository = AsyncMock()
+        storage_service = AsyncMock()
+        user_repository.get_by_id.return_value = test_user
+        storage_service.exists.side_effect = lambda path: path.endswith("_original.png")
+        storage_service.get_file.return_value = b"not an image"
+
+        use_case = GetAvatarUseCase(user_repository, storage_service)
+
+        with pytest.raises(EntityNotFoundException):
+            await use_case.execute(str(test_user.id), "64x64")
+
+    @pytest.mark.asyncio
+    async def test_get_avatar_invalid_size(self, test_user) -> None:
+        """Test sizes outside the allowed list are rejected."""
+        use_case = GetAvatarUseCase(AsyncMock(), AsyncMock())
+
+        with pytest.raises(ValidationException):
+            await use_case.execute(str(test_user.id), "4000x4000")
+
+
+class TestNegotiateOutputFormat:
+    """Tests for ImageProcessingService.negotiate_output_format."""
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            ("image/avif,image/webp,*/*", "AVIF"),
+            ("image/webp,*/*;q=0.8", "WEBP"),
+            ("image/avif;q=0,image/webp", "WEBP"),
+            ("image/png,*/*", "JPEG"),
+            (None, "JPEG"),
+        ],
+    )
+    def test_negotiate_output_format(self, accept, expected) -> None:
+        """Test the most compact accepted format is picked."""
+        assert ImageProcessingService.negotiate_output_format(accept, "JPEG") == expected
@@ -73,11 +73,6 @@ class TestListBacklogUseCase:
 
         mock_project_repository.get_by_id.return_value = test_project
 
-        # Mock sprint issues (empty - all issues in backlog)
-        mock_sprint_result = MagicMock()
-        mock_sprint_result.all.return_value = []
-        mock_session.execute.return_value = mock_sprint_result
-
         # Mock backlog issues with real types for IssueListItemResponse validation
         def make_issue_mock(num: int):
             m = MagicMock(spec=IssueModel)
@@ -102,7 +97,6 @@ class TestListBacklogUseCase:
         mock_issues_result = MagicMock()
         mock_issues_result.scalars.return_value.all.return_value = [issue1, issue2]
         mock_session.execute.side_effect = [
-            mock_sprint_result,  # First call for sprint issues
             MagicMock(scalar_one=MagicMock(return_value=2)),  # Count query
             mock_issues_result,  # Issues query
         ]
@@ -134,10 +128,6 @@ class TestListBacklogUseCase:
 
         mock_project_repository.get_by_id.return_value = test_project
 
-        # Mock empty sprint issues
-        mock_sprint_result = MagicMock()
-        mock_sprint_result.all.return_value = []
-
         # Mock count result
         mock_count_result = MagicMock()
         mock_count_result.scalar_one.return_value = 0
@@ -147,7 +137,6 @@ class TestListBacklogUseCase:
         mock_issues_result.scalars.return_value.all.return_value = []
 
         mock_session.execute.side_effect = [
-            mock_sprint_result,  # First call for sprint issues
             mock_count_result,  # Count query
             mock_issues_result,  # Issues query
         ]
@@ -282,17 +271,12 @@ class TestReorderBacklogIssueUseCase:
         # Mock: issue not in any sprint
         mock_sprint_repository.get_issue_sprint.return_value = None
 
-        # Mock: get all backlog issues (empty sprint issues list)
-        mock_sprint_issues_result = MagicMock()
-        mock_sprint_issues_result.all.return_value = []
-
         # Mock: get backlog issues
         mock_backlog_result = MagicMock()
         mock_backlog_result.scalars.return_value.all.return_value = []
 
         mock_session.execute.side_effect = [
             mock_issue_result,  # Get issue
-            mock_sprint_issues_result,  # Get sprint issues
             mock_backlog_result,  # Get backlog issues
         ]
 
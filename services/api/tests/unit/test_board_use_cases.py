@@ -13,6 +13,7 @@ from src.application.dtos.board import (
     UpdateBoardRequest,
     UpdateBoardScopeRequest,
 )
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.board import (
     CreateBoardListUseCase,
     CreateBoardUseCase,
@@ -33,8 +34,9 @@ from src.application.use_cases.board import (
     UpdateBoardSwimlanesUseCase,
     UpdateBoardUseCase,
 )
-from src.domain.entities import Board, Project
+from src.domain.entities import Board, Project, Workflow
 from src.domain.entities.board import BoardList
+from src.domain.events import IssueStatusChanged
 from src.domain.exceptions import ConflictException, EntityNotFoundException, ValidationException
 
 
@@ -1936,7 +1938,7 @@ class TestMoveBoardIssueUseCase:
 
         assert result.id == issue.id
         assert result.title == "Task"
-        mock_issue_activity_repository.create.assert_not_called()
+        mock_issue_activity_repository.create_batch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_move_board_not_found(
@@ -2085,7 +2087,7 @@ class TestMoveBoardIssueUseCase:
         assert result.id == issue.id
         mock_label_repository.remove_label_from_issue.assert_called_once_with(issue.id, label_src)
         mock_label_repository.add_label_to_issue.assert_called_once_with(issue.id, label_tgt)
-        mock_issue_activity_repository.create.assert_called_once()
+        mock_issue_activity_repository.create_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_move_assignee_swap_success(
@@ -2140,7 +2142,7 @@ class TestMoveBoardIssueUseCase:
 
         assert result.id == issue.id
         mock_issue_repository.update.assert_called()
-        mock_issue_activity_repository.create.assert_called_once()
+        mock_issue_activity_repository.create_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_move_issue_not_in_scope_raises(
@@ -2333,7 +2335,7 @@ class TestMoveBoardIssueUseCase:
             sprint_src, issue.id
         )
         mock_sprint_repository.add_issue_to_sprint.assert_called_once_with(sprint_tgt, issue.id, 1)
-        mock_issue_activity_repository.create.assert_called_once()
+        mock_issue_activity_repository.create_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_move_label_target_already_has_conflict(
@@ -2391,7 +2393,7 @@ class TestMoveBoardIssueUseCase:
             test_board.id, issue.id, source_list.id, target_list.id, user_id=uuid4()
         )
         assert result.id == issue.id
-        mock_issue_activity_repository.create.assert_called_once()
+        mock_issue_activity_repository.create_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_move_source_milestone_remove_not_found(
@@ -2553,6 +2555,193 @@ class TestMoveBoardIssueUseCase:
                 test_board.id, issue.id, source_list.id, target_list.id, user_id=uuid4()
             )
 
+    @staticmethod
+    def _status_lists(board_id):
+        """Status lists "In Progress" -> "Done"."""
+        source_list = BoardList.create(
+            board_id=board_id, list_type="status", list_config={"status": "in_progress"}
+        )
+        target_list = BoardList.create(
+            board_id=board_id, list_type="status", list_config={"status": "done"}, position=1
+        )
+        return source_list, target_list
+
+    @staticmethod
+    def _workflow_repository(project_id, allow_done: bool):
+        """Repository of a default workflow todo -> in_progress (-> done if allowed)."""
+        workflow = Workflow.create(project_id=project_id, name="Flow", is_default=True)
+        todo = workflow.add_status("Todo", order=0, is_initial=True)
+        in_progress = workflow.add_status("In Progress", order=1)
+        done = workflow.add_status("Done", order=2, is_final=True)
+        workflow.add_transition(todo.id, in_progress.id)
+        if allow_done:
+            workflow.add_transition(in_progress.id, done.id)
+        repository = AsyncMock()
+        repository.get_default_by_project_id.return_value = workflow
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_move_status_list_sets_status(
+        self,
+        mock_board_repository,
+        mock_issue_repository,
+        mock_label_repository,
+        mock_sprint_repository,
+        mock_comment_repository,
+        mock_project_repository_for_issues,
+        mock_issue_activity_repository,
+        test_board,
+        test_project,
+    ):
+        """Test moving to a status list changes the status the workflow allows."""
+        from src.domain.entities import Issue
+
+        issue = Issue.create(
+            project_id=test_board.project_id, issue_number=1, title="Task", status="in_progress"
+        )
+        source_list, target_list = self._status_lists(test_board.id)
+
+        mock_board_repository.get_by_id.return_value = test_board
+        mock_project_repository_for_issues.get_by_id.return_value = test_project
+        mock_issue_repository.get_by_id.return_value = issue
+        mock_label_repository.get_labels_for_issue.return_value = []
+        mock_comment_repository.count_by_issue_id.return_value = 0
+        mock_issue_repository.count.return_value = 0
+        mock_board_repository.get_board_list_by_id.side_effect = [source_list, target_list]
+
+        use_case = MoveBoardIssueUseCase(
+            mock_board_repository,
+            mock_issue_repository,
+            mock_label_repository,
+            mock_sprint_repository,
+            mock_comment_repository,
+            mock_project_repository_for_issues,
+            mock_issue_activity_repository,
+            workflow_repository=self._workflow_repository(test_board.project_id, True),
+            workflow_cache=WorkflowCache(),
+        )
+        result = await use_case.execute(
+            test_board.id, issue.id, source_list.id, target_list.id, user_id=uuid4()
+        )
+
+        assert result.status == "done"
+        mock_issue_repository.update.assert_called_once_with(issue)
+        # The status change is logged with the move, in one batch
+        entries = mock_issue_activity_repository.create_batch.call_args.args[0]
+        assert [(entry.action, entry.old_value, entry.new_value) for entry in entries] == [
+            ("status_changed", "in_progress", "done"),
+            ("board_move", str(source_list.id), str(target_list.id)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_move_status_list_refreshes_parent_and_notifies(
+        self,
+        mock_board_repository,
+        mock_issue_repository,
+        mock_label_repository,
+        mock_sprint_repository,
+        mock_comment_repository,
+        mock_project_repository_for_issues,
+        mock_issue_activity_repository,
+        test_board,
+        test_project,
+    ):
+        """Test a status change by a move updates the parent's rollups, like an edit."""
+        from src.domain.entities import Issue
+
+        issue = Issue.create(
+            project_id=test_board.project_id,
+            issue_number=2,
+            title="Subtask",
+            status="in_progress",
+            parent_issue_id=uuid4(),
+        )
+        source_list, target_list = self._status_lists(test_board.id)
+
+        mock_board_repository.get_by_id.return_value = test_board
+        mock_project_repository_for_issues.get_by_id.return_value = test_project
+        mock_issue_repository.get_by_id.return_value = issue
+        mock_label_repository.get_labels_for_issue.return_value = []
+        mock_comment_repository.count_by_issue_id.return_value = 0
+        mock_issue_repository.count.return_value = 0
+        mock_board_repository.get_board_list_by_id.side_effect = [source_list, target_list]
+        hierarchy_service = AsyncMock()
+        filter_count_cache = AsyncMock()
+        event_publisher = AsyncMock()
+        user_id = uuid4()
+
+        use_case = MoveBoardIssueUseCase(
+            mock_board_repository,
+            mock_issue_repository,
+            mock_label_repository,
+            mock_sprint_repository,
+            mock_comment_repository,
+            mock_project_repository_for_issues,
+            mock_issue_activity_repository,
+            event_publisher=event_publisher,
+            hierarchy_service=hierarchy_service,
+            filter_count_cache=filter_count_cache,
+        )
+        await use_case.execute(
+            test_board.id, issue.id, source_list.id, target_list.id, user_id=user_id
+        )
+
+        hierarchy_service.refresh_rollups.assert_called_once_with([issue.id])
+        filter_count_cache.invalidate.assert_called_once_with(issue.project_id)
+        (event,) = event_publisher.publish.call_args.args
+        assert isinstance(event, IssueStatusChanged)
+        assert (event.old_status, event.new_status, event.changed_by) == (
+            "in_progress",
+            "done",
+            user_id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_move_status_list_rejected_by_workflow(
+        self,
+        mock_board_repository,
+        mock_issue_repository,
+        mock_label_repository,
+        mock_sprint_repository,
+        mock_comment_repository,
+        mock_project_repository_for_issues,
+        mock_issue_activity_repository,
+        test_board,
+        test_project,
+    ):
+        """Test moving to a status list the workflow does not allow changes nothing."""
+        from src.domain.entities import Issue
+
+        issue = Issue.create(
+            project_id=test_board.project_id, issue_number=1, title="Task", status="in_progress"
+        )
+        source_list, target_list = self._status_lists(test_board.id)
+
+        mock_board_repository.get_by_id.return_value = test_board
+        mock_project_repository_for_issues.get_by_id.return_value = test_project
+        mock_issue_repository.get_by_id.return_value = issue
+        mock_board_repository.get_board_list_by_id.side_effect = [source_list, target_list]
+
+        use_case = MoveBoardIssueUseCase(
+            mock_board_repository,
+            mock_issue_repository,
+            mock_label_repository,
+            mock_sprint_repository,
+            mock_comment_repository,
+            mock_project_repository_for_issues,
+            mock_issue_activity_repository,
+            workflow_repository=self._workflow_repository(test_board.project_id, False),
+            workflow_cache=WorkflowCache(),
+        )
+        with pytest.raises(ValidationException, match="not allowed"):
+            await use_case.execute(
+                test_board.id, issue.id, source_list.id, target_list.id, user_id=uuid4()
+            )
+
+        assert issue.status == "in_progress"
+        mock_issue_repository.update.assert_not_called()
+        mock_issue_activity_repository.create_batch.assert_not_called()
+
 
 def test_get_uuid_from_config():
     """Test _get_uuid_from_config in move_board_issue."""
@@ -14,6 +14,7 @@ from src.application.use_cases.comment import (
     UpdateCommentUseCase,
 )
 from src.domain.entities import Comment, Issue, User
+from src.domain.events import CommentCreated
 from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.value_objects import Email, HashedPassword
 
@@ -43,8 +44,8 @@ def mock_project_repository():
 
 
 @pytest.fixture
-def mock_notification_repository():
-    """Mock notification repository."""
+def mock_event_publisher():
+    """Mock event publisher."""
     return AsyncMock()
 
 
@@ -97,6 +98,7 @@ class TestCreateCommentUseCase:
         mock_comment_repository,
         mock_issue_repository,
         mock_user_repository,
+        mock_event_publisher,
         mock_session,
         test_issue,
         test_user,
@@ -131,7 +133,7 @@ class TestCreateCommentUseCase:
             mock_comment_repository,
             mock_issue_repository,
             mock_user_repository,
-            mock_notification_repository,
+            mock_event_publisher,
             mock_session,
         )
 
@@ -145,6 +147,10 @@ class TestCreateCommentUseCase:
         mock_comment_repository.create.assert_called_once()
         mock_issue_repository.get_by_id.assert_called_once_with(test_issue.id)
         mock_user_repository.get_by_id.assert_called_once_with(test_user.id)
+        (event,) = mock_event_publisher.publish.call_args.args
+        assert isinstance(event, CommentCreated)
+        assert (event.comment_id, event.issue_id) == (created_comment.id, test_issue.id)
+        assert event.author_id == test_user.id
 
     @pytest.mark.asyncio
     async def test_create_comment_issue_not_found(
@@ -152,7 +158,7 @@ class TestCreateCommentUseCase:
         mock_comment_repository,
         mock_issue_repository,
         mock_user_repository,
-        mock_notification_repository,
+        mock_event_publisher,
         mock_session,
     ):
         """Test comment creation with non-existent issue."""
@@ -162,7 +168,7 @@ class TestCreateCommentUseCase:
             mock_comment_repository,
             mock_issue_repository,
             mock_user_repository,
-            mock_notification_repository,
+            mock_event_publisher,
             mock_session,
         )
 
@@ -178,7 +184,7 @@ class TestCreateCommentUseCase:
         mock_comment_repository,
         mock_issue_repository,
         mock_user_repository,
-        mock_notification_repository,
+        mock_event_publisher,
         mock_session,
         test_issue,
     ):
@@ -190,7 +196,7 @@ class TestCreateCommentUseCase:
             mock_comment_repository,
             mock_issue_repository,
             mock_user_repository,
-            mock_notification_repository,
+            mock_event_publisher,
             mock_session,
         )
 
@@ -191,3 +191,35 @@ async def test_get_custom_field_values_by_issue_id(mock_session, test_custom_fie
 
     assert len(values) == 1
     assert values[0].id == test_custom_field_value.id
+
+
+@pytest.mark.asyncio
+async def test_get_custom_field_values_by_issue_ids(mock_session, test_custom_field):
+    """Test the values of many issues are loaded in one query, grouped by issue."""
+    first_issue_id, second_issue_id = uuid4(), uuid4()
+    value_models = [
+        CustomFieldValueModel(
+            id=uuid4(), custom_field_id=test_custom_field.id, issue_id=issue_id, value=value
+        )
+        for issue_id, value in ((first_issue_id, "a"), (second_issue_id, 2), (first_issue_id, "b"))
+    ]
+
+    mock_result = create_mock_result(scalars_list=value_models)
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    repository = SQLAlchemyCustomFieldValueRepository(mock_session)
+    values = await repository.get_by_issue_ids([first_issue_id, second_issue_id, uuid4()])
+
+    mock_session.execute.assert_called_once()
+    assert [value.value for value in values[first_issue_id]] == ["a", "b"]
+    assert [value.value for value in values[second_issue_id]] == [2]
+    assert len(values) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_custom_field_values_by_no_issue_ids(mock_session):
+    """Test no query is made without issues."""
+    repository = SQLAlchemyCustomFieldValueRepository(mock_session)
+
+    assert await repository.get_by_issue_ids([]) == {}
+    mock_session.execute.assert_not_called()
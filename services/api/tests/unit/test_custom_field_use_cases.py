@@ -215,12 +215,14 @@ class TestDeleteCustomFieldUseCase:
         """Test successfully deleting a custom field."""
         mock_custom_field_repository.get_by_id.return_value = test_custom_field
         mock_custom_field_repository.delete.return_value = None
+        filter_count_cache = AsyncMock()
 
-        use_case = DeleteCustomFieldUseCase(mock_custom_field_repository)
+        use_case = DeleteCustomFieldUseCase(mock_custom_field_repository, filter_count_cache)
 
         await use_case.execute(test_custom_field.id)
 
         mock_custom_field_repository.delete.assert_called_once_with(test_custom_field.id)
+        filter_count_cache.invalidate.assert_awaited_once_with(test_custom_field.project_id)
 
     @pytest.mark.asyncio
     async def test_delete_custom_field_not_found(self, mock_custom_field_repository):
@@ -13,6 +13,7 @@ from src.application.dtos.dashboard import (
 from src.application.use_cases.dashboard import (
     CreateDashboardUseCase,
     DeleteDashboardUseCase,
+    GetDashboardDataUseCase,
     GetDashboardUseCase,
     GetWidgetDataUseCase,
     ListDashboardsUseCase,
@@ -20,6 +21,7 @@ from src.application.use_cases.dashboard import (
 )
 from src.domain.entities import Dashboard, Project
 from src.domain.exceptions import EntityNotFoundException
+from src.infrastructure.services import InMemoryCacheService
 
 
 @pytest.fixture
@@ -373,3 +375,121 @@ class TestGetWidgetDataUseCase:
 
         with pytest.raises(EntityNotFoundException):
             await use_case.execute(dashboard.id, widget_id, request)
+
+
+class TestGetDashboardDataUseCase:
+    """Tests for GetDashboardDataUseCase."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Mock async session returning one status row."""
+        from unittest.mock import MagicMock
+
+        mock_row = MagicMock()
+        mock_row.status = "todo"
+        mock_row.count = 5
+        mock_result = MagicMock()
+        mock_result.all.return_value = [mock_row]
+
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=mock_result)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_widgets_sharing_an_aggregate_query_once(
+        self, mock_dashboard_repository, mock_session, test_dashboard
+    ):
+        """Test that widgets with the same type and project share one query."""
+        test_dashboard.add_widget("issue_status_breakdown", {"title": "Copy"})
+        mock_dashboard_repository.get_by_id.return_value = test_dashboard
+
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository, mock_session, InMemoryCacheService()
+        )
+
+        result = await use_case.execute(test_dashboard.id)
+
+        assert [w.widget_id for w in result.widgets] == [w.id for w in test_dashboard.widgets]
+        assert all(w.data == {"todo": 5} for w in result.widgets)
+        assert mock_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_loaded_dashboard_is_not_loaded_again(
+        self, mock_dashboard_repository, mock_session, test_dashboard
+    ):
+        """Test that a dashboard passed in (loaded for the permission check) is used as is."""
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository, mock_session, InMemoryCacheService()
+        )
+
+        result = await use_case.execute(test_dashboard.id, test_dashboard)
+
+        assert result.dashboard_id == test_dashboard.id
+        mock_dashboard_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_reused(
+        self, mock_dashboard_repository, mock_session, test_dashboard
+    ):
+        """Test that a second call is served from the cache."""
+        mock_dashboard_repository.get_by_id.return_value = test_dashboard
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository, mock_session, InMemoryCacheService()
+        )
+
+        first = await use_case.execute(test_dashboard.id)
+        second = await use_case.execute(test_dashboard.id)
+
+        assert not first.widgets[0].cached
+        assert second.widgets[0].cached
+        assert second.widgets[0].data == {"todo": 5}
+        assert mock_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, mock_dashboard_repository, mock_session, test_dashboard):
+        """Test that a zero TTL queries on every call."""
+        mock_dashboard_repository.get_by_id.return_value = test_dashboard
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository,
+            mock_session,
+            InMemoryCacheService(),
+            cache_ttl_seconds=0,
+        )
+
+        await use_case.execute(test_dashboard.id)
+        result = await use_case.execute(test_dashboard.id)
+
+        assert not result.widgets[0].cached
+        assert mock_session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_widget_without_project_reports_error(
+        self, mock_dashboard_repository, mock_session
+    ):
+        """Test that a widget without project does not fail the whole dashboard."""
+        dashboard = Dashboard.create(project_id=None, user_id=uuid4(), name="Personal")
+        dashboard.add_widget("issue_status_breakdown", {"project_id": str(uuid4())})
+        dashboard.add_widget("issue_status_breakdown", {})
+        mock_dashboard_repository.get_by_id.return_value = dashboard
+
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository, mock_session, InMemoryCacheService()
+        )
+
+        result = await use_case.execute(dashboard.id)
+
+        assert result.widgets[0].data == {"todo": 5}
+        assert result.widgets[0].error is None
+        assert result.widgets[1].error == "No project specified"
+
+    @pytest.mark.asyncio
+    async def test_dashboard_not_found(self, mock_dashboard_repository, mock_session):
+        """Test getting data of a non-existent dashboard."""
+        mock_dashboard_repository.get_by_id.return_value = None
+
+        use_case = GetDashboardDataUseCase(
+            mock_dashboard_repository, mock_session, InMemoryCacheService()
+        )
+
+        with pytest.raises(EntityNotFoundException):
+            await use_case.execute(uuid4())
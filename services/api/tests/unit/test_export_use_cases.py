@@ -1,6 +1,6 @@
 """Unit tests for export use cases."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -199,3 +199,34 @@ class TestExportSpaceUseCase:
 
         with pytest.raises(EntityNotFoundException):
             await use_case.execute(str(uuid4()), "html")
+
+
+class TestExportIssuesUseCase:
+    """Tests for ExportIssuesUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_export_streams_from_own_session(self):
+        """Test the content is read through a session opened and closed by the iterator."""
+        from src.application.use_cases.export import ExportIssuesUseCase
+
+        project_repository = AsyncMock()
+        project_repository.get_by_id.return_value = MagicMock(key="TEST")
+
+        async def partitions():
+            for batch in ():
+                yield batch
+
+        session = MagicMock()
+        session.stream = AsyncMock(return_value=MagicMock(partitions=partitions))
+        session.close = AsyncMock()
+        session_factory = MagicMock(return_value=session)
+
+        use_case = ExportIssuesUseCase(project_repository, AsyncMock(), session_factory)
+        chunks, mime_type, filename = await use_case.execute(str(uuid4()), "ndjson")
+
+        # Nothing is read before the content is consumed
+        session_factory.assert_not_called()
+        assert [chunk async for chunk in chunks] == []
+        assert (mime_type, filename) == ("application/x-ndjson", "test-issues.ndjson")
+        session.stream.assert_awaited_once()
+        session.close.assert_awaited_once()
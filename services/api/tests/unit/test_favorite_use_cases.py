@@ -4,15 +4,15 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.dtos.favorite import CreateFavoriteRequest
+from src.application.dtos.node import NodeDetailsProject, NodeDetailsSpace, NodeListItemResponse
 from src.application.use_cases.favorite import (
     CreateFavoriteUseCase,
     DeleteFavoriteUseCase,
     ListFavoritesUseCase,
 )
-from src.domain.entities import Favorite, Project, Space, User
+from src.domain.entities import Favorite, User
 from src.domain.exceptions import ConflictException, EntityNotFoundException
 from src.domain.value_objects import Email, EntityType, HashedPassword
 
@@ -30,23 +30,11 @@ def mock_user_repository():
 
 
 @pytest.fixture
-def mock_project_repository():
-    """Mock project repository."""
+def mock_node_resolver():
+    """Mock node resolver."""
     return AsyncMock()
 
 
-@pytest.fixture
-def mock_space_repository():
-    """Mock space repository."""
-    return AsyncMock()
-
-
-@pytest.fixture
-def mock_session():
-    """Mock database session."""
-    return AsyncMock(spec=AsyncSession)
-
-
 @pytest.fixture
 def test_user():
     """Create a test user."""
@@ -59,6 +47,16 @@ def test_user():
     )
 
 
+def _project_node(project_id):
+    """Node of a project, as resolved by the node resolver."""
+    return NodeListItemResponse(
+        type="project",
+        id=project_id,
+        organization_id=uuid4(),
+        details=NodeDetailsProject(name="Test Project", key="TEST"),
+    )
+
+
 @pytest.fixture
 def test_favorite(test_user):
     """Create a test favorite."""
@@ -185,9 +183,7 @@ class TestListFavoritesUseCase:
     async def test_list_favorites_success(
         self,
         mock_favorite_repository,
-        mock_project_repository,
-        mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_user,
         test_favorite,
     ):
@@ -195,31 +191,11 @@ class TestListFavoritesUseCase:
         favorites = [test_favorite]
         mock_favorite_repository.get_all.return_value = favorites
         mock_favorite_repository.count.return_value = 1
-        # Mock project repository for project favorite
-        project_id = test_favorite.entity_id
-        project = Project(
-            id=project_id,
-            organization_id=uuid4(),
-            name="Test Project",
-            key="TEST",
-        )
-        mock_project_repository.get_by_id.return_value = project
-        # Mock session queries - create separate mock results for each query
-        folder_result = AsyncMock()
-        folder_result.scalar_one_or_none = lambda: None
-        member_result = AsyncMock()
-        member_result.scalar_one = lambda: 0
-        issue_result = AsyncMock()
-        issue_result.scalar_one = lambda: 0
-        # Return different results for different queries
-        mock_session.execute.side_effect = [folder_result, member_result, issue_result]
-
-        use_case = ListFavoritesUseCase(
-            mock_favorite_repository,
-            mock_project_repository,
-            mock_space_repository,
-            mock_session,
-        )
+        mock_node_resolver.resolve.return_value = {
+            ("project", test_favorite.entity_id): _project_node(test_favorite.entity_id)
+        }
+
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
 
         result = await use_case.execute(str(test_user.id))
 
@@ -233,9 +209,7 @@ class TestListFavoritesUseCase:
     async def test_list_favorites_with_entity_type_filter(
         self,
         mock_favorite_repository,
-        mock_project_repository,
-        mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_user,
     ):
         """Test favorite listing with entity type filter."""
@@ -245,59 +219,36 @@ class TestListFavoritesUseCase:
             entity_type=EntityType.project(),
             entity_id=project_id,
         )
-        favorites = [project_favorite]
-        mock_favorite_repository.get_all.return_value = favorites
+        mock_favorite_repository.get_all.return_value = [project_favorite]
         mock_favorite_repository.count.return_value = 1
-        # Mock project repository
-        project = Project(
-            id=project_id,
-            organization_id=uuid4(),
-            name="Test Project",
-            key="TEST",
-        )
-        mock_project_repository.get_by_id.return_value = project
-        # Mock session queries - create separate mock results for each query
-        folder_result = AsyncMock()
-        folder_result.scalar_one_or_none = lambda: None
-        member_result = AsyncMock()
-        member_result.scalar_one = lambda: 0
-        issue_result = AsyncMock()
-        issue_result.scalar_one = lambda: 0
-        # Return different results for different queries
-        mock_session.execute.side_effect = [folder_result, member_result, issue_result]
-
-        use_case = ListFavoritesUseCase(
-            mock_favorite_repository,
-            mock_project_repository,
-            mock_space_repository,
-            mock_session,
-        )
+        mock_node_resolver.resolve.return_value = {
+            ("project", project_id): _project_node(project_id)
+        }
+
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
 
         result = await use_case.execute(str(test_user.id), entity_type="project")
 
         assert len(result.favorites) == 1
         assert result.favorites[0].entity_type == "project"
         assert result.favorites[0].node is not None
+        assert mock_favorite_repository.get_all.call_args.kwargs["entity_type"] == (
+            EntityType.project()
+        )
 
     @pytest.mark.asyncio
     async def test_list_favorites_empty(
         self,
         mock_favorite_repository,
-        mock_project_repository,
-        mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_user,
     ):
         """Test favorite listing with no favorites."""
         mock_favorite_repository.get_all.return_value = []
         mock_favorite_repository.count.return_value = 0
+        mock_node_resolver.resolve.return_value = {}
 
-        use_case = ListFavoritesUseCase(
-            mock_favorite_repository,
-            mock_project_repository,
-            mock_space_repository,
-            mock_session,
-        )
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
 
         result = await use_case.execute(str(test_user.id))
 
@@ -308,12 +259,10 @@ class TestListFavoritesUseCase:
     async def test_list_favorites_with_pagination(
         self,
         mock_favorite_repository,
-        mock_project_repository,
-        mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_user,
     ):
-        """Test favorite listing with pagination."""
+        """Test favorite listing with pagination resolves the page in one call."""
         favorites = [
             Favorite.create(
                 user_id=test_user.id,
@@ -324,46 +273,27 @@ class TestListFavoritesUseCase:
         ]
         mock_favorite_repository.get_all.return_value = favorites
         mock_favorite_repository.count.return_value = 10
-        # Mock project repository for all favorites
-        mock_project_repository.get_by_id.return_value = Project(
-            id=uuid4(),
-            organization_id=uuid4(),
-            name="Test Project",
-            key="TEST",
-        )
-        # Mock session queries - need to return multiple results for each favorite
-        folder_result = AsyncMock()
-        folder_result.scalar_one_or_none = lambda: None
-        member_result = AsyncMock()
-        member_result.scalar_one = lambda: 0
-        issue_result = AsyncMock()
-        issue_result.scalar_one = lambda: 0
-        # Return results for each favorite (5 favorites * 3 queries each = 15 results)
-        mock_session.execute.side_effect = [
-            folder_result,
-            member_result,
-            issue_result,
-        ] * 5
-
-        use_case = ListFavoritesUseCase(
-            mock_favorite_repository,
-            mock_project_repository,
-            mock_space_repository,
-            mock_session,
-        )
+        mock_node_resolver.resolve.return_value = {
+            ("project", favorite.entity_id): _project_node(favorite.entity_id)
+            for favorite in favorites
+        }
+
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
 
         result = await use_case.execute(str(test_user.id), skip=0, limit=5)
 
         assert len(result.favorites) == 5
         assert result.total == 10
+        mock_node_resolver.resolve.assert_called_once()
+        assert list(mock_node_resolver.resolve.call_args.args[0]) == [
+            ("project", favorite.entity_id) for favorite in favorites
+        ]
 
     @pytest.mark.asyncio
     async def test_list_favorites_with_space(
         self,
         mock_favorite_repository,
-        mock_project_repository,
-        mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_user,
     ):
         """Test favorite listing with space favorite."""
@@ -373,30 +303,18 @@ class TestListFavoritesUseCase:
             entity_type=EntityType.space(),
             entity_id=space_id,
         )
-        favorites = [space_favorite]
-        mock_favorite_repository.get_all.return_value = favorites
+        mock_favorite_repository.get_all.return_value = [space_favorite]
         mock_favorite_repository.count.return_value = 1
-        # Mock space repository
-        space = Space(
-            id=space_id,
-            organization_id=uuid4(),
-            name="Test Space",
-            key="TEST",
-        )
-        mock_space_repository.get_by_id.return_value = space
-        # Mock session queries
-        folder_result = AsyncMock()
-        folder_result.scalar_one_or_none = lambda: None
-        page_count_result = AsyncMock()
-        page_count_result.scalar_one = lambda: 0
-        mock_session.execute.side_effect = [folder_result, page_count_result]
-
-        use_case = ListFavoritesUseCase(
-            mock_favorite_repository,
-            mock_project_repository,
-            mock_space_repository,
-            mock_session,
-        )
+        mock_node_resolver.resolve.return_value = {
+            ("space", space_id): NodeListItemResponse(
+                type="space",
+                id=space_id,
+                organization_id=uuid4(),
+                details=NodeDetailsSpace(name="Test Space", key="TEST"),
+            )
+        }
+
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
 
         result = await use_case.execute(str(test_user.id))
 
@@ -405,6 +323,25 @@ class TestListFavoritesUseCase:
         assert result.favorites[0].node is not None
         assert result.favorites[0].node.type == "space"
 
+    @pytest.mark.asyncio
+    async def test_list_favorites_skips_missing_entities(
+        self,
+        mock_favorite_repository,
+        mock_node_resolver,
+        test_user,
+        test_favorite,
+    ):
+        """Test favorites of deleted entities are left out."""
+        mock_favorite_repository.get_all.return_value = [test_favorite]
+        mock_favorite_repository.count.return_value = 1
+        mock_node_resolver.resolve.return_value = {}
+
+        use_case = ListFavoritesUseCase(mock_favorite_repository, mock_node_resolver)
+
+        result = await use_case.execute(str(test_user.id))
+
+        assert result.favorites == []
+
 
 class TestDeleteFavoriteUseCase:
     """Tests for DeleteFavoriteUseCase."""
@@ -6,9 +6,11 @@ from uuid import uuid4
 
 import pytest
 
+from src.application.services.issue_activity_recorder import IssueActivityRecorder
 from src.application.use_cases.issue.list_issue_activities import ListIssueActivitiesUseCase
 from src.domain.entities import Issue, Project, User
 from src.domain.exceptions import EntityNotFoundException
+from src.domain.repositories import IssueActivityEntry
 from src.domain.value_objects import Email, HashedPassword
 from src.infrastructure.database.models import IssueActivityModel
 
@@ -287,3 +289,29 @@ class TestListIssueActivitiesUseCase:
         assert result.limit == 50
         assert result.total_pages == 0
         assert len(result.activities) == 0
+
+
+class TestIssueActivityRecorder:
+    """Tests for IssueActivityRecorder."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_recorded_entries_once(self, mock_activity_repository):
+        """Test recorded entries are written in one batch, then cleared."""
+        issue_id, user_id = uuid4(), uuid4()
+        mock_activity_repository.create_batch.return_value = 2
+        recorder = IssueActivityRecorder(mock_activity_repository)
+
+        recorder.record(issue_id, user_id, "updated", "title", "Old", "New")
+        recorder.record(issue_id, user_id, "status_changed", "status", "todo", "done")
+        assert recorder.pending == 2
+
+        assert await recorder.flush() == 2
+        assert await recorder.flush() == 0
+
+        mock_activity_repository.create_batch.assert_called_once_with(
+            [
+                IssueActivityEntry(issue_id, user_id, "updated", "title", "Old", "New"),
+                IssueActivityEntry(issue_id, user_id, "status_changed", "status", "todo", "done"),
+            ]
+        )
+        assert recorder.pending == 0
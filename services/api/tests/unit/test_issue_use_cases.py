@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 
 from src.application.dtos.issue import CreateIssueRequest, UpdateIssueRequest
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.issue import (
     CreateIssueUseCase,
     DeleteIssueUseCase,
@@ -13,8 +14,9 @@ from src.application.use_cases.issue import (
     ListIssuesUseCase,
     UpdateIssueUseCase,
 )
-from src.domain.entities import Issue, Project, User
-from src.domain.exceptions import EntityNotFoundException
+from src.domain.entities import CustomFieldValue, Issue, Project, User, Workflow
+from src.domain.events import IssueStatusChanged
+from src.domain.exceptions import EntityNotFoundException, ValidationException
 from src.domain.value_objects import Email, HashedPassword
 
 
@@ -49,8 +51,8 @@ def mock_activity_repository():
 
 
 @pytest.fixture
-def mock_notification_repository():
-    """Mock notification repository."""
+def mock_event_publisher():
+    """Mock event publisher."""
     return AsyncMock()
 
 
@@ -362,6 +364,62 @@ class TestListIssuesUseCase:
         assert len(result.issues) == 1
         mock_issue_repository.search.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_issues_with_custom_fields(
+        self,
+        mock_issue_repository,
+        mock_project_repository,
+        mock_session,
+        test_project,
+        test_issue,
+    ):
+        """Test custom field filters and sort reach the repository, values load in batch."""
+        field_id = uuid4()
+        mock_issue_repository.get_all.return_value = [test_issue]
+        mock_issue_repository.count.return_value = 1
+        mock_project_repository.get_by_id.return_value = test_project
+        value_repository = AsyncMock()
+        value_repository.get_by_issue_ids.return_value = {
+            test_issue.id: [
+                CustomFieldValue.create(custom_field_id=field_id, issue_id=test_issue.id, value=5)
+            ]
+        }
+
+        use_case = ListIssuesUseCase(
+            mock_issue_repository,
+            mock_project_repository,
+            mock_session,
+            custom_field_value_repository=value_repository,
+        )
+
+        result = await use_case.execute(
+            str(test_project.id),
+            custom_field_values={str(field_id): ["a", "b"]},
+            sort_custom_field_id=str(field_id),
+            sort_order="desc",
+            include_custom_fields=True,
+        )
+
+        get_all_kwargs = mock_issue_repository.get_all.call_args.kwargs
+        assert get_all_kwargs["custom_field_values"] == {field_id: ["a", "b"]}
+        assert get_all_kwargs["sort_custom_field_id"] == field_id
+        assert get_all_kwargs["sort_descending"] is True
+        assert mock_issue_repository.count.call_args.kwargs["custom_field_values"] == {
+            field_id: ["a", "b"]
+        }
+        value_repository.get_by_issue_ids.assert_called_once_with([test_issue.id])
+        assert result.issues[0].custom_fields == {field_id: 5}
+
+    @pytest.mark.asyncio
+    async def test_list_issues_invalid_sort_order(
+        self, mock_issue_repository, mock_project_repository, mock_session, test_project
+    ):
+        """Test an unknown sort order is rejected."""
+        use_case = ListIssuesUseCase(mock_issue_repository, mock_project_repository, mock_session)
+
+        with pytest.raises(ValueError, match="Sort order"):
+            await use_case.execute(str(test_project.id), sort_order="sideways")
+
 
 class TestUpdateIssueUseCase:
     """Tests for UpdateIssueUseCase."""
@@ -373,7 +431,7 @@ class TestUpdateIssueUseCase:
         mock_project_repository,
         mock_user_repository,
         mock_activity_repository,
-        mock_notification_repository,
+        mock_event_publisher,
         mock_session,
         test_issue,
         test_project,
@@ -401,7 +459,7 @@ class TestUpdateIssueUseCase:
             mock_project_repository,
             mock_user_repository,
             mock_activity_repository,
-            mock_notification_repository,
+            mock_event_publisher,
             mock_session,
         )
 
@@ -415,6 +473,54 @@ class TestUpdateIssueUseCase:
         assert result.status == "in_progress"
         assert result.key == "TEST-1"  # Generated key
         mock_issue_repository.update.assert_called_once()
+        mock_event_publisher.publish.assert_called_once()
+        (event,) = mock_event_publisher.publish.call_args.args
+        assert isinstance(event, IssueStatusChanged)
+        assert (event.old_status, event.new_status) == ("todo", "in_progress")
+        assert event.changed_by == test_user.id
+
+    @pytest.mark.asyncio
+    async def test_update_issue_logs_changes_in_one_batch(
+        self,
+        mock_issue_repository,
+        mock_project_repository,
+        mock_user_repository,
+        mock_activity_repository,
+        mock_event_publisher,
+        mock_session,
+        test_issue,
+        test_project,
+        test_user,
+    ):
+        """Test the changed fields are logged together, in order, in one statement."""
+        mock_issue_repository.get_by_id.return_value = test_issue
+        mock_issue_repository.update.side_effect = lambda issue: issue
+        mock_project_repository.get_by_id.return_value = test_project
+
+        use_case = UpdateIssueUseCase(
+            mock_issue_repository,
+            mock_project_repository,
+            mock_user_repository,
+            mock_activity_repository,
+            mock_event_publisher,
+            mock_session,
+        )
+
+        request = UpdateIssueRequest(
+            title="Renamed", description="A test issue", priority="high", story_points=3
+        )
+        await use_case.execute(str(test_issue.id), request, test_user.id)
+
+        mock_activity_repository.create.assert_not_called()
+        mock_activity_repository.create_batch.assert_called_once()
+        entries = mock_activity_repository.create_batch.call_args.args[0]
+        assert [(entry.field_name, entry.old_value, entry.new_value) for entry in entries] == [
+            ("title", "Test Issue", "Renamed"),
+            ("priority", "medium", "high"),
+            ("story_points", None, "3"),
+        ]
+        assert {entry.user_id for entry in entries} == {test_user.id}
+        mock_event_publisher.publish.assert_called_once_with()
 
     @pytest.mark.asyncio
     async def test_update_issue_not_found(
@@ -423,7 +529,7 @@ class TestUpdateIssueUseCase:
         mock_project_repository,
         mock_user_repository,
         mock_activity_repository,
-        mock_notification_repository,
+        mock_event_publisher,
         mock_session,
     ):
         """Test issue update fails when issue not found."""
@@ -434,7 +540,7 @@ class TestUpdateIssueUseCase:
             mock_project_repository,
             mock_user_repository,
             mock_activity_repository,
-            mock_notification_repository,
+            mock_event_publisher,
             mock_session,
         )
 
@@ -442,6 +548,45 @@ class TestUpdateIssueUseCase:
         with pytest.raises(EntityNotFoundException, match="Issue"):
             await use_case.execute(str(uuid4()), request, uuid4())
 
+    @pytest.mark.asyncio
+    async def test_update_issue_status_follows_workflow(
+        self,
+        mock_issue_repository,
+        mock_project_repository,
+        mock_user_repository,
+        mock_activity_repository,
+        mock_event_publisher,
+        mock_session,
+        test_issue,
+    ):
+        """Test a status change the project's default workflow forbids is rejected."""
+        workflow = Workflow.create(project_id=test_issue.project_id, name="Flow", is_default=True)
+        todo = workflow.add_status("Todo", order=0, is_initial=True)
+        in_progress = workflow.add_status("In Progress", order=1)
+        done = workflow.add_status("Done", order=2, is_final=True)
+        workflow.add_transition(todo.id, in_progress.id)
+        workflow.add_transition(in_progress.id, done.id)
+        workflow_repository = AsyncMock()
+        workflow_repository.get_default_by_project_id.return_value = workflow
+        mock_issue_repository.get_by_id.return_value = test_issue
+
+        use_case = UpdateIssueUseCase(
+            mock_issue_repository,
+            mock_project_repository,
+            mock_user_repository,
+            mock_activity_repository,
+            mock_event_publisher,
+            mock_session,
+            workflow_repository=workflow_repository,
+            workflow_cache=WorkflowCache(),
+        )
+
+        with pytest.raises(ValidationException, match="not allowed") as exc_info:
+            await use_case.execute(str(test_issue.id), UpdateIssueRequest(status="done"))
+
+        assert exc_info.value.details["field"] == "status"
+        mock_issue_repository.update.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_issue_invalid_status(
         self,
@@ -498,3 +643,42 @@ class TestDeleteIssueUseCase:
 
         with pytest.raises(EntityNotFoundException, match="Issue"):
             await use_case.execute(str(uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_delete_subtask_refreshes_parent_rollups(
+        self, mock_issue_repository, mock_activity_repository, test_project, test_user
+    ):
+        """Test deleting a subtask refreshes the rollups of its ancestors."""
+        subtask = Issue.create(
+            project_id=test_project.id,
+            issue_number=2,
+            title="Subtask",
+            reporter_id=test_user.id,
+            parent_issue_id=uuid4(),
+        )
+        mock_issue_repository.get_by_id.return_value = subtask
+        hierarchy_service = AsyncMock()
+
+        use_case = DeleteIssueUseCase(
+            mock_issue_repository, mock_activity_repository, hierarchy_service=hierarchy_service
+        )
+
+        await use_case.execute(str(subtask.id))
+
+        hierarchy_service.refresh_rollups.assert_awaited_once_with([subtask.id])
+
+    @pytest.mark.asyncio
+    async def test_delete_top_level_issue_skips_rollups(
+        self, mock_issue_repository, mock_activity_repository, test_issue
+    ):
+        """Test deleting an issue without parent leaves rollups untouched."""
+        mock_issue_repository.get_by_id.return_value = test_issue
+        hierarchy_service = AsyncMock()
+
+        use_case = DeleteIssueUseCase(
+            mock_issue_repository, mock_activity_repository, hierarchy_service=hierarchy_service
+        )
+
+        await use_case.execute(str(test_issue.id))
+
+        hierarchy_service.refresh_rollups.assert_not_awaited()
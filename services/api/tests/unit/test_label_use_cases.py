@@ -215,9 +215,13 @@ class TestAddLabelToIssueUseCase:
             type="bug",
         )
         mock_issue_repository.get_by_id.return_value = issue
-        use_case = AddLabelToIssueUseCase(mock_label_repository, mock_issue_repository)
+        filter_count_cache = AsyncMock()
+        use_case = AddLabelToIssueUseCase(
+            mock_label_repository, mock_issue_repository, filter_count_cache
+        )
         await use_case.execute(str(issue.id), str(test_label.id))
         mock_label_repository.add_label_to_issue.assert_called_once()
+        filter_count_cache.invalidate.assert_awaited_once_with(issue.project_id)
 
     @pytest.mark.asyncio
     async def test_add_label_to_issue_issue_not_found(
@@ -236,12 +240,15 @@ class TestRemoveLabelFromIssueUseCase:
     @pytest.mark.asyncio
     async def test_remove_label_from_issue_success(self, mock_label_repository, test_label):
         """Test removing label from issue."""
-        use_case = RemoveLabelFromIssueUseCase(mock_label_repository)
+        mock_label_repository.get_by_id.return_value = test_label
+        filter_count_cache = AsyncMock()
+        use_case = RemoveLabelFromIssueUseCase(mock_label_repository, filter_count_cache)
         issue_id = uuid4()
         await use_case.execute(str(issue_id), str(test_label.id))
         mock_label_repository.remove_label_from_issue.assert_called_once_with(
             issue_id, test_label.id
         )
+        filter_count_cache.invalidate.assert_awaited_once_with(test_label.project_id)
 
 
 class TestListIssueLabelsUseCase:
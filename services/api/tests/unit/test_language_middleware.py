@@ -1,117 +1,120 @@
 """Unit tests for language detection middleware."""
 
-from unittest.mock import MagicMock
-
 import pytest
-from fastapi import Request
-from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
 
 from src.presentation.middlewares.language import LanguageDetectionMiddleware
 
 
-@pytest.fixture
-def mock_call_next():
-    """Create a mock call_next function."""
-
-    async def call_next(request: Request) -> Response:
-        return Response(content="OK", status_code=200)
-
-    return call_next
+async def downstream_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Minimal ASGI app returning 200 OK."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"OK"})
 
 
 @pytest.fixture
 def middleware():
     """Create language detection middleware instance."""
-    return LanguageDetectionMiddleware(lambda request, call_next: call_next(request))
+    return LanguageDetectionMiddleware(downstream_app)
+
+
+async def call_middleware(
+    middleware: LanguageDetectionMiddleware, headers: dict[str, str]
+) -> tuple[Scope, list[Message]]:
+    """Run an HTTP request through the middleware.
+
+    Returns:
+        The request scope (with state) and the messages sent downstream
+    """
+    scope: Scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/test",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return scope, messages
 
 
 class TestLanguageDetectionMiddleware:
     """Tests for LanguageDetectionMiddleware."""
 
     @pytest.mark.asyncio
-    async def test_detect_language_from_accept_language_header(
-        self, middleware, mock_call_next
-    ) -> None:
+    async def test_detect_language_from_accept_language_header(self, middleware) -> None:
         """Test language detection from Accept-Language header."""
-        request = MagicMock(spec=Request)
-        request.headers = {"Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8"}
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
+        scope, messages = await call_middleware(
+            middleware, {"Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8"}
+        )
 
-        response = await middleware.dispatch(request, mock_call_next)
-
-        assert response.status_code == 200
-        assert request.state.language == "fr"
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "fr"
 
     @pytest.mark.asyncio
-    async def test_detect_language_with_region_code(self, middleware, mock_call_next) -> None:
+    async def test_detect_language_with_region_code(self, middleware) -> None:
         """Test language detection with region code."""
-        request = MagicMock(spec=Request)
-        request.headers = {"Accept-Language": "en-US,en;q=0.9"}
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
-
-        response = await middleware.dispatch(request, mock_call_next)
+        scope, messages = await call_middleware(middleware, {"Accept-Language": "en-US,en;q=0.9"})
 
-        assert response.status_code == 200
-        assert request.state.language == "en"
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "en"
 
     @pytest.mark.asyncio
-    async def test_detect_language_default_when_no_header(self, middleware, mock_call_next) -> None:
+    async def test_detect_language_default_when_no_header(self, middleware) -> None:
         """Test default language when no Accept-Language header."""
-        request = MagicMock(spec=Request)
-        request.headers = {}
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
-
-        response = await middleware.dispatch(request, mock_call_next)
+        scope, messages = await call_middleware(middleware, {})
 
-        assert response.status_code == 200
-        assert request.state.language == "en"  # Default
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "en"  # Default
 
     @pytest.mark.asyncio
-    async def test_detect_language_unsupported_fallback_to_default(
-        self, middleware, mock_call_next
-    ) -> None:
+    async def test_detect_language_unsupported_fallback_to_default(self, middleware) -> None:
         """Test fallback to default when unsupported language in header."""
-        request = MagicMock(spec=Request)
-        request.headers = {"Accept-Language": "zh-CN,zh;q=0.9"}  # Chinese not supported
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
+        scope, messages = await call_middleware(
+            middleware, {"Accept-Language": "zh-CN,zh;q=0.9"}  # Chinese not supported
+        )
 
-        response = await middleware.dispatch(request, mock_call_next)
-
-        assert response.status_code == 200
-        assert request.state.language == "en"  # Fallback to default
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "en"  # Fallback to default
 
     @pytest.mark.asyncio
-    async def test_detect_language_quality_values(self, middleware, mock_call_next) -> None:
+    async def test_detect_language_quality_values(self, middleware) -> None:
         """Test language detection with quality values (q-values)."""
-        request = MagicMock(spec=Request)
         # Spanish has higher quality (0.9) than French (0.8)
-        request.headers = {"Accept-Language": "fr;q=0.8,es;q=0.9,en;q=0.7"}
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
-
-        response = await middleware.dispatch(request, mock_call_next)
+        scope, messages = await call_middleware(
+            middleware, {"Accept-Language": "fr;q=0.8,es;q=0.9,en;q=0.7"}
+        )
 
-        assert response.status_code == 200
-        assert request.state.language == "es"  # Highest quality supported language
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "es"  # Highest quality supported language
 
     @pytest.mark.asyncio
-    async def test_detect_language_multiple_supported_languages(
-        self, middleware, mock_call_next
-    ) -> None:
+    async def test_detect_language_multiple_supported_languages(self, middleware) -> None:
         """Test language detection with multiple supported languages."""
-        request = MagicMock(spec=Request)
-        request.headers = {"Accept-Language": "de,fr,es,en"}
-        request.url.path = "/api/v1/test"
-        request.state = MagicMock()
+        scope, messages = await call_middleware(middleware, {"Accept-Language": "de,fr,es,en"})
+
+        assert messages[0]["status"] == 200
+        assert scope["state"]["language"] == "de"  # First supported language
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self, middleware) -> None:
+        """Test that non-HTTP scopes (lifespan, websocket) are not touched."""
+        received: list[Scope] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            received.append(scope)
 
-        response = await middleware.dispatch(request, mock_call_next)
+        scope: Scope = {"type": "lifespan"}
+        await LanguageDetectionMiddleware(app)(scope, None, None)  # type: ignore[arg-type]
 
-        assert response.status_code == 200
-        assert request.state.language == "de"  # First supported language
+        assert received == [scope]
+        assert "state" not in scope
 
     @pytest.mark.asyncio
     async def test_parse_accept_language_simple(self, middleware) -> None:
@@ -0,0 +1,122 @@
+"""Unit tests for the maintenance scheduler and storage listings."""
+
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.monitoring import get_metrics_registry
+from src.infrastructure.services import LocalStorageService
+from src.infrastructure.services.maintenance import (
+    MaintenanceJob,
+    MaintenanceScheduler,
+    PurgeBatch,
+)
+
+
+class FakeJob(MaintenanceJob):
+    """Job returning (or raising) scripted batches."""
+
+    def __init__(self, name, batches):
+        super().__init__(name, timedelta(hours=1))
+        self.batches = list(batches)
+        self.cursors = []
+
+    async def purge_batch(self, session, limit, cursor):
+        self.cursors.append(cursor)
+        batch = self.batches.pop(0)
+        if isinstance(batch, Exception):
+            raise batch
+        return batch
+
+
+def session_factory():
+    """Session factory of mock sessions."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory, session
+
+
+def counter(name):
+    """Counter of the process-wide registry."""
+    return get_metrics_registry().counter(name, "")
+
+
+class TestMaintenanceScheduler:
+    """Tests for MaintenanceScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_run_follows_cursor_until_done(self):
+        """Test batches run until one is done, each resuming from the previous cursor."""
+        factory, session = session_factory()
+        job = FakeJob(
+            "unit_follow_cursor",
+            [PurgeBatch(2, False, "a"), PurgeBatch(2, False, "b"), PurgeBatch(1, True)],
+        )
+        scheduler = MaintenanceScheduler(factory, [job], batch_size=2, batch_delay_seconds=0)
+
+        assert await scheduler.run_job(job) == 5
+        assert job.cursors == [None, "a", "b"]
+        # A commit per batch, then the outcome of the run
+        assert session.commit.call_count == 4
+        assert counter("maintenance_purged_total").value(job="unit_follow_cursor") == 5
+
+    @pytest.mark.asyncio
+    async def test_run_stops_at_batch_limit(self):
+        """Test a run stops after the maximum number of batches."""
+        factory, _ = session_factory()
+        job = FakeJob("unit_batch_limit", [PurgeBatch(1, False, str(i)) for i in range(5)])
+        scheduler = MaintenanceScheduler(
+            factory, [job], batch_size=1, batch_delay_seconds=0, max_batches_per_run=3
+        )
+
+        assert await scheduler.run_job(job) == 3
+        assert len(job.batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_keeps_batches_done(self):
+        """Test a failure ends the run, counted as failed, with the batches before it kept."""
+        factory, session = session_factory()
+        job = FakeJob("unit_failure", [PurgeBatch(1, False, "a"), RuntimeError("disk full")])
+        scheduler = MaintenanceScheduler(factory, [job], batch_size=1, batch_delay_seconds=0)
+
+        assert await scheduler.run_job(job) == 1
+        assert counter("maintenance_job_runs_total").value(job="unit_failure", status="failed") == 1
+        outcome = session.execute.call_args.args[0].compile().params
+        assert outcome["last_error"] == "disk full"
+        assert outcome["last_purged"] == 1
+
+
+class TestLocalStorageListing:
+    """Tests for LocalStorageService.list_files."""
+
+    @pytest.mark.asyncio
+    async def test_pages_in_path_order(self, tmp_path):
+        """Test files under a prefix are listed in pages, after the given path."""
+        storage = LocalStorageService(str(tmp_path))
+        for path in ["attachments/b/2.txt", "attachments/a/1.txt", "avatars/x.webp"]:
+            await storage.save(b"x", path, "text/plain")
+
+        first = await storage.list_files("attachments/", limit=1)
+        second = await storage.list_files("attachments/", after=first[-1].path, limit=1)
+        last = await storage.list_files("attachments/", after=second[-1].path, limit=1)
+
+        assert [file.path for file in first + second] == [
+            "attachments/a/1.txt",
+            "attachments/b/2.txt",
+        ]
+        assert last == []
+
+    @pytest.mark.asyncio
+    async def test_missing_prefix(self, tmp_path):
+        """Test a prefix without files lists nothing."""
+        storage = LocalStorageService(str(tmp_path))
+
+        assert await storage.list_files("attachments/") == []
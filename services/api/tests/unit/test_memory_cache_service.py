@@ -0,0 +1,51 @@
+"""Unit tests for InMemoryCacheService."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.services import InMemoryCacheService
+
+
+class TestInMemoryCacheService:
+    """Tests for InMemoryCacheService."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        """Test that a cached value is returned until deleted."""
+        cache = InMemoryCacheService()
+
+        await cache.set("key", {"a": 1}, ttl_seconds=30)
+        assert await cache.get("key") == {"a": 1}
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_value_is_missing(self):
+        """Test that values expire after their TTL."""
+        cache = InMemoryCacheService()
+
+        with patch("src.infrastructure.services.memory_cache_service.time.monotonic") as clock:
+            clock.return_value = 100.0
+            await cache.set("key", "value", ttl_seconds=30)
+
+            clock.return_value = 129.0
+            assert await cache.get("key") == "value"
+
+            clock.return_value = 130.0
+            assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = InMemoryCacheService(max_entries=2)
+
+        await cache.set("a", 1, ttl_seconds=30)
+        await cache.set("b", 2, ttl_seconds=30)
+        await cache.get("a")
+        await cache.set("c", 3, ttl_seconds=30)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
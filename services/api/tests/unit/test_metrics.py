@@ -0,0 +1,149 @@
+"""Unit tests for the in-process metrics registry and query analysis."""
+
+import pytest
+
+from src.infrastructure.monitoring import (
+    PHASE_DB,
+    MetricsRegistry,
+    find_repeated_statements,
+    get_request_timings,
+    normalize_statement,
+    record_phase,
+    reset_request_timings,
+    start_request_timings,
+)
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry and metric types."""
+
+    def test_counter_increments_per_label_set(self) -> None:
+        """Test counter values are tracked per label set."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind="b")
+
+        assert counter.value(kind="a") == 3
+        assert counter.value(kind="b") == 1
+
+    def test_gauge_goes_up_and_down(self) -> None:
+        """Test gauge inc/dec/set."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("in_flight", "In flight")
+
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        assert gauge.value() == 1
+
+        gauge.set(7)
+        assert gauge.value() == 7
+
+    def test_histogram_renders_cumulative_buckets(self) -> None:
+        """Test histogram buckets are cumulative in the text format."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency", ("route",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(5.0, route="/a")
+
+        rendered = registry.render()
+        assert "# TYPE latency histogram" in rendered
+        assert 'latency_bucket{route="/a",le="0.1"} 1' in rendered
+        assert 'latency_bucket{route="/a",le="1"} 2' in rendered
+        assert 'latency_bucket{route="/a",le="+Inf"} 3' in rendered
+        assert 'latency_count{route="/a"} 3' in rendered
+        assert histogram.sum(route="/a") == pytest.approx(5.55)
+
+    def test_registering_twice_returns_same_metric(self) -> None:
+        """Test metrics are get-or-create by name."""
+        registry = MetricsRegistry()
+
+        assert registry.counter("c", "C") is registry.counter("c", "C")
+
+    def test_registering_with_other_type_fails(self) -> None:
+        """Test a name cannot be reused for another metric type."""
+        registry = MetricsRegistry()
+        registry.counter("c", "C")
+
+        with pytest.raises(ValueError):
+            registry.gauge("c", "C")
+
+    def test_wrong_labels_are_rejected(self) -> None:
+        """Test observing with undeclared labels fails."""
+        registry = MetricsRegistry()
+        counter = registry.counter("c", "C", ("route",))
+
+        with pytest.raises(ValueError):
+            counter.inc(method="GET")
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test quotes in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("c", "C", ("route",)).inc(route='/a"b')
+
+        assert 'c{route="/a\\"b"} 1' in registry.render()
+
+
+class TestRequestTimings:
+    """Tests for per-request phase timings."""
+
+    def test_record_phase_outside_request_is_noop(self) -> None:
+        """Test recording without an open request does nothing."""
+        assert get_request_timings() is None
+        record_phase(PHASE_DB, 0.5)
+
+    def test_record_phase_accumulates(self) -> None:
+        """Test phases entered several times are summed."""
+        timings, token = start_request_timings()
+        try:
+            record_phase(PHASE_DB, 0.25)
+            record_phase(PHASE_DB, 0.5)
+            assert get_request_timings() is timings
+            assert timings.phases[PHASE_DB] == pytest.approx(0.75)
+        finally:
+            reset_request_timings(token)
+
+        assert get_request_timings() is None
+
+
+class TestQueryAnalysis:
+    """Tests for SQL statement shape normalization and N+1 detection."""
+
+    def test_normalize_collapses_placeholder_lists(self) -> None:
+        """Test IN lists of any length have the same shape."""
+        short = normalize_statement("SELECT * FROM issues WHERE id IN ($1, $2)")
+        long = normalize_statement("SELECT * FROM issues WHERE id IN ($1, $2, $3, $4)")
+
+        assert short == long == "SELECT * FROM issues WHERE id IN (?...)"
+
+    def test_normalize_replaces_literals(self) -> None:
+        """Test literal values do not change the shape."""
+        first = normalize_statement("SELECT pg_advisory_xact_lock(123)  WHERE name = 'a'")
+        second = normalize_statement("SELECT pg_advisory_xact_lock(456) WHERE name = 'b''c'")
+
+        assert first == second
+
+    def test_find_repeated_statements(self) -> None:
+        """Test shapes over the threshold are reported, most executed first."""
+        statements = {
+            "SELECT * FROM users WHERE id = $1": 6,
+            "SELECT * FROM projects WHERE id = $1": 2,
+            "SELECT * FROM labels WHERE id IN ($1, $2)": 4,
+            "SELECT * FROM labels WHERE id IN ($1, $2, $3)": 4,
+        }
+
+        suspects = find_repeated_statements(statements, threshold=5)
+
+        assert suspects == [
+            ("SELECT * FROM labels WHERE id IN (?...)", 8),
+            ("SELECT * FROM users WHERE id = ?", 6),
+        ]
+
+    def test_find_repeated_statements_below_threshold(self) -> None:
+        """Test nothing is reported for requests with few statements."""
+        assert find_repeated_statements({"SELECT 1": 3}, threshold=5) == []
@@ -0,0 +1,174 @@
+"""Unit tests for the index advisor of the migration audit script."""
+
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from scripts.migration_audit import (
+    IndexAdvice,
+    IndexCandidate,
+    QueryShape,
+    advise_indexes,
+    estimate_index_size,
+    get_existing_indexes,
+    get_model_structure,
+    load_captured_queries,
+    parse_query_shape,
+    render_index_migration,
+)
+from src.infrastructure.database.models import IssueModel, ProjectModel
+
+TABLES = {table_name: set(table["columns"]) for table_name, table in get_model_structure().items()}
+
+
+def _sql(statement) -> str:
+    """Statement as the app sends it (asyncpg placeholders)."""
+    return " ".join(str(statement.compile(dialect=asyncpg.dialect())).split())
+
+
+class TestParseQueryShape:
+    """Tests for parse_query_shape."""
+
+    def test_equality_then_order_with_soft_delete_condition(self):
+        """Test equality columns lead, the ORDER BY follows, IS NULL becomes the condition."""
+        query = _sql(
+            select(IssueModel)
+            .where(IssueModel.project_id == uuid4(), IssueModel.deleted_at.is_(None))
+            .order_by(IssueModel.backlog_order, IssueModel.created_at.desc())
+            .limit(20)
+        )
+
+        assert parse_query_shape(query, TABLES) == [
+            IndexCandidate(
+                "issues", ("project_id",), ("backlog_order", "created_at"), "deleted_at IS NULL"
+            )
+        ]
+
+    def test_join_conditions_ignored(self):
+        """Test columns compared to other columns are not indexed."""
+        query = _sql(
+            select(func.count())
+            .select_from(IssueModel)
+            .join(ProjectModel, ProjectModel.id == IssueModel.project_id)
+            .where(
+                IssueModel.project_id == uuid4(),
+                IssueModel.status.in_(["todo"]),
+                IssueModel.deleted_at.is_(None),
+            )
+        )
+
+        assert parse_query_shape(query, TABLES) == [
+            IndexCandidate("issues", ("project_id", "status"), (), "deleted_at IS NULL")
+        ]
+
+    def test_range_column_trails_without_order(self):
+        """Test the first range predicate is the trailing column when nothing is sorted."""
+        query = _sql(
+            select(IssueModel.id).where(
+                IssueModel.assignee_id == uuid4(), IssueModel.due_date < func.now()
+            )
+        )
+
+        assert parse_query_shape(query, TABLES) == [
+            IndexCandidate("issues", ("assignee_id",), ("due_date",))
+        ]
+
+    def test_single_column_not_proposed(self):
+        """Test a lone equality column (a plain index) is not a candidate."""
+        query = _sql(select(IssueModel.id).where(IssueModel.project_id == uuid4()))
+
+        assert parse_query_shape(query, TABLES) == []
+
+
+class TestAdviseIndexes:
+    """Tests for advise_indexes."""
+
+    def test_existing_indexes_skipped(self):
+        """Test candidates served by the model indexes are not proposed."""
+        # ix_issues_backlog: project_id, backlog_order, created_at WHERE deleted_at IS NULL
+        query = _sql(
+            select(IssueModel)
+            .where(IssueModel.project_id == uuid4(), IssueModel.deleted_at.is_(None))
+            .order_by(IssueModel.backlog_order, IssueModel.created_at)
+        )
+        existing = get_existing_indexes({}, get_model_structure())
+
+        assert advise_indexes([QueryShape(query, 100, 500.0)], TABLES, existing) == []
+
+    def test_ranked_and_prefixes_merged(self):
+        """Test candidates are ranked by time and a prefix adds its workload to the longer one."""
+        by_status = "WHERE issues.project_id = $1 AND issues.status = $2"
+        by_status_and_due = f"{by_status} ORDER BY issues.due_date"
+        by_reporter = "WHERE issues.reporter_id = $1 AND issues.type = $2"
+        workload = [
+            QueryShape(f"SELECT issues.id FROM issues {by_status_and_due}", 10, 900.0),
+            QueryShape(f"SELECT issues.id FROM issues {by_status}", 5, 100.0),
+            QueryShape(f"SELECT issues.id FROM issues {by_reporter}", 50, 500.0),
+        ]
+
+        advice = advise_indexes(workload, TABLES, {})
+
+        assert [entry.candidate.columns for entry in advice] == [
+            ("project_id", "status", "due_date"),
+            ("reporter_id", "type"),
+        ]
+        assert (advice[0].calls, advice[0].total_ms, advice[0].queries) == (15, 1000.0, 2)
+
+
+def test_estimate_index_size():
+    """Test the size grows with the rows and the share kept by a partial index."""
+    full = estimate_index_size(1_000_000, [16, 8])
+    partial = estimate_index_size(1_000_000, [16, 8], selected_fraction=0.5)
+
+    # 36 byte entries, ~7.3k per page: about 5k pages
+    assert 35_000_000 < full < 45_000_000
+    assert partial < full * 0.6
+    assert estimate_index_size(0, [16]) == 8192
+
+
+def test_load_captured_queries(tmp_path):
+    """Test slow query log lines are grouped by statement, other lines skipped."""
+    statement = "SELECT issues.id FROM issues WHERE issues.project_id = $1"
+    log = tmp_path / "api.log"
+    log.write_text(
+        "\n".join(
+            [
+                json.dumps({"event": "Slow query", "statement": statement, "duration_ms": 600}),
+                json.dumps({"event": "Request completed", "duration_ms": 900}),
+                "not json",
+                json.dumps(
+                    {"event": "Slow query", "statement": f"  {statement} ", "duration_ms": 700}
+                ),
+            ]
+        )
+    )
+
+    assert load_captured_queries(log) == [QueryShape(statement, 2, 1300.0)]
+
+
+def test_render_index_migration():
+    """Test the migration creates the indexes concurrently after the head."""
+    advice = [
+        IndexAdvice(
+            IndexCandidate("issues", ("project_id", "status"), (), "deleted_at IS NULL"),
+            calls=300,
+            total_ms=900.0,
+            queries=1,
+            estimated_bytes=40 * 1024 * 1024,
+        )
+    ]
+
+    source = render_index_migration(
+        advice, "abc123def456", "d0e1f2a3b4c5", datetime(2026, 10, 19), "pg_stat_statements"
+    )
+
+    compile(source, "migration.py", "exec")
+    assert 'down_revision: str | None = "d0e1f2a3b4c5"' in source
+    assert "autocommit_block()" in source
+    assert '"ix_issues_project_id_status_partial"' in source
+    assert 'postgresql_where=sa.text("deleted_at IS NULL")' in source
+    assert source.count("postgresql_concurrently=True") == 2
+    assert "~40.0 MB" in source
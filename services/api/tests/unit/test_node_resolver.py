@@ -0,0 +1,74 @@
+"""Unit tests for NodeResolver."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.node_resolver import NodeResolver
+
+
+def _result(rows):
+    """Mock result returning rows from all()."""
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+@pytest.mark.asyncio
+async def test_resolve_loads_one_query_per_entity_type():
+    """Test any number of projects and spaces costs one query per entity type."""
+    organization_id = uuid4()
+    project_ids = [uuid4() for _ in range(3)]
+    space_id = uuid4()
+    session = AsyncMock()
+    session.execute.side_effect = [
+        _result(
+            [
+                SimpleNamespace(
+                    id=project_id,
+                    organization_id=organization_id,
+                    name=f"Project {n}",
+                    key=f"P{n}",
+                    description=None,
+                    folder_id=None,
+                    member_count=n,
+                    issue_count=2 * n,
+                )
+                for n, project_id in enumerate(project_ids)
+            ]
+        ),
+        _result(
+            [
+                SimpleNamespace(
+                    id=space_id,
+                    organization_id=organization_id,
+                    name="Space",
+                    key="S",
+                    description=None,
+                    folder_id=None,
+                    page_count=4,
+                )
+            ]
+        ),
+    ]
+
+    nodes = await NodeResolver(session).resolve(
+        [("project", project_id) for project_id in project_ids]
+        + [("space", space_id), ("page", uuid4())]
+    )
+
+    assert session.execute.call_count == 2
+    assert len(nodes) == 4
+    assert nodes[("project", project_ids[2])].details.issue_count == 4
+    assert nodes[("space", space_id)].details.page_count == 4
+
+
+@pytest.mark.asyncio
+async def test_resolve_nothing_runs_no_query():
+    """Test no query is made without references."""
+    session = AsyncMock()
+
+    assert await NodeResolver(session).resolve([]) == {}
+    session.execute.assert_not_called()
@@ -1,10 +1,11 @@
 """Unit tests for node use cases."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from src.application.dtos.node import NodeDetailsProject, NodeDetailsSpace, NodeListItemResponse
 from src.application.use_cases.node import ListNodesUseCase
 from src.domain.entities import Organization, Project, Space
 
@@ -22,9 +23,28 @@ def mock_space_repository():
 
 
 @pytest.fixture
-def mock_session():
-    """Mock database session."""
-    return AsyncMock()
+def mock_node_resolver():
+    """Node resolver returning the node of every reference it is given."""
+    resolver = AsyncMock()
+
+    async def resolve(refs):
+        return {
+            (entity_type, entity_id): NodeListItemResponse(
+                type=entity_type,
+                id=entity_id,
+                organization_id=uuid4(),
+                details=(
+                    NodeDetailsProject(name="Project", folder_id=resolver.folder_id)
+                    if entity_type == "project"
+                    else NodeDetailsSpace(name="Space", folder_id=resolver.folder_id)
+                ),
+            )
+            for entity_type, entity_id in refs
+        }
+
+    resolver.folder_id = None
+    resolver.resolve.side_effect = resolve
+    return resolver
 
 
 @pytest.fixture
@@ -67,7 +87,7 @@ class TestListNodesUseCase:
         self,
         mock_project_repository,
         mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_organization,
         test_project,
         test_space,
@@ -78,23 +98,9 @@ class TestListNodesUseCase:
         mock_project_repository.get_all.return_value = projects
         mock_space_repository.get_all.return_value = spaces
 
-        # Mock folder_id queries
-        folder_result = MagicMock()
-        folder_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = folder_result
-
-        # Mock count queries
-        count_result = MagicMock()
-        count_result.scalar_one.return_value = 0
-        mock_session.execute.side_effect = [
-            folder_result,  # project folder_id
-            count_result,  # project member_count
-            count_result,  # project issue_count
-            folder_result,  # space folder_id
-            count_result,  # space page_count
-        ]
-
-        use_case = ListNodesUseCase(mock_project_repository, mock_space_repository, mock_session)
+        use_case = ListNodesUseCase(
+            mock_project_repository, mock_space_repository, mock_node_resolver
+        )
 
         result = await use_case.execute(str(test_organization.id))
 
@@ -110,7 +116,7 @@ class TestListNodesUseCase:
         self,
         mock_project_repository,
         mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_organization,
         test_project,
     ):
@@ -120,22 +126,11 @@ class TestListNodesUseCase:
         spaces = []
         mock_project_repository.get_all.return_value = projects
         mock_space_repository.get_all.return_value = spaces
+        mock_node_resolver.folder_id = folder_id
 
-        # Mock folder_id query
-        folder_result = MagicMock()
-        folder_result.scalar_one_or_none.return_value = folder_id
-        mock_session.execute.return_value = folder_result
-
-        # Mock count queries
-        count_result = MagicMock()
-        count_result.scalar_one.return_value = 0
-        mock_session.execute.side_effect = [
-            folder_result,  # project folder_id
-            count_result,  # project member_count
-            count_result,  # project issue_count
-        ]
-
-        use_case = ListNodesUseCase(mock_project_repository, mock_space_repository, mock_session)
+        use_case = ListNodesUseCase(
+            mock_project_repository, mock_space_repository, mock_node_resolver
+        )
 
         result = await use_case.execute(str(test_organization.id), folder_id=str(folder_id))
 
@@ -156,14 +151,16 @@ class TestListNodesUseCase:
         self,
         mock_project_repository,
         mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_organization,
     ):
         """Test node listing with no nodes."""
         mock_project_repository.get_all.return_value = []
         mock_space_repository.get_all.return_value = []
 
-        use_case = ListNodesUseCase(mock_project_repository, mock_space_repository, mock_session)
+        use_case = ListNodesUseCase(
+            mock_project_repository, mock_space_repository, mock_node_resolver
+        )
 
         result = await use_case.execute(str(test_organization.id))
 
@@ -175,7 +172,7 @@ class TestListNodesUseCase:
         self,
         mock_project_repository,
         mock_space_repository,
-        mock_session,
+        mock_node_resolver,
         test_organization,
     ):
         """Test node listing with pagination."""
@@ -198,25 +195,16 @@ class TestListNodesUseCase:
         mock_project_repository.get_all.return_value = projects
         mock_space_repository.get_all.return_value = spaces
 
-        # Mock folder_id and count queries
-        folder_result = MagicMock()
-        folder_result.scalar_one_or_none.return_value = None
-        count_result = MagicMock()
-        count_result.scalar_one.return_value = 0
-
-        # 5 projects * 3 queries each + 3 spaces * 2 queries each = 21 queries
-        mock_session.execute.side_effect = [
-            folder_result,
-            count_result,
-            count_result,
-        ] * 5 + [
-            folder_result,
-            count_result,
-        ] * 3
-
-        use_case = ListNodesUseCase(mock_project_repository, mock_space_repository, mock_session)
+        use_case = ListNodesUseCase(
+            mock_project_repository, mock_space_repository, mock_node_resolver
+        )
 
         result = await use_case.execute(str(test_organization.id), skip=0, limit=10)
 
         assert len(result.nodes) == 8  # 5 projects + 3 spaces
         assert result.total == 8
+        # Projects then spaces, resolved together
+        mock_node_resolver.resolve.assert_called_once()
+        assert [node.id for node in result.nodes] == [p.id for p in projects] + [
+            s.id for s in spaces
+        ]
@@ -0,0 +1,291 @@
+"""Unit tests for domain events, their handlers and the transactional outbox."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.event_bus import EventHandlerRegistry
+from src.application.services.notification_event_handler import NotificationEventHandler
+from src.domain.entities import Issue
+from src.domain.events import CommentCreated, IssueAssigned, IssueStatusChanged
+from src.infrastructure.database.models import OutboxEventModel
+from src.infrastructure.services.outbox import (
+    OutboxDispatcher,
+    OutboxEventPublisher,
+    deserialize_event,
+    serialize_event,
+)
+
+
+def status_changed(**overrides):
+    """IssueStatusChanged event, with overridable fields."""
+    fields = {
+        "issue_id": uuid4(),
+        "project_id": uuid4(),
+        "issue_title": "Fix login",
+        "old_status": "todo",
+        "new_status": "in_progress",
+        "assignee_id": uuid4(),
+        "changed_by": uuid4(),
+    }
+    fields.update(overrides)
+    return IssueStatusChanged(**fields)
+
+
+def outbox_row(event, **overrides):
+    """Pending outbox row of an event."""
+    row = OutboxEventModel(
+        id=uuid4(),
+        event_type=event.event_type,
+        payload=serialize_event(event),
+        attempts=0,
+        completed_handlers=[],
+    )
+    for name, value in overrides.items():
+        setattr(row, name, value)
+    return row
+
+
+def session_factory(rows):
+    """Session factory whose batch query returns the rows."""
+    session = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    session.begin_nested = begin_nested
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory, session
+
+
+class TestEventSerialization:
+    """Tests for event serialization."""
+
+    def test_round_trip(self):
+        """Test a stored event reads back equal to the published one."""
+        event = status_changed(assignee_id=None)
+
+        payload = serialize_event(event)
+
+        assert payload["issue_id"] == str(event.issue_id)
+        assert deserialize_event(event.event_type, payload) == event
+
+    def test_unknown_event_type(self):
+        """Test a payload of an unknown event type is rejected."""
+        with pytest.raises(ValueError, match="Unknown domain event type"):
+            deserialize_event("issue.archived", {})
+
+
+class TestEventHandlerRegistry:
+    """Tests for EventHandlerRegistry."""
+
+    def test_handlers_by_event_type(self):
+        """Test handlers are returned for their event type only, in subscription order."""
+        registry = EventHandlerRegistry()
+        first, second, other = MagicMock(), MagicMock(), MagicMock()
+        registry.subscribe(IssueStatusChanged, "notifications", first)
+        registry.subscribe(IssueStatusChanged, "webhooks", second)
+        registry.subscribe(IssueAssigned, "notifications", other)
+
+        assert registry.handlers("issue.status_changed") == {
+            "notifications": first,
+            "webhooks": second,
+        }
+        assert registry.handlers("comment.created") == {}
+
+    def test_duplicate_handler_name(self):
+        """Test a handler name is subscribed once per event type."""
+        registry = EventHandlerRegistry()
+        registry.subscribe(IssueStatusChanged, "notifications", MagicMock())
+
+        with pytest.raises(ValueError, match="already subscribed"):
+            registry.subscribe(IssueStatusChanged, "notifications", MagicMock())
+
+
+class TestOutboxEventPublisher:
+    """Tests for OutboxEventPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_publish_in_one_statement(self):
+        """Test the events of a call are written with one INSERT."""
+        session = AsyncMock()
+        publisher = OutboxEventPublisher(session)
+
+        await publisher.publish(status_changed(), status_changed())
+
+        session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_publish_nothing(self):
+        """Test publishing no events writes nothing."""
+        session = AsyncMock()
+
+        await OutboxEventPublisher(session).publish()
+
+        session.execute.assert_not_called()
+
+
+class TestOutboxDispatcher:
+    """Tests for OutboxDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_marks_events_processed(self):
+        """Test every handler receives the event, which is then marked processed."""
+        event = status_changed()
+        row = outbox_row(event)
+        factory, session = session_factory([row])
+        handler = AsyncMock()
+        registry = EventHandlerRegistry()
+        registry.subscribe(IssueStatusChanged, "notifications", lambda s: handler)
+
+        claimed = await OutboxDispatcher(factory, registry).dispatch_batch()
+
+        assert claimed == 1
+        handler.assert_called_once_with(event)
+        assert row.processed_at is not None
+        assert row.completed_handlers == ["notifications"]
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_handler_is_retried_alone(self):
+        """Test a failure backs the event off and keeps the handlers that succeeded."""
+        row = outbox_row(status_changed())
+        factory, _ = session_factory([row])
+        succeeded, failed = AsyncMock(), AsyncMock(side_effect=RuntimeError("SMTP down"))
+        registry = EventHandlerRegistry()
+        registry.subscribe(IssueStatusChanged, "notifications", lambda s: succeeded)
+        registry.subscribe(IssueStatusChanged, "emails", lambda s: failed)
+        dispatcher = OutboxDispatcher(factory, registry, retry_delay_seconds=5.0)
+
+        before = datetime.now(UTC)
+        await dispatcher.dispatch_batch()
+
+        assert row.processed_at is None
+        assert row.attempts == 1
+        assert row.last_error == "emails: SMTP down"
+        assert row.completed_handlers == ["notifications"]
+        assert (row.available_at - before).total_seconds() >= 5.0
+
+        # Second attempt: only the failed handler runs, with a doubled delay
+        before = datetime.now(UTC)
+        await dispatcher.dispatch_batch()
+
+        assert succeeded.call_count == 1
+        assert failed.call_count == 2
+        assert row.attempts == 2
+        assert (row.available_at - before).total_seconds() >= 10.0
+
+    @pytest.mark.asyncio
+    async def test_event_without_handlers_is_processed(self):
+        """Test an event nobody handles is marked processed."""
+        row = outbox_row(status_changed())
+        factory, _ = session_factory([row])
+
+        await OutboxDispatcher(factory, EventHandlerRegistry()).dispatch_batch()
+
+        assert row.processed_at is not None
+        assert row.attempts == 0
+
+
+@pytest.fixture
+def notification_repository():
+    """Mock notification repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def issue_repository():
+    """Mock issue repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def session():
+    """Mock database session resolving every user name to "Alice"."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = "Alice"
+    result.scalars.return_value.first.return_value = None
+    session.execute.return_value = result
+    return session
+
+
+@pytest.fixture
+def handler(notification_repository, issue_repository, session):
+    """Notification handler under test."""
+    return NotificationEventHandler(notification_repository, issue_repository, session)
+
+
+class TestNotificationEventHandler:
+    """Tests for NotificationEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_status_change_notifies_assignee(self, handler, notification_repository):
+        """Test the assignee is told who changed the status."""
+        event = status_changed()
+
+        await handler.issue_status_changed(event)
+
+        notification_repository.create.assert_called_once()
+        notification = notification_repository.create.call_args.args[0]
+        assert notification.user_id == event.assignee_id
+        assert "Alice" in notification.content
+
+    @pytest.mark.asyncio
+    async def test_own_status_change_not_notified(self, handler, notification_repository):
+        """Test an assignee changing the status is not notified."""
+        user_id = uuid4()
+
+        await handler.issue_status_changed(status_changed(assignee_id=user_id, changed_by=user_id))
+        await handler.issue_status_changed(status_changed(assignee_id=None))
+
+        notification_repository.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_comment_notifies_reporter_and_assignee_once(
+        self, handler, notification_repository, issue_repository
+    ):
+        """Test a comment notifies the reporter and the assignee, not its author."""
+        reporter_id, author_id = uuid4(), uuid4()
+        issue = Issue.create(
+            project_id=uuid4(),
+            issue_number=1,
+            title="Fix login",
+            reporter_id=reporter_id,
+            assignee_id=reporter_id,
+        )
+        issue_repository.get_by_id.return_value = issue
+
+        await handler.comment_created(
+            CommentCreated(
+                comment_id=uuid4(), issue_id=issue.id, author_id=author_id, content="Looks good"
+            )
+        )
+
+        notification_repository.create.assert_called_once()
+        assert notification_repository.create.call_args.args[0].user_id == reporter_id
+
+    @pytest.mark.asyncio
+    async def test_comment_on_deleted_issue(
+        self, handler, notification_repository, issue_repository
+    ):
+        """Test a comment of an issue deleted since is skipped."""
+        issue_repository.get_by_id.return_value = None
+
+        await handler.comment_created(
+            CommentCreated(comment_id=uuid4(), issue_id=uuid4(), author_id=uuid4(), content="Hi")
+        )
+
+        notification_repository.create.assert_not_called()
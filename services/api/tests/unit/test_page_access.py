@@ -0,0 +1,44 @@
+"""Unit tests for resolved page permissions."""
+
+from uuid import uuid4
+
+from src.application.services.page_access import UNRESTRICTED, PageAccess
+from src.domain.entities import Page
+
+
+def test_unrestricted():
+    """Test spaces without grants let members read and edit every page."""
+    page_id = uuid4()
+
+    assert UNRESTRICTED.can_read(page_id)
+    assert UNRESTRICTED.can_edit(page_id)
+
+
+def test_exceptions_to_space_rights():
+    """Test hidden pages and edit overrides take precedence over the space rights."""
+    hidden, read_only, other = uuid4(), uuid4(), uuid4()
+    access = PageAccess(hidden=frozenset({hidden}), edit_overrides=frozenset({read_only}))
+
+    assert (access.can_read(hidden), access.can_edit(hidden)) == (False, False)
+    assert (access.can_read(read_only), access.can_edit(read_only)) == (True, False)
+    assert (access.can_read(other), access.can_edit(other)) == (True, True)
+
+
+def test_edit_override_in_read_only_space():
+    """Test a page grant lets a user edit in a space they may only view."""
+    editable, other = uuid4(), uuid4()
+    access = PageAccess(can_edit_space=False, edit_overrides=frozenset({editable}))
+
+    assert access.can_edit(editable)
+    assert not access.can_edit(other)
+
+
+def test_readable():
+    """Test pages are filtered in order, and all of them in a space the user may not read."""
+    space_id, author = uuid4(), uuid4()
+    pages = [Page.create(space_id=space_id, title=f"Page {i}", created_by=author) for i in range(3)]
+
+    access = PageAccess(hidden=frozenset({pages[1].id}))
+
+    assert access.readable(pages) == [pages[0], pages[2]]
+    assert PageAccess(can_read_space=False).readable(pages) == []
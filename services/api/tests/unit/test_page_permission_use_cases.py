@@ -167,6 +167,27 @@ class TestUpdatePagePermissionsUseCase:
         assert result.total == 1
         assert result.permissions[0].role == "admin"
 
+    @pytest.mark.asyncio
+    async def test_update_page_permissions_invalidates_access(
+        self,
+        mock_page_repository,
+        mock_page_permission_repository,
+        test_page,
+    ):
+        """Test new grants start a new access version of the space."""
+        mock_page_repository.get_by_id.return_value = test_page
+        mock_page_permission_repository.get_all_by_page.return_value = []
+        page_access_resolver = AsyncMock()
+
+        use_case = UpdatePagePermissionsUseCase(
+            mock_page_repository,
+            mock_page_permission_repository,
+            page_access_resolver=page_access_resolver,
+        )
+        await use_case.execute(str(test_page.id), UpdatePagePermissionRequest(permissions=[]))
+
+        page_access_resolver.invalidate.assert_awaited_once_with(test_page.space_id)
+
     @pytest.mark.asyncio
     async def test_update_page_permissions_page_not_found(
         self, mock_page_repository, mock_page_permission_repository
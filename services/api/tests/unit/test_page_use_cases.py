@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 
 from src.application.dtos.page import CreatePageRequest, UpdatePageRequest
+from src.application.services.page_access import PageAccess
 from src.application.use_cases.page import (
     CreatePageUseCase,
     DeletePageUseCase,
@@ -261,6 +262,22 @@ class TestListPagesUseCase:
         assert result.pages[0].title == "Documentation Page"
         mock_page_repository.search.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_pages_leaves_out_hidden(
+        self, mock_page_repository, mock_session, test_space
+    ):
+        """Test pages the user may not read are excluded by the query, count included."""
+        mock_page_repository.get_all.return_value = []
+        mock_page_repository.count.return_value = 0
+        hidden = frozenset({uuid4()})
+
+        use_case = ListPagesUseCase(mock_page_repository, mock_session)
+
+        await use_case.execute(str(test_space.id), access=PageAccess(hidden=hidden))
+
+        assert mock_page_repository.get_all.call_args.kwargs["exclude_ids"] == hidden
+        assert mock_page_repository.count.call_args.kwargs["exclude_ids"] == hidden
+
 
 class TestUpdatePageUseCase:
     """Tests for UpdatePageUseCase."""
@@ -291,6 +308,26 @@ class TestUpdatePageUseCase:
         assert result.content == "Updated content"
         mock_page_repository.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_page_move_invalidates_access(
+        self, mock_page_repository, mock_session, test_page, test_user
+    ):
+        """Test moving a page under another parent starts a new access version."""
+        parent = Page.create(space_id=test_page.space_id, title="Parent", created_by=uuid4())
+        mock_page_repository.get_by_id.side_effect = [test_page, parent]
+        mock_page_repository.update.side_effect = lambda page: page
+        mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one=Mock(return_value=0)))
+        page_access_resolver = AsyncMock()
+
+        use_case = UpdatePageUseCase(
+            mock_page_repository, session=mock_session, page_access_resolver=page_access_resolver
+        )
+        await use_case.execute(
+            str(test_page.id), UpdatePageRequest(parent_id=parent.id), str(test_user.id)
+        )
+
+        page_access_resolver.invalidate.assert_awaited_once_with(test_page.space_id)
+
     @pytest.mark.asyncio
     async def test_update_page_not_found(self, mock_page_repository, mock_session, test_user):
         """Test page update fails when page not found."""
@@ -353,3 +390,18 @@ class TestGetPageTreeUseCase:
         assert result.pages[0].title == "Root Page"
         assert len(result.pages[0].children) == 1
         assert result.pages[0].children[0].title == "Child Page"
+
+    @pytest.mark.asyncio
+    async def test_get_page_tree_leaves_out_hidden(self, mock_page_repository, test_space):
+        """Test pages the user may not read are left out of the tree."""
+        open_page = Page.create(space_id=test_space.id, title="Open", created_by=uuid4())
+        hidden_page = Page.create(space_id=test_space.id, title="Hidden", created_by=uuid4())
+        mock_page_repository.get_tree.return_value = [open_page, hidden_page]
+
+        use_case = GetPageTreeUseCase(mock_page_repository)
+
+        result = await use_case.execute(
+            str(test_space.id), access=PageAccess(hidden=frozenset({hidden_page.id}))
+        )
+
+        assert [page.title for page in result.pages] == ["Open"]
@@ -0,0 +1,167 @@
+"""Unit tests for read replica routing."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.infrastructure.database.models import IssueModel
+from src.infrastructure.database.replicas import (
+    ROUTER_INFO_KEY,
+    ReplicaRouter,
+    ReplicaRoutingSession,
+    set_session_user,
+)
+
+
+def _engine(host: str) -> AsyncEngine:
+    """Engine that is never connected to."""
+    return create_async_engine(f"postgresql+asyncpg://user:secret@{host}/pages")
+
+
+def _router(lags: dict[AsyncEngine, float | Exception], **kwargs) -> ReplicaRouter:
+    """Router whose replicas report the given lags (or fail with the given errors)."""
+    router = ReplicaRouter(list(lags), **kwargs)
+
+    async def measure_lag(engine: AsyncEngine) -> float:
+        lag = lags[engine]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    router._measure_lag = measure_lag  # type: ignore[method-assign]
+    return router
+
+
+class TestReplicaRouter:
+    """Tests for ReplicaRouter."""
+
+    @pytest.mark.asyncio
+    async def test_primary_until_checked(self):
+        """Test replicas are not read before their first health check."""
+        router = _router({_engine("replica-1"): 0.0})
+
+        assert router.choose() is None
+
+        await router.refresh()
+
+        assert router.choose() is router.replicas[0].engine
+
+    @pytest.mark.asyncio
+    async def test_round_robin_over_healthy_caught_up_replicas(self):
+        """Test lagging and failing replicas are skipped, the others used in turn."""
+        first, second = _engine("replica-1"), _engine("replica-2")
+        lagging, down = _engine("replica-3"), _engine("replica-4")
+        router = _router(
+            {first: 0.5, second: 0.0, lagging: 30.0, down: ConnectionRefusedError()},
+            max_lag_seconds=5.0,
+        )
+
+        await router.refresh()
+
+        assert {router.choose() for _ in range(4)} == {first, second}
+        assert [replica.healthy for replica in router.replicas] == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_primary_when_no_replica_qualifies(self):
+        """Test reads go to the primary when every replica lags or is down."""
+        router = _router({_engine("replica-1"): 30.0, _engine("replica-2"): TimeoutError()})
+
+        await router.refresh()
+
+        assert router.choose() is None
+
+    @pytest.mark.asyncio
+    async def test_slow_health_check_marks_replica_unhealthy(self):
+        """Test a replica not answering within the timeout is not read."""
+        replica = _engine("replica-1")
+        router = ReplicaRouter([replica], check_timeout_seconds=0.01)
+
+        async def measure_lag(engine: AsyncEngine) -> float:
+            await asyncio.sleep(1)
+            return 0.0
+
+        router._measure_lag = measure_lag  # type: ignore[method-assign]
+
+        await router.refresh()
+
+        assert router.replicas[0].healthy is False
+        assert router.choose() is None
+
+    @pytest.mark.asyncio
+    async def test_read_your_writes(self):
+        """Test a user who just wrote reads the primary, other users the replica."""
+        replica = _engine("replica-1")
+        router = _router({replica: 0.0}, read_your_writes_seconds=60)
+        await router.refresh()
+        writer, reader = uuid4(), uuid4()
+
+        router.record_write(writer)
+
+        assert router.choose(writer) is None
+        assert router.choose(reader) is replica
+
+    @pytest.mark.asyncio
+    async def test_read_your_writes_window_expires(self):
+        """Test the user reads replicas again once the window is over."""
+        replica = _engine("replica-1")
+        router = _router({replica: 0.0}, read_your_writes_seconds=0)
+        await router.refresh()
+        writer = uuid4()
+
+        router.record_write(writer)
+
+        assert router.choose(writer) is replica
+
+    @pytest.mark.asyncio
+    async def test_refresh_if_stale_respects_interval(self):
+        """Test replicas are checked again only once the interval is over."""
+        replica = _engine("replica-1")
+        lags: dict[AsyncEngine, float | Exception] = {replica: 0.0}
+        router = _router(lags, check_interval_seconds=3600)
+
+        await router.refresh_if_stale()
+        lags[replica] = ConnectionRefusedError()
+        await router.refresh_if_stale()
+
+        assert router.choose() is replica
+
+
+class TestReplicaRoutingSession:
+    """Tests for ReplicaRoutingSession."""
+
+    @pytest.mark.asyncio
+    async def test_reads_on_replica_writes_on_primary(self):
+        """Test reads use the replica until the session writes."""
+        primary, replica = _engine("primary"), _engine("replica-1")
+        router = _router({replica: 0.0})
+        await router.refresh()
+        session = ReplicaRoutingSession(bind=primary.sync_engine, info={ROUTER_INFO_KEY: router})
+
+        assert session.get_bind(clause=select(IssueModel)) is replica.sync_engine
+        assert session.get_bind(clause=update(IssueModel)) is primary.sync_engine
+        # Reads after a write see it
+        assert session.get_bind(clause=select(IssueModel)) is primary.sync_engine
+
+    @pytest.mark.asyncio
+    async def test_user_who_wrote_reads_primary(self):
+        """Test the session of a user who just wrote reads the primary."""
+        primary, replica = _engine("primary"), _engine("replica-1")
+        router = _router({replica: 0.0})
+        await router.refresh()
+        user_id = uuid4()
+        router.record_write(user_id)
+        set_session_user(user_id)
+
+        session = ReplicaRoutingSession(bind=primary.sync_engine, info={ROUTER_INFO_KEY: router})
+
+        assert session.get_bind(clause=select(IssueModel)) is primary.sync_engine
+
+    def test_without_router_reads_primary(self):
+        """Test a session without router reads its bind."""
+        primary = _engine("primary")
+        session = ReplicaRoutingSession(bind=primary.sync_engine)
+
+        assert session.get_bind(clause=select(IssueModel)) is primary.sync_engine
@@ -1,23 +1,31 @@
 """Unit tests for saved filter use cases."""
 
-from unittest.mock import AsyncMock
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from src.application.dtos.saved_filter import (
     CreateSavedFilterRequest,
+    FilterCriteria,
     UpdateSavedFilterRequest,
 )
+from src.application.services.saved_filter_count_cache import SavedFilterCountCache
 from src.application.use_cases.saved_filter import (
     CreateSavedFilterUseCase,
     DeleteSavedFilterUseCase,
     GetSavedFilterUseCase,
+    ListSavedFilterIssuesUseCase,
     ListSavedFiltersUseCase,
     UpdateSavedFilterUseCase,
 )
+from src.application.use_cases.saved_filter.filter_query import decode_cursor, encode_cursor
 from src.domain.entities import Project, SavedFilter
-from src.domain.exceptions import EntityNotFoundException
+from src.domain.exceptions import EntityNotFoundException, ValidationException
+from src.infrastructure.database import run_after_commit
+from src.infrastructure.services import InMemoryCacheService
 
 
 @pytest.fixture
@@ -225,3 +233,132 @@ class TestDeleteSavedFilterUseCase:
 
         with pytest.raises(EntityNotFoundException):
             await use_case.execute(filter_id)
+
+
+class TestFilterCriteria:
+    """Tests for saved filter criteria validation and cursors."""
+
+    def test_scalars_are_accepted_for_lists(self):
+        """Test a single value is wrapped for list criteria."""
+        criteria = FilterCriteria.model_validate(
+            {"status": "todo", "assignee_id": None, "created_at": {"from": "2026-01-01"}}
+        )
+
+        assert criteria.status == ["todo"]
+        assert criteria.assignee_id is None
+        assert criteria.created_at is not None
+        assert criteria.created_at.from_ == date(2026, 1, 1)
+
+    def test_unknown_criterion_rejected(self):
+        """Test create requests with unknown criteria are rejected."""
+        with pytest.raises(ValidationError):
+            CreateSavedFilterRequest(name="Filter", filter_criteria={"statuz": "todo"})
+
+    def test_reversed_range_rejected(self):
+        """Test a date range ending before it starts is rejected."""
+        with pytest.raises(ValidationError):
+            FilterCriteria.model_validate({"due_date": {"from": "2026-02-01", "to": "2026-01-01"}})
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes to the position it encodes."""
+        created_at = datetime(2026, 10, 18, 12, 30, tzinfo=UTC)
+        issue_id = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, issue_id)) == (created_at, issue_id)
+
+    def test_malformed_cursor_rejected(self):
+        """Test a malformed cursor raises a validation error on the cursor field."""
+        with pytest.raises(ValidationException) as exc_info:
+            decode_cursor("not-a-cursor")
+
+        assert exc_info.value.details == {"field": "cursor"}
+
+
+class TestListSavedFilterIssuesUseCase:
+    """Tests for ListSavedFilterIssuesUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_filter_not_found(self, mock_saved_filter_repository):
+        """Test listing the issues of a missing filter."""
+        mock_saved_filter_repository.get_by_id.return_value = None
+        use_case = ListSavedFilterIssuesUseCase(mock_saved_filter_repository, AsyncMock())
+
+        with pytest.raises(EntityNotFoundException):
+            await use_case.execute(uuid4())
+
+    @pytest.mark.asyncio
+    async def test_invalid_stored_criteria(self, mock_saved_filter_repository, test_saved_filter):
+        """Test criteria saved before validation existed are reported, not run."""
+        test_saved_filter.filter_criteria = {"unknown": 1}
+        mock_saved_filter_repository.get_by_id.return_value = test_saved_filter
+        session = AsyncMock()
+        use_case = ListSavedFilterIssuesUseCase(mock_saved_filter_repository, session)
+
+        with pytest.raises(ValidationException):
+            await use_case.execute(test_saved_filter.id)
+
+        session.execute.assert_not_called()
+
+
+class TestSavedFilterCountCache:
+    """Tests for SavedFilterCountCache."""
+
+    @pytest.mark.asyncio
+    async def test_count_cached_until_project_invalidated(self):
+        """Test counts are reused until an issue of the project changes."""
+        cache = SavedFilterCountCache(InMemoryCacheService(), ttl_seconds=60)
+        filter_id, project_id = uuid4(), uuid4()
+        count = AsyncMock(side_effect=[3, 4])
+
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        await cache.invalidate(uuid4())  # Other project
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        await cache.invalidate(project_id)
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 4
+        assert count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_waits_for_commit(self):
+        """Test a count between the write and its commit is not kept afterwards."""
+        session = MagicMock(info={})
+        cache = SavedFilterCountCache(InMemoryCacheService(), ttl_seconds=60, session=session)
+        filter_id, project_id = uuid4(), uuid4()
+        count = AsyncMock(side_effect=[3, 4])
+
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        await cache.invalidate(project_id)
+        # Not committed yet: readers still get the count of the committed rows
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        await run_after_commit(session)
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 4
+
+    @pytest.mark.asyncio
+    async def test_unscoped_filters_invalidated_by_any_project(self):
+        """Test filters spanning all projects are recounted after any write."""
+        cache = SavedFilterCountCache(InMemoryCacheService(), ttl_seconds=60)
+        filter_id = uuid4()
+        count = AsyncMock(side_effect=[3, 4])
+
+        assert await cache.get_or_count(filter_id, "v1", None, count) == 3
+        await cache.invalidate(uuid4())
+        assert await cache.get_or_count(filter_id, "v1", None, count) == 4
+
+    @pytest.mark.asyncio
+    async def test_new_filter_version_recounted(self):
+        """Test editing the criteria (new version) bypasses the cached count."""
+        cache = SavedFilterCountCache(InMemoryCacheService(), ttl_seconds=60)
+        filter_id, project_id = uuid4(), uuid4()
+        count = AsyncMock(side_effect=[3, 5])
+
+        assert await cache.get_or_count(filter_id, "v1", project_id, count) == 3
+        assert await cache.get_or_count(filter_id, "v2", project_id, count) == 5
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(self):
+        """Test every call counts when caching is disabled."""
+        cache = SavedFilterCountCache(InMemoryCacheService(), ttl_seconds=0)
+        count = AsyncMock(side_effect=[3, 4])
+
+        assert await cache.get_or_count(uuid4(), "v1", None, count) == 3
+        assert await cache.get_or_count(uuid4(), "v1", None, count) == 4
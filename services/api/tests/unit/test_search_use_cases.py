@@ -4,10 +4,19 @@ from uuid import uuid4
 
 import pytest
 
+from src.application.services.page_access import PageAccess
 from src.application.services.search_query_service import SearchQueryService
+from src.application.services.typeahead_query_service import (
+    ISSUE_KEY_PATTERN,
+    TypeaheadQueryService,
+    _contains,
+)
 from src.application.use_cases.search.search_all import SearchAllUseCase
 from src.application.use_cases.search.search_issues import SearchIssuesUseCase
+from src.application.use_cases.search.search_organization import SearchOrganizationUseCase
 from src.application.use_cases.search.search_pages import SearchPagesUseCase
+from src.application.use_cases.search.typeahead import TypeaheadUseCase
+from src.domain.exceptions import ValidationException
 
 
 class DummySearchService(SearchQueryService):
@@ -51,6 +60,50 @@ class DummySearchService(SearchQueryService):
         )
 
 
+class DummyOrganizationSearchService(SearchQueryService):
+    """Organization search returning scored hits, best first, cut at the requested limit."""
+
+    def __init__(self, issue_scores: list[float], page_scores: list[float]) -> None:  # type: ignore[super-init-not-called]
+        self.calls: list[dict] = []
+        self.project_id = uuid4()
+        self.space_id = uuid4()
+        self._issue_scores = issue_scores
+        self._page_scores = page_scores
+
+    def _hits(self, entity_type: str, scores: list[float], limit: int) -> list[dict]:
+        return [
+            {
+                "entity_type": entity_type,
+                "id": uuid4(),
+                "title": f"{entity_type} {score}",
+                "snippet": None,
+                "score": score,
+                "project_id": self.project_id if entity_type == "issue" else None,
+                "space_id": self.space_id if entity_type == "page" else None,
+            }
+            for score in sorted(scores, reverse=True)[:limit]
+        ]
+
+    async def search_organization_issues(self, query, organization_id, limit):
+        self.calls.append({"method": "issues", "limit": limit})
+        facets = [{"id": self.project_id, "name": "Backend", "count": len(self._issue_scores)}]
+        return self._hits("issue", self._issue_scores, limit), facets
+
+    async def search_organization_pages(
+        self, query, organization_id, limit, exclude_space_ids=None, exclude_ids=None
+    ):
+        self.calls.append(
+            {
+                "method": "pages",
+                "limit": limit,
+                "exclude_space_ids": exclude_space_ids,
+                "exclude_ids": exclude_ids,
+            }
+        )
+        facets = [{"id": self.space_id, "name": "Handbook", "count": len(self._page_scores)}]
+        return self._hits("page", self._page_scores, limit), facets
+
+
 @pytest.mark.asyncio
 async def test_search_issues_use_case_calls_service():
     service = DummySearchService()
@@ -115,3 +168,174 @@ async def test_search_all_use_case_pages_only():
     assert result.total == 1
     assert result.items[0].entity_type == "page"
     assert service.calls[0]["method"] == "pages"
+
+
+@pytest.mark.asyncio
+async def test_search_all_use_case_paginates_merge_once():
+    """Test each side is asked for the hits up to the end of the page, sliced once merged."""
+    service = DummySearchService()
+    use_case = SearchAllUseCase(service)
+
+    result = await use_case.execute(
+        query="test", search_type="all", project_id=uuid4(), space_id=uuid4(), page=1, limit=1
+    )
+    await use_case.execute(
+        query="test", search_type="all", project_id=uuid4(), space_id=uuid4(), page=3, limit=10
+    )
+
+    assert len(result.items) == 1
+    assert result.total == 2
+    assert [(call["kwargs"]["skip"], call["kwargs"]["limit"]) for call in service.calls[2:]] == [
+        (0, 30),
+        (0, 30),
+    ]
+
+
+class TestSearchOrganizationUseCase:
+    """Tests for SearchOrganizationUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_merged_by_score_and_paginated_globally(self):
+        """Test pages of the merge follow the scores of both types, with facets."""
+        service = DummyOrganizationSearchService([0.9, 0.5, 0.2], [0.8, 0.4])
+        use_case = SearchOrganizationUseCase(service)
+
+        pages = [
+            await use_case.execute(uuid4(), "deploy", page=page, limit=2) for page in (1, 2, 3)
+        ]
+
+        assert [[item.score for item in result.items] for result in pages] == [
+            [0.9, 0.8],
+            [0.5, 0.4],
+            [0.2],
+        ]
+        assert pages[0].total == 5
+        assert (pages[0].facets.issues, pages[0].facets.pages) == (3, 2)
+        assert pages[0].facets.projects[0].name == "Backend"
+        assert pages[0].facets.spaces[0].count == 2
+        # Each type is asked for the hits up to the end of the page
+        assert [call["limit"] for call in service.calls] == [2, 2, 4, 4, 6, 6]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_spaces_and_pages_excluded(self):
+        """Test pages hidden from the user are left out, with whole spaces they cannot read."""
+        service = DummyOrganizationSearchService([], [0.5])
+        use_case = SearchOrganizationUseCase(service)
+        hidden_page, closed_space, open_space = uuid4(), uuid4(), uuid4()
+
+        await use_case.execute(
+            uuid4(),
+            "deploy",
+            search_type="pages",
+            page_access={
+                open_space: PageAccess(hidden=frozenset({hidden_page})),
+                closed_space: PageAccess(can_read_space=False, hidden=frozenset({uuid4()})),
+            },
+        )
+
+        assert service.calls == [
+            {
+                "method": "pages",
+                "limit": 20,
+                "exclude_space_ids": [closed_space],
+                "exclude_ids": [hidden_page],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_types_run_on_own_sessions(self, monkeypatch):
+        """Test both types are searched on sessions of the factory when one is given."""
+        opened = []
+
+        class Session:
+            async def __aenter__(self):
+                opened.append(self)
+                return self
+
+            async def __aexit__(self, *args):
+                return None
+
+        created: list[DummyOrganizationSearchService] = []
+
+        def service_on(session):
+            service = DummyOrganizationSearchService([0.3], [0.6])
+            created.append(service)
+            return service
+
+        monkeypatch.setattr(
+            "src.application.use_cases.search.search_organization.SearchQueryService", service_on
+        )
+        request_service = DummyOrganizationSearchService([], [])
+        use_case = SearchOrganizationUseCase(request_service, session_factory=Session)
+
+        result = await use_case.execute(uuid4(), "deploy")
+
+        assert len(opened) == 2
+        assert request_service.calls == []
+        assert [[call["method"] for call in service.calls] for service in created] == [
+            ["issues"],
+            ["pages"],
+        ]
+        assert [item.entity_type for item in result.items] == ["page", "issue"]
+
+    @pytest.mark.asyncio
+    async def test_pages_beyond_max_results_rejected(self):
+        """Test deep pages are rejected instead of fetching every hit before them."""
+        service = DummyOrganizationSearchService([0.5], [0.5])
+        use_case = SearchOrganizationUseCase(service)
+        last_page = SearchOrganizationUseCase.MAX_RESULTS // 20
+
+        await use_case.execute(uuid4(), "deploy", page=last_page, limit=20)
+        with pytest.raises(ValidationException):
+            await use_case.execute(uuid4(), "deploy", page=last_page + 1, limit=20)
+
+        assert [call["limit"] for call in service.calls] == [1000, 1000]
+
+    @pytest.mark.asyncio
+    async def test_blank_query_not_searched(self):
+        """Test a blank query returns no hit without searching."""
+        service = DummyOrganizationSearchService([0.5], [0.5])
+
+        result = await SearchOrganizationUseCase(service).execute(uuid4(), "  ")
+
+        assert result.total == 0
+        assert result.items == []
+        assert service.calls == []
+
+
+class DummyTypeaheadService(TypeaheadQueryService):
+    """Typeahead returning one project suggestion."""
+
+    def __init__(self) -> None:  # type: ignore[super-init-not-called]
+        self.calls: list[dict] = []
+
+    async def suggest(self, organization_id, user_id, query, limit):
+        self.calls.append({"query": query, "limit": limit})
+        return [
+            {
+                "entity_type": "project",
+                "id": uuid4(),
+                "label": "Backend",
+                "key": "BACK",
+                "project_id": None,
+                "score": 1.75,
+            }
+        ]
+
+
+@pytest.mark.asyncio
+async def test_typeahead_use_case_caps_limit():
+    service = DummyTypeaheadService()
+
+    result = await TypeaheadUseCase(service).execute(uuid4(), uuid4(), "back", limit=100)
+
+    assert result.items[0].key == "BACK"
+    assert service.calls == [{"query": "back", "limit": TypeaheadUseCase.MAX_LIMIT}]
+
+
+def test_typeahead_patterns():
+    """Test issue keys are recognized and LIKE wildcards typed by the user are escaped."""
+    assert ISSUE_KEY_PATTERN.match("proj-42").groups() == ("proj", "42")
+    assert ISSUE_KEY_PATTERN.match("PROJ-") is None
+    assert ISSUE_KEY_PATTERN.match("my issue-2") is None
+    assert _contains("100%_done") == "%100\\%\\_done%"
@@ -20,7 +20,7 @@ from src.application.use_cases.sprint import (
     UpdateSprintUseCase,
 )
 from src.domain.entities import Issue, Project, Sprint
-from src.domain.exceptions import ConflictException, EntityNotFoundException
+from src.domain.exceptions import ConflictException, EntityNotFoundException, ValidationException
 from src.domain.value_objects.sprint_status import SprintStatus
 
 
@@ -509,13 +509,15 @@ class TestRemoveIssueFromSprintUseCase:
     ):
         """Test successful removing issue from sprint."""
         mock_sprint_repository.get_by_id.return_value = test_sprint
+        filter_count_cache = AsyncMock()
 
-        use_case = RemoveIssueFromSprintUseCase(mock_sprint_repository)
+        use_case = RemoveIssueFromSprintUseCase(mock_sprint_repository, filter_count_cache)
         await use_case.execute(test_sprint.id, test_issue.id)
 
         mock_sprint_repository.remove_issue_from_sprint.assert_called_once_with(
             test_sprint.id, test_issue.id
         )
+        filter_count_cache.invalidate.assert_awaited_once_with(test_sprint.project_id)
 
     @pytest.mark.asyncio
     async def test_remove_issue_from_sprint_sprint_not_found(
@@ -721,27 +723,15 @@ class TestCompleteSprintUseCase:
         test_sprint,
     ):
         """Test successful sprint completion."""
-        from unittest.mock import MagicMock
-
         from src.application.dtos.sprint_metrics import (
             CompleteSprintRequest,
             SprintMetricsResponse,
         )
-        from src.infrastructure.database.models import IssueModel
 
         mock_sprint_repository.get_by_id.return_value = test_sprint
-        mock_sprint_repository.get_sprint_issues.return_value = [(uuid4(), 0)]
-
-        # Mock issue
-        issue = MagicMock(spec=IssueModel)
-        issue.id = uuid4()
-        issue.status = "todo"
-        issue.deleted_at = None
-        issue.backlog_order = None
-
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [issue]
-        mock_session.execute.return_value = mock_result
+        moved_issue_id = uuid4()
+        mock_sprint_repository.move_incomplete_issues.return_value = [moved_issue_id]
+        mock_activity_repository = AsyncMock()
 
         # Mock metrics use case
         mock_metrics = SprintMetricsResponse(
@@ -756,9 +746,14 @@ class TestCompleteSprintUseCase:
         )
 
         request = CompleteSprintRequest(move_incomplete_to_backlog=True)
+        filter_count_cache = AsyncMock()
 
         use_case = CompleteSprintUseCase(
-            mock_sprint_repository, mock_issue_repository, mock_session
+            mock_sprint_repository,
+            mock_issue_repository,
+            mock_session,
+            activity_repository=mock_activity_repository,
+            filter_count_cache=filter_count_cache,
         )
 
         # Mock the metrics use case
@@ -766,7 +761,7 @@ class TestCompleteSprintUseCase:
             "src.application.use_cases.sprint.get_sprint_metrics.GetSprintMetricsUseCase"
         ) as mock_metrics_class:
             mock_metrics_instance = AsyncMock()
-            mock_metrics_instance.execute.return_value = mock_metrics
+            mock_metrics_instance.compute.return_value = mock_metrics
             mock_metrics_class.return_value = mock_metrics_instance
 
             result = await use_case.execute(test_sprint.id, request)
@@ -775,6 +770,87 @@ class TestCompleteSprintUseCase:
             assert result.metrics == mock_metrics
             assert test_sprint.status == SprintStatus.COMPLETED
             mock_sprint_repository.update.assert_called_once()
+            # Issues move to the backlog in one statement, activity is logged in bulk
+            mock_sprint_repository.move_incomplete_issues.assert_awaited_once_with(
+                test_sprint.id, None
+            )
+            mock_activity_repository.create_many.assert_awaited_once()
+            assert mock_activity_repository.create_many.call_args[0][0] == [moved_issue_id]
+            filter_count_cache.invalidate.assert_awaited_once_with(test_sprint.project_id)
+            # Snapshot recorded
+            mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_complete_sprint_move_to_next_sprint(
+        self,
+        mock_sprint_repository,
+        mock_issue_repository,
+        mock_session,
+        test_sprint,
+        test_project,
+    ):
+        """Test incomplete issues move to the next sprint when one is given."""
+        from src.application.dtos.sprint_metrics import (
+            CompleteSprintRequest,
+            SprintMetricsResponse,
+        )
+
+        next_sprint = Sprint.create(project_id=test_project.id, name="Sprint 2")
+        mock_sprint_repository.get_by_id.side_effect = [test_sprint, next_sprint]
+        mock_sprint_repository.move_incomplete_issues.return_value = [uuid4(), uuid4()]
+
+        request = CompleteSprintRequest(move_incomplete_to_sprint_id=next_sprint.id)
+
+        use_case = CompleteSprintUseCase(
+            mock_sprint_repository, mock_issue_repository, mock_session
+        )
+
+        with patch(
+            "src.application.use_cases.sprint.get_sprint_metrics.GetSprintMetricsUseCase"
+        ) as mock_metrics_class:
+            mock_metrics_instance = AsyncMock()
+            mock_metrics_instance.compute.return_value = SprintMetricsResponse(
+                sprint_id=test_sprint.id,
+                total_story_points=0,
+                completed_story_points=0,
+                remaining_story_points=0,
+                completion_percentage=0.0,
+                velocity=0.0,
+                issue_counts={},
+            )
+            mock_metrics_class.return_value = mock_metrics_instance
+
+            result = await use_case.execute(test_sprint.id, request)
+
+        assert result.incomplete_issues_moved == 2
+        assert result.moved_to_sprint_id == next_sprint.id
+        mock_sprint_repository.move_incomplete_issues.assert_awaited_once_with(
+            test_sprint.id, next_sprint.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_complete_sprint_move_to_other_project_sprint(
+        self,
+        mock_sprint_repository,
+        mock_issue_repository,
+        mock_session,
+        test_sprint,
+    ):
+        """Test incomplete issues cannot move to a sprint of another project."""
+        from src.application.dtos.sprint_metrics import CompleteSprintRequest
+
+        other_sprint = Sprint.create(project_id=uuid4(), name="Other")
+        mock_sprint_repository.get_by_id.side_effect = [test_sprint, other_sprint]
+
+        request = CompleteSprintRequest(move_incomplete_to_sprint_id=other_sprint.id)
+
+        use_case = CompleteSprintUseCase(
+            mock_sprint_repository, mock_issue_repository, mock_session
+        )
+
+        with pytest.raises(ValidationException):
+            await use_case.execute(test_sprint.id, request)
+        mock_sprint_repository.move_incomplete_issues.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_complete_sprint_no_move_incomplete(
@@ -815,12 +891,13 @@ class TestCompleteSprintUseCase:
             "src.application.use_cases.sprint.get_sprint_metrics.GetSprintMetricsUseCase"
         ) as mock_metrics_class:
             mock_metrics_instance = AsyncMock()
-            mock_metrics_instance.execute.return_value = mock_metrics
+            mock_metrics_instance.compute.return_value = mock_metrics
             mock_metrics_class.return_value = mock_metrics_instance
 
             result = await use_case.execute(test_sprint.id, request)
             assert result.sprint_id == test_sprint.id
             assert result.incomplete_issues_moved == 0
+            mock_sprint_repository.move_incomplete_issues.assert_not_called()
             assert test_sprint.status == SprintStatus.COMPLETED
 
     @pytest.mark.asyncio
@@ -2,7 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, call
 from uuid import uuid4
 
 import pytest
@@ -11,8 +11,10 @@ from src.application.dtos.time_entry import TimeEntryRequest
 from src.application.use_cases.time_entry import (
     CreateTimeEntryUseCase,
     DeleteTimeEntryUseCase,
+    GetProjectTimesheetUseCase,
     GetTimeEntryUseCase,
     GetTimeSummaryUseCase,
+    GetUserTimesheetUseCase,
     ListTimeEntriesUseCase,
     UpdateTimeEntryUseCase,
 )
@@ -250,62 +252,54 @@ class TestGetTimeSummaryUseCase:
     """Tests for GetTimeSummaryUseCase."""
 
     @pytest.mark.asyncio
-    async def test_get_time_summary_success(
-        self, mock_time_entry_repository, test_issue, test_time_entry
-    ):
+    async def test_get_time_summary_success(self, mock_time_entry_repository, test_time_entry):
         """Test successfully getting time summary."""
-        entries = [test_time_entry]
-        mock_time_entry_repository.get_by_issue_id.return_value = entries
-        mock_time_entry_repository.get_total_hours_by_issue.return_value = Decimal("2.5")
+        mock_time_entry_repository.get_hours_summary_by_issue.return_value = (
+            Decimal("2.5"),
+            {test_time_entry.user_id: Decimal("2.5")},
+            {test_time_entry.date: Decimal("2.5")},
+        )
 
         use_case = GetTimeSummaryUseCase(mock_time_entry_repository)
 
-        result = await use_case.execute(test_issue.id)
+        result = await use_case.execute(test_time_entry.issue_id)
 
         assert result.total_hours == Decimal("2.5")
-        assert len(result.hours_by_user) > 0
+        assert result.hours_by_user == {str(test_time_entry.user_id): Decimal("2.5")}
+        assert result.hours_by_date_range == {test_time_entry.date.isoformat(): Decimal("2.5")}
+        mock_time_entry_repository.get_hours_summary_by_issue.assert_called_once_with(
+            test_time_entry.issue_id
+        )
+        mock_time_entry_repository.get_by_issue_id.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_time_summary_multiple_entries(self, mock_time_entry_repository, test_issue):
-        """Test getting time summary with multiple entries."""
+    async def test_get_time_summary_multiple_users(self, mock_time_entry_repository, test_issue):
+        """Test getting time summary with hours of several users and days."""
         user_id1 = uuid4()
         user_id2 = uuid4()
-        entry1 = TimeEntry.create(
-            issue_id=test_issue.id,
-            user_id=user_id1,
-            hours=Decimal("2.5"),
-            date=date.today(),
-        )
-        entry2 = TimeEntry.create(
-            issue_id=test_issue.id,
-            user_id=user_id2,
-            hours=Decimal("1.5"),
-            date=date.today(),
-        )
-        entry3 = TimeEntry.create(
-            issue_id=test_issue.id,
-            user_id=user_id1,
-            hours=Decimal("1.0"),
-            date=date.today(),
+        mock_time_entry_repository.get_hours_summary_by_issue.return_value = (
+            Decimal("5.0"),
+            {user_id1: Decimal("3.5"), user_id2: Decimal("1.5")},
+            {date(2026, 10, 5): Decimal("1.0"), date(2026, 10, 6): Decimal("4.0")},
         )
 
-        entries = [entry1, entry2, entry3]
-        mock_time_entry_repository.get_by_issue_id.return_value = entries
-        mock_time_entry_repository.get_total_hours_by_issue.return_value = Decimal("5.0")
-
         use_case = GetTimeSummaryUseCase(mock_time_entry_repository)
 
         result = await use_case.execute(test_issue.id)
 
         assert result.total_hours == Decimal("5.0")
-        assert result.hours_by_user[str(user_id1)] == 3.5
-        assert result.hours_by_user[str(user_id2)] == 1.5
+        assert result.hours_by_user[str(user_id1)] == Decimal("3.5")
+        assert result.hours_by_user[str(user_id2)] == Decimal("1.5")
+        assert list(result.hours_by_date_range) == ["2026-10-05", "2026-10-06"]
 
     @pytest.mark.asyncio
     async def test_get_time_summary_no_entries(self, mock_time_entry_repository, test_issue):
         """Test getting time summary with no entries."""
-        mock_time_entry_repository.get_by_issue_id.return_value = []
-        mock_time_entry_repository.get_total_hours_by_issue.return_value = Decimal("0")
+        mock_time_entry_repository.get_hours_summary_by_issue.return_value = (
+            Decimal("0"),
+            {},
+            {},
+        )
 
         use_case = GetTimeSummaryUseCase(mock_time_entry_repository)
 
@@ -314,3 +308,123 @@ class TestGetTimeSummaryUseCase:
         assert result.total_hours == Decimal("0")
         assert len(result.hours_by_user) == 0
         assert len(result.hours_by_date_range) == 0
+
+
+class TestTimesheetRollups:
+    """Tests for the timesheet rollups kept by the time entry use cases."""
+
+    @pytest.mark.asyncio
+    async def test_create_records_hours(
+        self, mock_time_entry_repository, mock_issue_repository, test_issue, test_time_entry
+    ):
+        """Test creating a time entry adds its hours to the rollup of its day."""
+        timesheet_service = AsyncMock()
+        mock_issue_repository.get_by_id.return_value = test_issue
+        mock_time_entry_repository.create.return_value = test_time_entry
+
+        use_case = CreateTimeEntryUseCase(
+            mock_time_entry_repository,
+            mock_issue_repository,
+            timesheet_service=timesheet_service,
+        )
+        await use_case.execute(
+            test_issue.id,
+            test_time_entry.user_id,
+            TimeEntryRequest(hours=test_time_entry.hours, date=test_time_entry.date),
+        )
+
+        timesheet_service.record.assert_called_once_with(
+            test_issue.id, test_time_entry.user_id, test_time_entry.date, Decimal("2.5"), 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_moves_hours(self, mock_time_entry_repository, test_time_entry):
+        """Test updating a time entry moves its hours to the new day."""
+        timesheet_service = AsyncMock()
+        previous_date = test_time_entry.date
+        new_date = date(2026, 10, 5)
+        mock_time_entry_repository.get_by_id.return_value = test_time_entry
+        mock_time_entry_repository.update.side_effect = lambda entry: entry
+
+        use_case = UpdateTimeEntryUseCase(
+            mock_time_entry_repository, timesheet_service=timesheet_service
+        )
+        await use_case.execute(
+            test_time_entry.id, TimeEntryRequest(hours=Decimal("4"), date=new_date)
+        )
+
+        issue_id, user_id = test_time_entry.issue_id, test_time_entry.user_id
+        assert timesheet_service.record.call_args_list == [
+            call(issue_id, user_id, previous_date, Decimal("-2.5"), -1),
+            call(issue_id, user_id, new_date, Decimal("4"), 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_description_keeps_rollups(
+        self, mock_time_entry_repository, test_time_entry
+    ):
+        """Test updating only the description leaves the rollups alone."""
+        timesheet_service = AsyncMock()
+        mock_time_entry_repository.get_by_id.return_value = test_time_entry
+        mock_time_entry_repository.update.side_effect = lambda entry: entry
+
+        use_case = UpdateTimeEntryUseCase(
+            mock_time_entry_repository, timesheet_service=timesheet_service
+        )
+        await use_case.execute(
+            test_time_entry.id,
+            TimeEntryRequest(
+                hours=test_time_entry.hours, date=test_time_entry.date, description="Review"
+            ),
+        )
+
+        timesheet_service.record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_hours(self, mock_time_entry_repository, test_time_entry):
+        """Test deleting a time entry removes its hours from the rollup of its day."""
+        timesheet_service = AsyncMock()
+        mock_time_entry_repository.get_by_id.return_value = test_time_entry
+
+        use_case = DeleteTimeEntryUseCase(
+            mock_time_entry_repository, timesheet_service=timesheet_service
+        )
+        await use_case.execute(test_time_entry.id)
+
+        timesheet_service.record.assert_called_once_with(
+            test_time_entry.issue_id,
+            test_time_entry.user_id,
+            test_time_entry.date,
+            Decimal("-2.5"),
+            -1,
+        )
+
+
+class TestTimesheetUseCases:
+    """Tests for the timesheet use cases."""
+
+    @pytest.mark.asyncio
+    async def test_user_timesheet_covers_week(self):
+        """Test the user timesheet runs from the Monday to the Sunday of the week."""
+        timesheet_service = AsyncMock()
+        organization_id, user_id = uuid4(), uuid4()
+
+        use_case = GetUserTimesheetUseCase(timesheet_service)
+        await use_case.execute(organization_id, user_id, date(2026, 10, 15))
+
+        timesheet_service.get_user_timesheet.assert_called_once_with(
+            organization_id, user_id, date(2026, 10, 12), date(2026, 10, 18)
+        )
+
+    @pytest.mark.asyncio
+    async def test_project_timesheet_covers_month(self):
+        """Test the project timesheet runs from the first to the last day of the month."""
+        timesheet_service = AsyncMock()
+        project_id = uuid4()
+
+        use_case = GetProjectTimesheetUseCase(timesheet_service)
+        await use_case.execute(project_id, date(2028, 2, 10))
+
+        timesheet_service.get_project_timesheet.assert_called_once_with(
+            project_id, date(2028, 2, 1), date(2028, 2, 29)
+        )
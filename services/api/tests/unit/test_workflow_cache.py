@@ -0,0 +1,183 @@
+"""Unit tests for the compiled workflow cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.workflow_cache import CompiledWorkflow, WorkflowCache, status_key
+from src.domain.entities import Workflow
+from src.infrastructure.database import run_after_commit
+
+
+@pytest.fixture
+def workflow():
+    """To Do -> In Progress -> Done, with a way back from In Progress."""
+    workflow = Workflow.create(project_id=uuid4(), name="Delivery", is_default=True)
+    todo = workflow.add_status("To Do", order=0, is_initial=True)
+    in_progress = workflow.add_status("In Progress", order=1)
+    done = workflow.add_status("Done", order=2, is_final=True)
+    workflow.add_transition(todo.id, in_progress.id)
+    workflow.add_transition(in_progress.id, todo.id)
+    workflow.add_transition(in_progress.id, done.id)
+    return workflow
+
+
+@pytest.fixture
+def workflow_repository(workflow):
+    """Workflow repository returning the workflow."""
+    repository = AsyncMock()
+    repository.get_default_by_project_id.return_value = workflow
+    repository.get_by_id.return_value = workflow
+    return repository
+
+
+def test_status_key():
+    """Test workflow status names map to issue statuses."""
+    assert status_key("In Progress") == status_key("in_progress") == "inprogress"
+    assert status_key("To-Do") == status_key("todo") == "todo"
+    assert status_key("Done") == "done"
+
+
+class TestCompiledWorkflow:
+    """Tests for CompiledWorkflow."""
+
+    def test_allows(self, workflow):
+        """Test transitions are looked up in the adjacency table."""
+        todo, in_progress, done = workflow.statuses
+        compiled = CompiledWorkflow.compile(workflow)
+
+        assert compiled.allows(todo.id, in_progress.id)
+        assert compiled.allows(in_progress.id, done.id)
+        assert not compiled.allows(todo.id, done.id)
+        assert not compiled.allows(done.id, todo.id)
+        assert compiled.targets[done.id] == frozenset()
+
+    def test_allows_status_change(self, workflow):
+        """Test issue statuses are checked by name, unknown ones are not constrained."""
+        compiled = CompiledWorkflow.compile(workflow)
+
+        assert compiled.allows_status_change("todo", "in_progress")
+        assert not compiled.allows_status_change("todo", "done")
+        assert not compiled.allows_status_change("done", "in_progress")
+        assert compiled.allows_status_change("done", "done")
+        # "cancelled" is not a status of the workflow
+        assert compiled.allows_status_change("done", "cancelled")
+
+    def test_without_transitions_unconstrained(self):
+        """Test a workflow without transitions allows any status change."""
+        workflow = Workflow.create(project_id=uuid4(), name="Statuses only")
+        workflow.add_status("To Do", order=0, is_initial=True)
+        workflow.add_status("Done", order=1, is_final=True)
+        compiled = CompiledWorkflow.compile(workflow)
+
+        assert compiled.allows_status_change("todo", "done")
+        assert not compiled.allows(*(status.id for status in workflow.statuses))
+
+    def test_is_immutable(self, workflow):
+        """Test the compiled table cannot be changed."""
+        compiled = CompiledWorkflow.compile(workflow)
+
+        with pytest.raises(TypeError):
+            compiled.targets[uuid4()] = frozenset()  # type: ignore[index]
+
+
+class TestWorkflowCache:
+    """Tests for WorkflowCache."""
+
+    @pytest.mark.asyncio
+    async def test_default_workflow_loaded_once(self, workflow, workflow_repository):
+        """Test the default workflow is compiled on the first read only."""
+        cache = WorkflowCache()
+
+        first = await cache.get_default(workflow.project_id, workflow_repository)
+        second = await cache.get_default(workflow.project_id, workflow_repository)
+
+        assert first is second
+        assert first is not None and first.workflow_id == workflow.id
+        workflow_repository.get_default_by_project_id.assert_awaited_once_with(workflow.project_id)
+
+    @pytest.mark.asyncio
+    async def test_project_without_workflow_cached(self):
+        """Test a project without default workflow is not looked up again."""
+        repository = AsyncMock()
+        repository.get_default_by_project_id.return_value = None
+        cache = WorkflowCache()
+        project_id = uuid4()
+
+        assert await cache.allows_status_change(project_id, "todo", "done", repository)
+        assert await cache.allows_status_change(project_id, "done", "todo", repository)
+
+        repository.get_default_by_project_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_recompiles(self, workflow, workflow_repository):
+        """Test invalidating a project reloads its workflows."""
+        cache = WorkflowCache()
+        await cache.get_default(workflow.project_id, workflow_repository)
+        await cache.get(workflow.id, workflow_repository)
+
+        cache.invalidate(workflow.project_id)
+        await cache.get_default(workflow.project_id, workflow_repository)
+        await cache.get(workflow.id, workflow_repository)
+
+        assert workflow_repository.get_default_by_project_id.await_count == 2
+        assert workflow_repository.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_not_cached(self, workflow):
+        """Test a workflow loaded while the project is invalidated is loaded again."""
+        cache = WorkflowCache()
+        repository = AsyncMock()
+
+        async def load(project_id):
+            await asyncio.sleep(0)
+            return workflow
+
+        repository.get_default_by_project_id.side_effect = load
+
+        loading = asyncio.create_task(cache.get_default(workflow.project_id, repository))
+        await asyncio.sleep(0)
+        cache.invalidate(workflow.project_id)
+        await loading
+        await cache.get_default(workflow.project_id, repository)
+
+        assert repository.get_default_by_project_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_waits_for_commit(self, workflow):
+        """Test a workflow loaded between the write and its commit is loaded again after it."""
+        cache = WorkflowCache()
+        session = MagicMock(info={})
+        changed = Workflow.create(project_id=workflow.project_id, name="Changed", is_default=True)
+        repository = AsyncMock()
+        repository.get_default_by_project_id.side_effect = [workflow, changed]
+
+        cache.invalidate(workflow.project_id, session)
+        # Not committed yet: the load still sees the old workflow
+        before_commit = await cache.get_default(workflow.project_id, repository)
+        await run_after_commit(session)
+        after_commit = await cache.get_default(workflow.project_id, repository)
+
+        assert before_commit is not None and before_commit.workflow_id == workflow.id
+        assert after_commit is not None and after_commit.workflow_id == changed.id
+
+    @pytest.mark.asyncio
+    async def test_ttl_zero_disables_caching(self, workflow, workflow_repository):
+        """Test every read loads the workflow when caching is disabled."""
+        cache = WorkflowCache(ttl_seconds=0)
+
+        await cache.get_default(workflow.project_id, workflow_repository)
+        await cache.get_default(workflow.project_id, workflow_repository)
+
+        assert workflow_repository.get_default_by_project_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_not_looked_up(self, workflow_repository):
+        """Test keeping the same status needs no workflow."""
+        cache = WorkflowCache()
+
+        assert await cache.allows_status_change(uuid4(), "done", "done", workflow_repository)
+
+        workflow_repository.get_default_by_project_id.assert_not_awaited()
@@ -1,6 +1,6 @@
 """Unit tests for workflow use cases."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -11,6 +11,7 @@ from src.application.dtos.workflow import (
     ValidateTransitionRequest,
     WorkflowStatusRequest,
 )
+from src.application.services.workflow_cache import WorkflowCache
 from src.application.use_cases.workflow import (
     CreateWorkflowUseCase,
     DeleteWorkflowUseCase,
@@ -227,6 +228,22 @@ class TestUpdateWorkflowUseCase:
         assert result.name == "Updated Workflow"
         mock_workflow_repository.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_workflow_invalidates_cache(self, mock_workflow_repository, test_workflow):
+        """Test updating a workflow drops the compiled workflows of its project."""
+        mock_workflow_repository.get_by_id.return_value = test_workflow
+        mock_workflow_repository.update.return_value = test_workflow
+        workflow_cache = MagicMock()
+        session = MagicMock()
+
+        use_case = UpdateWorkflowUseCase(
+            mock_workflow_repository, workflow_cache=workflow_cache, session=session
+        )
+
+        await use_case.execute(test_workflow.id, UpdateWorkflowRequest(name="Renamed"))
+
+        workflow_cache.invalidate.assert_called_once_with(test_workflow.project_id, session)
+
     @pytest.mark.asyncio
     async def test_update_workflow_not_found(self, mock_workflow_repository):
         """Test updating non-existent workflow."""
@@ -309,6 +326,29 @@ class TestValidateTransitionUseCase:
         assert result.is_valid is False
         assert result.message is not None
 
+    @pytest.mark.asyncio
+    async def test_validate_transition_cached(self, mock_workflow_repository, test_workflow):
+        """Test the workflow is loaded once when validating with the cache."""
+        todo, in_progress, done = test_workflow.statuses
+        mock_workflow_repository.get_by_id.return_value = test_workflow
+
+        use_case = ValidateTransitionUseCase(
+            mock_workflow_repository, workflow_cache=WorkflowCache()
+        )
+
+        allowed = await use_case.execute(
+            test_workflow.id,
+            ValidateTransitionRequest(from_status_id=todo.id, to_status_id=in_progress.id),
+        )
+        skipped = await use_case.execute(
+            test_workflow.id,
+            ValidateTransitionRequest(from_status_id=todo.id, to_status_id=done.id),
+        )
+
+        assert allowed.is_valid is True
+        assert skipped.is_valid is False
+        mock_workflow_repository.get_by_id.assert_awaited_once_with(test_workflow.id)
+
     @pytest.mark.asyncio
     async def test_validate_transition_with_conditional_logic(
         self, mock_workflow_repository, test_workflow